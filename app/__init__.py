@@ -22,13 +22,46 @@ def create_app(config_class=Config):
                 static_folder='static')
     app.config.from_object(config_class)
 
-    # 확장 초기화
+    # 확장 초기화 (복제본 bind는 db.init_app 이전에 등록)
+    from app.infrastructure.persistence.routing_session import configure_replica_binds, init_replica_routing
+    from app.infrastructure.persistence.connection_pool import build_engine_options, init_pool_metrics
+    configure_replica_binds(app)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        **build_engine_options(app.config),
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+    }
     db.init_app(app)
+    init_pool_metrics(app)
     migrate.init_app(app, db)
     login_manager.init_app(app)
     cors.init_app(app)
     csrf.init_app(app)
 
+    # 읽기 복제본 read-your-writes 고정
+    init_replica_routing(app)
+
+    # 요청 단위 Repository 로더 (Identity Map)
+    from app.infrastructure.repositories.request_loader import init_request_loader
+    init_request_loader(app)
+
+    # 캐시 (홈 피드, user_loader)
+    from app.infrastructure.cache.tagged_cache import init_cache
+    from app.infrastructure.cache.user_principal_cache import init_user_principal_cache
+    init_cache(app)
+    init_user_principal_cache(app)
+
+    # Supabase 클라이언트 (워커별 공유, keep-alive 연결 풀)
+    from app.infrastructure.external.supabase.supabase_client import init_supabase
+    from app.infrastructure.external.supabase.supabase_token_verifier import init_token_verifier
+    from app.infrastructure.external.resilience.resilient_auth_provider import init_auth_resilience
+    init_supabase(app)
+    init_token_verifier(app)
+    init_auth_resilience(app)
+
+    # 파일 스토리지 (local 백엔드면 /uploads 라우트 등록)
+    from app.infrastructure.external.storage_registry import init_storage
+    init_storage(app)
+
     # Blueprint 등록
     from app.presentation.routes.auth_routes import auth_bp
     from app.presentation.routes.main_routes import main_bp
@@ -42,8 +75,4 @@ def create_app(config_class=Config):
     app.register_blueprint(influencer_bp)
     app.register_blueprint(campaign_bp)
 
-    # UserModel import (user_loader 등록을 위해)
-    with app.app_context():
-        from app.infrastructure.persistence.models import user_model
-
     return app
@@ -4,7 +4,7 @@ Application Service
 체험단 지원 비즈니스 로직
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from app.domain.entities.application import Application
 from app.domain.entities.campaign import Campaign, CampaignStatus
@@ -24,11 +24,9 @@ from app.domain.exceptions.application_exceptions import (
 )
 from app.domain.exceptions.influencer_exceptions import InfluencerNotFoundException
 from app.domain.business_rules.application_rules import ApplicationRules
-from app.shared.constants.campaign_constants import (
-    APPLICATION_STATUS_APPLIED,
-    APPLICATION_STATUS_SELECTED,
-    APPLICATION_STATUS_REJECTED,
-)
+from app.infrastructure.cache.tagged_cache import TaggedCache
+from app.shared.constants.cache_constants import CACHE_TAG_RECRUITING_FEED
+from app.shared.constants.campaign_constants import APPLICATION_STATUS_APPLIED
 
 
 class ApplicationService:
@@ -39,16 +37,19 @@ class ApplicationService:
         application_repository: IApplicationRepository,
         campaign_repository: ICampaignRepository,
         influencer_repository: IInfluencerRepository,
+        cache: Optional[TaggedCache] = None,
     ):
         """
         Args:
             application_repository: ApplicationRepository
             campaign_repository: CampaignRepository
             influencer_repository: InfluencerRepository
+            cache: 홈 피드 캐시 (optional, 지원/선정 커밋 시 무효화)
         """
         self.application_repository = application_repository
         self.campaign_repository = campaign_repository
         self.influencer_repository = influencer_repository
+        self.cache = cache
 
     def apply_to_campaign(
         self,
@@ -73,36 +74,12 @@ class ApplicationService:
             CampaignNotRecruitingException: 모집이 종료된 체험단
             AlreadyAppliedException: 이미 지원한 체험단
         """
-        # 1. 체험단 조회
-        campaign = self.campaign_repository.find_by_id(campaign_id)
-        if campaign is None:
-            raise CampaignNotFoundException("체험단을 찾을 수 없습니다")
-
-        # 2. 인플루언서 조회
+        # 1. 인플루언서 조회 (요청 단위 로더 사용 시 캐시 적중)
         influencer = self.influencer_repository.find_by_id(influencer_id)
+        if influencer is None:
+            raise InfluencerNotRegisteredException("인플루언서 정보가 등록되지 않았습니다")
 
-        # 3. 중복 지원 확인
-        already_applied = self.application_repository.exists_by_campaign_and_influencer(
-            campaign_id, influencer_id
-        )
-
-        # 4. 지원 가능 여부 검증 (비즈니스 규칙)
-        can_apply, error_message = ApplicationRules.can_apply(
-            campaign, influencer, already_applied
-        )
-
-        if not can_apply:
-            # 에러 메시지에 따라 적절한 예외 발생
-            if "인플루언서" in error_message:
-                raise InfluencerNotRegisteredException(error_message)
-            elif "모집이 종료" in error_message:
-                raise CampaignNotRecruitingException(error_message)
-            elif "이미 지원" in error_message:
-                raise AlreadyAppliedException(error_message)
-            else:
-                raise Exception(error_message)
-
-        # 5. Application 엔티티 생성
+        # 2. 모집 상태 확인 + 중복 방지 + 저장을 단일 INSERT로 처리
         application = Application(
             id=None,
             campaign_id=campaign_id,
@@ -111,12 +88,44 @@ class ApplicationService:
             status=APPLICATION_STATUS_APPLIED,
             applied_at=datetime.now()
         )
+        saved_application = self.application_repository.insert_if_recruiting(application)
+        if saved_application is None:
+            self._raise_apply_rejected(campaign_id, influencer)
 
-        # 6. 저장
-        saved_application = self.application_repository.save(application)
+        # 3. 지원자 수 카운터 증가 (같은 트랜잭션)
+        self.campaign_repository.increment_application_count(campaign_id)
+
+        # 커밋 시 홈 피드 캐시 무효화 (지원자 수/인기순 변경)
+        if self.cache is not None:
+            self.cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
 
         return saved_application
 
+    def _raise_apply_rejected(self, campaign_id: int, influencer) -> None:
+        """
+        저장되지 않은 지원의 사유를 확인하여 예외 발생 (실패 경로에서만 조회)
+
+        Raises:
+            CampaignNotFoundException: 체험단이 존재하지 않음
+            CampaignNotRecruitingException: 모집이 종료된 체험단
+            AlreadyAppliedException: 이미 지원한 체험단
+        """
+        campaign = self.campaign_repository.find_by_id(campaign_id)
+        if campaign is None:
+            raise CampaignNotFoundException("체험단을 찾을 수 없습니다")
+
+        already_applied = self.application_repository.exists_by_campaign_and_influencer(
+            campaign_id, influencer.id
+        )
+        _, error_message = ApplicationRules.can_apply(campaign, influencer, already_applied)
+
+        if error_message is None or "이미 지원" in error_message:
+            # 규칙상 지원 가능하면 동시 지원과 경합한 경우
+            raise AlreadyAppliedException("이미 지원한 체험단입니다")
+        if "모집이 종료" in error_message:
+            raise CampaignNotRecruitingException(error_message)
+        raise Exception(error_message)
+
     def select_influencers(
         self,
         campaign_id: int,
@@ -156,26 +165,17 @@ class ApplicationService:
                 f"선정 인원은 모집 인원({campaign.quota}명)을 초과할 수 없습니다"
             )
 
-        # 선정된 인플루언서 상태 업데이트
-        self.application_repository.update_status_bulk(
-            selected_application_ids, APPLICATION_STATUS_SELECTED
-        )
-
-        # 미선정 인플루언서 상태 업데이트
-        all_applications = self.application_repository.find_by_campaign_id(campaign_id)
-        rejected_ids = [
-            app.id for app in all_applications
-            if app.id not in selected_application_ids and app.is_applied()
-        ]
-        if rejected_ids:
-            self.application_repository.update_status_bulk(
-                rejected_ids, APPLICATION_STATUS_REJECTED
-            )
+        # 선정/미선정 상태를 단일 UPDATE로 반영
+        self.application_repository.apply_selection(campaign_id, selected_application_ids)
 
         # 체험단 상태 업데이트
         campaign.status = CampaignStatus.SELECTED
         self.campaign_repository.save(campaign)
 
+        # 커밋 시 홈 피드 캐시 무효화
+        if self.cache is not None:
+            self.cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+
     def get_applications_by_influencer(self, influencer_id: int) -> List[Application]:
         """
         인플루언서의 지원 내역 조회
@@ -198,3 +198,29 @@ class ApplicationService:
         applications = self.application_repository.find_by_influencer_id(influencer_id)
 
         return applications
+
+    def get_application_history(
+        self,
+        influencer_id: int,
+        status: Optional[str] = None,
+        page: int = 1,
+        per_page: Optional[int] = None
+    ) -> Tuple[List[dict], Dict[str, int]]:
+        """
+        인플루언서의 지원 내역 조회 (체험단/광고주 정보 및 상태별 개수 포함)
+
+        Args:
+            influencer_id: 인플루언서 ID
+            status: 지원 상태 필터 (None이면 전체)
+            page: 페이지 번호 (1부터 시작)
+            per_page: 페이지당 레코드 수 (None이면 전체)
+
+        Returns:
+            (지원 내역 리스트, {status: 개수}) 튜플
+        """
+        skip = (max(page, 1) - 1) * per_page if per_page else 0
+        history = self.application_repository.find_history_by_influencer(
+            influencer_id, status=status, skip=skip, limit=per_page
+        )
+        status_counts = self.application_repository.count_by_status_for_influencer(influencer_id)
+        return history, status_counts
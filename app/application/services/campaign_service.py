@@ -4,14 +4,22 @@ Campaign Service
 체험단 비즈니스 로직
 """
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import date
 
-from app.domain.entities.campaign import Campaign
+from app.application.services.image_variant_service import image_srcset, image_thumbnail_url
+from app.domain.entities.campaign import Campaign, CampaignStatus
+from app.domain.exceptions import ValidationException
+from app.domain.value_objects.campaign_filter import CampaignFilter
 from app.infrastructure.repositories.interfaces.i_campaign_repository import ICampaignRepository
 from app.infrastructure.repositories.interfaces.i_influencer_repository import IInfluencerRepository
 from app.infrastructure.repositories.interfaces.i_application_repository import IApplicationRepository
+from app.infrastructure.repositories.interfaces.i_advertiser_repository import IAdvertiserRepository
+from app.infrastructure.cache.tagged_cache import TaggedCache
 from app.presentation.schemas.campaign_schemas import CampaignDetailDTO, CampaignListItemDTO
+from app.shared.constants.cache_constants import CACHE_TAG_RECRUITING_FEED
+from app.shared.constants.campaign_constants import STATUS_RECRUITING, VALID_CAMPAIGN_STATUSES
+from app.shared.utils.search_utils import parse_search_query
 
 
 class CampaignService:
@@ -21,17 +29,23 @@ class CampaignService:
         self,
         campaign_repository: ICampaignRepository,
         influencer_repository: IInfluencerRepository = None,
-        application_repository: IApplicationRepository = None
+        application_repository: IApplicationRepository = None,
+        advertiser_repository: IAdvertiserRepository = None,
+        cache: Optional[TaggedCache] = None
     ):
         """
         Args:
             campaign_repository: CampaignRepository
             influencer_repository: InfluencerRepository (optional)
             application_repository: ApplicationRepository (optional)
+            advertiser_repository: AdvertiserRepository (optional, 소유자 확인용)
+            cache: 홈 피드 캐시 (optional, 없으면 캐시하지 않음)
         """
         self.campaign_repository = campaign_repository
         self.influencer_repository = influencer_repository
         self.application_repository = application_repository
+        self.advertiser_repository = advertiser_repository
+        self.cache = cache
 
     def create_campaign(
         self,
@@ -84,6 +98,11 @@ class CampaignService:
 
         # Repository를 통해 저장
         saved_campaign = self.campaign_repository.save(campaign)
+
+        # 커밋 시 홈 피드 캐시 무효화
+        if self.cache is not None:
+            self.cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+
         return saved_campaign
 
     def get_advertiser_campaigns(
@@ -104,9 +123,6 @@ class CampaignService:
         # DTO 변환
         campaign_dtos = []
         for campaign in campaigns:
-            # 지원자 수 조회
-            application_count = self.campaign_repository.get_application_count(campaign.id)
-
             campaign_dtos.append(
                 CampaignListItemDTO(
                     id=campaign.id,
@@ -114,17 +130,62 @@ class CampaignService:
                     description_short=campaign.description[:100],
                     image_url=campaign.image_url,
                     quota=campaign.quota,
-                    application_count=application_count,
+                    application_count=campaign.application_count,
                     deadline=campaign.end_date,
                     business_name='',  # 광고주 자신의 체험단이므로 불필요
-                    status=campaign.status.value
+                    status=campaign.status.value,
+                    image_thumbnail_url=image_thumbnail_url(campaign.image_variants),
+                    image_srcset=image_srcset(campaign.image_variants)
                 )
             )
 
         return campaign_dtos
 
+    def get_advertiser_dashboard(
+        self,
+        advertiser_id: int,
+        per_status: Optional[int] = None,
+        pages: Optional[Dict[str, int]] = None
+    ) -> Tuple[Dict[str, List[CampaignListItemDTO]], Dict[str, int]]:
+        """
+        광고주 대시보드 조회 (상태별 체험단 목록 + 상태별 총 개수)
+
+        Args:
+            advertiser_id: 광고주 ID
+            per_status: 상태별 페이지 크기 (None이면 전체 조회)
+            pages: 상태별 페이지 번호 (1부터 시작, 예: {'CLOSED': 2})
+
+        Returns:
+            ({status: CampaignListItemDTO 리스트}, {status: 총 개수}) 튜플
+        """
+        offsets = None
+        if per_status is not None and pages:
+            offsets = {
+                status: (max(page, 1) - 1) * per_status
+                for status, page in pages.items()
+            }
+
+        campaigns_by_status, status_counts = (
+            self.campaign_repository.find_advertiser_campaigns_by_status(
+                advertiser_id, limit_per_status=per_status, offsets=offsets
+            )
+        )
+
+        # 광고주 자신의 체험단이므로 업체명 불필요
+        dtos_by_status = {
+            status: self._to_list_item_dtos(rows, business_name='')
+            for status, rows in campaigns_by_status.items()
+        }
+
+        return (dtos_by_status, status_counts)
+
     def get_campaign_detail(
-        self, campaign_id: int, user_id: Optional[str] = None, user_role: Optional[str] = None
+        self,
+        campaign_id: int,
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+        advertiser_id: Optional[int] = None,
+        influencer_id: Optional[int] = None
     ) -> Optional[CampaignDetailDTO]:
         """
         체험단 상세 정보 조회
@@ -133,6 +194,8 @@ class CampaignService:
             campaign_id: 체험단 ID
             user_id: 사용자 ID (로그인 시)
             user_role: 사용자 역할 (advertiser/influencer/None)
+            advertiser_id: 광고주 ID (세션 등에서 이미 알고 있으면 조회 생략)
+            influencer_id: 인플루언서 ID (세션 등에서 이미 알고 있으면 조회 생략)
 
         Returns:
             CampaignDetailDTO 또는 None
@@ -144,8 +207,10 @@ class CampaignService:
 
         campaign, business_name, business_address = result
 
-        # 지원자 수 조회
-        application_count = self.campaign_repository.get_application_count(campaign_id)
+        # 모집 기간이 지난 체험단은 자동 종료 작업 전이라도 종료로 표시
+        status = campaign.status.value
+        if campaign.is_recruiting() and campaign.is_past_end_date(date.today()):
+            status = CampaignStatus.CLOSED.value
 
         # 로그인 여부
         is_authenticated = user_id is not None
@@ -153,12 +218,15 @@ class CampaignService:
         # 소유자 여부 확인 (광고주 역할인 경우)
         is_owner = False
         if user_role == 'advertiser' and user_id:
-            from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
-            from app.extensions import db
-            advertiser_repo = AdvertiserRepository(db.session)
-            advertiser = advertiser_repo.find_by_user_id(user_id)
-            if advertiser and advertiser.id == campaign.advertiser_id:
-                is_owner = True
+            if advertiser_id is None:
+                advertiser_repo = self.advertiser_repository
+                if advertiser_repo is None:
+                    from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
+                    from app.extensions import db
+                    advertiser_repo = AdvertiserRepository(db.session)
+                advertiser = advertiser_repo.find_by_user_id(user_id)
+                advertiser_id = advertiser.id if advertiser else None
+            is_owner = advertiser_id is not None and advertiser_id == campaign.advertiser_id
 
         # 지원 가능 여부 확인
         can_apply = False
@@ -166,12 +234,14 @@ class CampaignService:
 
         if user_role == 'influencer' and user_id and self.influencer_repository and self.application_repository:
             # 인플루언서 정보 확인
-            influencer = self.influencer_repository.find_by_user_id(user_id)
-            if influencer and campaign.is_recruiting():
+            if influencer_id is None:
+                influencer = self.influencer_repository.find_by_user_id(user_id)
+                influencer_id = influencer.id if influencer else None
+            if influencer_id is not None and status == CampaignStatus.RECRUITING.value:
                 can_apply = True
                 # 중복 지원 확인
                 already_applied = self.application_repository.exists_by_campaign_and_influencer(
-                    campaign_id, influencer.id
+                    campaign_id, influencer_id
                 )
                 if already_applied:
                     can_apply = False
@@ -182,12 +252,12 @@ class CampaignService:
             description=campaign.description,
             image_url=campaign.image_url,
             quota=campaign.quota,
-            application_count=application_count,
+            application_count=campaign.application_count,
             start_date=campaign.start_date,
             end_date=campaign.end_date,
             benefits=campaign.benefits,
             conditions=campaign.conditions,
-            status=campaign.status.value,
+            status=status,
             business_name=business_name,
             business_address=business_address,
             can_apply=can_apply,
@@ -195,51 +265,227 @@ class CampaignService:
             advertiser_id=campaign.advertiser_id,
             is_owner=is_owner,
             user_role=user_role,
-            is_authenticated=is_authenticated
+            is_authenticated=is_authenticated,
+            image_thumbnail_url=image_thumbnail_url(campaign.image_variants),
+            image_srcset=image_srcset(campaign.image_variants)
         )
 
     def list_recruiting_campaigns(
-        self, page: int = 1, per_page: int = 12, sort: str = 'latest'
-    ) -> Tuple[List[CampaignListItemDTO], int]:
+        self,
+        page: int = 1,
+        per_page: int = 12,
+        sort: str = 'latest',
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[CampaignListItemDTO], int, Optional[str]]:
         """
         모집 중인 체험단 목록 조회
 
+        목록과 총 개수를 한 쿼리(count(*) OVER ())로 조회합니다.
+        캐시가 설정된 경우 (page, per_page, sort, filters) 단위로 결과를 캐시하며,
+        체험단 생성/종료/선정/지원이 커밋되면 무효화됩니다.
+
         Args:
             page: 페이지 번호 (1부터 시작)
             per_page: 페이지당 레코드 수
             sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
 
         Returns:
-            (campaigns, total_count) 튜플
+            (campaigns, total_count, next_cursor) 튜플
+            (next_cursor: 다음 페이지를 커서 방식으로 조회하는 커서, 마지막 페이지면 None)
+        """
+        filters = filters or CampaignFilter()
+
+        def load() -> Tuple[List[CampaignListItemDTO], int, Optional[str]]:
+            skip = (page - 1) * per_page
+
+            # 체험단 목록 + 총 개수 조회
+            results, total_count, has_next = self.campaign_repository.find_recruiting_campaigns_page(
+                skip=skip, limit=per_page, sort=sort, with_total=True, filters=filters
+            )
+            return (
+                self._to_list_item_dtos(results),
+                total_count,
+                self._next_page_cursor(results, has_next, sort)
+            )
+
+        if self.cache is None:
+            return load()
+
+        return self.cache.get_or_set(
+            f'recruiting:{sort}:{page}:{per_page}:{filters.cache_key()}',
+            load,
+            tags=(CACHE_TAG_RECRUITING_FEED,)
+        )
+
+    def list_recruiting_campaigns_without_total(
+        self,
+        page: int = 1,
+        per_page: int = 12,
+        sort: str = 'latest',
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[CampaignListItemDTO], bool, Optional[str]]:
+        """
+        모집 중인 체험단 목록 조회 (총 개수 생략)
+
+        총 개수가 필요 없는 화면용으로, COUNT 없이 다음 페이지 여부만 반환합니다.
+
+        Args:
+            page: 페이지 번호 (1부터 시작)
+            per_page: 페이지당 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (campaigns, has_next, next_cursor) 튜플
+            (next_cursor: 다음 페이지를 커서 방식으로 조회하는 커서, 마지막 페이지면 None)
         """
         skip = (page - 1) * per_page
 
-        # 체험단 목록 조회
-        results = self.campaign_repository.find_recruiting_campaigns(
-            skip=skip, limit=per_page, sort=sort
+        results, _, has_next = self.campaign_repository.find_recruiting_campaigns_page(
+            skip=skip, limit=per_page, sort=sort, with_total=False, filters=filters
         )
 
-        # DTO 변환
-        campaign_dtos = [
+        return (self._to_list_item_dtos(results), has_next, self._next_page_cursor(results, has_next, sort))
+
+    def _next_page_cursor(self, results: List, has_next: bool, sort: str) -> Optional[str]:
+        """
+        페이지 번호 목록의 다음 페이지 커서
+
+        '다음' 링크를 커서 방식으로 연결해 깊은 페이지도 OFFSET 없이 조회되도록 합니다.
+
+        Args:
+            results: 현재 페이지 카드 행
+            has_next: 다음 페이지 존재 여부
+            sort: 정렬 기준
+
+        Returns:
+            커서 (다음 페이지가 없으면 None)
+        """
+        if not has_next or not results:
+            return None
+        return self.campaign_repository.encode_sort_cursor(results[-1], sort)
+
+    def list_recruiting_campaigns_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        per_page: int = 12,
+        sort: str = 'latest',
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[CampaignListItemDTO], Optional[str]]:
+        """
+        모집 중인 체험단 목록 조회 (커서 방식)
+
+        Args:
+            cursor: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+            per_page: 페이지당 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (campaigns, next_cursor) 튜플 (마지막 페이지면 next_cursor는 None)
+
+        Raises:
+            ValidationException: 커서 형식이 잘못된 경우
+        """
+        results, next_cursor = self.campaign_repository.find_recruiting_campaigns_by_cursor(
+            cursor=cursor, limit=per_page, sort=sort, filters=filters
+        )
+
+        return (self._to_list_item_dtos(results), next_cursor)
+
+    def get_recruiting_facets(self, filters: Optional[CampaignFilter] = None) -> Dict:
+        """
+        모집 중인 체험단 필터별 개수 조회
+
+        목록과 같은 태그로 캐시하므로 목록이 무효화될 때 함께 무효화됩니다.
+
+        Args:
+            filters: 현재 목록 필터 (optional)
+
+        Returns:
+            {'deadline': {일수: 개수}, 'quota': {구간: 개수}, 'region': {지역: 개수}, 'new': 개수}
+        """
+        filters = filters or CampaignFilter()
+
+        def load() -> Dict:
+            return self.campaign_repository.count_recruiting_facets(filters)
+
+        if self.cache is None:
+            return load()
+
+        return self.cache.get_or_set(
+            f'recruiting-facets:{filters.cache_key()}',
+            load,
+            tags=(CACHE_TAG_RECRUITING_FEED,)
+        )
+
+    def search_campaigns(
+        self,
+        query: str,
+        status: Optional[str] = STATUS_RECRUITING,
+        page: int = 1,
+        per_page: int = 12
+    ) -> Tuple[List[CampaignListItemDTO], int]:
+        """
+        체험단 검색 (제목/설명/혜택/상호명, 관련도순)
+
+        검색어는 한국어 형태소 분석 없이 문자 2-gram으로 나누어 모든 토큰을 포함한 체험단을 찾습니다.
+
+        Args:
+            query: 검색어
+            status: 상태 필터 (RECRUITING, CLOSED, SELECTED, None이면 전체)
+            page: 페이지 번호 (1부터 시작)
+            per_page: 페이지당 레코드 수
+
+        Returns:
+            (campaigns, total_count) 튜플 (검색어에 토큰이 없으면 빈 결과)
+
+        Raises:
+            ValidationException: 지원하지 않는 상태 값
+        """
+        if status is not None and status not in VALID_CAMPAIGN_STATUSES:
+            raise ValidationException(f"Invalid status: {status}")
+
+        results, total_count = self.campaign_repository.search_campaigns(
+            parse_search_query(query),
+            status=status,
+            skip=(max(page, 1) - 1) * per_page,
+            limit=per_page
+        )
+        return (self._to_list_item_dtos(results), total_count)
+
+    @staticmethod
+    def _to_list_item_dtos(
+        rows: List, business_name: Optional[str] = None
+    ) -> List[CampaignListItemDTO]:
+        """
+        카드 행 리스트 → CampaignListItemDTO 리스트
+
+        Args:
+            rows: 저장소의 카드 읽기 모델 행 (description_short는 SQL에서 잘린 값)
+            business_name: 모든 행에 쓸 업체명 (None이면 행의 business_name 사용)
+
+        Returns:
+            CampaignListItemDTO 리스트
+        """
+        return [
             CampaignListItemDTO(
-                id=campaign.id,
-                title=campaign.title,
-                description_short=campaign.description[:100],
-                image_url=campaign.image_url,
-                quota=campaign.quota,
-                application_count=application_count,
-                deadline=campaign.end_date,
-                business_name=business_name,
-                status=campaign.status.value
+                id=row.id,
+                title=row.title,
+                description_short=row.description_short,
+                image_url=row.image_url,
+                quota=row.quota,
+                application_count=row.application_count,
+                deadline=row.end_date,
+                business_name=row.business_name if business_name is None else business_name,
+                status=row.status,
+                image_thumbnail_url=image_thumbnail_url(row.image_variants),
+                image_srcset=image_srcset(row.image_variants)
             )
-            for campaign, business_name, application_count in results
+            for row in rows
         ]
 
-        # 총 개수 조회
-        total_count = self.campaign_repository.count_recruiting_campaigns()
-
-        return (campaign_dtos, total_count)
-
     def close_campaign_early(self, campaign_id: int, advertiser_id: int) -> None:
         """
         체험단 모집 조기종료
@@ -281,18 +527,55 @@ class CampaignService:
         # 저장
         self.campaign_repository.save(campaign)
 
+        # 커밋 시 홈 피드 캐시 무효화
+        if self.cache is not None:
+            self.cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+
+    def close_expired_campaigns(self, today: date, batch_size: int = 500) -> int:
+        """
+        모집 기간이 지난 체험단 자동 종료 (한 배치, 커밋은 호출자가 수행)
+
+        Args:
+            today: 기준일 (종료일이 이 날짜보다 이전이면 종료)
+            batch_size: 배치 크기
+
+        Returns:
+            종료된 체험단 수
+        """
+        from datetime import datetime
+
+        closed = self.campaign_repository.close_expired_campaigns(
+            today, closed_at=datetime.utcnow(), limit=batch_size
+        )
+
+        # 커밋 시 홈 피드 캐시 무효화
+        if closed and self.cache is not None:
+            self.cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+
+        return closed
+
     def get_campaign_applications(
-        self, campaign_id: int, advertiser_id: int
-    ) -> List[dict]:
+        self,
+        campaign_id: int,
+        advertiser_id: int,
+        status: Optional[str] = None,
+        sort: str = 'applied_at',
+        page: int = 1,
+        per_page: Optional[int] = None
+    ) -> Tuple[List[dict], int]:
         """
         체험단의 지원자 목록 조회 (인플루언서 정보 포함)
 
         Args:
             campaign_id: 체험단 ID
             advertiser_id: 광고주 ID (권한 검증용)
+            status: 지원 상태 필터 (None이면 전체)
+            sort: 정렬 기준 ('applied_at', 'follower_count')
+            page: 페이지 번호 (1부터 시작)
+            per_page: 페이지당 레코드 수 (None이면 전체)
 
         Returns:
-            지원자 정보 리스트 (Application + Influencer 정보)
+            (지원자 정보 리스트, 전체 지원자 수) 튜플
 
         Raises:
             CampaignNotFoundException: 체험단이 존재하지 않음
@@ -312,24 +595,8 @@ class CampaignService:
         if campaign.advertiser_id != advertiser_id:
             raise CampaignNotOwnedException("이 체험단에 대한 권한이 없습니다")
 
-        # 지원자 목록 조회
-        applications = self.application_repository.find_by_campaign_id(campaign_id)
-
-        # 인플루언서 정보 포함
-        result = []
-        for application in applications:
-            influencer = self.influencer_repository.find_by_id(application.influencer_id)
-            if influencer:
-                result.append({
-                    "application_id": application.id,
-                    "influencer_id": influencer.id,
-                    "influencer_name": influencer.name,
-                    "channel_name": influencer.channel_name,
-                    "channel_url": influencer.channel_url,
-                    "follower_count": influencer.follower_count,
-                    "application_reason": application.application_reason,
-                    "applied_at": application.applied_at,
-                    "status": application.status,
-                })
-
-        return result
+        # 지원자 목록 조회 (application + influencer JOIN, 단일 쿼리)
+        skip = (max(page, 1) - 1) * per_page if per_page else 0
+        return self.application_repository.find_applicants_by_campaign(
+            campaign_id, status=status, sort=sort, skip=skip, limit=per_page
+        )
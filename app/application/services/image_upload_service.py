@@ -0,0 +1,230 @@
+# app/application/services/image_upload_service.py
+"""
+Image Upload Service
+체험단 대표 이미지 업로드 파이프라인
+
+- 업로드 스트림을 청크 단위로 읽으며 형식(파일 시그니처)과 크기를 검증하고 SHA-256을 계산
+- 내용은 임시 파일에만 기록 (요청 메모리에 전체 파일을 올리지 않음)
+- 저장 키는 내용 해시 기반이므로 같은 이미지를 다시 올리면 기존 파일을 재사용
+- 스토리지 전송은 백그라운드 스레드에서 수행 (체험단 생성 요청은 URL만 받아 바로 응답),
+  실패하면 retries회까지 재시도 (그래도 실패하면 Future에 예외가 남고 호출자가 정리)
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.domain.exceptions.validation_exceptions import InvalidImageException
+from app.infrastructure.external.interfaces.i_storage_provider import IStorageProvider
+from app.shared.constants.upload_constants import (
+    CAMPAIGN_IMAGE_PREFIX,
+    IMAGE_SIGNATURE_LENGTH,
+    IMAGE_SIGNATURES,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StagedImage:
+    """검증을 마치고 임시 파일에 기록된 이미지"""
+    key: str
+    content_type: str
+    size: int
+    sha256: str
+    temp_path: str
+
+
+class ImageUploadService:
+    """이미지 업로드 서비스 (워커 단위 공유)"""
+
+    def __init__(
+        self,
+        storage: IStorageProvider,
+        bucket: str,
+        max_bytes: int = 5 * 1024 * 1024,
+        chunk_size: int = 64 * 1024,
+        max_workers: int = 2,
+        tmp_dir: Optional[str] = None,
+        retries: int = 2,
+        retry_delay: float = 0.5
+    ):
+        """
+        Args:
+            storage: 스토리지 제공자
+            bucket: 버킷 이름
+            max_bytes: 최대 파일 크기(바이트)
+            chunk_size: 읽기 청크 크기(바이트)
+            max_workers: 백그라운드 업로드 스레드 수
+            tmp_dir: 임시 파일 디렉터리 (None이면 시스템 기본값)
+            retries: 전송 실패 시 재시도 횟수
+            retry_delay: 첫 재시도 전 대기 시간(초, 재시도마다 두 배)
+        """
+        self.storage = storage
+        self.bucket = bucket
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.tmp_dir = tmp_dir
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-upload')
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def stage(self, stream: BinaryIO) -> StagedImage:
+        """
+        업로드 스트림을 검증하며 임시 파일에 기록
+
+        Args:
+            stream: 업로드 파일 스트림 (FileStorage.stream 등)
+
+        Returns:
+            StagedImage: 저장 키, MIME 타입, 크기, 해시, 임시 파일 경로
+
+        Raises:
+            InvalidImageException: 빈 파일, 지원하지 않는 형식, 최대 크기 초과
+        """
+        digest = hashlib.sha256()
+        size = 0
+        head = b''
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir, prefix='image-upload-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise InvalidImageException(f'최대 {self.max_bytes // (1024 * 1024)}MB까지 업로드할 수 있습니다')
+                    if len(head) < IMAGE_SIGNATURE_LENGTH:
+                        head += chunk[:IMAGE_SIGNATURE_LENGTH - len(head)]
+                        if len(head) >= IMAGE_SIGNATURE_LENGTH:
+                            # 형식이 틀리면 나머지를 읽지 않고 바로 거부
+                            _detect_format(head)
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+
+            if size == 0:
+                raise InvalidImageException('빈 파일입니다')
+            content_type, extension = _detect_format(head)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        sha256 = digest.hexdigest()
+        return StagedImage(
+            key=f'{CAMPAIGN_IMAGE_PREFIX}/{sha256[:2]}/{sha256}.{extension}',
+            content_type=content_type,
+            size=size,
+            sha256=sha256,
+            temp_path=temp_path
+        )
+
+    def upload(self, staged: StagedImage) -> str:
+        """
+        임시 파일을 스토리지로 전송 후 삭제 (이미 같은 키가 있으면 전송 생략, 실패하면 재시도)
+
+        Args:
+            staged: stage 결과
+
+        Returns:
+            str: 파일 URL
+
+        Raises:
+            Exception: 재시도까지 모두 실패한 경우 마지막 전송 예외
+        """
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    return self._transfer(staged)
+                except Exception as e:
+                    if attempt == self.retries:
+                        raise
+                    logger.warning('이미지 업로드 재시도 %d/%d (%s): %s', attempt + 1, self.retries, staged.key, e)
+                    time.sleep(self.retry_delay * (2 ** attempt))
+        finally:
+            os.remove(staged.temp_path)
+
+    def _transfer(self, staged: StagedImage) -> str:
+        if self.storage.exists(self.bucket, staged.key):
+            return self.storage.get_file_url(self.bucket, staged.key)
+        with open(staged.temp_path, 'rb') as stream:
+            return self.storage.upload_stream(self.bucket, staged.key, stream, staged.content_type)
+
+    def is_stored(self, image_url: str) -> bool:
+        """
+        업로드 이미지 URL의 파일이 스토리지에 있는지 확인
+
+        Args:
+            image_url: submit이 반환한 파일 URL
+
+        Returns:
+            bool: 존재 여부 (이 버킷의 체험단 이미지 URL이 아니면 False)
+
+        Raises:
+            Exception: 스토리지 조회 실패 (없는 것으로 간주하지 않음)
+        """
+        path = urlparse(image_url).path
+        marker = f'/{self.bucket}/{CAMPAIGN_IMAGE_PREFIX}/'
+        index = path.find(marker)
+        if index < 0:
+            return False
+        return self.storage.exists(self.bucket, path[index + len(self.bucket) + 2:])
+
+    def submit(self, stream: BinaryIO) -> Tuple[str, Future]:
+        """
+        검증 후 백그라운드 업로드 시작
+
+        같은 내용의 업로드가 진행 중이면 새로 전송하지 않고 진행 중인 작업을 공유합니다.
+
+        Args:
+            stream: 업로드 파일 스트림
+
+        Returns:
+            (파일 URL, 업로드 Future) - URL은 업로드 완료 전에 결정됨
+
+        Raises:
+            InvalidImageException: 빈 파일, 지원하지 않는 형식, 최대 크기 초과
+        """
+        staged = self.stage(stream)
+        url = self.storage.get_file_url(self.bucket, staged.key)
+
+        with self._lock:
+            future = self._in_flight.get(staged.key)
+            if future is not None:
+                os.remove(staged.temp_path)
+                return url, future
+
+            future = self._executor.submit(self.upload, staged)
+            self._in_flight[staged.key] = future
+
+        future.add_done_callback(lambda done, key=staged.key: self._finish(key, done))
+        return url, future
+
+    def _finish(self, key: str, future: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        error = future.exception()
+        if error is not None:
+            logger.error('이미지 업로드 실패 (%s): %s', key, error)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """백그라운드 업로드 스레드 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+def _detect_format(head: bytes) -> Tuple[str, str]:
+    """파일 앞부분 시그니처로 (MIME 타입, 확장자) 판별"""
+    for signature, content_type, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type, extension
+    raise InvalidImageException('jpg, png, gif 이미지만 업로드할 수 있습니다')
@@ -0,0 +1,260 @@
+# app/application/services/image_variant_service.py
+"""
+Image Variant Service
+체험단 대표 이미지의 반응형 변형(썸네일, WebP srcset) 생성
+
+- 변형 키는 원본 키(내용 해시)에서 결정되므로 같은 원본은 항상 같은 변형 키를 가짐
+- 이미 저장된 변형은 다시 만들지 않음 (모두 있으면 원본도 내려받지 않음)
+- 생성은 백그라운드 스레드에서 수행 (원본 업로드 완료를 기다린 뒤 시작)
+- 이미지 처리는 Pillow를 사용 (사용할 때만 import)
+"""
+
+import io
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.infrastructure.external.interfaces.i_storage_provider import IStorageProvider
+from app.shared.constants.upload_constants import (
+    CAMPAIGN_IMAGE_PREFIX,
+    IMAGE_THUMBNAIL_VARIANT,
+    IMAGE_VARIANT_PREFIX,
+    IMAGE_VARIANT_QUALITY,
+    IMAGE_WEBP_VARIANTS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# (원본 데이터, [(이름, 너비, 형식)]) → {이름: 인코딩된 데이터} (원본보다 큰 WebP 너비는 생략 가능)
+VariantRenderer = Callable[[bytes, List[Tuple[str, int, str]]], Dict[str, bytes]]
+
+
+class ImageVariantService:
+    """이미지 변형 생성 서비스 (워커 단위 공유)"""
+
+    def __init__(
+        self,
+        storage: IStorageProvider,
+        bucket: str,
+        max_workers: int = 1,
+        renderer: Optional[VariantRenderer] = None
+    ):
+        """
+        Args:
+            storage: 스토리지 제공자
+            bucket: 버킷 이름 (원본과 변형을 같은 버킷에 저장)
+            max_workers: 백그라운드 생성 스레드 수
+            renderer: 변형 인코더 (None이면 Pillow 사용)
+        """
+        self.storage = storage
+        self.bucket = bucket
+        self.renderer = renderer or render_variants_with_pillow
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-variant')
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def source_key(self, image_url: str) -> Optional[str]:
+        """
+        이미지 URL에서 원본 저장 키 추출
+
+        Args:
+            image_url: 체험단 이미지 URL
+
+        Returns:
+            원본 키 (이 버킷의 체험단 이미지가 아니면 None)
+        """
+        path = urlparse(image_url).path
+        marker = f'/{self.bucket}/{CAMPAIGN_IMAGE_PREFIX}/'
+        index = path.find(marker)
+        if index < 0:
+            return None
+        return path[index + len(self.bucket) + 2:]
+
+    @staticmethod
+    def variant_key(source_key: str, name: str, extension: str) -> str:
+        """
+        원본 키 기준 변형 저장 키
+
+        Args:
+            source_key: 원본 키 (campaigns/ab/abcdef....png)
+            name: 변형 이름
+            extension: 변형 확장자
+
+        Returns:
+            변형 키 (variants/ab/abcdef..../w800.webp)
+        """
+        stem = source_key[len(CAMPAIGN_IMAGE_PREFIX) + 1:].rsplit('.', 1)[0]
+        return f'{IMAGE_VARIANT_PREFIX}/{stem}/{name}.{extension}'
+
+    def generate(self, image_url: str) -> Optional[Dict]:
+        """
+        이미지 변형 생성 (이미 있는 변형은 재사용)
+
+        Args:
+            image_url: 체험단 이미지 URL
+
+        Returns:
+            {'thumbnail': URL, 'webp': {너비(str): URL}} 딕셔너리
+            (외부 URL이라 처리할 수 없으면 None)
+
+        Raises:
+            RuntimeError: Pillow가 설치되지 않은 경우
+            Exception: 스토리지 조회/전송 실패
+        """
+        source_key = self.source_key(image_url)
+        if source_key is None:
+            return None
+
+        specs = [IMAGE_THUMBNAIL_VARIANT] + IMAGE_WEBP_VARIANTS
+        keys = {name: self.variant_key(source_key, name, extension) for name, _, _, _, extension in specs}
+        missing = [spec for spec in specs if not self.storage.exists(self.bucket, keys[spec[0]])]
+        available = {spec[0] for spec in specs} - {spec[0] for spec in missing}
+
+        if missing:
+            source = self.storage.download_file(self.bucket, source_key)
+            rendered = self.renderer(source, [(name, width, image_format) for name, width, image_format, _, _ in missing])
+            for name, _, _, content_type, _ in missing:
+                if name in rendered:
+                    self.storage.upload_stream(self.bucket, keys[name], io.BytesIO(rendered[name]), content_type)
+                    available.add(name)
+
+        thumbnail_name = IMAGE_THUMBNAIL_VARIANT[0]
+        return {
+            'thumbnail': self.storage.get_file_url(self.bucket, keys[thumbnail_name]) if thumbnail_name in available else None,
+            'webp': {
+                str(width): self.storage.get_file_url(self.bucket, keys[name])
+                for name, width, _, _, _ in IMAGE_WEBP_VARIANTS
+                if name in available
+            },
+        }
+
+    def submit(
+        self,
+        image_url: str,
+        wait_for: Optional[Future] = None,
+        on_success: Optional[Callable[[str, Dict], None]] = None
+    ) -> Future:
+        """
+        백그라운드 변형 생성 시작
+
+        같은 이미지의 생성이 진행 중이면 진행 중인 작업을 공유합니다.
+
+        Args:
+            image_url: 체험단 이미지 URL
+            wait_for: 먼저 끝나야 하는 작업 (원본 업로드 Future)
+            on_success: 생성 완료 후 (image_url, variants)로 호출할 콜백 (변형 URL 저장 등)
+
+        Returns:
+            Future (결과는 generate 반환값)
+        """
+        with self._lock:
+            future = self._in_flight.get(image_url)
+            if future is not None:
+                return future
+
+            future = self._executor.submit(self._run, image_url, wait_for, on_success)
+            self._in_flight[image_url] = future
+
+        future.add_done_callback(lambda done, url=image_url: self._finish(url, done))
+        return future
+
+    def _run(
+        self,
+        image_url: str,
+        wait_for: Optional[Future],
+        on_success: Optional[Callable[[str, Dict], None]]
+    ) -> Optional[Dict]:
+        if wait_for is not None:
+            wait_for.result()
+        variants = self.generate(image_url)
+        if variants is not None and on_success is not None:
+            on_success(image_url, variants)
+        return variants
+
+    def _finish(self, image_url: str, future: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(image_url, None)
+        error = future.exception()
+        if error is not None:
+            logger.error('이미지 변형 생성 실패 (%s): %s', image_url, error)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """백그라운드 생성 스레드 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+def image_thumbnail_url(variants: Optional[Dict]) -> Optional[str]:
+    """
+    변형 딕셔너리에서 썸네일 URL 추출
+
+    Args:
+        variants: generate 반환값 (None 가능)
+
+    Returns:
+        썸네일 URL (아직 생성되지 않았으면 None)
+    """
+    return (variants or {}).get('thumbnail')
+
+
+def image_srcset(variants: Optional[Dict]) -> Optional[str]:
+    """
+    변형 딕셔너리 → WebP srcset 문자열
+
+    Args:
+        variants: generate 반환값 (None 가능)
+
+    Returns:
+        "URL 400w, URL 800w" 형식 문자열 (WebP 변형이 없으면 None)
+    """
+    webp = (variants or {}).get('webp') or {}
+    if not webp:
+        return None
+    return ', '.join(f'{webp[width]} {width}w' for width in sorted(webp, key=int))
+
+
+def render_variants_with_pillow(source: bytes, specs: List[Tuple[str, int, str]]) -> Dict[str, bytes]:
+    """
+    Pillow로 변형 인코딩 (비율 유지 축소, 확대하지 않음)
+
+    Args:
+        source: 원본 이미지 데이터
+        specs: [(이름, 너비, Pillow 형식)]
+
+    Returns:
+        {이름: 인코딩된 데이터} (원본보다 큰 WebP 너비는 가장 작은 것 하나만 생성)
+
+    Raises:
+        RuntimeError: Pillow가 설치되지 않은 경우
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        raise RuntimeError('이미지 변형 생성에는 Pillow 패키지가 필요합니다. pip install Pillow')
+
+    with Image.open(io.BytesIO(source)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+
+    rendered: Dict[str, bytes] = {}
+    kept_oversized_webp = False
+    for name, width, image_format in sorted(specs, key=lambda spec: spec[1]):
+        if width > image.width and image_format == 'WEBP':
+            # 원본보다 큰 WebP 너비는 같은 내용의 중복이므로 하나만 생성
+            if kept_oversized_webp:
+                continue
+            kept_oversized_webp = True
+
+        variant = image.copy()
+        variant.thumbnail((width, width * 10), Image.LANCZOS)
+        if image_format == 'JPEG' and variant.mode != 'RGB':
+            variant = variant.convert('RGB')
+        elif variant.mode not in ('RGB', 'RGBA'):
+            variant = variant.convert('RGBA')
+
+        buffer = io.BytesIO()
+        variant.save(buffer, format=image_format, quality=IMAGE_VARIANT_QUALITY, optimize=True)
+        rendered[name] = buffer.getvalue()
+    return rendered
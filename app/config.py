@@ -14,6 +14,27 @@ class Config:
     SUPABASE_URL = os.environ.get('SUPABASE_URL')
     SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
     SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_KEY')
+    # Supabase HTTP 클라이언트 (워커별 공유, keep-alive 연결 풀)
+    SUPABASE_HTTP_TIMEOUT = float(os.environ.get('SUPABASE_HTTP_TIMEOUT', 10))
+    SUPABASE_HTTP_CONNECT_TIMEOUT = float(os.environ.get('SUPABASE_HTTP_CONNECT_TIMEOUT', 5))
+    SUPABASE_HTTP_MAX_CONNECTIONS = int(os.environ.get('SUPABASE_HTTP_MAX_CONNECTIONS', 10))
+    SUPABASE_HTTP_MAX_KEEPALIVE = int(os.environ.get('SUPABASE_HTTP_MAX_KEEPALIVE', 5))
+    SUPABASE_HTTP_KEEPALIVE_EXPIRY = float(os.environ.get('SUPABASE_HTTP_KEEPALIVE_EXPIRY', 30))
+    # Access Token 로컬 검증 (HS256 프로젝트는 JWT secret, 비대칭 키 프로젝트는 JWKS 자동 조회)
+    SUPABASE_JWT_SECRET = os.environ.get('SUPABASE_JWT_SECRET')
+    SUPABASE_JWT_AUDIENCE = os.environ.get('SUPABASE_JWT_AUDIENCE', 'authenticated')
+    SUPABASE_JWT_LEEWAY = int(os.environ.get('SUPABASE_JWT_LEEWAY', 10))
+    SUPABASE_JWKS_CACHE_TTL = int(os.environ.get('SUPABASE_JWKS_CACHE_TTL', 600))
+    # 만료까지 남은 시간이 이 값(초) 이하이면 요청 안에서 토큰 갱신
+    SUPABASE_TOKEN_REFRESH_MARGIN = int(os.environ.get('SUPABASE_TOKEN_REFRESH_MARGIN', 60))
+    # 인증 호출 장애 대응: 호출별 제한 시간(초, 재시도 포함) / 로그인 재시도 횟수 / 재시도 기본 대기(초)
+    AUTH_CALL_DEADLINE = float(os.environ.get('AUTH_CALL_DEADLINE', 8))
+    AUTH_MAX_RETRIES = int(os.environ.get('AUTH_MAX_RETRIES', 2))
+    AUTH_RETRY_BACKOFF = float(os.environ.get('AUTH_RETRY_BACKOFF', 0.2))
+    AUTH_CALL_MAX_WORKERS = int(os.environ.get('AUTH_CALL_MAX_WORKERS', 4))
+    # 연속 실패 몇 번이면 회로를 열지 / 열린 뒤 몇 초 후 시험 호출할지
+    AUTH_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('AUTH_BREAKER_FAILURE_THRESHOLD', 5))
+    AUTH_BREAKER_RESET_TIMEOUT = float(os.environ.get('AUTH_BREAKER_RESET_TIMEOUT', 30))
 
     # 데이터베이스 설정 (SQLAlchemy - 로컬 개발용)
     # Render는 postgres:// 로 제공하지만 SQLAlchemy는 postgresql:// 필요
@@ -23,6 +44,66 @@ class Config:
     SQLALCHEMY_DATABASE_URI = database_url
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # 커넥션 풀 설정 (SQLite에는 pre-ping만 적용)
+    # 워커 수 × (DB_POOL_SIZE + DB_MAX_OVERFLOW) ≤ DB 최대 연결 수가 되도록 설정
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 5))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+    # Render 유휴 후 끊긴 연결 재사용 방지 (Supabase pooler 유휴 제한보다 짧게)
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 300))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() != 'false'
+    # Supabase Transaction Pooler(6543) 등 PgBouncer transaction 모드 사용 시 true (앱 측 풀 비활성화)
+    DB_PGBOUNCER_TRANSACTION_MODE = os.environ.get('DB_PGBOUNCER_TRANSACTION_MODE', 'false').lower() == 'true'
+    # 커넥션 획득 대기 경고 기준(ms) / 풀 상태 로그 주기(초, 0이면 비활성화)
+    DB_POOL_SLOW_CHECKOUT_MS = int(os.environ.get('DB_POOL_SLOW_CHECKOUT_MS', 100))
+    DB_POOL_LOG_INTERVAL = int(os.environ.get('DB_POOL_LOG_INTERVAL', 60))
+
+    # 읽기 복제본 (선택, 쉼표로 구분) - 조회 전용 Repository 메서드가 복제본을 사용
+    SQLALCHEMY_REPLICA_URIS = [
+        url.strip().replace('postgres://', 'postgresql://', 1)
+        for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',')
+        if url.strip()
+    ]
+    # 쓰기 커밋 후 해당 사용자의 조회를 primary로 고정하는 시간(초)
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+
+    # 세션에 저장한 역할/광고주·인플루언서 ID를 DB에서 다시 확인하는 주기(초, 0이면 만료 없음)
+    SESSION_IDENTITY_TTL = int(os.environ.get('SESSION_IDENTITY_TTL', 300))
+
+    # 홈 피드 총 개수 표시 여부 (false면 COUNT 없이 이전/다음 페이지만 표시)
+    HOME_FEED_EXACT_TOTAL = os.environ.get('HOME_FEED_EXACT_TOTAL', 'true').lower() != 'false'
+
+    # 캐시 설정 (CACHE_BACKEND: memory | redis)
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    HOME_FEED_CACHE_TTL = int(os.environ.get('HOME_FEED_CACHE_TTL', 60))
+    # user_loader 캐시 (워커별, 0이면 매 요청 조회)
+    USER_LOADER_CACHE_TTL = int(os.environ.get('USER_LOADER_CACHE_TTL', 30))
+    USER_LOADER_CACHE_MAX_ENTRIES = int(os.environ.get('USER_LOADER_CACHE_MAX_ENTRIES', 4096))
+
+    # 파일 스토리지 (STORAGE_BACKEND: supabase | local)
+    STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'supabase')
+    # local 백엔드 저장 위치 (기본값: instance/uploads)
+    LOCAL_STORAGE_ROOT = os.environ.get('LOCAL_STORAGE_ROOT')
+    # 체험단 대표 이미지 업로드 (버킷 / 최대 크기 / 읽기 청크 크기 / 백그라운드 업로드 스레드 수 / 전송 재시도 횟수)
+    IMAGE_UPLOAD_BUCKET = os.environ.get('IMAGE_UPLOAD_BUCKET', 'campaign-images')
+    IMAGE_UPLOAD_MAX_BYTES = int(os.environ.get('IMAGE_UPLOAD_MAX_BYTES', 5 * 1024 * 1024))
+    IMAGE_UPLOAD_CHUNK_SIZE = int(os.environ.get('IMAGE_UPLOAD_CHUNK_SIZE', 64 * 1024))
+    IMAGE_UPLOAD_WORKERS = int(os.environ.get('IMAGE_UPLOAD_WORKERS', 2))
+    IMAGE_UPLOAD_TMP_DIR = os.environ.get('IMAGE_UPLOAD_TMP_DIR')
+    IMAGE_UPLOAD_RETRIES = int(os.environ.get('IMAGE_UPLOAD_RETRIES', 2))
+    # 반응형 이미지 변형(썸네일/WebP) 백그라운드 생성 여부 / 생성 스레드 수 (Pillow 필요)
+    IMAGE_VARIANTS_ENABLED = os.environ.get('IMAGE_VARIANTS_ENABLED', 'true').lower() == 'true'
+    IMAGE_VARIANT_WORKERS = int(os.environ.get('IMAGE_VARIANT_WORKERS', 1))
+
+    # 모집 기간이 지난 체험단 자동 종료 (배치 크기 / --watch 실행 간격(초))
+    CAMPAIGN_SWEEP_BATCH_SIZE = int(os.environ.get('CAMPAIGN_SWEEP_BATCH_SIZE', 500))
+    CAMPAIGN_SWEEP_INTERVAL = int(os.environ.get('CAMPAIGN_SWEEP_INTERVAL', 300))
+
+    # 운영 지표 엔드포인트(/metrics/*) 노출 여부
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'
+
     # CORS 설정
     CORS_HEADERS = 'Content-Type'
 
@@ -37,9 +118,11 @@ class ProductionConfig(Config):
     """프로덕션 환경 설정"""
     DEBUG = False
     TESTING = False
+    DB_POOL_PRE_PING = True
 
 
 class TestingConfig(Config):
     """테스트 환경 설정"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    DB_POOL_LOG_INTERVAL = 0
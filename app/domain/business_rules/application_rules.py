@@ -2,6 +2,7 @@
 Application Business Rules (체험단 지원 비즈니스 규칙)
 """
 
+from datetime import date
 from typing import Tuple, Optional
 from app.domain.entities.campaign import Campaign
 from app.domain.entities.influencer import Influencer
@@ -35,6 +36,10 @@ class ApplicationRules:
         if not campaign.is_recruiting():
             return False, "모집이 종료된 체험단입니다"
 
+        # 모집 기간 검증 (자동 종료 작업이 아직 상태를 바꾸지 않은 경우)
+        if campaign.is_past_end_date(date.today()):
+            return False, "모집이 종료된 체험단입니다"
+
         # 중복 지원 검증
         if already_applied:
             return False, "이미 지원한 체험단입니다"
@@ -5,7 +5,7 @@ from datetime import datetime, date
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Advertiser:
     """
     광고주 도메인 엔티티
@@ -12,7 +12,8 @@ from app.shared.constants.campaign_constants import (
 )
 
 
-@dataclass
+# 지원자 목록/지원 내역에서 대량 생성되므로 frozen 미사용 (frozen __init__은 필드마다 object.__setattr__ 호출)
+@dataclass(slots=True)
 class Application:
     """체험단 지원 도메인 엔티티"""
 
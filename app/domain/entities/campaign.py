@@ -7,7 +7,7 @@ Campaign 도메인 엔티티
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
 
 class CampaignStatus(Enum):
@@ -17,7 +17,8 @@ class CampaignStatus(Enum):
     SELECTED = 'SELECTED'  # 선정 완료
 
 
-@dataclass
+# 모집 종료/선정 완료 시 status/closed_at을 바꾸므로 frozen 미사용
+@dataclass(slots=True)
 class Campaign:
     """체험단 도메인 엔티티"""
     id: Optional[int]
@@ -33,11 +34,17 @@ class Campaign:
     status: CampaignStatus
     created_at: datetime
     closed_at: Optional[datetime]
+    application_count: int = 0
+    image_variants: Optional[Dict] = None  # 반응형 이미지 변형 URL (썸네일, WebP srcset)
 
     def is_recruiting(self) -> bool:
         """모집 중인지 확인"""
         return self.status == CampaignStatus.RECRUITING
 
+    def is_past_end_date(self, today: date) -> bool:
+        """모집 기간(종료일 포함)이 지났는지 확인 (자동 종료 전이라도 모집 중으로 보지 않음)"""
+        return self.end_date < today
+
     def is_selected(self) -> bool:
         """선정 완료 상태인지 확인"""
         return self.status == CampaignStatus.SELECTED
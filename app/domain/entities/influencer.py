@@ -6,7 +6,7 @@ from datetime import date, datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Influencer:
     """인플루언서 도메인 엔티티"""
     id: Optional[int]
@@ -8,6 +8,7 @@ from app.domain.exceptions.base import DomainException
 from app.domain.exceptions.validation_exceptions import (
     InvalidBusinessNumberException,
     InvalidEmailException,
+    InvalidImageException,
     InvalidPhoneNumberException,
     ValidationException,
 )
@@ -35,6 +36,7 @@ __all__ = [
     "InvalidEmailException",
     "InvalidPhoneNumberException",
     "InvalidBusinessNumberException",
+    "InvalidImageException",
     # Auth Exceptions
     "AuthException",
     "InvalidCredentialsException",
@@ -39,6 +39,41 @@ class InvalidCredentialsException(AuthException):
         super().__init__(message=message)
 
 
+class InvalidTokenException(AuthException):
+    """
+    유효하지 않은 토큰 예외
+
+    Access Token의 서명 불일치, 만료, 형식 오류 또는 토큰 갱신 실패 시 발생
+
+    HTTP Status Code: 401 Unauthorized
+    """
+
+    def __init__(self):
+        """InvalidTokenException 초기화"""
+        message = "Invalid or expired token"
+        super().__init__(message=message)
+
+
+class AuthProviderUnavailableException(DomainException):
+    """
+    인증 서버 사용 불가 예외
+
+    인증 서버(Supabase Auth)가 응답하지 않거나(시간 초과, 연결 실패, 5xx)
+    회로 차단기가 열려 호출을 즉시 거부한 경우 발생
+
+    HTTP Status Code: 503 Service Unavailable
+    """
+
+    def __init__(self, reason: str = "Authentication service unavailable"):
+        """
+        AuthProviderUnavailableException 초기화
+
+        Args:
+            reason: 사용 불가 사유
+        """
+        super().__init__(message=reason, http_status_code=503)
+
+
 class EmailAlreadyExistsException(DomainException):
     """
     이메일 중복 예외
@@ -79,3 +79,25 @@ class InvalidBusinessNumberException(ValidationException):
         """
         message = f"Invalid business number: {business_number}"
         super().__init__(message=message)
+
+
+class InvalidImageException(ValidationException):
+    """
+    업로드 이미지 검증 실패 예외
+
+    지원하지 않는 형식이거나 최대 크기를 초과한 경우 발생
+
+    Args:
+        reason: 실패 사유
+    """
+
+    def __init__(self, reason: str):
+        """
+        InvalidImageException 초기화
+
+        Args:
+            reason: 실패 사유
+        """
+        self.reason = reason
+        message = f"Invalid image: {reason}"
+        super().__init__(message=message)
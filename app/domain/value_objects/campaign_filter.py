@@ -0,0 +1,99 @@
+"""CampaignFilter Value Object"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from app.domain.exceptions import ValidationException
+from app.shared.constants.campaign_constants import DEADLINE_WINDOW_DAYS, QUOTA_RANGES, REGIONS
+
+
+@dataclass(frozen=True)
+class CampaignFilter:
+    """
+    모집 중 체험단 목록 필터 값 객체 (불변)
+
+    Attributes:
+        deadline_days: N일 이내 마감 (DEADLINE_WINDOW_DAYS 중 하나)
+        quota_range: 모집 인원 구간 이름 (QUOTA_RANGES 중 하나)
+        region: 지역 (REGIONS 중 하나)
+        new_only: 신규 오픈 체험단만 (NEW_CAMPAIGN_DAYS 이내 등록)
+    """
+
+    deadline_days: Optional[int] = None
+    quota_range: Optional[str] = None
+    region: Optional[str] = None
+    new_only: bool = False
+
+    def __post_init__(self):
+        """
+        Raises:
+            ValidationException: 지원하지 않는 필터 값
+        """
+        if self.deadline_days is not None and self.deadline_days not in DEADLINE_WINDOW_DAYS:
+            raise ValidationException(f"Invalid deadline window: {self.deadline_days}")
+        if self.quota_range is not None and self.quota_range not in [name for name, _, _ in QUOTA_RANGES]:
+            raise ValidationException(f"Invalid quota range: {self.quota_range}")
+        if self.region is not None and self.region not in REGIONS:
+            raise ValidationException(f"Invalid region: {self.region}")
+
+    @classmethod
+    def from_params(cls, params) -> "CampaignFilter":
+        """
+        쿼리 파라미터 → 필터 (빈 값은 필터 없음)
+
+        Args:
+            params: deadline, quota, region, new 키를 가진 매핑 (request.args 등)
+
+        Returns:
+            CampaignFilter
+
+        Raises:
+            ValidationException: 지원하지 않는 필터 값
+        """
+        deadline = params.get("deadline") or None
+        if deadline is not None:
+            try:
+                deadline = int(deadline)
+            except (TypeError, ValueError):
+                raise ValidationException(f"Invalid deadline window: {deadline}")
+
+        return cls(
+            deadline_days=deadline,
+            quota_range=params.get("quota") or None,
+            region=params.get("region") or None,
+            new_only=params.get("new") in ("1", "true", "on"),
+        )
+
+    @property
+    def quota_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        """모집 인원 구간의 (최소, 최대) (최대가 None이면 상한 없음)"""
+        for name, minimum, maximum in QUOTA_RANGES:
+            if name == self.quota_range:
+                return minimum, maximum
+        return None
+
+    def is_empty(self) -> bool:
+        """적용된 필터가 없는지 여부"""
+        return self == CampaignFilter()
+
+    def to_params(self) -> Dict[str, str]:
+        """
+        필터 → 쿼리 파라미터 (from_params의 역, 적용된 필터만)
+
+        Returns:
+            {'deadline': '7', 'quota': '1-5', 'region': '서울', 'new': '1'} 형식 딕셔너리
+        """
+        params = {}
+        if self.deadline_days is not None:
+            params["deadline"] = str(self.deadline_days)
+        if self.quota_range is not None:
+            params["quota"] = self.quota_range
+        if self.region is not None:
+            params["region"] = self.region
+        if self.new_only:
+            params["new"] = "1"
+        return params
+
+    def cache_key(self) -> str:
+        """캐시 키 조각 (같은 필터는 같은 키)"""
+        return f"{self.deadline_days or ''}:{self.quota_range or ''}:{self.region or ''}:{int(self.new_only)}"
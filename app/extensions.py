@@ -6,9 +6,10 @@ from flask_migrate import Migrate
 from flask_login import LoginManager
 from flask_cors import CORS
 from flask_wtf.csrf import CSRFProtect
+from app.infrastructure.persistence.routing_session import RoutingSession
 
-# SQLAlchemy 인스턴스
-db = SQLAlchemy()
+# SQLAlchemy 인스턴스 (읽기 복제본 라우팅 세션 사용)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Flask-Migrate 인스턴스
 migrate = Migrate()
@@ -24,9 +25,9 @@ login_manager.login_message = '로그인이 필요합니다.'
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Flask-Login user_loader"""
-    from app.infrastructure.persistence.models.user_model import User
-    return User.query.get(user_id)
+    """Flask-Login user_loader (id/email/role만 담은 UserPrincipal, TTL 캐시)"""
+    from app.infrastructure.cache.user_principal_cache import get_user_principal
+    return get_user_principal(user_id)
 
 
 # CORS 설정
@@ -0,0 +1 @@
+"""Cache 패키지"""
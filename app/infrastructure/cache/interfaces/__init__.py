@@ -0,0 +1 @@
+"""Cache Interfaces 패키지"""
@@ -0,0 +1,71 @@
+"""
+Cache Backend Interface
+Infrastructure Layer - Cache Interface
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class ICacheBackend(ABC):
+    """캐시 저장소 인터페이스 (키-값 + 원자적 카운터)"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        값 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Any]: 저장된 값 (없거나 만료되면 None)
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        값 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간(초), None이면 만료 없음
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        값 삭제
+
+        Args:
+            key: 캐시 키
+        """
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """
+        정수 카운터 원자적 증가 (없으면 0에서 시작)
+
+        Args:
+            key: 카운터 키
+
+        Returns:
+            int: 증가 후 값
+        """
+        pass
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """
+        정수 카운터 조회
+
+        Args:
+            key: 카운터 키
+
+        Returns:
+            int: 현재 값 (없으면 0)
+        """
+        pass
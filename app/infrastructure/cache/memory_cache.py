@@ -0,0 +1,68 @@
+"""
+In-process LRU 캐시 백엔드
+Infrastructure Layer - Cache
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.infrastructure.cache.interfaces.i_cache_backend import ICacheBackend
+
+
+class LRUCacheBackend(ICacheBackend):
+    """
+    프로세스 내부 LRU 캐시
+
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    워커 프로세스마다 별도로 유지되므로 여러 워커 간 공유가 필요하면
+    RedisCacheBackend를 사용합니다.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries: 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # 카운터(태그 버전)는 LRU 제거 대상에서 제외 (제거 후 0으로 돌아가면 무효화된 항목이 되살아남)
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,71 @@
+"""
+Redis 호환 공유 캐시 백엔드
+Infrastructure Layer - Cache
+"""
+import pickle
+from typing import Any, Optional
+
+from app.infrastructure.cache.interfaces.i_cache_backend import ICacheBackend
+
+
+class RedisCacheBackend(ICacheBackend):
+    """
+    Redis 호환 클라이언트 기반 공유 캐시
+
+    get/set(ex=)/delete/incr 명령만 사용하므로 redis-py 클라이언트뿐 아니라
+    같은 메서드를 제공하는 호환 구현(로컬 개발용 대체 서버 등)도 사용할 수 있습니다.
+    값은 pickle로 직렬화합니다.
+    """
+
+    def __init__(self, client, prefix: str = 'bungae:'):
+        """
+        Args:
+            client: Redis 호환 클라이언트
+            prefix: 키 접두사
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = 'bungae:') -> 'RedisCacheBackend':
+        """
+        URL로 redis-py 클라이언트를 생성하여 백엔드 반환
+
+        Args:
+            url: Redis URL (예: redis://localhost:6379/0)
+            prefix: 키 접두사
+
+        Returns:
+            RedisCacheBackend
+
+        Raises:
+            RuntimeError: redis 패키지가 설치되지 않은 경우
+        """
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('CACHE_BACKEND=redis 사용 시 redis 패키지를 설치해야 합니다.')
+
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def _key(self, key: str) -> str:
+        return f'{self.prefix}{key}'
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return None
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(self._key(key), pickle.dumps(value), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self._key(key)))
+
+    def get_counter(self, key: str) -> int:
+        raw = self.client.get(self._key(key))
+        return int(raw) if raw is not None else 0
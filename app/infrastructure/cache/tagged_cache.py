@@ -0,0 +1,248 @@
+"""
+태그 기반 무효화 캐시
+Infrastructure Layer - Cache
+
+항목을 저장할 때 태그의 현재 버전을 키에 포함하고, 태그를 무효화할 때는
+버전만 증가시킵니다. 이전 버전 키의 항목은 더 이상 조회되지 않으며
+TTL 만료 또는 LRU 제거로 정리됩니다. 따라서 백엔드는 키-값과 카운터만
+지원하면 됩니다.
+
+읽기 복제본을 쓰는 경우, 무효화 직후(fresh_window초 이내)의 재적재는
+fresh_reads 블록 안에서 실행하여 아직 복제되지 않은 이전 데이터가
+TTL 동안 캐시에 고정되지 않도록 합니다.
+"""
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Iterable, Optional
+
+from flask import Flask, current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.infrastructure.cache.interfaces.i_cache_backend import ICacheBackend
+
+
+_PENDING_TAGS_KEY = 'pending_cache_invalidations'
+
+
+class TaggedCache:
+    """태그 기반 무효화 + 적중률 통계를 제공하는 캐시"""
+
+    def __init__(
+        self,
+        backend: ICacheBackend,
+        namespace: str = 'cache',
+        default_ttl: Optional[int] = None,
+        session_provider: Optional[Callable[[], Session]] = None,
+        fresh_window: int = 0,
+        fresh_reads: Optional[Callable[[], ContextManager]] = None
+    ):
+        """
+        Args:
+            backend: 캐시 백엔드
+            namespace: 키 네임스페이스
+            default_ttl: 기본 만료 시간(초)
+            session_provider: 현재 DB 세션 반환 함수 (커밋 시 무효화용, 없으면 즉시 무효화)
+            fresh_window: 무효화 후 loader를 fresh_reads 안에서 실행할 시간(초, 복제 지연 허용치)
+            fresh_reads: 최신 데이터 조회 블록 생성 함수 (예: primary 고정, None이면 사용 안 함)
+        """
+        self.backend = backend
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self.session_provider = session_provider
+        self.fresh_window = fresh_window
+        self.fresh_reads = fresh_reads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.namespace}:tag:{tag}'
+
+    def _invalidated_at_key(self, tag: str) -> str:
+        return f'{self.namespace}:tag-invalidated-at:{tag}'
+
+    def _recently_invalidated(self, tags: Iterable[str]) -> bool:
+        """태그 중 하나라도 fresh_window 이내에 무효화되었는지 확인"""
+        if not self.fresh_window or self.fresh_reads is None:
+            return False
+        return any(self.backend.get(self._invalidated_at_key(tag)) is not None for tag in tags)
+
+    def _entry_key(self, key: str, tags: Iterable[str]) -> str:
+        versions = ','.join(
+            f'{tag}={self.backend.get_counter(self._tag_key(tag))}' for tag in sorted(tags)
+        )
+        return f'{self.namespace}:{key}|{versions}'
+
+    def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        캐시 조회, 없으면 loader 결과를 저장 후 반환
+
+        Args:
+            key: 캐시 키
+            loader: 캐시 미스 시 값을 생성하는 함수
+            tags: 무효화 태그
+            ttl: 만료 시간(초), None이면 default_ttl
+
+        Returns:
+            캐시된 값 또는 loader 결과
+        """
+        tags = tuple(tags)
+        entry_key = self._entry_key(key, tags)
+        value = self.backend.get(entry_key)
+        if value is not None:
+            self._record(hit=True)
+            return value
+
+        self._record(hit=False)
+        if self._recently_invalidated(tags):
+            # 방금 커밋된 쓰기가 복제본에 아직 없을 수 있으므로 최신 데이터로 재적재
+            with self.fresh_reads():
+                value = loader()
+        else:
+            value = loader()
+        if value is not None:
+            self.backend.set(entry_key, value, ttl if ttl is not None else self.default_ttl)
+        return value
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        태그 즉시 무효화
+
+        Args:
+            tags: 무효화할 태그
+        """
+        for tag in tags:
+            self.backend.incr(self._tag_key(tag))
+            if self.fresh_window:
+                self.backend.set(self._invalidated_at_key(tag), time.time(), self.fresh_window)
+        with self._lock:
+            self.invalidations += len(tags)
+
+    def invalidate_on_commit(self, *tags: str) -> None:
+        """
+        현재 트랜잭션이 커밋되면 태그 무효화 (롤백 시 취소)
+
+        session_provider가 없으면 즉시 무효화합니다.
+
+        Args:
+            tags: 무효화할 태그
+        """
+        if self.session_provider is None:
+            self.invalidate(*tags)
+            return
+
+        session = self.session_provider()
+        pending = session.info.setdefault(_PENDING_TAGS_KEY, {})
+        pending.setdefault(id(self), (self, set()))[1].update(tags)
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {'hits', 'misses', 'hit_ratio', 'invalidations'} 딕셔너리
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'invalidations': self.invalidations,
+            }
+
+
+@event.listens_for(Session, 'after_commit')
+def _flush_pending_invalidations(session: Session) -> None:
+    """커밋 완료 후 대기 중인 태그 무효화 실행"""
+    pending = session.info.pop(_PENDING_TAGS_KEY, None)
+    if not pending:
+        return
+    for cache, tags in pending.values():
+        cache.invalidate(*tags)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_pending_invalidations(session: Session, previous_transaction) -> None:
+    """최상위 트랜잭션 롤백 시 대기 중인 태그 무효화 취소"""
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_TAGS_KEY, None)
+
+
+def create_cache_backend(config: Dict[str, Any]) -> ICacheBackend:
+    """
+    설정에 따라 캐시 백엔드 생성
+
+    Args:
+        config: Flask 설정 (CACHE_BACKEND, CACHE_REDIS_URL, CACHE_MAX_ENTRIES)
+
+    Returns:
+        ICacheBackend
+
+    Raises:
+        ValueError: 지원하지 않는 CACHE_BACKEND 값
+    """
+    backend_name = config.get('CACHE_BACKEND', 'memory')
+
+    if backend_name == 'memory':
+        from app.infrastructure.cache.memory_cache import LRUCacheBackend
+        return LRUCacheBackend(max_entries=config.get('CACHE_MAX_ENTRIES', 1024))
+
+    if backend_name == 'redis':
+        from app.infrastructure.cache.redis_cache import RedisCacheBackend
+        url = config.get('CACHE_REDIS_URL')
+        if not url:
+            raise ValueError('CACHE_BACKEND=redis 사용 시 CACHE_REDIS_URL이 설정되어야 합니다.')
+        return RedisCacheBackend.from_url(url)
+
+    raise ValueError(f'지원하지 않는 CACHE_BACKEND: {backend_name}')
+
+
+def init_cache(app: Flask) -> None:
+    """
+    앱 캐시 초기화 (app.extensions['feed_cache'])
+
+    Args:
+        app: Flask 앱
+    """
+    from app.extensions import db
+    from app.infrastructure.persistence.routing_session import primary_reads
+
+    # 복제본 사용 시: 무효화 후 복제 지연 시간(REPLICA_STICKY_SECONDS) 동안의 재적재는 primary에서 조회
+    fresh_window = (
+        app.config.get('REPLICA_STICKY_SECONDS', 0) if app.config.get('SQLALCHEMY_REPLICA_URIS') else 0
+    )
+
+    app.extensions['feed_cache'] = TaggedCache(
+        create_cache_backend(app.config),
+        namespace='feed',
+        default_ttl=app.config.get('HOME_FEED_CACHE_TTL', 60),
+        session_provider=lambda: db.session(),
+        fresh_window=fresh_window,
+        fresh_reads=lambda: primary_reads(db.session)
+    )
+
+
+def get_feed_cache() -> Optional[TaggedCache]:
+    """
+    현재 앱의 피드 캐시 반환
+
+    Returns:
+        TaggedCache 또는 None (초기화되지 않은 경우)
+    """
+    return current_app.extensions.get('feed_cache')
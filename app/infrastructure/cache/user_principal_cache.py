@@ -0,0 +1,200 @@
+"""
+Flask-Login user_loader 캐시
+Infrastructure Layer - Cache
+
+인증된 요청마다 UserModel 전체를 조회하는 대신 id/email/role만 담은
+UserPrincipal을 짧은 TTL로 캐시합니다.
+
+- UserRepository.save 시 해당 사용자 항목을 무효화
+- 캐시는 워커 프로세스별로 유지되므로 다른 워커의 항목은 TTL이 지나면 갱신
+- USER_LOADER_CACHE_TTL=0 이면 캐시 없이 매 요청 조회
+"""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from flask import Flask, current_app, has_app_context
+
+from app.infrastructure.cache.memory_cache import LRUCacheBackend
+
+
+class UserPrincipal:
+    """
+    current_user로 사용하는 경량 사용자 정보 (Flask-Login 사용자 인터페이스 구현)
+
+    ORM 인스턴스가 아니므로 세션과 무관하게 캐시/재사용할 수 있습니다.
+    """
+
+    __slots__ = ('id', 'email', 'role')
+
+    is_authenticated = True
+    is_active = True
+    is_anonymous = False
+
+    def __init__(self, id: str, email: str, role: Optional[str]):
+        self.id = id
+        self.email = email
+        self.role = role
+
+    def get_id(self) -> str:
+        return str(self.id)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UserPrincipal):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f'<UserPrincipal id={self.id} email={self.email} role={self.role}>'
+
+
+class UserPrincipalCache:
+    """사용자 ID → UserPrincipal TTL 캐시"""
+
+    def __init__(self, ttl: int = 30, max_entries: int = 4096):
+        """
+        Args:
+            ttl: 만료 시간(초), 0이면 캐시하지 않음
+            max_entries: 최대 항목 수 (LRU 제거)
+        """
+        self.ttl = ttl
+        self.backend = LRUCacheBackend(max_entries=max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f'user:{user_id}'
+
+    def get(self, user_id: str, loader: Callable[[str], Optional[UserPrincipal]]) -> Optional[UserPrincipal]:
+        """
+        캐시 조회, 없으면 loader 결과 저장 후 반환 (존재하지 않는 사용자는 캐시하지 않음)
+
+        Args:
+            user_id: 사용자 ID
+            loader: 캐시 미스 시 UserPrincipal을 조회하는 함수
+
+        Returns:
+            UserPrincipal 또는 None
+        """
+        if self.ttl > 0:
+            principal = self.backend.get(self._key(user_id))
+            if principal is not None:
+                self._record(hit=True)
+                return principal
+
+        self._record(hit=False)
+        principal = loader(user_id)
+        if principal is not None and self.ttl > 0:
+            self.backend.set(self._key(user_id), principal, self.ttl)
+        return principal
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        사용자 항목 무효화
+
+        Args:
+            user_id: 사용자 ID
+        """
+        self.backend.delete(self._key(user_id))
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {'hits', 'misses', 'hit_ratio'} 딕셔너리
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def load_user_principal(user_id: str) -> Optional[UserPrincipal]:
+    """
+    DB에서 UserPrincipal 조회 (id, email, role 컬럼만 조회)
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        UserPrincipal 또는 None
+    """
+    from app.extensions import db
+    from app.infrastructure.persistence.models.user_model import UserModel
+
+    row = (
+        db.session.query(UserModel.id, UserModel.email, UserModel.role)
+        .filter(UserModel.id == user_id)
+        .first()
+    )
+    if row is None:
+        return None
+    return UserPrincipal(id=row.id, email=row.email, role=row.role)
+
+
+def init_user_principal_cache(app: Flask) -> None:
+    """
+    user_loader 캐시 초기화 (app.extensions['user_principal_cache'])
+
+    Args:
+        app: Flask 앱
+    """
+    app.extensions['user_principal_cache'] = UserPrincipalCache(
+        ttl=app.config.get('USER_LOADER_CACHE_TTL', 30),
+        max_entries=app.config.get('USER_LOADER_CACHE_MAX_ENTRIES', 4096)
+    )
+
+
+def get_user_principal_cache() -> Optional[UserPrincipalCache]:
+    """
+    현재 앱의 user_loader 캐시 반환
+
+    Returns:
+        UserPrincipalCache 또는 None (초기화되지 않은 경우)
+    """
+    return current_app.extensions.get('user_principal_cache')
+
+
+def get_user_principal(user_id: str) -> Optional[UserPrincipal]:
+    """
+    user_loader용 UserPrincipal 조회 (캐시 사용)
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        UserPrincipal 또는 None
+    """
+    cache = get_user_principal_cache()
+    if cache is None:
+        return load_user_principal(user_id)
+    return cache.get(user_id, load_user_principal)
+
+
+def invalidate_user_principal(user_id: str) -> None:
+    """
+    사용자 캐시 항목 무효화 (앱 컨텍스트 밖이면 무시)
+
+    Args:
+        user_id: 사용자 ID
+    """
+    if not has_app_context():
+        return
+    cache = get_user_principal_cache()
+    if cache is not None:
+        cache.invalidate(user_id)
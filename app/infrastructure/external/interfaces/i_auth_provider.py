@@ -30,6 +30,7 @@ class IAuthProvider(ABC):
         Raises:
             EmailAlreadyExistsException: 이메일 중복
             WeakPasswordException: 비밀번호 강도 미달
+            AuthProviderUnavailableException: 인증 서버 응답 없음
         """
         pass
 
@@ -47,5 +48,23 @@ class IAuthProvider(ABC):
 
         Raises:
             InvalidCredentialsException: 이메일 또는 비밀번호 불일치
+            AuthProviderUnavailableException: 인증 서버 응답 없음
+        """
+        pass
+
+    @abstractmethod
+    def refresh_session(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        세션 갱신 (Refresh Token으로 새 Access Token 발급)
+
+        Args:
+            refresh_token: Refresh Token
+
+        Returns:
+            Dict: 새 세션 정보 (access_token, refresh_token, user_id)
+
+        Raises:
+            InvalidTokenException: Refresh Token이 유효하지 않음
+            AuthProviderUnavailableException: 인증 서버 응답 없음
         """
         pass
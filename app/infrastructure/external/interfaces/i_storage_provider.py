@@ -3,7 +3,7 @@ Storage Provider Interface
 Infrastructure Layer - External Services Interface
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 class IStorageProvider(ABC):
@@ -24,6 +24,53 @@ class IStorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def upload_stream(self, bucket: str, path: str, stream: BinaryIO, content_type: str) -> str:
+        """
+        파일 스트림 업로드 (전체 내용을 메모리에 올리지 않음)
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+            stream: 읽기용 바이너리 파일 객체
+            content_type: MIME 타입
+
+        Returns:
+            str: 업로드된 파일의 URL
+        """
+        pass
+
+    @abstractmethod
+    def download_file(self, bucket: str, path: str) -> bytes:
+        """
+        파일 다운로드
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bytes: 파일 데이터
+        """
+        pass
+
+    @abstractmethod
+    def exists(self, bucket: str, path: str) -> bool:
+        """
+        파일 존재 여부
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bool: 존재 여부
+
+        Raises:
+            Exception: 스토리지 조회 실패 (확인할 수 없으면 False 대신 예외)
+        """
+        pass
+
     @abstractmethod
     def delete_file(self, bucket: str, path: str) -> bool:
         """
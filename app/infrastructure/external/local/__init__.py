@@ -0,0 +1 @@
+"""Local FileSystem External Services 패키지"""
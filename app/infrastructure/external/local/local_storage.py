@@ -0,0 +1,143 @@
+"""
+Local FileSystem Storage Provider Implementation
+Infrastructure Layer - External Services
+
+개발/테스트용 로컬 파일 시스템 스토리지 ({root}/{bucket}/{path})
+"""
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Optional
+
+from app.infrastructure.external.interfaces.i_storage_provider import IStorageProvider
+
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+class LocalStorageProvider(IStorageProvider):
+    """로컬 파일 시스템 스토리지 구현체"""
+
+    def __init__(self, root: str, base_url: str = '/uploads'):
+        """
+        로컬 스토리지 초기화
+
+        Args:
+            root: 저장 루트 디렉터리
+            base_url: 파일 URL 접두사
+        """
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip('/')
+
+    def _full_path(self, bucket: str, path: str) -> str:
+        """버킷/경로를 루트 아래 절대 경로로 변환 (루트 밖 경로 거부)"""
+        full_path = os.path.abspath(os.path.join(self.root, bucket, path))
+        if not full_path.startswith(self.root + os.sep):
+            raise ValueError(f"잘못된 파일 경로: {bucket}/{path}")
+        return full_path
+
+    def upload_file(self, bucket: str, path: str, file_data: bytes) -> str:
+        """
+        파일 업로드
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+            file_data: 파일 데이터
+
+        Returns:
+            str: 업로드된 파일의 URL
+        """
+        full_path = self._full_path(bucket, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.write(file_data)
+        return self.get_file_url(bucket, path)
+
+    def upload_stream(self, bucket: str, path: str, stream: BinaryIO, content_type: str) -> str:
+        """
+        파일 스트림 업로드 (임시 파일에 나눠 쓴 뒤 원자적으로 교체)
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+            stream: 읽기용 바이너리 파일 객체
+            content_type: MIME 타입 (로컬 저장 시 사용하지 않음)
+
+        Returns:
+            str: 업로드된 파일의 URL
+        """
+        full_path = self._full_path(bucket, path)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(stream, f, COPY_CHUNK_SIZE)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self.get_file_url(bucket, path)
+
+    def download_file(self, bucket: str, path: str) -> bytes:
+        """
+        파일 다운로드
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bytes: 파일 데이터
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        with open(self._full_path(bucket, path), 'rb') as f:
+            return f.read()
+
+    def exists(self, bucket: str, path: str) -> bool:
+        """
+        파일 존재 여부
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bool: 존재 여부
+        """
+        return os.path.isfile(self._full_path(bucket, path))
+
+    def delete_file(self, bucket: str, path: str) -> bool:
+        """
+        파일 삭제
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bool: 삭제 성공 여부 (파일이 없으면 False)
+        """
+        try:
+            os.remove(self._full_path(bucket, path))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def get_file_url(self, bucket: str, path: str) -> Optional[str]:
+        """
+        파일 URL 조회
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            Optional[str]: 파일 URL
+        """
+        return f"{self.base_url}/{bucket}/{path}"
@@ -0,0 +1 @@
+"""External Service 장애 대응 (타임아웃, 재시도, 회로 차단기) 패키지"""
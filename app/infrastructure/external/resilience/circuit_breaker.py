@@ -0,0 +1,109 @@
+"""
+회로 차단기 (Circuit Breaker)
+Infrastructure Layer - External Services
+
+외부 서비스가 연속으로 실패하면 일정 시간 호출을 즉시 거부하여
+요청 스레드가 응답 없는 서비스를 기다리며 묶이지 않도록 합니다.
+
+- closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+- open: reset_timeout 동안 즉시 거부, 이후 half_open
+- half_open: 시험 호출 1건만 허용, 성공하면 closed / 실패하면 다시 open
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class CircuitBreaker:
+    """연속 실패 기반 회로 차단기 (스레드 안전)"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_threshold: open으로 전환할 연속 실패 수
+            reset_timeout: open 유지 시간(초), 이후 시험 호출 허용
+            clock: 시간 함수 (테스트 주입용)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self.rejections = 0
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 유지 시간이 지났으면 half_open)"""
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (허용된 호출은 반드시 record_success/record_failure로 결과를 기록)
+
+        Returns:
+            bool: 호출 가능 여부 (False면 즉시 실패 처리)
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return True
+            self.rejections += 1
+            return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (half_open이면 closed로 복구)"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (기준 도달 또는 시험 호출 실패 시 open)"""
+        with self._lock:
+            self._consecutive_failures += 1
+            trial_failed = self._trial_in_flight
+            self._trial_in_flight = False
+            if trial_failed or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        상태 스냅샷
+
+        Returns:
+            {'state', 'consecutive_failures', 'times_opened', 'rejections'} 딕셔너리
+        """
+        with self._lock:
+            return {
+                'state': self._current_state(),
+                'consecutive_failures': self._consecutive_failures,
+                'times_opened': self.times_opened,
+                'rejections': self.rejections,
+            }
@@ -0,0 +1,295 @@
+"""
+장애 대응 인증 제공자
+Infrastructure Layer - External Services
+
+IAuthProvider 구현체를 감싸 Supabase Auth가 느리거나 응답하지 않을 때
+gunicorn 워커가 로그인/회원가입 요청에 묶이지 않도록 합니다.
+
+- 호출별 제한 시간(AUTH_CALL_DEADLINE): 별도 스레드에서 실행하고 시간이 지나면 포기
+- 재시도: 멱등 호출(authenticate)만, 지수 백오프 + full jitter, 제한 시간 안에서만
+  (create_user는 중복 생성, refresh_session은 refresh_token 회전 때문에 재시도하지 않음)
+- 회로 차단기: 일시적 장애(시간 초과, 연결 실패, 5xx)가 연속되면 즉시 거부
+  (잘못된 비밀번호 등 도메인 예외는 서버가 응답한 것이므로 성공으로 기록)
+- 지표: 호출별 지연 시간, 실패/재시도/거부 수, 회로 상태 (/metrics/auth)
+"""
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Deque, Dict, Optional
+
+from flask import Flask, current_app
+
+from app.domain.exceptions.auth_exceptions import AuthProviderUnavailableException
+from app.infrastructure.external.interfaces.i_auth_provider import (
+    IAuthProvider,
+    AuthUserCreationResult
+)
+from app.infrastructure.external.resilience.circuit_breaker import CircuitBreaker
+
+
+class CallStats:
+    """외부 호출 지연 시간/결과 통계 (작업별)"""
+
+    def __init__(self, sample_size: int = 256):
+        """
+        Args:
+            sample_size: p95 계산에 사용할 최근 지연 시간 표본 수
+        """
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, Any]] = {}
+        self._sample_size = sample_size
+
+    def _entry(self, operation: str) -> Dict[str, Any]:
+        entry = self._operations.get(operation)
+        if entry is None:
+            entry = {
+                'calls': 0, 'failures': 0, 'timeouts': 0, 'retries': 0, 'rejected': 0,
+                'total_ms': 0.0, 'max_ms': 0.0, 'samples': deque(maxlen=self._sample_size),
+            }
+            self._operations[operation] = entry
+        return entry
+
+    def record_attempt(self, operation: str, latency_ms: float, failed: bool, timed_out: bool = False) -> None:
+        with self._lock:
+            entry = self._entry(operation)
+            entry['calls'] += 1
+            entry['total_ms'] += latency_ms
+            entry['max_ms'] = max(entry['max_ms'], latency_ms)
+            entry['samples'].append(latency_ms)
+            if failed:
+                entry['failures'] += 1
+            if timed_out:
+                entry['timeouts'] += 1
+
+    def record_retry(self, operation: str) -> None:
+        with self._lock:
+            self._entry(operation)['retries'] += 1
+
+    def record_rejection(self, operation: str) -> None:
+        with self._lock:
+            self._entry(operation)['rejected'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 통계 스냅샷 (지연 시간은 ms)"""
+        with self._lock:
+            return {
+                operation: {
+                    'calls': entry['calls'],
+                    'failures': entry['failures'],
+                    'timeouts': entry['timeouts'],
+                    'retries': entry['retries'],
+                    'rejected': entry['rejected'],
+                    'avg_ms': round(entry['total_ms'] / entry['calls'], 3) if entry['calls'] else 0.0,
+                    'p95_ms': _percentile(entry['samples'], 0.95),
+                    'max_ms': round(entry['max_ms'], 3),
+                }
+                for operation, entry in self._operations.items()
+            }
+
+
+def _percentile(samples: Deque[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+class AuthResilience:
+    """워커 단위 공유 상태 (회로 차단기, 통계, 제한 시간 실행 스레드)"""
+
+    def __init__(
+        self,
+        deadline: float = 8.0,
+        max_retries: int = 2,
+        backoff: float = 0.2,
+        max_workers: int = 4,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            deadline: 호출별 제한 시간(초, 재시도 포함)
+            max_retries: 멱등 호출의 최대 재시도 횟수
+            backoff: 재시도 기본 대기 시간(초), 시도마다 2배 (full jitter 적용)
+            max_workers: 동시에 진행할 수 있는 외부 호출 수
+            breaker: 회로 차단기
+            sleep: 대기 함수 (테스트 주입용)
+        """
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = CallStats()
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def executor(self) -> ThreadPoolExecutor:
+        """제한 시간 실행용 스레드 풀 (fork 후에는 새로 생성)"""
+        with self._lock:
+            if self._executor is None or os.getpid() != self._pid:
+                self._pid = os.getpid()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='auth-provider-call'
+                )
+            return self._executor
+
+    def retry_delay(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (0 ~ backoff × 2^attempt)"""
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        지표 스냅샷
+
+        Returns:
+            {'circuit': {...}, 'calls': {operation: {...}}} 딕셔너리
+        """
+        return {'circuit': self.breaker.snapshot(), 'calls': self.stats.snapshot()}
+
+    def shutdown(self) -> None:
+        """실행 스레드 종료 (진행 중인 호출은 기다리지 않음)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ResilientAuthProvider(IAuthProvider):
+    """제한 시간/재시도/회로 차단기를 적용한 IAuthProvider"""
+
+    def __init__(self, provider: IAuthProvider, resilience: AuthResilience):
+        """
+        Args:
+            provider: 실제 인증 제공자 (SupabaseAuthProvider 등)
+            resilience: 워커 단위 공유 상태
+        """
+        self.provider = provider
+        self.resilience = resilience
+
+    def create_user(self, email: str, password: str) -> AuthUserCreationResult:
+        """
+        사용자 생성 (재시도 없음)
+
+        Raises:
+            AuthProviderUnavailableException: 제한 시간 초과, 인증 서버 장애, 회로 open
+        """
+        return self._call('create_user', self.provider.create_user, email, password, idempotent=False)
+
+    def authenticate(self, email: str, password: str) -> Dict[str, Any]:
+        """
+        사용자 인증 (일시적 장애 시 재시도)
+
+        Raises:
+            InvalidCredentialsException: 이메일 또는 비밀번호 불일치
+            AuthProviderUnavailableException: 제한 시간 초과, 인증 서버 장애, 회로 open
+        """
+        return self._call('authenticate', self.provider.authenticate, email, password, idempotent=True)
+
+    def refresh_session(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        세션 갱신 (refresh_token이 회전되므로 재시도 없음)
+
+        Raises:
+            InvalidTokenException: Refresh Token이 유효하지 않음
+            AuthProviderUnavailableException: 제한 시간 초과, 인증 서버 장애, 회로 open
+        """
+        return self._call('refresh_session', self.provider.refresh_session, refresh_token, idempotent=False)
+
+    def _call(self, operation: str, func: Callable[..., Any], *args: Any, idempotent: bool) -> Any:
+        """제한 시간 안에서 호출, 멱등 호출은 일시적 장애 시 재시도"""
+        resilience = self.resilience
+        breaker = resilience.breaker
+
+        if not breaker.allow():
+            resilience.stats.record_rejection(operation)
+            raise AuthProviderUnavailableException('Authentication service unavailable (circuit open)')
+
+        deadline_at = time.monotonic() + resilience.deadline
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            future = resilience.executor().submit(func, *args)
+            try:
+                result = future.result(timeout=max(deadline_at - started, 0))
+            except FutureTimeoutError:
+                future.cancel()
+                resilience.stats.record_attempt(operation, _elapsed_ms(started), failed=True, timed_out=True)
+                error = AuthProviderUnavailableException('Authentication service timed out')
+            except AuthProviderUnavailableException as e:
+                resilience.stats.record_attempt(operation, _elapsed_ms(started), failed=True)
+                error = e
+            except Exception:
+                # 인증 서버가 응답한 도메인 예외 (잘못된 비밀번호, 이메일 중복 등)
+                resilience.stats.record_attempt(operation, _elapsed_ms(started), failed=False)
+                breaker.record_success()
+                raise
+            else:
+                resilience.stats.record_attempt(operation, _elapsed_ms(started), failed=False)
+                breaker.record_success()
+                return result
+
+            delay = resilience.retry_delay(attempt)
+            if not idempotent or attempt >= resilience.max_retries or time.monotonic() + delay >= deadline_at:
+                breaker.record_failure()
+                raise error
+
+            attempt += 1
+            resilience.stats.record_retry(operation)
+            resilience.sleep(delay)
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.monotonic() - started) * 1000
+
+
+def init_auth_resilience(app: Flask) -> None:
+    """
+    인증 호출 장애 대응 상태 등록 (app.extensions['auth_resilience'])
+
+    Args:
+        app: Flask 앱
+    """
+    app.extensions['auth_resilience'] = AuthResilience(
+        deadline=app.config.get('AUTH_CALL_DEADLINE', 8.0),
+        max_retries=app.config.get('AUTH_MAX_RETRIES', 2),
+        backoff=app.config.get('AUTH_RETRY_BACKOFF', 0.2),
+        max_workers=app.config.get('AUTH_CALL_MAX_WORKERS', 4),
+        breaker=CircuitBreaker(
+            failure_threshold=app.config.get('AUTH_BREAKER_FAILURE_THRESHOLD', 5),
+            reset_timeout=app.config.get('AUTH_BREAKER_RESET_TIMEOUT', 30.0)
+        )
+    )
+
+
+def get_auth_resilience() -> Optional[AuthResilience]:
+    """
+    현재 앱의 인증 호출 장애 대응 상태
+
+    Returns:
+        AuthResilience 또는 None (초기화되지 않은 경우)
+    """
+    return current_app.extensions.get('auth_resilience')
+
+
+def get_auth_provider() -> IAuthProvider:
+    """
+    라우트/서비스에서 사용할 인증 제공자 (Supabase Auth + 장애 대응)
+
+    Returns:
+        IAuthProvider
+    """
+    from app.infrastructure.external.supabase.supabase_auth import SupabaseAuthProvider
+
+    provider = SupabaseAuthProvider()
+    resilience = get_auth_resilience()
+    if resilience is None:
+        return provider
+    return ResilientAuthProvider(provider, resilience)
@@ -0,0 +1,235 @@
+"""
+스토리지 제공자 / 이미지 업로드 서비스 등록
+Infrastructure Layer - External Services
+
+STORAGE_BACKEND 설정으로 스토리지 구현체를 선택합니다.
+
+- supabase: Supabase Storage (service role key)
+- local: 로컬 파일 시스템 (LOCAL_STORAGE_ROOT, /uploads/<bucket>/<path>로 제공) - 개발/테스트용
+
+제공자와 업로드/변형 서비스는 처음 사용할 때 워커 프로세스별로 한 번 생성합니다.
+"""
+import logging
+import os
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+from flask import Flask, current_app, send_from_directory
+
+from app.infrastructure.external.interfaces.i_storage_provider import IStorageProvider
+
+
+logger = logging.getLogger(__name__)
+
+LOCAL_STORAGE_URL = '/uploads'
+
+
+def _local_root(app: Flask) -> str:
+    return app.config.get('LOCAL_STORAGE_ROOT') or os.path.join(app.instance_path, 'uploads')
+
+
+def init_storage(app: Flask) -> None:
+    """
+    스토리지 설정 (local 백엔드면 업로드 파일 제공 라우트 등록)
+
+    Args:
+        app: Flask 앱
+    """
+    if app.config.get('STORAGE_BACKEND', 'supabase') != 'local':
+        return
+
+    def serve_upload(bucket: str, path: str):
+        return send_from_directory(os.path.join(_local_root(app), bucket), path)
+
+    app.add_url_rule(f'{LOCAL_STORAGE_URL}/<bucket>/<path:path>', 'local_upload', serve_upload)
+
+
+def get_storage_provider() -> IStorageProvider:
+    """
+    현재 앱의 스토리지 제공자 반환
+
+    Returns:
+        IStorageProvider
+    """
+    provider = current_app.extensions.get('storage_provider')
+    if provider is not None:
+        return provider
+
+    if current_app.config.get('STORAGE_BACKEND', 'supabase') == 'local':
+        from app.infrastructure.external.local.local_storage import LocalStorageProvider
+
+        provider = LocalStorageProvider(root=_local_root(current_app), base_url=LOCAL_STORAGE_URL)
+    else:
+        from app.infrastructure.external.supabase.supabase_client import get_supabase_admin_client
+        from app.infrastructure.external.supabase.supabase_storage import SupabaseStorageProvider
+
+        provider = SupabaseStorageProvider(get_supabase_admin_client())
+
+    return current_app.extensions.setdefault('storage_provider', provider)
+
+
+def get_image_upload_service():
+    """
+    현재 앱의 이미지 업로드 서비스 반환 (백그라운드 업로드 스레드 공유)
+
+    Returns:
+        ImageUploadService
+    """
+    service = current_app.extensions.get('image_upload_service')
+    if service is not None:
+        return service
+
+    from app.application.services.image_upload_service import ImageUploadService
+
+    config = current_app.config
+    service = ImageUploadService(
+        storage=get_storage_provider(),
+        bucket=config.get('IMAGE_UPLOAD_BUCKET', 'campaign-images'),
+        max_bytes=config.get('IMAGE_UPLOAD_MAX_BYTES', 5 * 1024 * 1024),
+        chunk_size=config.get('IMAGE_UPLOAD_CHUNK_SIZE', 64 * 1024),
+        max_workers=config.get('IMAGE_UPLOAD_WORKERS', 2),
+        tmp_dir=config.get('IMAGE_UPLOAD_TMP_DIR'),
+        retries=config.get('IMAGE_UPLOAD_RETRIES', 2)
+    )
+    existing = current_app.extensions.setdefault('image_upload_service', service)
+    if existing is not service:
+        service.shutdown(wait=False)
+    return existing
+
+
+def get_image_variant_service():
+    """
+    현재 앱의 이미지 변형 서비스 반환 (백그라운드 생성 스레드 공유)
+
+    Returns:
+        ImageVariantService
+    """
+    service = current_app.extensions.get('image_variant_service')
+    if service is not None:
+        return service
+
+    from app.application.services.image_variant_service import ImageVariantService
+
+    config = current_app.config
+    service = ImageVariantService(
+        storage=get_storage_provider(),
+        bucket=config.get('IMAGE_UPLOAD_BUCKET', 'campaign-images'),
+        max_workers=config.get('IMAGE_VARIANT_WORKERS', 1)
+    )
+    existing = current_app.extensions.setdefault('image_variant_service', service)
+    if existing is not service:
+        service.shutdown(wait=False)
+    return existing
+
+
+def save_image_variants(image_url: str, variants: Dict) -> int:
+    """
+    변형 URL을 같은 이미지의 체험단에 저장하고 커밋 (홈 피드 캐시 무효화)
+
+    앱 컨텍스트 안에서 호출해야 합니다.
+
+    Args:
+        image_url: 체험단 이미지 URL
+        variants: 변형 URL 딕셔너리
+
+    Returns:
+        수정된 체험단 수
+    """
+    from app.extensions import db
+    from app.infrastructure.cache.tagged_cache import get_feed_cache
+    from app.infrastructure.repositories.campaign_repository import CampaignRepository
+    from app.shared.constants.cache_constants import CACHE_TAG_RECRUITING_FEED
+
+    try:
+        updated = CampaignRepository(db.session).update_image_variants(image_url, variants)
+        cache = get_feed_cache()
+        if updated and cache is not None:
+            cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+        db.session.commit()
+        return updated
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def schedule_image_variants(image_url: str, wait_for: Optional[Future] = None) -> Optional[Future]:
+    """
+    백그라운드 변형 생성 예약 (완료되면 별도 앱 컨텍스트에서 변형 URL 저장)
+
+    Args:
+        image_url: 체험단 이미지 URL
+        wait_for: 원본 업로드 Future (완료 후 생성 시작)
+
+    Returns:
+        Future (IMAGE_VARIANTS_ENABLED가 꺼져 있으면 None)
+    """
+    if not current_app.config.get('IMAGE_VARIANTS_ENABLED', True):
+        return None
+
+    app = current_app._get_current_object()
+
+    def persist(url: str, variants: Dict) -> None:
+        with app.app_context():
+            save_image_variants(url, variants)
+
+    return get_image_variant_service().submit(image_url, wait_for=wait_for, on_success=persist)
+
+
+def clear_campaign_image(campaign_id: int, image_url: str) -> int:
+    """
+    업로드에 실패한 체험단의 이미지 URL을 비우고 커밋 (홈 피드 캐시 무효화)
+
+    같은 URL(같은 내용)의 다른 체험단은 그대로 둡니다. 앱 컨텍스트 안에서 호출해야 합니다.
+
+    Args:
+        campaign_id: 체험단 ID
+        image_url: 업로드에 실패한 이미지 URL
+
+    Returns:
+        수정된 체험단 수 (0 또는 1)
+    """
+    from app.extensions import db
+    from app.infrastructure.cache.tagged_cache import get_feed_cache
+    from app.infrastructure.repositories.campaign_repository import CampaignRepository
+    from app.shared.constants.cache_constants import CACHE_TAG_RECRUITING_FEED
+
+    try:
+        updated = CampaignRepository(db.session).clear_image(campaign_id, image_url)
+        cache = get_feed_cache()
+        if updated and cache is not None:
+            cache.invalidate_on_commit(CACHE_TAG_RECRUITING_FEED)
+        db.session.commit()
+        return updated
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def watch_image_upload(campaign_id: int, image_url: str, upload_future: Future) -> None:
+    """
+    백그라운드 업로드가 재시도까지 실패하면 별도 앱 컨텍스트에서 해당 체험단의 이미지 URL 제거
+
+    파일이 스토리지에 없는 것이 확인된 경우에만 비웁니다.
+    (다른 업로드로 같은 파일이 이미 있거나 스토리지를 조회할 수 없으면 그대로 둠)
+    체험단을 커밋한 뒤 호출해야 합니다. (이미 실패한 업로드는 바로 정리)
+
+    Args:
+        campaign_id: 체험단 ID
+        image_url: 체험단 이미지 URL
+        upload_future: ImageUploadService.submit의 업로드 Future
+    """
+    app = current_app._get_current_object()
+
+    def on_done(future: Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        try:
+            with app.app_context():
+                if get_image_upload_service().is_stored(image_url):
+                    return
+                cleared = clear_campaign_image(campaign_id, image_url)
+            logger.warning('이미지 업로드 실패로 체험단 %d의 이미지 URL 제거 (%d건, %s)', campaign_id, cleared, image_url)
+        except Exception:
+            logger.exception('업로드 실패 이미지 URL 정리 실패 (체험단 %d, %s)', campaign_id, image_url)
+
+    upload_future.add_done_callback(on_done)
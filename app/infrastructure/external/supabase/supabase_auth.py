@@ -8,24 +8,43 @@ from app.infrastructure.external.interfaces.i_auth_provider import (
 from app.domain.exceptions.auth_exceptions import (
     EmailAlreadyExistsException,
     WeakPasswordException,
-    InvalidCredentialsException
+    InvalidCredentialsException,
+    InvalidTokenException,
+    AuthProviderUnavailableException
 )
-from supabase import create_client, Client
-import os
+from gotrue.errors import AuthRetryableError
+from app.infrastructure.external.supabase.supabase_client import get_supabase_registry
 
 
 class SupabaseAuthProvider(IAuthProvider):
     """Supabase Auth 구현체"""
 
-    def __init__(self):
-        """Supabase 클라이언트 초기화"""
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
+    def __init__(self, auth_client=None):
+        """
+        Supabase Auth 클라이언트 설정
+
+        auth_client를 주지 않으면 호출마다 레지스트리에서 새 GoTrue 클라이언트를 받습니다.
+        (GoTrue 클라이언트는 마지막 세션을 보관하므로 사용자/스레드 간에 공유하지 않음,
+        HTTP 연결 풀은 워커 내 공용 클라이언트를 사용)
 
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
+        Args:
+            auth_client: GoTrue 클라이언트 (기본값: 호출마다 Supabase 레지스트리에서 생성)
 
-        self.client: Client = create_client(supabase_url, supabase_key)
+        Raises:
+            ValueError: SUPABASE_URL 또는 SUPABASE_KEY 미설정
+        """
+        self._auth_client = auth_client
+        self._registry = None
+        if auth_client is None:
+            self._registry = get_supabase_registry()
+            self._registry.auth()  # 설정 누락은 생성 시점에 확인
+
+    @property
+    def auth(self):
+        """이번 호출에 사용할 GoTrue 클라이언트"""
+        if self._auth_client is not None:
+            return self._auth_client
+        return self._registry.auth()
 
     def create_user(self, email: str, password: str) -> AuthUserCreationResult:
         """
@@ -41,10 +60,11 @@ class SupabaseAuthProvider(IAuthProvider):
         Raises:
             EmailAlreadyExistsException: 이메일 중복
             WeakPasswordException: 비밀번호 강도 미달
+            AuthProviderUnavailableException: 인증 서버 응답 없음
         """
         try:
             print(f"[DEBUG] Supabase Auth - 회원가입 요청: {email}")
-            response = self.client.auth.sign_up({
+            response = self.auth.sign_up({
                 "email": email,
                 "password": password
             })
@@ -61,6 +81,10 @@ class SupabaseAuthProvider(IAuthProvider):
                 email=response.user.email
             )
 
+        except AuthRetryableError as e:
+            # 시간 초과, 연결 실패, 502/503/504
+            raise AuthProviderUnavailableException(str(e) or "Supabase Auth unavailable")
+
         except Exception as e:
             print(f"[ERROR] Supabase Auth - 예외 발생: {type(e).__name__}: {str(e)}")
             error_message = str(e).lower()
@@ -89,9 +113,10 @@ class SupabaseAuthProvider(IAuthProvider):
 
         Raises:
             InvalidCredentialsException: 이메일 또는 비밀번호 불일치
+            AuthProviderUnavailableException: 인증 서버 응답 없음
         """
         try:
-            response = self.client.auth.sign_in_with_password({
+            response = self.auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -105,6 +130,40 @@ class SupabaseAuthProvider(IAuthProvider):
                 "user_id": response.user.id
             }
 
+        except AuthRetryableError as e:
+            # 시간 초과, 연결 실패, 502/503/504 (잘못된 인증 정보와 구분)
+            raise AuthProviderUnavailableException(str(e) or "Supabase Auth unavailable")
+
         except Exception as e:
             # 인증 실패
             raise InvalidCredentialsException()
+
+    def refresh_session(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        세션 갱신 (Refresh Token으로 새 Access Token 발급)
+
+        Args:
+            refresh_token: Refresh Token
+
+        Returns:
+            Dict: 새 세션 정보 (access_token, refresh_token, user_id)
+
+        Raises:
+            InvalidTokenException: Refresh Token이 유효하지 않음
+            AuthProviderUnavailableException: 인증 서버 응답 없음
+        """
+        try:
+            response = self.auth.refresh_session(refresh_token)
+        except AuthRetryableError as e:
+            raise AuthProviderUnavailableException(str(e) or "Supabase Auth unavailable")
+        except Exception:
+            raise InvalidTokenException()
+
+        if response.session is None:
+            raise InvalidTokenException()
+
+        return {
+            "access_token": response.session.access_token,
+            "refresh_token": response.session.refresh_token,
+            "user_id": response.session.user.id
+        }
@@ -1,29 +1,217 @@
 """
-Supabase 클라이언트 유틸리티
+Supabase 클라이언트 레지스트리
 Infrastructure Layer - External Services
+
+워커 프로세스마다 Supabase 클라이언트를 한 번만 생성하여 재사용합니다.
+HTTP 연결은 keep-alive로 유지되므로 로그인/회원가입마다 클라이언트 생성과
+TLS 핸드셰이크를 반복하지 않습니다.
+
+- 타임아웃/연결 풀 크기는 SUPABASE_HTTP_* 설정으로 조정
+- fork 안전: 생성한 프로세스와 현재 PID가 다르면(gunicorn --preload 등) 새로 생성
+- 인증(GoTrue) 클라이언트는 호출마다 새로 생성하고 공용 HTTP 클라이언트만 공유
+  (gotrue는 persist_session=False여도 로그인/회원가입/갱신 결과를 _in_memory_session에 보관하므로
+  인스턴스를 공유하면 다른 사용자의 세션이 남고 스레드 간 경쟁이 생김)
 """
 import os
-from supabase import create_client, Client
-from flask import current_app
+import threading
+from typing import Any, Callable, Dict, Optional
 
+import httpx
+from flask import Flask, current_app
+from gotrue import SyncGoTrueClient
+from storage3 import SyncStorageClient
+from storage3.utils import SyncClient as StorageHttpClient
+from supabase import Client, ClientOptions, create_client
 
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트 인스턴스 반환"""
-    url = current_app.config.get('SUPABASE_URL')
-    key = current_app.config.get('SUPABASE_KEY')
 
-    if not url or not key:
-        raise ValueError('SUPABASE_URL과 SUPABASE_KEY가 설정되어야 합니다.')
+class _PooledStorageClient(SyncStorageClient):
+    """연결 풀 제한/타임아웃을 지정한 Storage 클라이언트"""
 
-    return create_client(url, key)
+    def __init__(self, url: str, headers: Dict[str, str], timeout: httpx.Timeout, limits: httpx.Limits):
+        self._limits = limits
+        super().__init__(url, headers, timeout)
 
+    def _create_session(self, base_url, headers, timeout, verify=True):
+        return StorageHttpClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            verify=bool(verify),
+            follow_redirects=True,
+            limits=self._limits,
+        )
 
-def get_supabase_admin_client() -> Client:
-    """Supabase 관리자 클라이언트 인스턴스 반환"""
-    url = current_app.config.get('SUPABASE_URL')
-    key = current_app.config.get('SUPABASE_SERVICE_KEY')
 
-    if not url or not key:
-        raise ValueError('SUPABASE_URL과 SUPABASE_SERVICE_KEY가 설정되어야 합니다.')
+class SupabaseClientRegistry:
+    """프로세스(워커) 단위 Supabase 클라이언트 레지스트리"""
+
+    def __init__(
+        self,
+        url: Optional[str],
+        anon_key: Optional[str],
+        service_key: Optional[str] = None,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0
+    ):
+        """
+        Args:
+            url: SUPABASE_URL
+            anon_key: SUPABASE_KEY (anon public key)
+            service_key: SUPABASE_SERVICE_KEY (service role key)
+            timeout: 요청 타임아웃(초)
+            connect_timeout: 연결 타임아웃(초)
+            max_connections: 워커당 최대 연결 수
+            max_keepalive_connections: 유지할 유휴 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간(초)
+        """
+        self.url = url.rstrip('/') if url else url
+        self.anon_key = anon_key
+        self.service_key = service_key
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._clients: Dict[str, Any] = {}
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """이름별 클라이언트 반환 (없으면 생성, fork 후에는 새로 생성)"""
+        if os.getpid() != self._pid:
+            # 부모 프로세스의 소켓을 공유하지 않도록 닫지 않고 버림
+            self._lock = threading.RLock()
+            self._clients = {}
+            self._pid = os.getpid()
+
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None:
+                client = factory()
+                self._clients[name] = client
+            return client
+
+    def _require(self, key: Optional[str], key_name: str) -> str:
+        if not self.url or not key:
+            raise ValueError(f'SUPABASE_URL과 {key_name}가 설정되어야 합니다.')
+        return key
+
+    def _headers(self, key: str) -> Dict[str, str]:
+        return {'apiKey': key, 'Authorization': f'Bearer {key}'}
+
+    def http_client(self) -> httpx.Client:
+        """keep-alive 연결 풀을 사용하는 공용 HTTP 클라이언트"""
+        return self._get('http', lambda: httpx.Client(
+            timeout=self.timeout,
+            limits=self.limits,
+            follow_redirects=True
+        ))
+
+    def auth(self) -> SyncGoTrueClient:
+        """
+        인증(GoTrue) 클라이언트 (anon key, 호출마다 새 인스턴스)
+
+        GoTrue 클라이언트는 마지막 세션을 인스턴스에 보관하므로 사용자/스레드 간에 공유하지 않습니다.
+        연결 풀은 공용 HTTP 클라이언트를 사용하므로 생성 비용은 객체 생성 정도입니다.
+        """
+        key = self._require(self.anon_key, 'SUPABASE_KEY')
+        return SyncGoTrueClient(
+            url=f'{self.url}/auth/v1',
+            headers=self._headers(key),
+            http_client=self.http_client(),
+            auto_refresh_token=False,
+            persist_session=False
+        )
+
+    def storage(self) -> SyncStorageClient:
+        """Storage 클라이언트 (service role key)"""
+        key = self._require(self.service_key, 'SUPABASE_SERVICE_KEY')
+        return self._get('storage', lambda: _PooledStorageClient(
+            f'{self.url}/storage/v1',
+            self._headers(key),
+            self.timeout,
+            self.limits
+        ))
+
+    def client(self) -> Client:
+        """Supabase 클라이언트 (anon key)"""
+        key = self._require(self.anon_key, 'SUPABASE_KEY')
+        return self._get('client', lambda: self._create_client(key))
 
-    return create_client(url, key)
+    def admin_client(self) -> Client:
+        """Supabase 관리자 클라이언트 (service role key)"""
+        key = self._require(self.service_key, 'SUPABASE_SERVICE_KEY')
+        return self._get('admin_client', lambda: self._create_client(key))
+
+    def _create_client(self, key: str) -> Client:
+        return create_client(self.url, key, options=ClientOptions(
+            auto_refresh_token=False,
+            persist_session=False,
+            postgrest_client_timeout=self.timeout,
+            storage_client_timeout=self.timeout.read
+        ))
+
+    def close(self) -> None:
+        """현재 프로세스에서 생성한 클라이언트의 연결 종료"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        if os.getpid() != self._pid:
+            return
+        http = clients.get('http')
+        if http is not None:
+            http.close()
+        storage = clients.get('storage')
+        if storage is not None:
+            storage.session.close()
+
+
+def init_supabase(app: Flask) -> None:
+    """
+    Supabase 클라이언트 레지스트리 등록 (app.extensions['supabase'])
+
+    클라이언트는 처음 사용할 때 생성되므로 Supabase 설정이 없어도 앱은 시작됩니다.
+
+    Args:
+        app: Flask 앱
+    """
+    app.extensions['supabase'] = SupabaseClientRegistry(
+        url=app.config.get('SUPABASE_URL'),
+        anon_key=app.config.get('SUPABASE_KEY'),
+        service_key=app.config.get('SUPABASE_SERVICE_KEY'),
+        timeout=app.config.get('SUPABASE_HTTP_TIMEOUT', 10.0),
+        connect_timeout=app.config.get('SUPABASE_HTTP_CONNECT_TIMEOUT', 5.0),
+        max_connections=app.config.get('SUPABASE_HTTP_MAX_CONNECTIONS', 10),
+        max_keepalive_connections=app.config.get('SUPABASE_HTTP_MAX_KEEPALIVE', 5),
+        keepalive_expiry=app.config.get('SUPABASE_HTTP_KEEPALIVE_EXPIRY', 30.0)
+    )
+
+
+def get_supabase_registry() -> SupabaseClientRegistry:
+    """
+    현재 앱의 Supabase 클라이언트 레지스트리 반환
+
+    Raises:
+        RuntimeError: init_supabase가 호출되지 않음
+    """
+    registry = current_app.extensions.get('supabase')
+    if registry is None:
+        raise RuntimeError('Supabase 클라이언트 레지스트리가 초기화되지 않았습니다.')
+    return registry
+
+
+def get_supabase_client() -> Client:
+    """Supabase 클라이언트 인스턴스 반환 (워커 내 공유)"""
+    return get_supabase_registry().client()
+
+
+def get_supabase_admin_client() -> Client:
+    """Supabase 관리자 클라이언트 인스턴스 반환 (워커 내 공유)"""
+    return get_supabase_registry().admin_client()
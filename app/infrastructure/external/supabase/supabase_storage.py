@@ -2,7 +2,7 @@
 Supabase Storage Provider Implementation
 Infrastructure Layer - External Services
 """
-from typing import Optional
+from typing import BinaryIO, Optional
 from app.infrastructure.external.interfaces.i_storage_provider import IStorageProvider
 
 
@@ -38,6 +38,67 @@ class SupabaseStorageProvider(IStorageProvider):
         except Exception as e:
             raise Exception(f"파일 업로드 실패: {str(e)}")
 
+    def upload_stream(self, bucket: str, path: str, stream: BinaryIO, content_type: str) -> str:
+        """
+        파일 스트림 업로드 (multipart 본문을 파일에서 나눠 읽어 전송)
+
+        같은 경로의 파일이 이미 있으면 덮어쓰지 않고 기존 파일 URL을 반환합니다.
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+            stream: 읽기용 바이너리 파일 객체 (open(..., 'rb'))
+            content_type: MIME 타입
+
+        Returns:
+            str: 업로드된 파일의 URL
+        """
+        try:
+            self.client.storage.from_(bucket).upload(path, stream, {'content-type': content_type})
+        except Exception as e:
+            # 내용 해시 경로이므로 중복은 같은 파일이 이미 업로드된 것
+            if 'duplicate' not in str(e).lower() and 'already exists' not in str(e).lower():
+                raise Exception(f"파일 업로드 실패: {str(e)}")
+
+        return self.client.storage.from_(bucket).get_public_url(path)
+
+    def download_file(self, bucket: str, path: str) -> bytes:
+        """
+        파일 다운로드
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bytes: 파일 데이터
+        """
+        try:
+            return self.client.storage.from_(bucket).download(path)
+        except Exception as e:
+            raise Exception(f"파일 다운로드 실패: {str(e)}")
+
+    def exists(self, bucket: str, path: str) -> bool:
+        """
+        파일 존재 여부 (상위 폴더를 파일 이름으로 검색)
+
+        Args:
+            bucket: 버킷 이름
+            path: 파일 경로
+
+        Returns:
+            bool: 존재 여부
+
+        Raises:
+            Exception: 목록 조회 실패 (네트워크 오류를 파일 없음으로 취급하지 않도록 전파)
+        """
+        folder, _, filename = path.rpartition('/')
+        try:
+            files = self.client.storage.from_(bucket).list(folder or None, {'search': filename})
+        except Exception as e:
+            raise Exception(f"파일 존재 확인 실패: {str(e)}")
+        return any(item.get('name') == filename for item in files)
+
     def delete_file(self, bucket: str, path: str) -> bool:
         """
         파일 삭제
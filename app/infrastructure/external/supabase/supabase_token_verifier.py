@@ -0,0 +1,332 @@
+"""
+Supabase Access Token 로컬 검증
+Infrastructure Layer - External Services
+
+Supabase가 발급한 JWT를 원격 호출 없이 서명 키로 검증합니다.
+
+- 대칭 키(HS256): SUPABASE_JWT_SECRET
+- 비대칭 키(RS256/ES256): JWKS(/auth/v1/.well-known/jwks.json)를 TTL 동안 캐시,
+  알 수 없는 kid가 오면 (최소 간격을 두고) 한 번 다시 조회 - RSA/EC 키는 cryptography 패키지 필요
+- 토큰 갱신은 SupabaseTokenRefresher가 refresh_token별로 한 번만 호출 (동시 요청은 같은 결과 사용)
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import jwt
+from flask import Flask, current_app
+
+from app.domain.exceptions.auth_exceptions import InvalidTokenException
+
+
+logger = logging.getLogger(__name__)
+
+HMAC_ALGORITHMS = ['HS256']
+
+
+class SupabaseTokenVerifier:
+    """Supabase Access Token 검증기 (서명 키/JWKS 캐시)"""
+
+    def __init__(
+        self,
+        jwt_secret: Optional[str] = None,
+        fetch_jwks: Optional[Callable[[], Dict[str, Any]]] = None,
+        audience: Optional[str] = 'authenticated',
+        issuer: Optional[str] = None,
+        leeway: int = 10,
+        jwks_ttl: int = 600,
+        jwks_min_refetch_interval: int = 30
+    ):
+        """
+        Args:
+            jwt_secret: Supabase JWT secret (HS256)
+            fetch_jwks: JWKS 딕셔너리를 반환하는 함수 (비대칭 키 사용 시)
+            audience: 허용할 aud 클레임 (None이면 검사하지 않음)
+            issuer: 허용할 iss 클레임 (None이면 검사하지 않음)
+            leeway: 만료 시간 허용 오차(초)
+            jwks_ttl: JWKS 캐시 시간(초)
+            jwks_min_refetch_interval: 알 수 없는 kid로 JWKS를 다시 조회하는 최소 간격(초)
+        """
+        self.jwt_secret = jwt_secret
+        self.fetch_jwks = fetch_jwks
+        self.audience = audience
+        self.issuer = issuer
+        self.leeway = leeway
+        self.jwks_ttl = jwks_ttl
+        self.jwks_min_refetch_interval = jwks_min_refetch_interval
+        self._lock = threading.Lock()
+        self._keys: Dict[Optional[str], jwt.PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self.jwks_fetches = 0
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        토큰 서명 및 클레임(exp, aud, iss) 검증
+
+        Args:
+            token: Access Token (JWT)
+
+        Returns:
+            Dict: 토큰 클레임 (sub, exp, role 등)
+
+        Raises:
+            InvalidTokenException: 서명 불일치, 만료, 형식 오류, 알 수 없는 서명 키
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            raise InvalidTokenException()
+
+        algorithm = header.get('alg')
+        if algorithm in HMAC_ALGORITHMS and self.jwt_secret:
+            key: Any = self.jwt_secret
+            algorithms = HMAC_ALGORITHMS
+        else:
+            jwk = self._jwk(header.get('kid'))
+            if jwk is None or jwk.algorithm_name != algorithm:
+                raise InvalidTokenException()
+            key = jwk
+            algorithms = [jwk.algorithm_name]
+
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=algorithms,
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={'require': ['exp', 'sub'], 'verify_aud': self.audience is not None}
+            )
+        except jwt.PyJWTError:
+            raise InvalidTokenException()
+
+    def _jwk(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        """kid에 해당하는 서명 키 (캐시 만료 또는 미등록 kid면 JWKS 재조회)"""
+        if self.fetch_jwks is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            expired = self._fetched_at is None or now - self._fetched_at >= self.jwks_ttl
+            unknown = kid not in self._keys and (
+                self._fetched_at is None or now - self._fetched_at >= self.jwks_min_refetch_interval
+            )
+            if expired or unknown:
+                self._refresh_keys(now)
+            return self._keys.get(kid)
+
+    def _refresh_keys(self, now: float) -> None:
+        """JWKS 조회 후 키 캐시 교체 (실패 시 기존 키 유지)"""
+        try:
+            jwks = self.fetch_jwks()
+        except Exception as e:
+            logger.warning('JWKS 조회 실패: %s', e)
+            self._fetched_at = now
+            return
+
+        keys: Dict[Optional[str], jwt.PyJWK] = {}
+        for data in jwks.get('keys', []):
+            try:
+                keys[data.get('kid')] = jwt.PyJWK(data)
+            except jwt.PyJWTError as e:
+                # RSA/EC 키는 cryptography 패키지가 없으면 사용할 수 없음
+                logger.warning('JWKS 키(kid=%s) 사용 불가: %s', data.get('kid'), e)
+
+        self._keys = keys
+        self._fetched_at = now
+        self.jwks_fetches += 1
+
+
+class SupabaseTokenRefresher:
+    """
+    토큰 갱신기 (refresh_token별 단일 호출)
+
+    같은 refresh_token으로 동시에 여러 요청이 와도 Supabase 갱신 요청은 한 번만 보내고,
+    완료된 결과는 result_ttl 동안 보관하여 갱신 전 쿠키로 바로 뒤따라온 요청도 같은 결과를 받습니다.
+    (갱신 결과는 기다린 요청이 세션에 저장하므로 보관 기간이 지나도 유실되지 않음)
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], Dict[str, Any]],
+        max_workers: int = 2,
+        result_ttl: int = 60
+    ):
+        """
+        Args:
+            refresh: refresh_token으로 새 세션 정보(access_token, refresh_token)를 반환하는 함수
+            max_workers: 갱신 스레드 수
+            result_ttl: 완료된 갱신 결과 보관 시간(초)
+        """
+        self.refresh = refresh
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._started_at: Dict[str, float] = {}
+
+    def schedule(self, refresh_token: str) -> Future:
+        """
+        갱신 시작 (이미 진행 중이거나 완료된 갱신이 있으면 그 결과 사용)
+
+        Args:
+            refresh_token: Refresh Token
+
+        Returns:
+            Future: 새 세션 정보 딕셔너리를 결과로 갖는 Future
+        """
+        with self._lock:
+            self._check_fork()
+            self._prune(time.monotonic())
+            future = self._futures.get(refresh_token)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='supabase-token-refresh'
+                    )
+                future = self._executor.submit(self.refresh, refresh_token)
+                self._futures[refresh_token] = future
+                self._started_at[refresh_token] = time.monotonic()
+            return future
+
+    def refresh_now(self, refresh_token: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        갱신 결과를 기다려 반환 (진행 중인 갱신이 있으면 합류)
+
+        Args:
+            refresh_token: Refresh Token
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            새 세션 정보
+
+        Raises:
+            InvalidTokenException: 갱신 실패 또는 시간 초과
+        """
+        try:
+            return self.schedule(refresh_token).result(timeout=timeout)
+        except Exception:
+            raise InvalidTokenException()
+
+    def _prune(self, now: float) -> None:
+        """보관 시간이 지난 완료 항목 제거 (실패한 항목은 다음 요청에서 재시도)"""
+        for refresh_token, future in list(self._futures.items()):
+            if not future.done():
+                continue
+            failed = future.exception() is not None
+            if failed or now - self._started_at[refresh_token] >= self.result_ttl:
+                del self._futures[refresh_token]
+                del self._started_at[refresh_token]
+
+    def _check_fork(self) -> None:
+        # fork된 자식 프로세스에는 부모의 스레드가 없으므로 새 실행기 사용
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._executor = None
+            self._futures = {}
+            self._started_at = {}
+
+    def shutdown(self) -> None:
+        """백그라운드 스레드 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def seconds_until_expiry(claims: Dict[str, Any]) -> float:
+    """
+    토큰 만료까지 남은 시간(초)
+
+    Args:
+        claims: 검증된 토큰 클레임
+
+    Returns:
+        남은 시간(초), 이미 만료되었으면 음수
+    """
+    return claims['exp'] - time.time()
+
+
+def _fetch_jwks_from(url: str) -> Callable[[], Dict[str, Any]]:
+    """Supabase 공유 HTTP 클라이언트로 JWKS를 조회하는 함수 생성"""
+    from app.infrastructure.external.supabase.supabase_client import get_supabase_registry
+
+    http_client = get_supabase_registry().http_client()
+
+    def fetch() -> Dict[str, Any]:
+        response = http_client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    return fetch
+
+
+def init_token_verifier(app: Flask) -> None:
+    """
+    토큰 검증기 등록 (app.extensions['supabase_token_verifier'])
+
+    init_supabase 이후에 호출해야 합니다. JWKS는 처음 필요할 때 조회합니다.
+
+    Args:
+        app: Flask 앱
+    """
+    supabase_url = (app.config.get('SUPABASE_URL') or '').rstrip('/')
+    fetch_jwks = None
+    issuer = None
+    if supabase_url:
+        issuer = f'{supabase_url}/auth/v1'
+        jwks_url = f'{issuer}/.well-known/jwks.json'
+        state: Dict[str, Any] = {}
+
+        def fetch_jwks() -> Dict[str, Any]:
+            # 공유 HTTP 클라이언트는 요청 처리 중(앱 컨텍스트 안)에 처음 조회할 때 가져옴
+            if 'fetch' not in state:
+                state['fetch'] = _fetch_jwks_from(jwks_url)
+            return state['fetch']()
+
+    app.extensions['supabase_token_verifier'] = SupabaseTokenVerifier(
+        jwt_secret=app.config.get('SUPABASE_JWT_SECRET'),
+        fetch_jwks=fetch_jwks,
+        audience=app.config.get('SUPABASE_JWT_AUDIENCE', 'authenticated'),
+        issuer=issuer,
+        leeway=app.config.get('SUPABASE_JWT_LEEWAY', 10),
+        jwks_ttl=app.config.get('SUPABASE_JWKS_CACHE_TTL', 600)
+    )
+
+
+def get_token_verifier() -> SupabaseTokenVerifier:
+    """
+    현재 앱의 토큰 검증기 반환
+
+    Raises:
+        RuntimeError: init_token_verifier가 호출되지 않음
+    """
+    verifier = current_app.extensions.get('supabase_token_verifier')
+    if verifier is None:
+        raise RuntimeError('Supabase 토큰 검증기가 초기화되지 않았습니다.')
+    return verifier
+
+
+def get_token_refresher() -> SupabaseTokenRefresher:
+    """
+    현재 앱의 토큰 갱신기 반환 (처음 호출 시 장애 대응 인증 제공자로 생성)
+
+    Returns:
+        SupabaseTokenRefresher
+    """
+    refresher = current_app.extensions.get('supabase_token_refresher')
+    if refresher is None:
+        from app.infrastructure.external.resilience.resilient_auth_provider import get_auth_provider
+
+        refresher = current_app.extensions.setdefault(
+            'supabase_token_refresher',
+            SupabaseTokenRefresher(refresh=get_auth_provider().refresh_session)
+        )
+    return refresher
@@ -0,0 +1 @@
+"""Background Jobs 패키지"""
@@ -0,0 +1,80 @@
+"""
+모집 기간이 지난 체험단 자동 종료 작업
+Infrastructure Layer - Background Jobs
+
+python manage.py close-expired-campaigns 로 한 번 실행하거나
+--watch 옵션으로 워커 프로세스(Procfile worker)에서 주기적으로 실행합니다.
+배치마다 커밋하므로 중간에 중단되어도 처리한 배치는 유지되고,
+여러 인스턴스가 동시에 실행해도 같은 체험단을 중복 처리하지 않습니다.
+"""
+import logging
+import threading
+from datetime import date
+from typing import Optional
+
+from flask import Flask
+
+from app.extensions import db
+
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_expired_campaigns(batch_size: int = 500, today: Optional[date] = None) -> int:
+    """
+    모집 기간이 지난 체험단을 배치 단위로 모두 종료 (앱 컨텍스트 필요)
+
+    Args:
+        batch_size: 배치 크기 (배치마다 커밋)
+        today: 기준일 (None이면 오늘)
+
+    Returns:
+        종료된 체험단 수
+    """
+    from app.application.services.campaign_service import CampaignService
+    from app.infrastructure.cache.tagged_cache import get_feed_cache
+    from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+    today = today or date.today()
+    campaign_service = CampaignService(CampaignRepository(db.session), cache=get_feed_cache())
+
+    total = 0
+    while True:
+        try:
+            closed = campaign_service.close_expired_campaigns(today, batch_size=batch_size)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        total += closed
+        if closed < batch_size:
+            return total
+
+
+def run_campaign_sweeper(
+    app: Flask,
+    interval: float,
+    batch_size: int = 500,
+    stop_event: Optional[threading.Event] = None
+) -> None:
+    """
+    주기적으로 자동 종료 실행 (stop_event가 설정될 때까지 반복)
+
+    한 번의 실패로 워커가 종료되지 않도록 예외는 기록만 하고 다음 주기에 다시 시도합니다.
+
+    Args:
+        app: Flask 앱
+        interval: 실행 간격(초)
+        batch_size: 배치 크기
+        stop_event: 종료 신호 (None이면 프로세스가 끝날 때까지 실행)
+    """
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        with app.app_context():
+            try:
+                closed = sweep_expired_campaigns(batch_size=batch_size)
+                if closed:
+                    logger.info('모집 기간이 지난 체험단 %d개 종료', closed)
+            except Exception:
+                logger.exception('체험단 자동 종료 실패')
+        stop_event.wait(interval)
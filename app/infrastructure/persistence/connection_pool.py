@@ -0,0 +1,225 @@
+"""
+DB 커넥션 풀 설정 및 지표
+Infrastructure Layer - Persistence
+
+- build_engine_options: Config의 DB_POOL_* 설정으로 SQLALCHEMY_ENGINE_OPTIONS 생성
+- InstrumentedQueuePool: 커넥션 획득 대기 시간/타임아웃을 기록하는 QueuePool
+- collect_pool_stats: 엔진별 풀 상태 (checked out, overflow, 대기 시간)
+- init_pool_metrics: 풀 상태 주기적 로깅 및 pre-ping 무효화 집계
+
+워커 수 산정 기준: gunicorn 워커 수 × (DB_POOL_SIZE + DB_MAX_OVERFLOW) ≤ DB 최대 연결 수
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping
+
+from flask import Flask, current_app
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+
+logger = logging.getLogger(__name__)
+
+
+class CheckoutWaitStats:
+    """커넥션 획득 대기 시간 통계"""
+
+    def __init__(self, slow_threshold_ms: float = 100.0):
+        """
+        Args:
+            slow_threshold_ms: 경고 로그를 남길 대기 시간 기준(ms)
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.invalidations = 0
+
+    def record(self, wait_ms: float) -> bool:
+        """
+        대기 시간 기록
+
+        Returns:
+            bool: 기준 시간을 넘은 느린 획득 여부
+        """
+        slow = wait_ms >= self.slow_threshold_ms
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            if slow:
+                self.slow_checkouts += 1
+        return slow
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """통계 스냅샷"""
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'avg_wait_ms': round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                'max_wait_ms': round(self.max_wait_ms, 3),
+                'slow_checkouts': self.slow_checkouts,
+                'timeouts': self.timeouts,
+                'invalidations': self.invalidations,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """커넥션 획득 대기 시간을 기록하는 QueuePool"""
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow_limit = max_overflow
+        self.wait_stats = CheckoutWaitStats()
+
+    def recreate(self):
+        # engine.dispose() 후에도 누적 통계 유지
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record_timeout()
+            logger.error('DB 커넥션 획득 실패 (풀 포화): %s', self.status())
+            raise
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        if self.wait_stats.record(wait_ms):
+            logger.warning('DB 커넥션 획득 지연 %.1fms: %s', wait_ms, self.status())
+        return connection
+
+
+def build_engine_options(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    DB_POOL_* 설정으로 SQLAlchemy 엔진 옵션 생성
+
+    - SQLite: pre-ping만 적용 (Flask-SQLAlchemy 기본 풀 사용)
+    - PgBouncer transaction 모드: 앱 측 풀 없이(NullPool) PgBouncer가 풀링 담당
+    - 그 외: InstrumentedQueuePool + pool_size/max_overflow/timeout/recycle
+
+    Args:
+        config: Flask 설정
+
+    Returns:
+        SQLALCHEMY_ENGINE_OPTIONS 딕셔너리
+    """
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or ''
+    options: Dict[str, Any] = {'pool_pre_ping': config.get('DB_POOL_PRE_PING', True)}
+
+    if uri.startswith('sqlite'):
+        return options
+
+    if config.get('DB_PGBOUNCER_TRANSACTION_MODE'):
+        options['poolclass'] = NullPool
+        if uri.startswith('postgresql+psycopg:'):
+            # psycopg3는 자동 prepared statement를 사용하므로 transaction 모드에서 비활성화
+            options['connect_args'] = {'prepare_threshold': None}
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=config.get('DB_POOL_SIZE', 5),
+        max_overflow=config.get('DB_MAX_OVERFLOW', 5),
+        pool_timeout=config.get('DB_POOL_TIMEOUT', 10),
+        pool_recycle=config.get('DB_POOL_RECYCLE', 300),
+    )
+    return options
+
+
+def collect_pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    엔진의 커넥션 풀 상태 조회
+
+    Args:
+        engine: SQLAlchemy Engine
+
+    Returns:
+        {'pool', 'size', 'checked_in', 'checked_out', 'overflow', 'max_overflow', 'wait'} 딕셔너리
+        (QueuePool이 아니면 'pool'만 포함)
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {'pool': type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+
+    if isinstance(pool, InstrumentedQueuePool):
+        stats['max_overflow'] = pool.max_overflow_limit
+        stats['wait'] = pool.wait_stats.snapshot()
+
+    return stats
+
+
+def collect_all_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    현재 앱의 모든 엔진(primary + 복제본) 풀 상태
+
+    Returns:
+        {'primary': {...}, 'replica_0': {...}} 딕셔너리
+    """
+    from app.extensions import db
+
+    return {
+        key or 'primary': collect_pool_stats(engine)
+        for key, engine in db.engines.items()
+    }
+
+
+def init_pool_metrics(app: Flask) -> None:
+    """
+    풀 지표 설정: 느린 획득 기준, pre-ping 무효화 집계, 주기적 상태 로깅
+
+    db.init_app 이후에 호출해야 합니다.
+
+    Args:
+        app: Flask 앱
+    """
+    from app.extensions import db
+
+    with app.app_context():
+        for engine in db.engines.values():
+            pool = engine.pool
+            if not isinstance(pool, InstrumentedQueuePool):
+                continue
+            pool.wait_stats.slow_threshold_ms = app.config.get('DB_POOL_SLOW_CHECKOUT_MS', 100)
+
+            @event.listens_for(pool, 'invalidate')
+            def _count_invalidation(dbapi_connection, connection_record, exception, _pool=pool):
+                _pool.wait_stats.record_invalidation()
+
+    interval = app.config.get('DB_POOL_LOG_INTERVAL', 60)
+    if not interval:
+        return
+
+    state = {'last_logged': time.monotonic()}
+
+    @app.after_request
+    def _log_pool_stats(response):
+        now = time.monotonic()
+        if now - state['last_logged'] >= interval:
+            state['last_logged'] = now
+            current_app.logger.info('DB pool stats: %s', collect_all_pool_stats())
+        return response
@@ -0,0 +1,145 @@
+"""
+매퍼 변환 벤치마크
+Infrastructure Layer - Persistence
+
+- benchmark_mappers: ORM 모델 N개 → 도메인 엔티티 변환 시간/메모리를
+  slots 엔티티와 같은 필드의 일반 dataclass(인스턴스마다 __dict__)로 비교
+
+python manage.py benchmark-mappers [ROWS] 로 실행합니다. (DB 조회 없이 메모리 안의 모델만 변환)
+"""
+import gc
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import MISSING, dataclass, field, fields, make_dataclass
+from datetime import date, datetime
+from typing import Callable, Iterator, List
+
+
+@dataclass(frozen=True)
+class MapperBenchmark:
+    """매퍼 한 개의 변환 벤치마크 결과"""
+    name: str
+    rows: int
+    seconds: float  # slots 엔티티 변환 시간 (반복 중 최소)
+    baseline_seconds: float  # 일반 dataclass 변환 시간 (반복 중 최소)
+    bytes: int  # 변환 결과가 차지하는 메모리
+    baseline_bytes: int
+
+
+def _unslotted(entity_class: type) -> type:
+    """같은 필드를 가진 일반 dataclass (비교 기준)"""
+    return make_dataclass(entity_class.__name__, [
+        (f.name, f.type) if f.default is MISSING else (f.name, f.type, field(default=f.default))
+        for f in fields(entity_class)
+    ])
+
+
+@contextmanager
+def _entity_class(module, name: str, entity_class: type) -> Iterator[None]:
+    """매퍼 모듈이 생성하는 엔티티 클래스를 블록 안에서만 교체"""
+    original = getattr(module, name)
+    setattr(module, name, entity_class)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+def _measure(convert: Callable, models: list, repeat: int) -> tuple:
+    """(최소 변환 시간, 변환 결과 메모리)"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        entities = [convert(model) for model in models]
+        best = min(best, time.perf_counter() - start)
+        del entities
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        entities = [convert(model) for model in models]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del entities
+    return best, size
+
+
+def _campaign_models(rows: int) -> list:
+    from app.infrastructure.persistence.models.campaign_model import CampaignModel
+
+    return [
+        CampaignModel(
+            id=i,
+            advertiser_id=i % 100 + 1,
+            title=f'체험단 {i}',
+            description='체험단 설명',
+            quota=10,
+            start_date=date(2025, 11, 1),
+            end_date=date(2025, 11, 30),
+            benefits='혜택',
+            conditions='조건',
+            image_url=None,
+            status='RECRUITING',
+            created_at=datetime(2025, 11, 1),
+            closed_at=None,
+            application_count=i % 30,
+            image_variants=None
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def _application_models(rows: int) -> list:
+    from app.infrastructure.persistence.models.application_model import ApplicationModel
+
+    return [
+        ApplicationModel(
+            id=i,
+            campaign_id=i % 100 + 1,
+            influencer_id=i,
+            application_reason='지원 사유',
+            status='APPLIED',
+            applied_at=datetime(2025, 11, 1)
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def benchmark_mappers(rows: int = 10000, repeat: int = 5) -> List[MapperBenchmark]:
+    """
+    CampaignMapper / ApplicationMapper 변환 벤치마크
+
+    Args:
+        rows: 변환할 모델 개수
+        repeat: 시간 측정 반복 횟수 (최소값 사용)
+
+    Returns:
+        MapperBenchmark 리스트 (Campaign, Application 순서)
+    """
+    from app.infrastructure.persistence.mappers import application_mapper, campaign_mapper
+
+    targets = [
+        ('CampaignMapper', campaign_mapper, 'Campaign', campaign_mapper.CampaignMapper, _campaign_models),
+        ('ApplicationMapper', application_mapper, 'Application', application_mapper.ApplicationMapper,
+         _application_models),
+    ]
+
+    results = []
+    for name, module, entity_name, mapper, build_models in targets:
+        models = build_models(rows)
+        seconds, size = _measure(mapper.to_entity, models, repeat)
+        with _entity_class(module, entity_name, _unslotted(getattr(module, entity_name))):
+            baseline_seconds, baseline_size = _measure(mapper.to_entity, models, repeat)
+
+        results.append(MapperBenchmark(
+            name=name,
+            rows=rows,
+            seconds=seconds,
+            baseline_seconds=baseline_seconds,
+            bytes=size,
+            baseline_bytes=baseline_size
+        ))
+    return results
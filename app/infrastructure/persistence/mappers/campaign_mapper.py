@@ -6,6 +6,9 @@ Campaign Mapper (도메인 엔티티 ↔ ORM 모델 변환)
 from app.domain.entities.campaign import Campaign, CampaignStatus
 from app.infrastructure.persistence.models.campaign_model import CampaignModel
 
+# 상태 문자열 → Enum (행마다 CampaignStatus(...) 조회 대신 dict 조회)
+_STATUS_BY_VALUE = {status.value: status for status in CampaignStatus}
+
 
 class CampaignMapper:
     """Campaign 도메인 엔티티와 CampaignModel ORM 간 변환"""
@@ -32,9 +35,11 @@ class CampaignMapper:
             benefits=model.benefits,
             conditions=model.conditions,
             image_url=model.image_url,
-            status=CampaignStatus(model.status),
+            status=_STATUS_BY_VALUE[model.status],
             created_at=model.created_at,
-            closed_at=model.closed_at
+            closed_at=model.closed_at,
+            application_count=model.application_count or 0,
+            image_variants=model.image_variants
         )
 
     @staticmethod
@@ -63,6 +68,11 @@ class CampaignMapper:
             closed_at=entity.closed_at
         )
 
+        # application_count는 매핑하지 않음 (DB에서 원자적으로 증가시키는 카운터이므로
+        # 오래된 엔티티 값으로 덮어쓰지 않도록 함)
+        # image_variants도 매핑하지 않음 (백그라운드 생성 작업이 채우는 값이므로
+        # 수정 시 오래된 엔티티 값으로 덮어쓰지 않도록 함)
+
         # ID가 있으면 설정 (업데이트 케이스)
         if entity.id is not None:
             model.id = entity.id
@@ -36,6 +36,10 @@ class AdvertiserModel(db.Model):
     representative_name = db.Column(db.String(100), nullable=False)
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("idx_advertiser_phone_number", "phone_number"),
+    )
+
     # 관계
     user = db.relationship("UserModel", back_populates="advertiser")
     campaigns = db.relationship("CampaignModel", back_populates="advertiser", cascade="all, delete")
@@ -31,6 +31,13 @@ class ApplicationModel(db.Model):
     # 중복 지원 방지
     __table_args__ = (
         db.UniqueConstraint('campaign_id', 'influencer_id', name='uq_application_campaign_influencer'),
+        # 지원자 목록 / 지원 내역 / 상태별 조회
+        db.Index('idx_application_influencer_id', 'influencer_id'),
+        db.Index('idx_application_campaign_id', 'campaign_id'),
+        db.Index('idx_application_status', 'status'),
+        db.Index('idx_application_applied_at', db.text('applied_at DESC')),
+        # 특정 인플루언서의 지원 내역을 최신순으로 조회
+        db.Index('idx_application_influencer_applied_at', 'influencer_id', db.text('applied_at DESC')),
     )
 
     # 관계
@@ -3,9 +3,24 @@
 Campaign ORM Model (데이터베이스 테이블)
 """
 
+from sqlalchemy import DDL, event, text
+
 from app.extensions import db
+from app.shared.constants.campaign_constants import STATUS_RECRUITING
 from datetime import datetime, UTC, date
 
+# 모집 중 체험단만 담는 부분 인덱스 조건 (홈 피드/필터는 항상 모집 중 체험단만 조회)
+RECRUITING_INDEX_WHERE = text(f"status = '{STATUS_RECRUITING}'")
+
+
+def _recruiting_index(name: str, *columns: str) -> db.Index:
+    """모집 중 체험단 부분 인덱스 (PostgreSQL/SQLite)"""
+    return db.Index(
+        name, *columns,
+        postgresql_where=RECRUITING_INDEX_WHERE,
+        sqlite_where=RECRUITING_INDEX_WHERE
+    )
+
 
 class CampaignModel(db.Model):
     """
@@ -37,6 +52,17 @@ class CampaignModel(db.Model):
 
     # 이미지
     image_url = db.Column(db.Text, nullable=True)
+    # 반응형 변형 URL ({'thumbnail': URL, 'webp': {너비: URL}}), 백그라운드에서 생성 후 채움
+    image_variants = db.Column(db.JSON(none_as_null=True), nullable=True)
+
+    # 지역 (광고주 주소의 시/도 약칭, 저장 시 함께 갱신 - 지역 필터용 비정규화)
+    region = db.Column(db.String(20), nullable=True)
+
+    # 검색 문서 (제목/설명/혜택/상호명의 2-gram 토큰, 저장 시 함께 갱신)
+    search_document = db.Column(db.Text, nullable=True)
+
+    # 지원자 수 (application 삽입과 같은 트랜잭션에서 증가하는 비정규화 카운터)
+    application_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # 상태 (RECRUITING, CLOSED, SELECTED)
     status = db.Column(db.String(20), nullable=False, default='RECRUITING')
@@ -45,6 +71,28 @@ class CampaignModel(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(UTC))
     closed_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # PostgreSQL 전문 검색 인덱스 (SQLite는 아래 FTS5 테이블 사용)
+        db.Index(
+            'ix_campaign_search_document',
+            text("to_tsvector('simple', coalesce(search_document, ''))"),
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
+        # 모집 목록 필터/정렬 (마감 임박·신규 오픈·지역·모집 인원 조합)
+        _recruiting_index('ix_campaign_recruiting_end_date', 'end_date', 'id'),
+        _recruiting_index('ix_campaign_recruiting_created_at', 'created_at', 'id'),
+        _recruiting_index('ix_campaign_recruiting_region_end_date', 'region', 'end_date', 'id'),
+        _recruiting_index('ix_campaign_recruiting_region_created_at', 'region', 'created_at', 'id'),
+        _recruiting_index('ix_campaign_recruiting_quota_end_date', 'quota', 'end_date'),
+        # supabase/migrations/20251114000002_create_indexes.sql 과 같은 인덱스
+        db.Index('idx_campaign_advertiser_id', 'advertiser_id'),
+        db.Index('idx_campaign_status', 'status'),
+        db.Index('idx_campaign_end_date', 'end_date'),
+        db.Index('idx_campaign_created_at', text('created_at DESC')),
+        _recruiting_index('idx_campaign_recruiting', 'status'),
+        _recruiting_index('idx_campaign_status_created_at', 'status', text('created_at DESC')),
+    )
+
     # 관계
     advertiser = db.relationship('AdvertiserModel', back_populates='campaigns')
     applications = db.relationship('ApplicationModel', back_populates='campaign', cascade='all, delete-orphan')
@@ -53,5 +101,29 @@ class CampaignModel(db.Model):
         return f'<CampaignModel id={self.id} title={self.title} status={self.status}>'
 
 
+# SQLite 개발 환경 전문 검색: campaign.search_document를 내용으로 하는 FTS5 외부 콘텐츠 테이블
+# (트리거로 campaign 변경과 함께 색인 갱신)
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS campaign_fts USING fts5("
+    "search_document, content='campaign', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_ai AFTER INSERT ON campaign BEGIN "
+    "INSERT INTO campaign_fts(rowid, search_document) VALUES (new.id, coalesce(new.search_document, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_ad AFTER DELETE ON campaign BEGIN "
+    "INSERT INTO campaign_fts(campaign_fts, rowid, search_document) "
+    "VALUES ('delete', old.id, coalesce(old.search_document, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_au AFTER UPDATE OF search_document ON campaign BEGIN "
+    "INSERT INTO campaign_fts(campaign_fts, rowid, search_document) "
+    "VALUES ('delete', old.id, coalesce(old.search_document, '')); "
+    "INSERT INTO campaign_fts(rowid, search_document) VALUES (new.id, coalesce(new.search_document, '')); END",
+]
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(CampaignModel.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(
+    CampaignModel.__table__, 'before_drop',
+    DDL("DROP TABLE IF EXISTS campaign_fts").execute_if(dialect='sqlite')
+)
+
+
 # Advertiser 모델에 campaigns 관계 추가 필요
 # (advertiser_model.py에서 추가)
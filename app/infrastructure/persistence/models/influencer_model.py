@@ -20,6 +20,10 @@ class InfluencerModel(db.Model):
     follower_count = db.Column(db.Integer, nullable=False)
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('idx_influencer_phone_number', 'phone_number'),
+    )
+
     # Relationships
     user = db.relationship('UserModel', back_populates='influencer')
     applications = db.relationship('ApplicationModel', back_populates='influencer', cascade='all, delete')
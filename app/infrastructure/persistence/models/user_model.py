@@ -1,6 +1,6 @@
 """User ORM Model (데이터베이스 테이블)"""
 
-from app.extensions import db, login_manager
+from app.extensions import db
 from flask_login import UserMixin
 from datetime import datetime, UTC
 
@@ -27,6 +27,15 @@ class UserModel(db.Model, UserMixin):
     # 계정 생성일
     created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(UTC))
 
+    __table_args__ = (
+        # 역할별 조회 (역할이 있는 사용자만 인덱싱)
+        db.Index(
+            'idx_user_role', 'role',
+            postgresql_where=db.text('role IS NOT NULL'),
+            sqlite_where=db.text('role IS NOT NULL')
+        ),
+    )
+
     # 관계
     advertiser = db.relationship('AdvertiserModel', back_populates='user', uselist=False, cascade='all, delete-orphan')
     influencer = db.relationship('InfluencerModel', back_populates='user', uselist=False, cascade='all, delete-orphan')
@@ -34,8 +43,3 @@ class UserModel(db.Model, UserMixin):
     def __repr__(self):
         return f'<UserModel id={self.id} email={self.email} role={self.role}>'
 
-
-@login_manager.user_loader
-def load_user(user_id):
-    """Flask-Login user_loader 콜백"""
-    return UserModel.query.get(user_id)
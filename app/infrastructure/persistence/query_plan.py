@@ -0,0 +1,203 @@
+"""
+쿼리 실행 계획 점검
+Infrastructure Layer - Persistence
+
+- capture_query_plans: 블록 안에서 실행된 SELECT마다 같은 커넥션에서 EXPLAIN 실행
+- find_sequential_scans: 실행 계획에서 순차 스캔(PostgreSQL Seq Scan / SQLite SCAN)한 테이블 찾기
+- explain_hot_queries: 주요 저장소 쿼리의 실행 계획을 모아 큰 테이블 순차 스캔 표시
+
+python manage.py explain-hot-queries 로 실행합니다. (점검 대상 SELECT도 실제로 실행되며, 데이터는 변경하지 않음)
+"""
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event, func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+# 순차 스캔을 점검할 테이블
+CHECKED_TABLES = ('users', 'advertiser', 'influencer', 'campaign', 'application')
+
+_POSTGRESQL_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+_SQLITE_SCAN = re.compile(r'^SCAN (\w+)(.*)$')
+_ALIAS = re.compile(r'\b(\w+) AS (\w+)\b')
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """SQL 한 문장의 실행 계획"""
+    statement: str
+    lines: List[str]
+    dialect: str
+
+
+@dataclass
+class HotQueryReport:
+    """주요 쿼리 점검 결과"""
+    name: str
+    plans: List[QueryPlan] = field(default_factory=list)
+    sequential_scans: List[str] = field(default_factory=list)  # 큰 테이블 중 순차 스캔한 테이블
+
+
+@contextmanager
+def capture_query_plans() -> Iterator[List[QueryPlan]]:
+    """
+    블록 안에서 실행되는 SELECT의 실행 계획 수집
+
+    실행 직전에 같은 DB 커넥션에서 같은 파라미터로 EXPLAIN을 실행합니다.
+    (읽기 전용 복제본으로 라우팅된 쿼리도 그 복제본의 계획을 수집)
+
+    Yields:
+        QueryPlan 리스트 (블록 실행 중 채워짐)
+    """
+    plans: List[QueryPlan] = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            return
+
+        dialect = conn.dialect.name
+        prefix = 'EXPLAIN QUERY PLAN ' if dialect == 'sqlite' else 'EXPLAIN '
+        explain_cursor = conn.connection.cursor()
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            rows = explain_cursor.fetchall()
+        finally:
+            explain_cursor.close()
+
+        # SQLite: (id, parent, notused, detail) / PostgreSQL: (QUERY PLAN,)
+        plans.append(QueryPlan(statement=statement, lines=[str(row[-1]) for row in rows], dialect=dialect))
+
+    event.listen(Engine, 'before_cursor_execute', explain)
+    try:
+        yield plans
+    finally:
+        event.remove(Engine, 'before_cursor_execute', explain)
+
+
+def find_sequential_scans(plan: QueryPlan) -> List[str]:
+    """
+    실행 계획에서 순차 스캔한 테이블 이름 찾기 (SQLite 별칭은 원래 테이블 이름으로 변환)
+
+    인덱스 전체 스캔(SCAN ... USING INDEX)과 가상 테이블(FTS5) 스캔은 제외합니다.
+
+    Args:
+        plan: 실행 계획
+
+    Returns:
+        테이블 이름 리스트 (중복 제거, 나온 순서)
+    """
+    tables: List[str] = []
+    if plan.dialect == 'postgresql':
+        for line in plan.lines:
+            for match in _POSTGRESQL_SEQ_SCAN.finditer(line):
+                tables.append(match.group(1))
+    else:
+        aliases = {alias: table for table, alias in _ALIAS.findall(plan.statement)}
+        for line in plan.lines:
+            match = _SQLITE_SCAN.match(line.strip())
+            if match and not match.group(2).lstrip().startswith(('USING', 'VIRTUAL')):
+                tables.append(aliases.get(match.group(1), match.group(1)))
+    return list(dict.fromkeys(tables))
+
+
+def table_row_counts(session: Session, tables=CHECKED_TABLES) -> Dict[str, int]:
+    """
+    테이블별 행 수 (PostgreSQL은 통계 추정치 reltuples, 그 외는 COUNT)
+
+    Args:
+        session: SQLAlchemy Session
+        tables: 테이블 이름
+
+    Returns:
+        {테이블: 행 수}
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        rows = session.execute(
+            text("SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r' AND relname = ANY(:tables)"),
+            {'tables': list(tables)}
+        ).all()
+        return {name: max(int(count), 0) for name, count in rows}
+
+    return {
+        table: session.execute(text(f'SELECT count(*) FROM "{table}"')).scalar() or 0
+        for table in tables
+    }
+
+
+def hot_queries(session: Session) -> List[Tuple[str, Callable[[], object]]]:
+    """
+    점검할 주요 저장소 쿼리 (홈 피드, 검색, 상세, 대시보드, 지원 내역 등)
+
+    파라미터는 DB에 있는 첫 광고주/인플루언서/체험단 ID를 사용합니다.
+
+    Args:
+        session: SQLAlchemy Session
+
+    Returns:
+        [(이름, 쿼리 실행 함수)]
+    """
+    from app.domain.value_objects.campaign_filter import CampaignFilter
+    from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
+    from app.infrastructure.persistence.models.campaign_model import CampaignModel
+    from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+    from app.infrastructure.repositories.application_repository import ApplicationRepository
+    from app.infrastructure.repositories.campaign_repository import CampaignRepository
+    from app.infrastructure.repositories.user_repository import UserRepository
+    from app.shared.utils.search_utils import parse_search_query
+
+    campaigns = CampaignRepository(session)
+    applications = ApplicationRepository(session)
+    users = UserRepository(session)
+    advertiser_id = session.query(func.min(AdvertiserModel.id)).scalar() or 0
+    influencer_id = session.query(func.min(InfluencerModel.id)).scalar() or 0
+    campaign_id = session.query(func.min(CampaignModel.id)).scalar() or 0
+
+    return [
+        ('홈 피드 (최신순)', lambda: campaigns.find_recruiting_campaigns_page(sort='latest')),
+        ('홈 피드 (마감임박순)', lambda: campaigns.find_recruiting_campaigns_page(sort='deadline')),
+        ('홈 피드 (인기순)', lambda: campaigns.find_recruiting_campaigns_page(sort='popular')),
+        ('홈 피드 (커서)', lambda: campaigns.find_recruiting_campaigns_by_cursor(sort='latest')),
+        ('홈 피드 (지역 + 마감 필터)', lambda: campaigns.find_recruiting_campaigns_page(
+            sort='deadline', filters=CampaignFilter(region='서울', deadline_days=7)
+        )),
+        ('홈 피드 필터별 개수', lambda: campaigns.count_recruiting_facets()),
+        ('체험단 검색', lambda: campaigns.search_campaigns(parse_search_query('체험단'))),
+        ('체험단 상세', lambda: campaigns.find_by_id_with_advertiser(campaign_id)),
+        ('광고주 대시보드', lambda: campaigns.find_advertiser_campaigns_by_status(advertiser_id, limit_per_status=10)),
+        ('지원자 목록', lambda: applications.find_applicants_by_campaign(campaign_id, limit=20)),
+        ('중복 지원 확인', lambda: applications.exists_by_campaign_and_influencer(campaign_id, influencer_id)),
+        ('인플루언서 지원 내역', lambda: applications.find_history_by_influencer(influencer_id, limit=20)),
+        ('인플루언서 상태별 지원 개수', lambda: applications.count_by_status_for_influencer(influencer_id)),
+        ('이메일로 사용자 조회', lambda: users.find_by_email('explain@example.com')),
+    ]
+
+
+def explain_hot_queries(session: Session, min_rows: int = 10000) -> List[HotQueryReport]:
+    """
+    주요 쿼리 실행 계획 점검
+
+    Args:
+        session: SQLAlchemy Session
+        min_rows: 이 행 수 이상인 테이블의 순차 스캔만 표시 (0이면 모든 순차 스캔)
+
+    Returns:
+        HotQueryReport 리스트 (hot_queries 순서)
+    """
+    row_counts = table_row_counts(session)
+    large_tables = {table for table, count in row_counts.items() if count >= min_rows}
+
+    reports = []
+    for name, run in hot_queries(session):
+        with capture_query_plans() as plans:
+            run()
+        scans = [table for plan in plans for table in find_sequential_scans(plan)]
+        reports.append(HotQueryReport(
+            name=name,
+            plans=list(plans),
+            sequential_scans=[table for table in dict.fromkeys(scans) if table in large_tables]
+        ))
+    return reports
@@ -0,0 +1,179 @@
+"""
+읽기 복제본(Read Replica) 라우팅 세션
+Infrastructure Layer - Persistence
+
+- @read_only 로 표시한 Repository 메서드의 SELECT는 복제본으로 전송
+- INSERT/UPDATE/DELETE, flush, 그리고 같은 트랜잭션에서 쓰기 이후의 조회는 primary로 전송
+- 사용자가 쓰기를 커밋하면 REPLICA_STICKY_SECONDS 동안 해당 사용자의 조회를
+  primary로 고정하여 방금 한 지원/생성이 바로 보이도록 함 (read-your-writes)
+- primary_reads 블록 안의 조회는 @read_only여도 primary로 전송
+  (무효화 직후 공용 캐시 재적재 등 복제 지연 데이터를 저장하면 안 되는 경우)
+
+복제본이 설정되지 않으면(SQLALCHEMY_REPLICA_URIS 비어 있음) 모든 쿼리는 primary로 갑니다.
+"""
+import random
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import Flask, current_app, g, has_request_context, session as flask_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+
+REPLICA_BIND_PREFIX = 'replica_'
+
+_REPLICA_DEPTH_KEY = 'replica_read_depth'
+_PRIMARY_DEPTH_KEY = 'primary_read_depth'
+_WROTE_KEY = 'wrote_in_transaction'
+_STICKY_SESSION_KEY = '_primary_until'
+
+
+class RoutingSession(Session):
+    """복제본 라우팅을 지원하는 Flask-SQLAlchemy 세션"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and clause is not None:
+            if getattr(clause, 'is_dml', False):
+                # 쓰기 발생: 이후 같은 트랜잭션의 조회는 primary
+                self.info[_WROTE_KEY] = True
+            elif self._replica_eligible(clause):
+                replica = self._pick_replica()
+                if replica is not None:
+                    return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _replica_eligible(self, clause) -> bool:
+        """복제본으로 보낼 수 있는 조회인지 확인"""
+        if not self.info.get(_REPLICA_DEPTH_KEY) or self.info.get(_PRIMARY_DEPTH_KEY):
+            return False
+        if self._flushing or self.info.get(_WROTE_KEY):
+            return False
+        if not getattr(clause, 'is_select', False):
+            return False
+        if has_request_context() and g.get('read_primary'):
+            return False
+        return True
+
+    def _pick_replica(self):
+        """설정된 복제본 엔진 중 하나 선택 (없으면 None)"""
+        replicas = [
+            engine for key, engine in self._db.engines.items()
+            if key is not None and key.startswith(REPLICA_BIND_PREFIX)
+        ]
+        if not replicas:
+            return None
+        return random.choice(replicas)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_flush_write(session, flush_context) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _stick_to_primary_after_write(session) -> None:
+    """쓰기 커밋 후 일정 시간 동안 현재 사용자의 조회를 primary로 고정"""
+    if not session.info.pop(_WROTE_KEY, False):
+        return
+    if not has_request_context():
+        return
+
+    sticky_seconds = current_app.config.get('REPLICA_STICKY_SECONDS', 0)
+    if sticky_seconds and current_app.config.get('SQLALCHEMY_REPLICA_URIS'):
+        flask_session[_STICKY_SESSION_KEY] = time.time() + sticky_seconds
+        g.read_primary = True
+
+
+@event.listens_for(RoutingSession, 'after_soft_rollback')
+def _reset_write_flag(session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_WROTE_KEY, None)
+
+
+def read_only(method):
+    """
+    Repository 조회 메서드를 복제본으로 라우팅하는 데코레이터
+
+    self.session이 RoutingSession(또는 그 scoped_session)일 때만 효과가 있으며,
+    복제본이 없거나 primary 고정 상태면 그대로 primary에서 실행됩니다.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with replica_reads(self.session):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def replica_reads(session):
+    """
+    블록 안의 조회를 복제본으로 라우팅
+
+    Args:
+        session: SQLAlchemy Session 또는 scoped_session
+    """
+    info = session.info
+    info[_REPLICA_DEPTH_KEY] = info.get(_REPLICA_DEPTH_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_REPLICA_DEPTH_KEY] -= 1
+
+
+@contextmanager
+def primary_reads(session):
+    """
+    블록 안의 조회를 primary로 고정 (@read_only 메서드 포함)
+
+    Args:
+        session: SQLAlchemy Session 또는 scoped_session
+    """
+    info = session.info
+    info[_PRIMARY_DEPTH_KEY] = info.get(_PRIMARY_DEPTH_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_PRIMARY_DEPTH_KEY] -= 1
+
+
+def configure_replica_binds(app: Flask) -> None:
+    """
+    SQLALCHEMY_REPLICA_URIS를 SQLALCHEMY_BINDS(replica_0, replica_1, ...)로 등록
+
+    db.init_app 이전에 호출해야 합니다.
+
+    Args:
+        app: Flask 앱
+    """
+    replica_uris = app.config.get('SQLALCHEMY_REPLICA_URIS') or []
+    if not replica_uris:
+        return
+
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    for index, uri in enumerate(replica_uris):
+        binds[f'{REPLICA_BIND_PREFIX}{index}'] = uri
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def init_replica_routing(app: Flask) -> None:
+    """
+    요청 시작 시 read-your-writes 고정 여부 확인
+
+    Args:
+        app: Flask 앱
+    """
+
+    @app.before_request
+    def _check_primary_sticky():
+        primary_until = flask_session.get(_STICKY_SESSION_KEY)
+        if primary_until is None:
+            g.read_primary = False
+            return
+        if primary_until > time.time():
+            g.read_primary = True
+        else:
+            flask_session.pop(_STICKY_SESSION_KEY, None)
+            g.read_primary = False
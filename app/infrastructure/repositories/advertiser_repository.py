@@ -1,6 +1,6 @@
 """Advertiser Repository 구현체"""
 
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.domain.entities.advertiser import Advertiser
 from app.infrastructure.repositories.interfaces.i_advertiser_repository import IAdvertiserRepository
@@ -76,3 +76,18 @@ class AdvertiserRepository(IAdvertiserRepository):
         """
         model = self.session.get(AdvertiserModel, advertiser_id)
         return AdvertiserMapper.to_entity(model) if model else None
+
+    def find_by_ids(self, advertiser_ids: List[int]) -> List[Advertiser]:
+        """
+        광고주 ID 목록으로 일괄 조회 (IN 쿼리 1회)
+
+        Args:
+            advertiser_ids: 광고주 ID 리스트
+
+        Returns:
+            List[Advertiser]: 존재하는 광고주 엔티티 리스트 (순서 보장 안 함)
+        """
+        if not advertiser_ids:
+            return []
+        models = self.session.query(AdvertiserModel).filter(AdvertiserModel.id.in_(advertiser_ids)).all()
+        return [AdvertiserMapper.to_entity(model) for model in models]
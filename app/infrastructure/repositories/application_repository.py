@@ -4,13 +4,40 @@ Application Repository 구현체
 체험단 지원 데이터 접근 계층
 """
 
-from typing import List
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import (
+    DateTime, Integer, String, Text, any_, bindparam, case, desc, exists, false, func,
+    insert, literal, select, update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.domain.entities.application import Application
 from app.infrastructure.repositories.interfaces.i_application_repository import IApplicationRepository
 from app.infrastructure.persistence.models.application_model import ApplicationModel
+from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+from app.infrastructure.persistence.models.campaign_model import CampaignModel
+from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
+from app.infrastructure.persistence.routing_session import read_only
 from app.infrastructure.persistence.mappers.application_mapper import ApplicationMapper
+from app.shared.constants.campaign_constants import (
+    STATUS_RECRUITING,
+    APPLICATION_STATUS_APPLIED,
+    APPLICATION_STATUS_REJECTED,
+    APPLICATION_STATUS_SELECTED,
+    VALID_APPLICATION_STATUSES,
+)
+
+
+# ON CONFLICT DO NOTHING을 지원하는 dialect별 insert
+_ON_CONFLICT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
 
 
 class ApplicationRepository(IApplicationRepository):
@@ -38,6 +65,70 @@ class ApplicationRepository(IApplicationRepository):
         self.session.flush()
         return ApplicationMapper.to_entity(model)
 
+    def insert_if_recruiting(self, application: Application) -> Optional[Application]:
+        """
+        모집 중인 체험단에만 지원 저장 (단일 INSERT ... SELECT)
+
+        INSERT ... SELECT ... WHERE EXISTS (모집 중인 체험단)
+        ON CONFLICT (campaign_id, influencer_id) DO NOTHING 으로
+        모집 상태/기간 확인과 중복 지원 방지를 DB에서 한 번에 처리합니다.
+        동시 지원이 겹쳐도 유니크 제약 위반 예외가 발생하지 않습니다.
+
+        Args:
+            application: 저장할 Application 엔티티 (id 없음)
+
+        Returns:
+            저장된 Application 엔티티 (ID 포함),
+            체험단이 모집 중이 아니거나 이미 지원한 경우 None
+        """
+        applied_at = application.applied_at or datetime.now()
+        table = ApplicationModel.__table__
+        columns = ['campaign_id', 'influencer_id', 'application_reason', 'status', 'applied_at']
+        source = select(
+            literal(application.campaign_id, Integer),
+            literal(application.influencer_id, Integer),
+            literal(application.application_reason, Text),
+            literal(application.status, String),
+            literal(applied_at, DateTime),
+        ).where(
+            exists().where(
+                CampaignModel.id == application.campaign_id,
+                CampaignModel.status == STATUS_RECRUITING,
+                CampaignModel.end_date >= date.today()
+            )
+        )
+
+        dialect = self.session.get_bind().dialect
+        dialect_insert = _ON_CONFLICT_INSERTS.get(dialect.name)
+
+        if dialect_insert is not None:
+            statement = dialect_insert(table).from_select(columns, source).on_conflict_do_nothing(
+                index_elements=['campaign_id', 'influencer_id']
+            )
+            application_id = self._execute_insert(statement, dialect)
+        else:
+            # ON CONFLICT 미지원 DB: SAVEPOINT 안에서 유니크 제약 위반을 중복 지원으로 처리
+            try:
+                with self.session.begin_nested():
+                    application_id = self._execute_insert(
+                        insert(table).from_select(columns, source), dialect
+                    )
+            except IntegrityError:
+                application_id = None
+
+        if application_id is None:
+            return None
+
+        return replace(application, id=application_id, applied_at=applied_at)
+
+    def _execute_insert(self, statement, dialect) -> Optional[int]:
+        """INSERT 실행 후 생성된 ID 반환 (삽입되지 않았으면 None)"""
+        if dialect.insert_returning:
+            return self.session.execute(statement.returning(ApplicationModel.id)).scalar()
+
+        result = self.session.execute(statement)
+        return result.lastrowid if result.rowcount == 1 else None
+
     def find_by_campaign_id(self, campaign_id: int) -> List[Application]:
         """
         체험단의 지원자 목록 조회
@@ -56,6 +147,96 @@ class ApplicationRepository(IApplicationRepository):
         )
         return [ApplicationMapper.to_entity(model) for model in models]
 
+    @read_only
+    def find_applicants_by_campaign(
+        self,
+        campaign_id: int,
+        status: Optional[str] = None,
+        sort: str = 'applied_at',
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], int]:
+        """
+        체험단 지원자 목록 조회 (인플루언서 정보 포함, 단일 쿼리)
+
+        application과 influencer를 JOIN하고 COUNT(*) OVER()로 전체 개수를
+        함께 조회하므로 지원자 수와 무관하게 쿼리 1회로 처리합니다.
+
+        Args:
+            campaign_id: 체험단 ID
+            status: 지원 상태 필터 (None이면 전체)
+            sort: 정렬 기준 ('applied_at', 'follower_count', 내림차순)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수 (None이면 전체)
+
+        Returns:
+            (지원자 정보 딕셔너리 리스트, 필터 조건의 전체 지원자 수) 튜플
+        """
+        query = (
+            self.session.query(
+                ApplicationModel.id,
+                ApplicationModel.application_reason,
+                ApplicationModel.applied_at,
+                ApplicationModel.status,
+                InfluencerModel.id,
+                InfluencerModel.name,
+                InfluencerModel.channel_name,
+                InfluencerModel.channel_url,
+                InfluencerModel.follower_count,
+                func.count().over().label('total_count')
+            )
+            .join(InfluencerModel, ApplicationModel.influencer_id == InfluencerModel.id)
+            .filter(ApplicationModel.campaign_id == campaign_id)
+        )
+
+        if status is not None:
+            query = query.filter(ApplicationModel.status == status)
+
+        if sort == 'follower_count':
+            query = query.order_by(desc(InfluencerModel.follower_count), desc(ApplicationModel.id))
+        else:
+            query = query.order_by(desc(ApplicationModel.applied_at), desc(ApplicationModel.id))
+
+        if skip:
+            query = query.offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = query.all()
+
+        if rows:
+            total_count = rows[0].total_count
+        elif skip:
+            # 범위를 벗어난 페이지: 전체 개수만 별도 조회
+            count_query = self.session.query(func.count(ApplicationModel.id)).filter(
+                ApplicationModel.campaign_id == campaign_id
+            )
+            if status is not None:
+                count_query = count_query.filter(ApplicationModel.status == status)
+            total_count = count_query.scalar() or 0
+        else:
+            total_count = 0
+
+        applicants = [
+            {
+                "application_id": application_id,
+                "influencer_id": influencer_id,
+                "influencer_name": influencer_name,
+                "channel_name": channel_name,
+                "channel_url": channel_url,
+                "follower_count": follower_count,
+                "application_reason": application_reason,
+                "applied_at": applied_at,
+                "status": application_status,
+            }
+            for (
+                application_id, application_reason, applied_at, application_status,
+                influencer_id, influencer_name, channel_name, channel_url, follower_count, _
+            ) in rows
+        ]
+
+        return applicants, total_count
+
     def exists_by_campaign_and_influencer(
         self, campaign_id: int, influencer_id: int
     ) -> bool:
@@ -93,6 +274,45 @@ class ApplicationRepository(IApplicationRepository):
             synchronize_session=False
         )
 
+    def apply_selection(self, campaign_id: int, selected_application_ids: List[int]) -> int:
+        """
+        인플루언서 선정 결과 반영 (단일 UPDATE)
+
+        체험단의 APPLIED 지원 중 선정 ID는 SELECTED, 나머지는 REJECTED로 한 번에 변경합니다.
+        PostgreSQL에서는 선정 ID를 배열 파라미터 하나로 전달합니다 (id = ANY(:ids)).
+
+        Args:
+            campaign_id: 체험단 ID
+            selected_application_ids: 선정할 지원 ID 리스트 (다른 체험단의 ID는 무시)
+
+        Returns:
+            상태가 변경된 지원 수
+        """
+        selected_ids = sorted(set(selected_application_ids))
+        is_selected = self._id_in(selected_ids) if selected_ids else false()
+
+        result = self.session.execute(
+            update(ApplicationModel)
+            .where(
+                ApplicationModel.campaign_id == campaign_id,
+                ApplicationModel.status == APPLICATION_STATUS_APPLIED
+            )
+            .values(status=case(
+                (is_selected, APPLICATION_STATUS_SELECTED),
+                else_=APPLICATION_STATUS_REJECTED
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _id_in(self, ids: List[int]):
+        """지원 ID 포함 조건 (PostgreSQL은 배열 파라미터, 그 외는 IN 목록)"""
+        if self.session.get_bind().dialect.name == 'postgresql':
+            return ApplicationModel.id == any_(
+                bindparam('selected_application_ids', ids, type_=ARRAY(Integer))
+            )
+        return ApplicationModel.id.in_(ids)
+
     def find_by_influencer_id(self, influencer_id: int) -> List[Application]:
         """
         인플루언서의 지원 내역 조회
@@ -110,3 +330,88 @@ class ApplicationRepository(IApplicationRepository):
             .all()
         )
         return [ApplicationMapper.to_entity(model) for model in models]
+
+    @read_only
+    def find_history_by_influencer(
+        self,
+        influencer_id: int,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        인플루언서의 지원 내역 조회 (체험단 및 광고주 정보 포함, 단일 쿼리)
+
+        Args:
+            influencer_id: 인플루언서 ID
+            status: 지원 상태 필터 (None이면 전체)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수 (None이면 전체)
+
+        Returns:
+            지원 내역 딕셔너리 리스트 (지원일시 기준 최신순)
+        """
+        query = (
+            self.session.query(
+                ApplicationModel.id,
+                ApplicationModel.status,
+                ApplicationModel.applied_at,
+                CampaignModel.id,
+                CampaignModel.title,
+                CampaignModel.end_date,
+                CampaignModel.status,
+                AdvertiserModel.business_name
+            )
+            .join(CampaignModel, ApplicationModel.campaign_id == CampaignModel.id)
+            .join(AdvertiserModel, CampaignModel.advertiser_id == AdvertiserModel.id)
+            .filter(ApplicationModel.influencer_id == influencer_id)
+        )
+
+        if status is not None:
+            query = query.filter(ApplicationModel.status == status)
+
+        query = query.order_by(desc(ApplicationModel.applied_at), desc(ApplicationModel.id))
+
+        if skip:
+            query = query.offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [
+            {
+                "application_id": application_id,
+                "status": application_status,
+                "applied_at": applied_at,
+                "campaign_id": campaign_id,
+                "campaign_title": campaign_title,
+                "campaign_end_date": campaign_end_date,
+                "campaign_status": campaign_status,
+                "business_name": business_name,
+            }
+            for (
+                application_id, application_status, applied_at,
+                campaign_id, campaign_title, campaign_end_date, campaign_status, business_name
+            ) in query.all()
+        ]
+
+    @read_only
+    def count_by_status_for_influencer(self, influencer_id: int) -> Dict[str, int]:
+        """
+        인플루언서의 상태별 지원 개수 조회 (GROUP BY status)
+
+        Args:
+            influencer_id: 인플루언서 ID
+
+        Returns:
+            {status: 개수} 딕셔너리 (지원 내역이 없는 상태는 0)
+        """
+        counts = {status: 0 for status in VALID_APPLICATION_STATUSES}
+        rows = (
+            self.session.query(ApplicationModel.status, func.count(ApplicationModel.id))
+            .filter(ApplicationModel.influencer_id == influencer_id)
+            .group_by(ApplicationModel.status)
+            .all()
+        )
+        for status, count in rows:
+            counts[status] = count
+        return counts
@@ -4,16 +4,33 @@ Campaign Repository 구현체
 체험단 데이터 접근 계층
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta, UTC
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import Row, func, desc, tuple_, literal, literal_column, select, case, text, update, and_, true
 
 from app.domain.entities.campaign import Campaign
+from app.domain.exceptions import ValidationException
+from app.domain.value_objects.campaign_filter import CampaignFilter
 from app.infrastructure.repositories.interfaces.i_campaign_repository import ICampaignRepository
 from app.infrastructure.persistence.models.campaign_model import CampaignModel
 from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
 from app.infrastructure.persistence.models.application_model import ApplicationModel
+from app.infrastructure.persistence.routing_session import read_only
 from app.infrastructure.persistence.mappers.campaign_mapper import CampaignMapper
+from app.shared.utils.cursor_utils import encode_cursor, decode_cursor
+from app.shared.utils.region_utils import extract_region
+from app.shared.utils.search_utils import build_search_document
+from app.shared.constants.campaign_constants import (
+    DEADLINE_WINDOW_DAYS,
+    DESCRIPTION_SHORT_LENGTH,
+    NEW_CAMPAIGN_DAYS,
+    QUOTA_RANGES,
+    REGIONS,
+    STATUS_CLOSED,
+    STATUS_RECRUITING,
+    VALID_CAMPAIGN_STATUSES,
+)
 
 
 class CampaignRepository(ICampaignRepository):
@@ -41,6 +58,22 @@ class CampaignRepository(ICampaignRepository):
             return None
         return CampaignMapper.to_entity(model)
 
+    def find_by_ids(self, campaign_ids: List[int]) -> List[Campaign]:
+        """
+        체험단 ID 목록으로 일괄 조회 (IN 쿼리 1회)
+
+        Args:
+            campaign_ids: 체험단 ID 리스트
+
+        Returns:
+            Campaign 엔티티 리스트 (순서 보장 안 함)
+        """
+        if not campaign_ids:
+            return []
+        models = self.session.query(CampaignModel).filter(CampaignModel.id.in_(campaign_ids)).all()
+        return [CampaignMapper.to_entity(model) for model in models]
+
+    @read_only
     def find_by_id_with_advertiser(self, campaign_id: int) -> Optional[tuple]:
         """
         체험단 ID로 광고주 정보 포함하여 조회
@@ -71,7 +104,7 @@ class CampaignRepository(ICampaignRepository):
 
     def get_application_count(self, campaign_id: int) -> int:
         """
-        지원자 수 조회
+        지원자 수 조회 (campaign.application_count 컬럼)
 
         Args:
             campaign_id: 체험단 ID
@@ -80,86 +113,683 @@ class CampaignRepository(ICampaignRepository):
             지원자 수
         """
         count = (
-            self.session.query(func.count(ApplicationModel.id))
-            .filter(ApplicationModel.campaign_id == campaign_id)
+            self.session.query(CampaignModel.application_count)
+            .filter(CampaignModel.id == campaign_id)
             .scalar()
         )
         return count or 0
 
-    def find_recruiting_campaigns(
-        self, skip: int = 0, limit: int = 12, sort: str = 'latest'
-    ) -> List[tuple]:
+    def increment_application_count(self, campaign_id: int, amount: int = 1) -> None:
         """
-        모집 중인 체험단 목록 조회
+        지원자 수 카운터 증가
+
+        UPDATE ... SET application_count = application_count + :amount 로
+        DB에서 원자적으로 증가시키므로 현재 트랜잭션과 함께 커밋/롤백됩니다.
 
         Args:
-            skip: 건너뛸 레코드 수
-            limit: 조회할 레코드 수
-            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            campaign_id: 체험단 ID
+            amount: 증가량 (기본값: 1)
+        """
+        self.session.query(CampaignModel).filter(
+            CampaignModel.id == campaign_id
+        ).update(
+            {CampaignModel.application_count: CampaignModel.application_count + amount},
+            synchronize_session=False
+        )
+
+    def recalculate_application_counts(self) -> int:
+        """
+        지원자 수 카운터 재계산 (application 테이블 기준으로 보정)
 
         Returns:
-            (Campaign, business_name, application_count) 튜플 리스트
+            값이 보정된 체험단 수
         """
-        # 서브쿼리: 지원자 수 집계
-        application_count_subq = (
-            self.session.query(
-                ApplicationModel.campaign_id,
-                func.count(ApplicationModel.id).label('application_count')
-            )
-            .group_by(ApplicationModel.campaign_id)
-            .subquery()
+        actual_count = (
+            select(func.count(ApplicationModel.id))
+            .where(ApplicationModel.campaign_id == CampaignModel.id)
+            .correlate(CampaignModel)
+            .scalar_subquery()
+        )
+        updated = self.session.query(CampaignModel).filter(
+            CampaignModel.application_count != actual_count
+        ).update(
+            {CampaignModel.application_count: actual_count},
+            synchronize_session=False
+        )
+        return updated or 0
+
+    def update_image_variants(self, image_url: str, variants: Dict) -> int:
+        """
+        같은 이미지를 쓰는 체험단의 반응형 이미지 변형 URL 저장
+
+        이미지 URL은 내용 해시 기반이므로 같은 URL의 체험단은 변형도 공유합니다.
+
+        Args:
+            image_url: 체험단 이미지 URL
+            variants: 변형 URL 딕셔너리
+
+        Returns:
+            수정된 체험단 수
+        """
+        updated = self.session.query(CampaignModel).filter(
+            CampaignModel.image_url == image_url
+        ).update(
+            {CampaignModel.image_variants: variants},
+            synchronize_session=False
         )
+        return updated or 0
 
-        # 메인 쿼리
+    def clear_image(self, campaign_id: int, image_url: str) -> int:
+        """
+        체험단 이미지 URL과 변형 URL 제거 (원본 업로드 실패 시)
+
+        같은 내용의 이미지는 URL을 공유하므로 다른 체험단은 건드리지 않고,
+        그 사이 이미지가 바뀐 체험단도 건드리지 않습니다.
+
+        Args:
+            campaign_id: 체험단 ID
+            image_url: 업로드에 실패한 이미지 URL
+
+        Returns:
+            수정된 체험단 수 (0 또는 1)
+        """
+        updated = self.session.query(CampaignModel).filter(
+            CampaignModel.id == campaign_id,
+            CampaignModel.image_url == image_url
+        ).update(
+            {CampaignModel.image_url: None, CampaignModel.image_variants: None},
+            synchronize_session=False
+        )
+        return updated or 0
+
+    def find_image_urls_without_variants(self, limit: Optional[int] = None) -> List[str]:
+        """
+        반응형 이미지 변형이 아직 없는 체험단 이미지 URL 조회 (중복 제거)
+
+        Args:
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            이미지 URL 리스트
+        """
         query = (
-            self.session.query(
-                CampaignModel,
-                AdvertiserModel.business_name,
-                func.coalesce(application_count_subq.c.application_count, 0).label('application_count')
+            self.session.query(CampaignModel.image_url)
+            .filter(
+                CampaignModel.image_url.isnot(None),
+                CampaignModel.image_variants.is_(None)
+            )
+            .distinct()
+            .order_by(CampaignModel.image_url)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [image_url for (image_url,) in query.all()]
+
+    @staticmethod
+    def _open_for_recruiting() -> tuple:
+        """
+        모집 중 조건 (상태 + 모집 기간)
+
+        자동 종료 작업이 아직 돌지 않아 RECRUITING으로 남은 기간 지난 체험단도 제외합니다.
+        """
+        return (
+            CampaignModel.status == STATUS_RECRUITING,
+            CampaignModel.end_date >= date.today(),
+        )
+
+    def close_expired_campaigns(self, today: date, closed_at: datetime, limit: int = 500) -> int:
+        """
+        모집 기간이 지난 체험단 일괄 종료 (한 배치)
+
+        UPDATE ... WHERE id IN (SELECT id ... LIMIT :limit) 한 문장으로 처리합니다.
+        PostgreSQL에서는 대상 행을 FOR UPDATE SKIP LOCKED로 잡으므로 여러 인스턴스가
+        동시에 실행해도 서로 기다리지 않고 다른 행을 처리하며,
+        UPDATE에서 상태를 다시 확인하므로 같은 체험단을 두 번 종료하지 않습니다.
+
+        Args:
+            today: 기준일 (종료일이 이 날짜보다 이전이면 종료)
+            closed_at: 종료 시각
+            limit: 배치 크기
+
+        Returns:
+            종료된 체험단 수
+        """
+        expired_ids = (
+            select(CampaignModel.id)
+            .where(
+                CampaignModel.status == STATUS_RECRUITING,
+                CampaignModel.end_date < today
+            )
+            .order_by(CampaignModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        updated = self.session.query(CampaignModel).filter(
+            CampaignModel.id.in_(expired_ids),
+            CampaignModel.status == STATUS_RECRUITING
+        ).update(
+            {CampaignModel.status: STATUS_CLOSED, CampaignModel.closed_at: closed_at},
+            synchronize_session=False
+        )
+        return updated or 0
+
+    @staticmethod
+    def _filter_conditions(filters: Optional[CampaignFilter]) -> Dict[str, object]:
+        """
+        목록 필터 → 필터 종류별 SQL 조건
+
+        각 조건은 모집 중 부분 인덱스(ix_campaign_recruiting_*)의 선두 컬럼 범위 조건입니다.
+
+        Args:
+            filters: 목록 필터 (None이면 조건 없음)
+
+        Returns:
+            {'deadline' | 'quota' | 'region' | 'new': 조건} (적용된 필터만)
+        """
+        if filters is None:
+            return {}
+
+        conditions = {}
+        if filters.deadline_days is not None:
+            conditions['deadline'] = CampaignModel.end_date <= date.today() + timedelta(days=filters.deadline_days)
+        if filters.quota_bounds is not None:
+            minimum, maximum = filters.quota_bounds
+            conditions['quota'] = (
+                CampaignModel.quota.between(minimum, maximum) if maximum is not None
+                else CampaignModel.quota >= minimum
             )
+        if filters.region is not None:
+            conditions['region'] = CampaignModel.region == filters.region
+        if filters.new_only:
+            conditions['new'] = CampaignModel.created_at >= CampaignRepository._new_campaign_cutoff()
+        return conditions
+
+    @staticmethod
+    def _new_campaign_cutoff() -> datetime:
+        """신규 오픈 기준 시각 (created_at과 같은 naive UTC)"""
+        return datetime.now(UTC).replace(tzinfo=None) - timedelta(days=NEW_CAMPAIGN_DAYS)
+
+    def _recruiting_campaigns_query(self, sort: str, filters: Optional[CampaignFilter] = None):
+        """
+        모집 중인 체험단 목록 기본 쿼리 및 정렬 키 생성
+
+        Args:
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (query, sort_key, descending) 튜플 (query는 카드 행 + business_name 조회)
+        """
+        query = (
+            self.session.query(*self._card_columns(), AdvertiserModel.business_name)
             .join(AdvertiserModel, CampaignModel.advertiser_id == AdvertiserModel.id)
-            .outerjoin(application_count_subq, CampaignModel.id == application_count_subq.c.campaign_id)
-            .filter(CampaignModel.status == 'RECRUITING')
+            .filter(*self._open_for_recruiting())
+            .filter(*self._filter_conditions(filters).values())
         )
 
+        # 정렬 키 (동일 값은 id로 순서 고정)
+        if sort == 'deadline':
+            return query, CampaignModel.end_date, False
+        if sort == 'popular':
+            return query, CampaignModel.application_count, True
+        return query, CampaignModel.created_at, True
+
+    @staticmethod
+    def _card_columns(source=CampaignModel) -> tuple:
+        """
+        목록 카드 읽기 모델 컬럼
+
+        카드에 표시하는 컬럼만 조회하고(긴 description/benefits/conditions 제외),
+        설명은 SQL에서 DESCRIPTION_SHORT_LENGTH자로 잘라 가져옵니다.
+        결과 행은 엔티티로 변환하지 않고 바로 DTO로 옮깁니다.
+
+        Args:
+            source: 컬럼을 가져올 대상 (CampaignModel 또는 그 별칭/서브쿼리 엔티티)
+
+        Returns:
+            (id, title, description_short, image_url, image_variants, quota,
+             application_count, end_date, created_at, status) 컬럼 튜플
+        """
+        return (
+            source.id,
+            source.title,
+            func.substr(source.description, 1, DESCRIPTION_SHORT_LENGTH).label('description_short'),
+            source.image_url,
+            source.image_variants,
+            source.quota,
+            source.application_count,
+            source.end_date,
+            source.created_at,
+            source.status,
+        )
+
+    @read_only
+    def find_recruiting_campaigns(
+        self, skip: int = 0, limit: int = 12, sort: str = 'latest', filters: Optional[CampaignFilter] = None
+    ) -> List[Row]:
+        """
+        모집 중인 체험단 목록 조회 (페이지 번호 방식)
+
+        Args:
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            카드 행 리스트 (_card_columns + business_name)
+        """
+        query, sort_key, descending = self._recruiting_campaigns_query(sort, filters)
+
         # 정렬
-        if sort == 'latest':
-            query = query.order_by(desc(CampaignModel.created_at))
-        elif sort == 'deadline':
-            query = query.order_by(CampaignModel.end_date)
-        elif sort == 'popular':
-            query = query.order_by(desc('application_count'))
+        if descending:
+            query = query.order_by(desc(sort_key), desc(CampaignModel.id))
         else:
-            query = query.order_by(desc(CampaignModel.created_at))
+            query = query.order_by(sort_key, CampaignModel.id)
 
         # 페이지네이션
         query = query.offset(skip).limit(limit)
 
-        # 결과 변환
-        results = query.all()
-        return [
-            (
-                CampaignMapper.to_entity(campaign_model),
-                business_name,
-                application_count
+        return query.all()
+
+    @read_only
+    def find_recruiting_campaigns_page(
+        self,
+        skip: int = 0,
+        limit: int = 12,
+        sort: str = 'latest',
+        with_total: bool = True,
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[Row], Optional[int], bool]:
+        """
+        모집 중인 체험단 목록과 총 개수(또는 다음 페이지 여부)를 한 쿼리로 조회
+
+        - with_total=True: count(*) OVER () 윈도우 함수로 페이지 행과 총 개수를 함께 조회
+          (윈도우 함수 미지원 DB는 COUNT 쿼리로 대체)
+        - with_total=False: limit + 1건을 조회하여 다음 페이지 여부만 판단 (COUNT 생략)
+
+        Args:
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            with_total: 총 개수 조회 여부
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (카드 행 리스트 (_card_columns + business_name),
+             총 개수 (with_total=False면 None), 다음 페이지 존재 여부)
+        """
+        query, sort_key, descending = self._recruiting_campaigns_query(sort, filters)
+
+        # 정렬
+        if descending:
+            query = query.order_by(desc(sort_key), desc(CampaignModel.id))
+        else:
+            query = query.order_by(sort_key, CampaignModel.id)
+
+        # 총 개수 생략: 1건 더 조회하여 다음 페이지 여부 판단
+        if not with_total:
+            results = query.offset(skip).limit(limit + 1).all()
+            return results[:limit], None, len(results) > limit
+
+        # 윈도우 함수 미지원 DB: 목록 + COUNT 쿼리
+        if not self._supports_window_functions():
+            rows = query.offset(skip).limit(limit).all()
+            total_count = self.count_recruiting_campaigns(filters)
+            return rows, total_count, skip + len(rows) < total_count
+
+        # count(*) OVER ()는 LIMIT/OFFSET 적용 전 전체 행 수
+        rows = (
+            query.add_columns(func.count().over().label('total_count'))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+        if rows:
+            total_count = rows[0].total_count
+        elif skip > 0:
+            # 범위를 벗어난 페이지는 행이 없어 총 개수를 알 수 없음
+            total_count = self.count_recruiting_campaigns(filters)
+        else:
+            total_count = 0
+
+        return rows, total_count, skip + len(rows) < total_count
+
+    def _supports_window_functions(self) -> bool:
+        """현재 DB의 윈도우 함수 지원 여부 (SQLite는 3.25 이상부터 지원)"""
+        dialect = self.session.get_bind().dialect
+        if dialect.name == 'sqlite':
+            import sqlite3
+            return sqlite3.sqlite_version_info >= (3, 25, 0)
+        return True
+
+    @read_only
+    def find_recruiting_campaigns_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 12,
+        sort: str = 'latest',
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        모집 중인 체험단 목록 조회 (키셋/커서 방식)
+
+        OFFSET 없이 마지막 행의 (정렬 키, id) 이후부터 조회하므로
+        페이지 깊이와 무관하게 비용이 일정합니다.
+
+        Args:
+            cursor: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+            limit: 조회할 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional, 같은 필터로 받은 커서를 사용해야 함)
+
+        Returns:
+            (카드 행 리스트 (_card_columns + business_name), 다음 커서 또는 None)
+
+        Raises:
+            ValidationException: 커서 형식이 잘못된 경우
+        """
+        query, sort_key, descending = self._recruiting_campaigns_query(sort, filters)
+
+        # 커서 위치 이후로 탐색
+        if cursor is not None:
+            last_key, last_id = self._decode_sort_cursor(cursor, sort)
+            position = tuple_(sort_key, CampaignModel.id)
+            if descending:
+                query = query.filter(position < tuple_(literal(last_key), literal(last_id)))
+            else:
+                query = query.filter(position > tuple_(literal(last_key), literal(last_id)))
+
+        # 정렬
+        if descending:
+            query = query.order_by(desc(sort_key), desc(CampaignModel.id))
+        else:
+            query = query.order_by(sort_key, CampaignModel.id)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        results = query.limit(limit + 1).all()
+        has_next = len(results) > limit
+        results = results[:limit]
+
+        next_cursor = None
+        if has_next and results:
+            next_cursor = self.encode_sort_cursor(results[-1], sort)
+
+        return results, next_cursor
+
+    @staticmethod
+    def encode_sort_cursor(row: Row, sort: str) -> str:
+        """
+        카드 행 다음부터 조회하는 커서 생성 (정렬 키 + id)
+
+        Args:
+            row: 목록 조회가 반환한 카드 행
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+
+        Returns:
+            find_recruiting_campaigns_by_cursor에 넘길 커서
+        """
+        if sort == 'deadline':
+            sort_value = row.end_date.isoformat()
+        elif sort == 'popular':
+            sort_value = int(row.application_count)
+        else:
+            sort_value = row.created_at.isoformat()
+        return encode_cursor([sort, sort_value, row.id])
+
+    @staticmethod
+    def _decode_sort_cursor(cursor: str, sort: str) -> tuple:
+        """커서를 (정렬 키, id)로 복원"""
+        values = decode_cursor(cursor)
+        if len(values) != 3 or values[0] != sort or not isinstance(values[2], int):
+            raise ValidationException(f"Invalid cursor: {cursor}")
+
+        _, sort_value, last_id = values
+        try:
+            if sort == 'deadline':
+                return date.fromisoformat(sort_value), last_id
+            if sort == 'popular':
+                return int(sort_value), last_id
+            return datetime.fromisoformat(sort_value), last_id
+        except (TypeError, ValueError):
+            raise ValidationException(f"Invalid cursor: {cursor}")
+
+    @read_only
+    def search_campaigns(
+        self,
+        terms: List[Tuple[str, bool]],
+        status: Optional[str] = STATUS_RECRUITING,
+        skip: int = 0,
+        limit: int = 12
+    ) -> Tuple[List[Row], int]:
+        """
+        체험단 전문 검색 (제목/설명/혜택/상호명, 관련도순)
+
+        - PostgreSQL: search_document의 tsvector GIN 인덱스 (ts_rank_cd 순)
+        - SQLite: FTS5 campaign_fts 테이블 (bm25 순)
+        - 그 외 / FTS5 테이블이 없는 SQLite: search_document LIKE 검색 (최신순)
+
+        Args:
+            terms: parse_search_query 결과 [(토큰, 접두사 검색 여부)] (모두 포함해야 일치)
+            status: 상태 필터 (RECRUITING이면 모집 기간도 확인, None이면 전체)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수
+
+        Returns:
+            (카드 행 리스트 (_card_columns + business_name), total_count) 튜플
+        """
+        if not terms:
+            return [], 0
+
+        query = (
+            self.session.query(*self._card_columns(), AdvertiserModel.business_name)
+            .join(AdvertiserModel, CampaignModel.advertiser_id == AdvertiserModel.id)
+        )
+        if status == STATUS_RECRUITING:
+            query = query.filter(*self._open_for_recruiting())
+        elif status is not None:
+            query = query.filter(CampaignModel.status == status)
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            # 인덱스 식과 같은 식이어야 GIN 인덱스 사용
+            vector = literal_column("to_tsvector('simple', coalesce(campaign.search_document, ''))")
+            ts_query = func.to_tsquery(
+                literal_column("'simple'"),
+                ' & '.join(f'{token}:*' if prefix else token for token, prefix in terms)
             )
-            for campaign_model, business_name, application_count in results
-        ]
+            query = query.filter(vector.op('@@')(ts_query)).order_by(
+                desc(func.ts_rank_cd(vector, ts_query)), desc(CampaignModel.id)
+            )
+        elif dialect == 'sqlite' and self._has_sqlite_search_table():
+            match = ' '.join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms)
+            matches = (
+                select(
+                    literal_column('rowid').label('campaign_id'),
+                    literal_column('bm25(campaign_fts)').label('rank')
+                )
+                .select_from(text('campaign_fts'))
+                .where(text('campaign_fts MATCH :match').bindparams(match=match))
+                .subquery()
+            )
+            query = query.join(matches, matches.c.campaign_id == CampaignModel.id).order_by(
+                matches.c.rank, desc(CampaignModel.id)
+            )
+        else:
+            document = ' ' + func.coalesce(CampaignModel.search_document, '') + ' '
+            for token, prefix in terms:
+                query = query.filter(document.like(f'% {token}%' if prefix else f'% {token} %'))
+            query = query.order_by(desc(CampaignModel.created_at), desc(CampaignModel.id))
+
+        if not self._supports_window_functions():
+            total_count = query.order_by(None).count()
+            return query.offset(skip).limit(limit).all(), total_count
+
+        rows = (
+            query.add_columns(func.count().over().label('total_count'))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            total_count = rows[0].total_count
+        elif skip > 0:
+            total_count = query.order_by(None).count()
+        else:
+            total_count = 0
+        return rows, total_count
+
+    def _has_sqlite_search_table(self) -> bool:
+        """SQLite FTS5 검색 테이블(campaign_fts) 존재 여부"""
+        return self.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'campaign_fts'")
+        ).first() is not None
+
+    def _advertiser_derived_columns(self, campaign: Campaign) -> Dict[str, Optional[str]]:
+        """광고주 정보에서 파생하는 비정규화 컬럼 (검색 문서 - 상호명 포함, 지역 - 주소의 시/도)"""
+        advertiser = (
+            self.session.query(AdvertiserModel.business_name, AdvertiserModel.address)
+            .filter(AdvertiserModel.id == campaign.advertiser_id)
+            .first()
+        )
+        business_name, address = advertiser if advertiser is not None else (None, None)
+        return {
+            'search_document': build_search_document(
+                campaign.title, campaign.description, campaign.benefits, business_name
+            ),
+            'region': extract_region(address),
+        }
+
+    def rebuild_search_documents(self, batch_size: int = 500) -> int:
+        """
+        전체 체험단 검색 문서와 지역 재생성 (배치마다 flush, 커밋은 호출자가 수행)
+
+        광고주 상호명/주소가 바뀐 뒤 실행합니다.
+
+        Args:
+            batch_size: 배치 크기
+
+        Returns:
+            갱신된 체험단 수
+        """
+        updated = 0
+        last_id = 0
+        while True:
+            rows = (
+                self.session.query(
+                    CampaignModel.id,
+                    CampaignModel.title,
+                    CampaignModel.description,
+                    CampaignModel.benefits,
+                    AdvertiserModel.business_name,
+                    AdvertiserModel.address
+                )
+                .join(AdvertiserModel, CampaignModel.advertiser_id == AdvertiserModel.id)
+                .filter(CampaignModel.id > last_id)
+                .order_by(CampaignModel.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return updated
+
+            self.session.execute(
+                update(CampaignModel),
+                [
+                    {
+                        'id': row.id,
+                        'search_document': build_search_document(
+                            row.title, row.description, row.benefits, row.business_name
+                        ),
+                        'region': extract_region(row.address),
+                    }
+                    for row in rows
+                ]
+            )
+            updated += len(rows)
+            last_id = rows[-1].id
 
-    def count_recruiting_campaigns(self) -> int:
+    @read_only
+    def count_recruiting_campaigns(self, filters: Optional[CampaignFilter] = None) -> int:
         """
         모집 중인 체험단 총 개수 조회
 
+        Args:
+            filters: 목록 필터 (optional)
+
         Returns:
             총 개수
         """
         count = (
             self.session.query(func.count(CampaignModel.id))
-            .filter(CampaignModel.status == 'RECRUITING')
+            .filter(*self._open_for_recruiting())
+            .filter(*self._filter_conditions(filters).values())
             .scalar()
         )
         return count or 0
 
+    @read_only
+    def count_recruiting_facets(self, filters: Optional[CampaignFilter] = None) -> Dict:
+        """
+        모집 중인 체험단 필터별 개수 (facet) 조회
+
+        각 필터 값의 개수는 다른 종류의 필터만 적용한 결과입니다.
+        (예: 지역=서울 선택 시 지역 개수는 지역 필터 없이, 마감 임박 개수는 서울 안에서 셈)
+        마감/인원/신규 개수는 조건부 집계 한 쿼리, 지역 개수는 GROUP BY 한 쿼리로 조회합니다.
+
+        Args:
+            filters: 현재 목록 필터 (optional)
+
+        Returns:
+            {'deadline': {일수: 개수}, 'quota': {구간: 개수}, 'region': {지역: 개수}, 'new': 개수}
+        """
+        conditions = self._filter_conditions(filters)
+
+        def other_filters(facet: str) -> list:
+            return [condition for name, condition in conditions.items() if name != facet]
+
+        def count_if(facet: str, condition) -> object:
+            return func.count(case((and_(true(), condition, *other_filters(facet)), 1)))
+
+        today = date.today()
+        columns = [
+            count_if('deadline', CampaignModel.end_date <= today + timedelta(days=days))
+            for days in DEADLINE_WINDOW_DAYS
+        ]
+        for _, minimum, maximum in QUOTA_RANGES:
+            columns.append(count_if('quota', (
+                CampaignModel.quota.between(minimum, maximum) if maximum is not None
+                else CampaignModel.quota >= minimum
+            )))
+        columns.append(count_if('new', CampaignModel.created_at >= self._new_campaign_cutoff()))
+
+        counts = list(
+            self.session.query(*columns)
+            .filter(*self._open_for_recruiting())
+            .one()
+        )
+        deadline_counts = counts[:len(DEADLINE_WINDOW_DAYS)]
+        quota_counts = counts[len(DEADLINE_WINDOW_DAYS):-1]
+
+        region_rows = (
+            self.session.query(CampaignModel.region, func.count(CampaignModel.id))
+            .filter(*self._open_for_recruiting())
+            .filter(CampaignModel.region.isnot(None))
+            .filter(*other_filters('region'))
+            .group_by(CampaignModel.region)
+            .all()
+        )
+        region_counts = dict(region_rows)
+
+        return {
+            'deadline': dict(zip(DEADLINE_WINDOW_DAYS, deadline_counts)),
+            'quota': {name: count for (name, _, _), count in zip(QUOTA_RANGES, quota_counts)},
+            'region': {region: region_counts.get(region, 0) for region in REGIONS},
+            'new': counts[-1],
+        }
+
     def find_by_advertiser_id(self, advertiser_id: int) -> List[Campaign]:
         """
         광고주 ID로 체험단 목록 조회
@@ -178,6 +808,89 @@ class CampaignRepository(ICampaignRepository):
         )
         return [CampaignMapper.to_entity(model) for model in models]
 
+    @read_only
+    def find_advertiser_campaigns_by_status(
+        self,
+        advertiser_id: int,
+        limit_per_status: Optional[int] = None,
+        offsets: Optional[Dict[str, int]] = None
+    ) -> Tuple[Dict[str, List[Row]], Dict[str, int]]:
+        """
+        광고주 대시보드용 상태별 체험단 목록 및 상태별 총 개수 조회
+
+        체험단 수와 무관하게 쿼리 2회(목록 1회 + 상태별 집계 1회)로 처리합니다.
+        limit_per_status 지정 시 ROW_NUMBER() OVER (PARTITION BY status)로
+        상태별 페이지네이션을 한 번의 쿼리에서 수행합니다.
+
+        Args:
+            advertiser_id: 광고주 ID
+            limit_per_status: 상태별 최대 조회 개수 (None이면 전체)
+            offsets: 상태별 건너뛸 개수 (예: {'CLOSED': 12})
+
+        Returns:
+            ({status: 카드 행 리스트 (_card_columns)}, {status: 총 개수}) 튜플 (최신순)
+        """
+        campaigns_by_status = {status: [] for status in VALID_CAMPAIGN_STATUSES}
+
+        if limit_per_status is None:
+            rows = (
+                self.session.query(*self._card_columns())
+                .filter(CampaignModel.advertiser_id == advertiser_id)
+                .order_by(desc(CampaignModel.created_at))
+                .all()
+            )
+        else:
+            row_number = func.row_number().over(
+                partition_by=CampaignModel.status,
+                order_by=(desc(CampaignModel.created_at), desc(CampaignModel.id))
+            ).label('row_number')
+            ranked = (
+                select(*self._card_columns(), row_number)
+                .where(CampaignModel.advertiser_id == advertiser_id)
+                .subquery()
+            )
+
+            offsets = offsets or {}
+            offset = case(
+                {status: offsets.get(status, 0) for status in VALID_CAMPAIGN_STATUSES},
+                value=ranked.c.status,
+                else_=0
+            )
+            rows = (
+                self.session.query(*(ranked.c[column.key] for column in self._card_columns()))
+                .filter(ranked.c.row_number > offset)
+                .filter(ranked.c.row_number <= offset + limit_per_status)
+                .order_by(ranked.c.status, ranked.c.row_number)
+                .all()
+            )
+
+        for row in rows:
+            campaigns_by_status.setdefault(row.status, []).append(row)
+
+        return campaigns_by_status, self.count_by_status_for_advertiser(advertiser_id)
+
+    @read_only
+    def count_by_status_for_advertiser(self, advertiser_id: int) -> Dict[str, int]:
+        """
+        광고주의 상태별 체험단 개수 조회 (GROUP BY status)
+
+        Args:
+            advertiser_id: 광고주 ID
+
+        Returns:
+            {status: 개수} 딕셔너리 (체험단이 없는 상태는 0)
+        """
+        counts = {status: 0 for status in VALID_CAMPAIGN_STATUSES}
+        rows = (
+            self.session.query(CampaignModel.status, func.count(CampaignModel.id))
+            .filter(CampaignModel.advertiser_id == advertiser_id)
+            .group_by(CampaignModel.status)
+            .all()
+        )
+        for status, count in rows:
+            counts[status] = count
+        return counts
+
     def save(self, campaign: Campaign) -> Campaign:
         """
         체험단 저장
@@ -189,6 +902,12 @@ class CampaignRepository(ICampaignRepository):
             저장된 Campaign 엔티티 (ID 포함)
         """
         model = CampaignMapper.to_model(campaign)
-        self.session.add(model)
+        for column, value in self._advertiser_derived_columns(campaign).items():
+            setattr(model, column, value)
+        if campaign.id is not None:
+            # 기존 체험단 수정: 세션의 영속 객체에 병합 (application_count는 유지)
+            model = self.session.merge(model)
+        else:
+            self.session.add(model)
         self.session.flush()  # ID 생성
         return CampaignMapper.to_entity(model)
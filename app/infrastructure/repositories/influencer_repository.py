@@ -1,7 +1,7 @@
 """
 Influencer Repository 구현체
 """
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.domain.entities.influencer import Influencer
 from app.infrastructure.repositories.interfaces.i_influencer_repository import IInfluencerRepository
@@ -40,3 +40,10 @@ class InfluencerRepository(IInfluencerRepository):
         """사용자 ID로 인플루언서 존재 여부 확인"""
         count = self.session.query(InfluencerModel).filter_by(user_id=user_id).count()
         return count > 0
+
+    def find_by_ids(self, influencer_ids: List[int]) -> List[Influencer]:
+        """인플루언서 ID 목록으로 일괄 조회 (IN 쿼리 1회)"""
+        if not influencer_ids:
+            return []
+        models = self.session.query(InfluencerModel).filter(InfluencerModel.id.in_(influencer_ids)).all()
+        return [InfluencerMapper.to_entity(model) for model in models]
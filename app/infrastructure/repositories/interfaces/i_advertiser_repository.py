@@ -1,7 +1,7 @@
 """Advertiser Repository 인터페이스"""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.entities.advertiser import Advertiser
 
 
@@ -59,3 +59,16 @@ class IAdvertiserRepository(ABC):
             Optional[Advertiser]: 광고주 엔티티 (없으면 None)
         """
         pass
+
+    @abstractmethod
+    def find_by_ids(self, advertiser_ids: List[int]) -> List[Advertiser]:
+        """
+        광고주 ID 목록으로 일괄 조회
+
+        Args:
+            advertiser_ids: 광고주 ID 리스트
+
+        Returns:
+            List[Advertiser]: 존재하는 광고주 엔티티 리스트
+        """
+        pass
@@ -5,7 +5,7 @@ Application Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.domain.entities.application import Application
 
 
@@ -25,6 +25,19 @@ class IApplicationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def insert_if_recruiting(self, application: Application) -> Optional[Application]:
+        """
+        모집 중인 체험단에만 지원 저장 (중복 지원은 DB 유니크 제약으로 무시)
+
+        Args:
+            application: 저장할 Application 엔티티
+
+        Returns:
+            저장된 Application 엔티티, 저장되지 않았으면 None
+        """
+        pass
+
     @abstractmethod
     def find_by_campaign_id(self, campaign_id: int) -> List[Application]:
         """
@@ -38,6 +51,30 @@ class IApplicationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_applicants_by_campaign(
+        self,
+        campaign_id: int,
+        status: Optional[str] = None,
+        sort: str = 'applied_at',
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], int]:
+        """
+        체험단 지원자 목록 조회 (인플루언서 정보 포함)
+
+        Args:
+            campaign_id: 체험단 ID
+            status: 지원 상태 필터 (None이면 전체)
+            sort: 정렬 기준 ('applied_at', 'follower_count', 내림차순)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수 (None이면 전체)
+
+        Returns:
+            (지원자 정보 딕셔너리 리스트, 필터 조건의 전체 지원자 수) 튜플
+        """
+        pass
+
     @abstractmethod
     def exists_by_campaign_and_influencer(
         self, campaign_id: int, influencer_id: int
@@ -67,6 +104,20 @@ class IApplicationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def apply_selection(self, campaign_id: int, selected_application_ids: List[int]) -> int:
+        """
+        인플루언서 선정 결과 반영 (선정 ID는 SELECTED, 나머지 APPLIED는 REJECTED)
+
+        Args:
+            campaign_id: 체험단 ID
+            selected_application_ids: 선정할 지원 ID 리스트
+
+        Returns:
+            상태가 변경된 지원 수
+        """
+        pass
+
     @abstractmethod
     def find_by_influencer_id(self, influencer_id: int) -> List[Application]:
         """
@@ -79,3 +130,38 @@ class IApplicationRepository(ABC):
             Application 엔티티 리스트 (지원일시 기준 최신순)
         """
         pass
+
+    @abstractmethod
+    def find_history_by_influencer(
+        self,
+        influencer_id: int,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        인플루언서의 지원 내역 조회 (체험단 및 광고주 정보 포함)
+
+        Args:
+            influencer_id: 인플루언서 ID
+            status: 지원 상태 필터 (None이면 전체)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수 (None이면 전체)
+
+        Returns:
+            지원 내역 딕셔너리 리스트 (지원일시 기준 최신순)
+        """
+        pass
+
+    @abstractmethod
+    def count_by_status_for_influencer(self, influencer_id: int) -> Dict[str, int]:
+        """
+        인플루언서의 상태별 지원 개수 조회
+
+        Args:
+            influencer_id: 인플루언서 ID
+
+        Returns:
+            {status: 개수} 딕셔너리
+        """
+        pass
@@ -5,8 +5,10 @@ Campaign Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 from app.domain.entities.campaign import Campaign
+from app.domain.value_objects.campaign_filter import CampaignFilter
 
 
 class ICampaignRepository(ABC):
@@ -25,6 +27,19 @@ class ICampaignRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_ids(self, campaign_ids: List[int]) -> List[Campaign]:
+        """
+        체험단 ID 목록으로 일괄 조회
+
+        Args:
+            campaign_ids: 체험단 ID 리스트
+
+        Returns:
+            Campaign 엔티티 리스트
+        """
+        pass
+
     @abstractmethod
     def find_by_id_with_advertiser(self, campaign_id: int) -> Optional[tuple]:
         """
@@ -51,9 +66,89 @@ class ICampaignRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def increment_application_count(self, campaign_id: int, amount: int = 1) -> None:
+        """
+        지원자 수 카운터 증가 (현재 트랜잭션 내에서 원자적으로)
+
+        Args:
+            campaign_id: 체험단 ID
+            amount: 증가량 (기본값: 1)
+        """
+        pass
+
+    @abstractmethod
+    def recalculate_application_counts(self) -> int:
+        """
+        지원자 수 카운터 재계산 (application 테이블 기준으로 보정)
+
+        Returns:
+            값이 보정된 체험단 수
+        """
+        pass
+
+    @abstractmethod
+    def close_expired_campaigns(self, today: date, closed_at: datetime, limit: int = 500) -> int:
+        """
+        모집 기간이 지난 체험단 일괄 종료 (한 배치, 여러 인스턴스가 동시에 실행해도 안전)
+
+        Args:
+            today: 기준일 (종료일이 이 날짜보다 이전이면 종료)
+            closed_at: 종료 시각
+            limit: 배치 크기
+
+        Returns:
+            종료된 체험단 수
+        """
+        pass
+
+    @abstractmethod
+    def update_image_variants(self, image_url: str, variants: Dict) -> int:
+        """
+        같은 이미지를 쓰는 체험단의 반응형 이미지 변형 URL 저장
+
+        Args:
+            image_url: 체험단 이미지 URL
+            variants: 변형 URL 딕셔너리
+
+        Returns:
+            수정된 체험단 수
+        """
+        pass
+
+    @abstractmethod
+    def clear_image(self, campaign_id: int, image_url: str) -> int:
+        """
+        체험단 이미지 URL과 변형 URL 제거 (원본 업로드 실패 시)
+
+        같은 내용의 이미지는 URL을 공유하므로 다른 체험단은 건드리지 않고,
+        그 사이 이미지가 바뀐 체험단도 건드리지 않습니다.
+
+        Args:
+            campaign_id: 체험단 ID
+            image_url: 업로드에 실패한 이미지 URL
+
+        Returns:
+            수정된 체험단 수 (0 또는 1)
+        """
+        pass
+
+    @abstractmethod
+    def find_image_urls_without_variants(self, limit: Optional[int] = None) -> List[str]:
+        """
+        반응형 이미지 변형이 아직 없는 체험단 이미지 URL 조회 (중복 제거)
+
+        Args:
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            이미지 URL 리스트
+        """
+        pass
+
     @abstractmethod
     def find_recruiting_campaigns(
-        self, skip: int = 0, limit: int = 12, sort: str = 'latest'
+        self, skip: int = 0, limit: int = 12, sort: str = 'latest', filters: Optional[CampaignFilter] = None
     ) -> List[tuple]:
         """
         모집 중인 체험단 목록 조회
@@ -62,22 +157,169 @@ class ICampaignRepository(ABC):
             skip: 건너뛸 레코드 수
             limit: 조회할 레코드 수
             sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            카드 행 리스트 (id, title, description_short, image_url, image_variants, quota,
+             application_count, end_date, created_at, status, business_name 속성)
+        """
+        pass
+
+    @abstractmethod
+    def find_recruiting_campaigns_page(
+        self,
+        skip: int = 0,
+        limit: int = 12,
+        sort: str = 'latest',
+        with_total: bool = True,
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[tuple], Optional[int], bool]:
+        """
+        모집 중인 체험단 목록과 총 개수(또는 다음 페이지 여부)를 한 쿼리로 조회
+
+        Args:
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            with_total: 총 개수 조회 여부 (False면 다음 페이지 여부만 판단)
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (카드 행 리스트 (find_recruiting_campaigns와 같은 속성),
+             총 개수 (with_total=False면 None), 다음 페이지 존재 여부)
+        """
+        pass
+
+    @abstractmethod
+    def encode_sort_cursor(self, row: tuple, sort: str) -> str:
+        """
+        카드 행 다음부터 조회하는 커서 생성 (페이지 번호 목록에서 커서 방식으로 넘어갈 때 사용)
+
+        Args:
+            row: 목록 조회가 반환한 카드 행
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+
+        Returns:
+            find_recruiting_campaigns_by_cursor에 넘길 커서
+        """
+        pass
+
+    @abstractmethod
+    def find_recruiting_campaigns_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 12,
+        sort: str = 'latest',
+        filters: Optional[CampaignFilter] = None
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        모집 중인 체험단 목록 조회 (키셋/커서 방식)
+
+        Args:
+            cursor: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+            limit: 조회할 레코드 수
+            sort: 정렬 기준 ('latest', 'deadline', 'popular')
+            filters: 목록 필터 (optional)
+
+        Returns:
+            (카드 행 리스트 (find_recruiting_campaigns와 같은 속성), 다음 커서 또는 None)
+        """
+        pass
+
+    @abstractmethod
+    def search_campaigns(
+        self,
+        terms: List[Tuple[str, bool]],
+        status: Optional[str] = 'RECRUITING',
+        skip: int = 0,
+        limit: int = 12
+    ) -> Tuple[List[tuple], int]:
+        """
+        체험단 전문 검색 (제목/설명/혜택/상호명, 관련도순)
+
+        Args:
+            terms: [(토큰, 접두사 검색 여부)] (모두 포함해야 일치)
+            status: 상태 필터 (None이면 전체)
+            skip: 건너뛸 레코드 수
+            limit: 조회할 레코드 수
+
+        Returns:
+            (카드 행 리스트 (find_recruiting_campaigns와 같은 속성), total_count) 튜플
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_search_documents(self, batch_size: int = 500) -> int:
+        """
+        전체 체험단 검색 문서와 지역 재생성
+
+        Args:
+            batch_size: 배치 크기
 
         Returns:
-            (Campaign, business_name, application_count) 튜플 리스트
+            갱신된 체험단 수
         """
         pass
 
     @abstractmethod
-    def count_recruiting_campaigns(self) -> int:
+    def count_recruiting_campaigns(self, filters: Optional[CampaignFilter] = None) -> int:
         """
         모집 중인 체험단 총 개수 조회
 
+        Args:
+            filters: 목록 필터 (optional)
+
         Returns:
             총 개수
         """
         pass
 
+    @abstractmethod
+    def count_recruiting_facets(self, filters: Optional[CampaignFilter] = None) -> Dict:
+        """
+        모집 중인 체험단 필터별 개수 조회 (각 값은 다른 종류의 필터만 적용)
+
+        Args:
+            filters: 현재 목록 필터 (optional)
+
+        Returns:
+            {'deadline': {일수: 개수}, 'quota': {구간: 개수}, 'region': {지역: 개수}, 'new': 개수}
+        """
+        pass
+
+    @abstractmethod
+    def find_by_advertiser_id(self, advertiser_id: int) -> List[Campaign]:
+        """
+        광고주 ID로 체험단 목록 조회
+
+        Args:
+            advertiser_id: 광고주 ID
+
+        Returns:
+            Campaign 엔티티 리스트
+        """
+        pass
+
+    @abstractmethod
+    def find_advertiser_campaigns_by_status(
+        self,
+        advertiser_id: int,
+        limit_per_status: Optional[int] = None,
+        offsets: Optional[Dict[str, int]] = None
+    ) -> Tuple[Dict[str, List[tuple]], Dict[str, int]]:
+        """
+        광고주 대시보드용 상태별 체험단 목록 및 상태별 총 개수 조회
+
+        Args:
+            advertiser_id: 광고주 ID
+            limit_per_status: 상태별 최대 조회 개수 (None이면 전체)
+            offsets: 상태별 건너뛸 개수 (예: {'CLOSED': 12})
+
+        Returns:
+            ({status: 카드 행 리스트 (business_name 제외)}, {status: 총 개수}) 튜플
+        """
+        pass
+
     @abstractmethod
     def save(self, campaign: Campaign) -> Campaign:
         """
@@ -2,7 +2,7 @@
 Influencer Repository 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.entities.influencer import Influencer
 
 
@@ -60,3 +60,16 @@ class IInfluencerRepository(ABC):
             bool: 존재 여부
         """
         pass
+
+    @abstractmethod
+    def find_by_ids(self, influencer_ids: List[int]) -> List[Influencer]:
+        """
+        인플루언서 ID 목록으로 일괄 조회
+
+        Args:
+            influencer_ids: 인플루언서 ID 리스트
+
+        Returns:
+            List[Influencer]: 존재하는 인플루언서 엔티티 리스트
+        """
+        pass
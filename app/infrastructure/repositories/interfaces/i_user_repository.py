@@ -1,7 +1,7 @@
 """User Repository Interface"""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.entities.user import User
 
 
@@ -59,3 +59,16 @@ class IUserRepository(ABC):
             bool: 존재하면 True, 아니면 False
         """
         pass
+
+    @abstractmethod
+    def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        """
+        사용자 ID 목록으로 일괄 조회
+
+        Args:
+            user_ids: 사용자 ID 리스트
+
+        Returns:
+            List[User]: 존재하는 사용자 엔티티 리스트
+        """
+        pass
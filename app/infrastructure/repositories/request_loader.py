@@ -0,0 +1,252 @@
+"""
+Request-scoped Loader (요청 단위 Identity Map / 일괄 조회)
+
+한 요청 안에서 같은 광고주/인플루언서/체험단/사용자를 여러 번 조회해도
+DB에는 한 번만 접근하도록 id 및 user_id 기준으로 엔티티를 캐시합니다.
+find_by_ids는 캐시에 없는 id만 모아 IN (...) 쿼리 1회로 조회합니다.
+
+로더는 flask.g에 저장되며 요청 시작/종료 시 초기화됩니다.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from flask import Flask, current_app, g
+from sqlalchemy.orm import Session
+
+from app.domain.entities.advertiser import Advertiser
+from app.domain.entities.campaign import Campaign
+from app.domain.entities.influencer import Influencer
+from app.domain.entities.user import User
+from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
+from app.infrastructure.repositories.campaign_repository import CampaignRepository
+from app.infrastructure.repositories.influencer_repository import InfluencerRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+
+
+_G_KEY = 'request_loader'
+
+
+class _IdentityMapMixin:
+    """
+    id / user_id 기준 엔티티 캐시 공통 로직
+
+    조회 결과가 None인 경우도 캐시하여 같은 요청에서 재조회하지 않습니다.
+    """
+
+    def _init_identity_map(self, name: str) -> None:
+        self._name = name
+        self._by_id: Dict[Hashable, Optional[object]] = {}
+        self._by_user_id: Dict[str, Optional[object]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    def _remember(self, entity):
+        """엔티티를 캐시에 등록 (None은 무시)"""
+        if entity is None:
+            return entity
+        self._by_id[entity.id] = entity
+        user_id = getattr(entity, 'user_id', None)
+        if user_id is not None:
+            self._by_user_id[user_id] = entity
+        return entity
+
+    def _forget(self, entity_id: Hashable) -> None:
+        """캐시에서 엔티티 제거 (DB에서 직접 갱신된 경우)"""
+        entity = self._by_id.pop(entity_id, None)
+        user_id = getattr(entity, 'user_id', None)
+        if user_id is not None:
+            self._by_user_id.pop(user_id, None)
+
+    def _cached_by_id(self, entity_id: Hashable, loader: Callable):
+        if entity_id in self._by_id:
+            self.hits += 1
+            return self._by_id[entity_id]
+
+        self.misses += 1
+        self.queries += 1
+        entity = loader(entity_id)
+        self._by_id[entity_id] = entity
+        return self._remember(entity)
+
+    def _cached_by_user_id(self, user_id: str, loader: Callable):
+        if user_id in self._by_user_id:
+            self.hits += 1
+            return self._by_user_id[user_id]
+
+        self.misses += 1
+        self.queries += 1
+        entity = loader(user_id)
+        self._by_user_id[user_id] = entity
+        return self._remember(entity)
+
+    def _cached_by_ids(self, entity_ids: Iterable[Hashable], loader: Callable) -> list:
+        unique_ids = list(dict.fromkeys(entity_ids))
+        missing_ids = [entity_id for entity_id in unique_ids if entity_id not in self._by_id]
+
+        self.hits += len(unique_ids) - len(missing_ids)
+        if missing_ids:
+            self.misses += len(missing_ids)
+            self.queries += 1
+            for entity in loader(missing_ids):
+                self._remember(entity)
+            for entity_id in missing_ids:
+                self._by_id.setdefault(entity_id, None)
+
+        return [self._by_id[entity_id] for entity_id in unique_ids if self._by_id[entity_id] is not None]
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (hits, misses, queries)"""
+        return {'hits': self.hits, 'misses': self.misses, 'queries': self.queries}
+
+
+class RequestScopedAdvertiserRepository(_IdentityMapMixin, AdvertiserRepository):
+    """요청 단위 캐시가 적용된 AdvertiserRepository"""
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self._init_identity_map('advertiser')
+
+    def find_by_id(self, advertiser_id: int) -> Optional[Advertiser]:
+        return self._cached_by_id(advertiser_id, super().find_by_id)
+
+    def find_by_ids(self, advertiser_ids: List[int]) -> List[Advertiser]:
+        return self._cached_by_ids(advertiser_ids, super().find_by_ids)
+
+    def find_by_user_id(self, user_id: str) -> Optional[Advertiser]:
+        return self._cached_by_user_id(user_id, super().find_by_user_id)
+
+    def save(self, advertiser: Advertiser) -> Advertiser:
+        return self._remember(super().save(advertiser))
+
+
+class RequestScopedInfluencerRepository(_IdentityMapMixin, InfluencerRepository):
+    """요청 단위 캐시가 적용된 InfluencerRepository"""
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self._init_identity_map('influencer')
+
+    def find_by_id(self, influencer_id: int) -> Optional[Influencer]:
+        return self._cached_by_id(influencer_id, super().find_by_id)
+
+    def find_by_ids(self, influencer_ids: List[int]) -> List[Influencer]:
+        return self._cached_by_ids(influencer_ids, super().find_by_ids)
+
+    def find_by_user_id(self, user_id: str) -> Optional[Influencer]:
+        return self._cached_by_user_id(user_id, super().find_by_user_id)
+
+    def exists_by_user_id(self, user_id: str) -> bool:
+        return self.find_by_user_id(user_id) is not None
+
+    def save(self, influencer: Influencer) -> Influencer:
+        return self._remember(super().save(influencer))
+
+
+class RequestScopedCampaignRepository(_IdentityMapMixin, CampaignRepository):
+    """요청 단위 캐시가 적용된 CampaignRepository"""
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self._init_identity_map('campaign')
+
+    def find_by_id(self, campaign_id: int) -> Optional[Campaign]:
+        return self._cached_by_id(campaign_id, super().find_by_id)
+
+    def find_by_ids(self, campaign_ids: List[int]) -> List[Campaign]:
+        return self._cached_by_ids(campaign_ids, super().find_by_ids)
+
+    def increment_application_count(self, campaign_id: int, amount: int = 1) -> None:
+        super().increment_application_count(campaign_id, amount)
+        self._forget(campaign_id)
+
+    def save(self, campaign: Campaign) -> Campaign:
+        return self._remember(super().save(campaign))
+
+
+class RequestScopedUserRepository(_IdentityMapMixin, UserRepository):
+    """요청 단위 캐시가 적용된 UserRepository"""
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self._init_identity_map('user')
+
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        return self._cached_by_id(user_id, super().find_by_id)
+
+    def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        return self._cached_by_ids(user_ids, super().find_by_ids)
+
+    def save(self, user: User) -> User:
+        return self._remember(super().save(user))
+
+
+class RequestLoader:
+    """
+    요청 단위 Repository 묶음
+
+    Attributes:
+        advertisers: 캐시 적용 AdvertiserRepository
+        influencers: 캐시 적용 InfluencerRepository
+        campaigns: 캐시 적용 CampaignRepository
+        users: 캐시 적용 UserRepository
+    """
+
+    def __init__(self, session: Session):
+        """
+        Args:
+            session: SQLAlchemy Session
+        """
+        self.advertisers = RequestScopedAdvertiserRepository(session)
+        self.influencers = RequestScopedInfluencerRepository(session)
+        self.campaigns = RequestScopedCampaignRepository(session)
+        self.users = RequestScopedUserRepository(session)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Repository별 캐시 통계
+
+        Returns:
+            {'advertiser': {'hits': ..., 'misses': ..., 'queries': ...}, ...}
+        """
+        return {
+            repository._name: repository.stats()
+            for repository in (self.advertisers, self.influencers, self.campaigns, self.users)
+        }
+
+
+def get_request_loader() -> RequestLoader:
+    """
+    현재 요청의 RequestLoader 반환 (없으면 생성하여 flask.g에 저장)
+
+    Returns:
+        RequestLoader
+    """
+    loader = g.get(_G_KEY)
+    if loader is None:
+        from app.extensions import db
+        loader = RequestLoader(db.session)
+        setattr(g, _G_KEY, loader)
+    return loader
+
+
+def init_request_loader(app: Flask) -> None:
+    """
+    요청 시작/종료 시 로더 초기화 및 통계 로깅 등록
+
+    Args:
+        app: Flask 앱
+    """
+
+    @app.before_request
+    def _reset_request_loader():
+        g.pop(_G_KEY, None)
+
+    @app.teardown_request
+    def _report_request_loader(exc=None):
+        loader = g.pop(_G_KEY, None)
+        if loader is None:
+            return
+        stats = {name: counts for name, counts in loader.stats().items() if counts['hits'] or counts['misses']}
+        if stats:
+            current_app.logger.debug('request loader stats: %s', stats)
@@ -1,11 +1,12 @@
 """User Repository Implementation"""
 
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.domain.entities.user import User
 from app.infrastructure.repositories.interfaces.i_user_repository import IUserRepository
 from app.infrastructure.persistence.models.user_model import UserModel
 from app.infrastructure.persistence.mappers.user_mapper import UserMapper
+from app.infrastructure.cache.user_principal_cache import invalidate_user_principal
 
 
 class UserRepository(IUserRepository):
@@ -48,6 +49,9 @@ class UserRepository(IUserRepository):
 
         self.session.commit()
 
+        # user_loader 캐시 무효화 (역할 변경 즉시 반영)
+        invalidate_user_principal(user.id)
+
         # 저장된 엔티티 반환
         return user
 
@@ -55,3 +59,10 @@ class UserRepository(IUserRepository):
         """이메일 중복 검증"""
         count = self.session.query(UserModel).filter_by(email=email).count()
         return count > 0
+
+    def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        """사용자 ID 목록으로 일괄 조회 (IN 쿼리 1회)"""
+        if not user_ids:
+            return []
+        models = self.session.query(UserModel).filter(UserModel.id.in_(user_ids)).all()
+        return [UserMapper.to_entity(model) for model in models]
@@ -8,17 +8,37 @@ from app.application.services.advertiser_service import AdvertiserService
 from app.application.services.campaign_service import CampaignService
 from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
 from app.infrastructure.repositories.user_repository import UserRepository
-from app.infrastructure.repositories.campaign_repository import CampaignRepository
 from app.infrastructure.repositories.application_repository import ApplicationRepository
-from app.infrastructure.repositories.influencer_repository import InfluencerRepository
+from app.infrastructure.repositories.request_loader import get_request_loader
+from app.infrastructure.cache.tagged_cache import get_feed_cache
+from app.infrastructure.external.storage_registry import (
+    get_image_upload_service,
+    schedule_image_variants,
+    watch_image_upload,
+)
 from app.shared.decorators.auth_decorators import advertiser_required
+from app.shared.utils.session_identity import current_advertiser_id, update_identity
+from app.shared.constants.campaign_constants import (
+    APPLICATION_STATUS_APPLIED,
+    STATUS_RECRUITING,
+    STATUS_CLOSED,
+    STATUS_SELECTED,
+    VALID_APPLICATION_STATUSES,
+)
 from app.domain.exceptions.advertiser_exceptions import (
     AdvertiserAlreadyRegisteredException,
     BusinessNumberAlreadyExistsException
 )
+from app.domain.exceptions.validation_exceptions import InvalidImageException
 
 advertiser_bp = Blueprint('advertiser', __name__, url_prefix='/advertiser')
 
+# 대시보드 상태별 페이지 크기
+DASHBOARD_PER_STATUS = 12
+
+# 체험단 상세 지원자 목록 페이지 크기
+APPLICANTS_PER_PAGE = 50
+
 
 @advertiser_bp.route('/register', methods=['GET', 'POST'])
 @login_required
@@ -66,6 +86,9 @@ def register_advertiser():
             # 트랜잭션 커밋
             db.session.commit()
 
+            # 세션 신원 정보 갱신 (이후 요청에서 광고주 조회 생략)
+            update_identity(current_user.id, role='advertiser', advertiser_id=advertiser.id)
+
             flash('광고주 정보가 성공적으로 등록되었습니다!', 'success')
             return redirect(url_for('advertiser.dashboard'))
 
@@ -89,30 +112,54 @@ def dashboard():
     광고주 대시보드
 
     GET: 내 체험단 목록 표시 (모집중, 종료, 완료)
+
+    GET 파라미터:
+    - recruiting_page, closed_page, selected_page: 상태별 페이지 번호 (기본값: 1)
+    - tab: 열어둘 탭 (recruiting, closed, selected - 기본값: recruiting)
     """
     from app.extensions import db
 
     # Service 인스턴스 생성
-    advertiser_repo = AdvertiserRepository(db.session)
-    campaign_repo = CampaignRepository(db.session)
+    loader = get_request_loader()
+    campaign_repo = loader.campaigns
     campaign_service = CampaignService(campaign_repo)
 
-    # 광고주 정보 조회
-    advertiser = advertiser_repo.find_by_user_id(current_user.id)
+    # 광고주 ID (advertiser_required에서 세션에 확인됨)
+    advertiser_id = current_advertiser_id()
 
-    # 광고주의 체험단 목록 조회
-    campaigns = campaign_service.get_advertiser_campaigns(advertiser.id)
+    # 상태별 페이지 번호
+    pages = {
+        STATUS_RECRUITING: request.args.get('recruiting_page', 1, type=int),
+        STATUS_CLOSED: request.args.get('closed_page', 1, type=int),
+        STATUS_SELECTED: request.args.get('selected_page', 1, type=int),
+    }
 
-    # 상태별로 분류
-    recruiting_campaigns = [c for c in campaigns if c.status == 'RECRUITING']
-    closed_campaigns = [c for c in campaigns if c.status == 'CLOSED']
-    selected_campaigns = [c for c in campaigns if c.status == 'SELECTED']
+    # 상태별 체험단 목록 및 총 개수 조회 (체험단 수와 무관하게 쿼리 2회)
+    campaigns_by_status, status_counts = campaign_service.get_advertiser_dashboard(
+        advertiser_id, per_status=DASHBOARD_PER_STATUS, pages=pages
+    )
+
+    # 상태별 페이지 링크가 해당 탭을 다시 열도록 탭 유지
+    active_tab = request.args.get('tab', 'recruiting', type=str)
+    if active_tab.upper() not in pages:
+        active_tab = 'recruiting'
+
+    status_pages = {
+        status: {
+            'page': max(page, 1),
+            'total_pages': max((status_counts[status] + DASHBOARD_PER_STATUS - 1) // DASHBOARD_PER_STATUS, 1),
+        }
+        for status, page in pages.items()
+    }
 
     return render_template(
         'advertiser/dashboard.html',
-        recruiting_campaigns=recruiting_campaigns,
-        closed_campaigns=closed_campaigns,
-        selected_campaigns=selected_campaigns
+        recruiting_campaigns=campaigns_by_status[STATUS_RECRUITING],
+        closed_campaigns=campaigns_by_status[STATUS_CLOSED],
+        selected_campaigns=campaigns_by_status[STATUS_SELECTED],
+        status_counts=status_counts,
+        status_pages=status_pages,
+        active_tab=active_tab
     )
 
 
@@ -138,23 +185,22 @@ def create_campaign():
             from app.extensions import db
 
             # Service 인스턴스 생성
-            advertiser_repo = AdvertiserRepository(db.session)
-            campaign_repo = CampaignRepository(db.session)
-            campaign_service = CampaignService(campaign_repo)
+            loader = get_request_loader()
+            campaign_repo = loader.campaigns
+            campaign_service = CampaignService(campaign_repo, cache=get_feed_cache())
 
-            # 광고주 정보 조회
-            advertiser = advertiser_repo.find_by_user_id(current_user.id)
+            # 광고주 ID (advertiser_required에서 세션에 확인됨)
+            advertiser_id = current_advertiser_id()
 
-            # 이미지 업로드 (기본 구조만 - Supabase Storage 연동은 추후)
+            # 이미지 업로드 (청크 단위 검증 후 백그라운드 전송, URL은 내용 해시로 바로 결정)
             image_url = None
+            upload_future = None
             if form.image.data:
-                # TODO: Supabase Storage에 이미지 업로드
-                # image_url = storage_service.upload(...)
-                pass
+                image_url, upload_future = get_image_upload_service().submit(form.image.data.stream)
 
             # 체험단 생성
             campaign = campaign_service.create_campaign(
-                advertiser_id=advertiser.id,
+                advertiser_id=advertiser_id,
                 title=form.title.data,
                 description=form.description.data,
                 quota=form.quota.data,
@@ -168,9 +214,19 @@ def create_campaign():
             # 트랜잭션 커밋
             db.session.commit()
 
+            # 업로드가 재시도까지 실패하고 파일도 없으면 이 체험단의 이미지 URL을 비움
+            # 썸네일/WebP 변형은 업로드 완료 후 백그라운드에서 생성 (완료 전까지 원본 이미지 표시)
+            if image_url:
+                watch_image_upload(campaign.id, image_url, upload_future)
+                schedule_image_variants(image_url, wait_for=upload_future)
+
             flash('체험단이 성공적으로 생성되었습니다!', 'success')
             return redirect(url_for('advertiser.dashboard'))
 
+        except InvalidImageException as e:
+            db.session.rollback()
+            flash(f'대표 이미지: {e.reason}', 'danger')
+
         except Exception as e:
             db.session.rollback()
             flash(f'체험단 생성 중 오류가 발생했습니다: {str(e)}', 'danger')
@@ -185,37 +241,66 @@ def campaign_detail(campaign_id: int):
     광고주 체험단 상세 페이지
 
     GET: 체험단 정보 및 지원자 목록 표시
+
+    GET 파라미터:
+    - status: 지원 상태 필터 (APPLIED, SELECTED, REJECTED)
+    - sort: 정렬 기준 (applied_at, follower_count)
+    - page: 페이지 번호 (기본값: 1)
+    (모집 종료 상태에서는 선정할 수 있도록 status/page 없이 APPLIED 지원자 전원 표시)
     """
     from app.extensions import db
 
+    # Query 파라미터 파싱
+    status = request.args.get('status', type=str)
+    if status not in VALID_APPLICATION_STATUSES:
+        status = None
+    sort = request.args.get('sort', 'applied_at', type=str)
+    if sort not in ('applied_at', 'follower_count'):
+        sort = 'applied_at'
+    page = max(request.args.get('page', 1, type=int), 1)
+
     # Service 인스턴스 생성
-    advertiser_repo = AdvertiserRepository(db.session)
-    campaign_repo = CampaignRepository(db.session)
+    loader = get_request_loader()
+    campaign_repo = loader.campaigns
     application_repo = ApplicationRepository(db.session)
-    influencer_repo = InfluencerRepository(db.session)
-
+    influencer_repo = loader.influencers
     campaign_service = CampaignService(
         campaign_repo,
         influencer_repository=influencer_repo,
         application_repository=application_repo
     )
 
-    # 광고주 정보 조회
-    advertiser = advertiser_repo.find_by_user_id(current_user.id)
+    # 광고주 ID (advertiser_required에서 세션에 확인됨)
+    advertiser_id = current_advertiser_id()
 
     try:
-        # 체험단 정보 조회 (권한 검증 포함)
-        applications = campaign_service.get_campaign_applications(
-            campaign_id, advertiser.id
-        )
-
         # 체험단 기본 정보 조회
         campaign = campaign_repo.find_by_id(campaign_id)
 
+        # 선정 대기(모집 종료) 중에는 선정 폼에 APPLIED 지원자 전원을 표시
+        # (선정 시 선택하지 않은 APPLIED 지원자는 모두 탈락 처리되므로 페이지/필터로 숨기지 않음)
+        selecting = campaign is not None and campaign.is_closed()
+        if selecting:
+            status, page, per_page = APPLICATION_STATUS_APPLIED, 1, None
+        else:
+            per_page = APPLICANTS_PER_PAGE
+
+        # 지원자 목록 조회 (권한 검증 포함)
+        applications, total_count = campaign_service.get_campaign_applications(
+            campaign_id, advertiser_id,
+            status=status, sort=sort, page=page, per_page=per_page
+        )
+
         return render_template(
             'advertiser/campaign_detail.html',
             campaign=campaign,
-            applications=applications
+            applications=applications,
+            total_count=total_count,
+            current_page=page,
+            total_pages=(total_count + per_page - 1) // per_page if per_page else 1,
+            status=status,
+            sort=sort,
+            selecting=selecting
         )
 
     except Exception as e:
@@ -234,19 +319,21 @@ def close_campaign(campaign_id: int):
     from app.extensions import db
 
     # Service 인스턴스 생성
-    advertiser_repo = AdvertiserRepository(db.session)
-    campaign_repo = CampaignRepository(db.session)
-    campaign_service = CampaignService(campaign_repo)
+    loader = get_request_loader()
+    campaign_repo = loader.campaigns
+    campaign_service = CampaignService(campaign_repo, cache=get_feed_cache())
 
-    # 광고주 정보 조회
-    advertiser = advertiser_repo.find_by_user_id(current_user.id)
+    # 광고주 ID (advertiser_required에서 세션에 확인됨)
+    advertiser_id = current_advertiser_id()
 
     try:
         # 모집 조기종료
-        campaign_service.close_campaign_early(campaign_id, advertiser.id)
+        campaign_service.close_campaign_early(campaign_id, advertiser_id)
+        db.session.commit()
         flash('체험단 모집이 조기 종료되었습니다.', 'success')
 
     except Exception as e:
+        db.session.rollback()
         flash(f'모집 종료 중 오류가 발생했습니다: {str(e)}', 'danger')
 
     return redirect(url_for('advertiser.campaign_detail', campaign_id=campaign_id))
@@ -264,14 +351,19 @@ def select_influencers(campaign_id: int):
     from app.application.services.application_service import ApplicationService
 
     # Service 인스턴스 생성
-    advertiser_repo = AdvertiserRepository(db.session)
-    campaign_repo = CampaignRepository(db.session)
+    loader = get_request_loader()
+    campaign_repo = loader.campaigns
     application_repo = ApplicationRepository(db.session)
 
-    application_service = ApplicationService(application_repo, campaign_repo)
+    application_service = ApplicationService(
+        application_repo,
+        campaign_repo,
+        loader.influencers,
+        cache=get_feed_cache()
+    )
 
-    # 광고주 정보 조회
-    advertiser = advertiser_repo.find_by_user_id(current_user.id)
+    # 광고주 ID (advertiser_required에서 세션에 확인됨)
+    advertiser_id = current_advertiser_id()
 
     # 선정된 지원 ID 리스트 가져오기
     selected_ids_str = request.form.getlist('selected_application_ids[]')
@@ -280,7 +372,7 @@ def select_influencers(campaign_id: int):
     try:
         # 인플루언서 선정
         application_service.select_influencers(
-            campaign_id, advertiser.id, selected_ids
+            campaign_id, advertiser_id, selected_ids
         )
         db.session.commit()
         flash('인플루언서가 성공적으로 선정되었습니다.', 'success')
@@ -1,22 +1,29 @@
 """Auth Routes (회원가입, 로그인)"""
 
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, g
 from flask_login import login_user, logout_user, current_user
 from app.presentation.forms.auth_forms import RegisterForm, LoginForm
 from app.application.services.auth_service import AuthService
 from app.infrastructure.repositories.user_repository import UserRepository
-from app.infrastructure.external.supabase.supabase_auth import SupabaseAuthProvider
+from app.infrastructure.external.resilience.resilient_auth_provider import get_auth_provider
+from app.infrastructure.cache.user_principal_cache import get_user_principal
 from app.domain.exceptions.auth_exceptions import (
     EmailAlreadyExistsException,
     WeakPasswordException,
-    InvalidCredentialsException
+    InvalidCredentialsException,
+    AuthProviderUnavailableException
 )
 from app.domain.exceptions.validation_exceptions import InvalidEmailException
+from app.shared.utils.session_identity import load_identity, remember_identity
+from app.shared.utils.session_tokens import store_session_tokens
+from app.shared.decorators.auth_decorators import token_required
 
 
 # Blueprint 생성
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+AUTH_UNAVAILABLE_MESSAGE = '인증 서버가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.'
+
 
 @auth_bp.route('/register', methods=['GET', 'POST'])
 def register():
@@ -34,7 +41,7 @@ def register():
 
             # Service 인스턴스 생성
             user_repository = UserRepository(db.session)
-            auth_provider = SupabaseAuthProvider()
+            auth_provider = get_auth_provider()
             auth_service = AuthService(user_repository, auth_provider)
 
             print(f"[DEBUG] 회원가입 시도 - Email: {form.email.data}")
@@ -61,6 +68,11 @@ def register():
             print(f"[DEBUG] 이메일 형식 오류: {form.email.data}")
             flash('올바른 이메일 형식이 아닙니다.', 'danger')
 
+        except AuthProviderUnavailableException as e:
+            print(f"[ERROR] 인증 서버 응답 없음: {e}")
+            flash(AUTH_UNAVAILABLE_MESSAGE, 'danger')
+            return render_template('auth/register.html', form=form), 503
+
         except Exception as e:
             print(f"[ERROR] 회원가입 중 오류 발생: {type(e).__name__}: {str(e)}")
             import traceback
@@ -93,7 +105,7 @@ def login():
 
             # Service 인스턴스 생성
             user_repository = UserRepository(db.session)
-            auth_provider = SupabaseAuthProvider()
+            auth_provider = get_auth_provider()
             auth_service = AuthService(user_repository, auth_provider)
 
             # 로그인 처리
@@ -103,15 +115,16 @@ def login():
             )
 
             # 세션에 토큰 저장
-            session['access_token'] = response.access_token
-            session['refresh_token'] = response.refresh_token
+            store_session_tokens(response.access_token, response.refresh_token)
             session['user_id'] = response.user_id
 
-            # Flask-Login 세션 설정
-            from app.infrastructure.persistence.models.user_model import UserModel
-            user_model = UserModel.query.get(response.user_id)
-            if user_model:
-                login_user(user_model)
+            # Flask-Login 세션 설정 (user_loader와 같은 UserPrincipal 사용)
+            principal = get_user_principal(response.user_id)
+            if principal:
+                login_user(principal)
+
+            # 역할 및 광고주/인플루언서 ID를 세션에 저장 (보호된 라우트에서 재조회 생략)
+            remember_identity(load_identity(response.user_id))
 
             flash('로그인에 성공했습니다!', 'success')
             return redirect(response.redirect_url)
@@ -122,6 +135,10 @@ def login():
         except InvalidEmailException:
             flash('올바른 이메일 형식이 아닙니다.', 'danger')
 
+        except AuthProviderUnavailableException:
+            flash(AUTH_UNAVAILABLE_MESSAGE, 'danger')
+            return render_template('auth/login.html', form=form), 503
+
         except Exception as e:
             flash('로그인 중 오류가 발생했습니다. 다시 시도해주세요.', 'danger')
 
@@ -135,3 +152,20 @@ def logout():
     session.clear()
     flash('로그아웃되었습니다.', 'success')
     return redirect(url_for('auth.login'))
+
+
+@auth_bp.route('/me')
+@token_required
+def me():
+    """
+    토큰 사용자 정보 (Access Token 로컬 검증, Supabase 호출 없음)
+
+    Returns:
+        JSON: {'user_id', 'email', 'expires_at'}
+    """
+    claims = g.token_claims
+    return jsonify({
+        'user_id': claims['sub'],
+        'email': claims.get('email'),
+        'expires_at': claims['exp'],
+    })
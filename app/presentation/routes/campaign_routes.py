@@ -4,27 +4,119 @@ Campaign Routes
 체험단 관련 라우트
 """
 
-from flask import Blueprint, render_template, session, abort, redirect, url_for, flash, request
+from flask import Blueprint, render_template, session, abort, redirect, url_for, flash, request, jsonify
 from flask_login import current_user, login_required
 
 from app.application.services.campaign_service import CampaignService
 from app.application.services.application_service import ApplicationService
-from app.infrastructure.repositories.campaign_repository import CampaignRepository
-from app.infrastructure.repositories.influencer_repository import InfluencerRepository
 from app.infrastructure.repositories.application_repository import ApplicationRepository
+from app.infrastructure.repositories.request_loader import get_request_loader
+from app.infrastructure.cache.tagged_cache import get_feed_cache
 from app.extensions import db
 from app.presentation.forms.campaign_forms import CampaignApplicationForm
 from app.shared.decorators.auth_decorators import influencer_required
+from app.shared.utils.session_identity import current_influencer_id, resolve_identity
 from app.domain.exceptions.application_exceptions import (
     AlreadyAppliedException,
     CampaignNotRecruitingException,
 )
 from app.domain.exceptions.campaign_exceptions import CampaignNotFoundException
+from app.domain.exceptions import ValidationException
+from app.infrastructure.repositories.campaign_repository import CampaignRepository
+from app.shared.constants.campaign_constants import STATUS_RECRUITING
 
 
 # Blueprint 생성
 campaign_bp = Blueprint('campaign', __name__, url_prefix='/campaign')
 
+SEARCH_PER_PAGE = 12
+SEARCH_QUERY_MAX_LENGTH = 100
+
+
+def _run_search():
+    """
+    검색 요청 파라미터(q, status, page)로 검색 실행
+
+    Returns:
+        (query, status, page, campaigns, total_count) 튜플 (status가 ALL이면 None)
+    """
+    query = request.args.get('q', '', type=str).strip()[:SEARCH_QUERY_MAX_LENGTH]
+    status = request.args.get('status', STATUS_RECRUITING, type=str)
+    status = None if status == 'ALL' else status
+    page = max(request.args.get('page', 1, type=int), 1)
+
+    campaign_service = CampaignService(CampaignRepository(db.session))
+    try:
+        campaigns, total_count = campaign_service.search_campaigns(
+            query, status=status, page=page, per_page=SEARCH_PER_PAGE
+        )
+    except ValidationException:
+        abort(400, description="잘못된 검색 조건입니다.")
+
+    return query, status, page, campaigns, total_count
+
+
+@campaign_bp.route('/search')
+def search():
+    """
+    체험단 검색 페이지
+
+    GET 파라미터:
+    - q: 검색어 (제목/설명/혜택/상호명)
+    - status: 상태 필터 (RECRUITING, CLOSED, SELECTED, ALL, 기본값: RECRUITING)
+    - page: 페이지 번호 (기본값: 1)
+
+    Returns:
+        검색 결과 HTML 페이지 (관련도순)
+    """
+    query, status, page, campaigns, total_count = _run_search()
+
+    return render_template(
+        'campaign/search.html',
+        query=query,
+        status=status,
+        campaigns=campaigns,
+        current_page=page,
+        total_pages=(total_count + SEARCH_PER_PAGE - 1) // SEARCH_PER_PAGE,
+        total_count=total_count
+    )
+
+
+@campaign_bp.route('/search.json')
+def search_json():
+    """
+    체험단 검색 API (GET 파라미터는 search와 동일)
+
+    Returns:
+        JSON: {'query', 'status', 'page', 'per_page', 'total_count',
+               'items': [{'id', 'title', 'description_short', 'image_url', 'image_thumbnail_url',
+                          'business_name', 'status', 'quota', 'application_count', 'deadline'}]}
+    """
+    query, status, page, campaigns, total_count = _run_search()
+
+    return jsonify({
+        'query': query,
+        'status': status,
+        'page': page,
+        'per_page': SEARCH_PER_PAGE,
+        'total_count': total_count,
+        'items': [
+            {
+                'id': campaign.id,
+                'title': campaign.title,
+                'description_short': campaign.description_short,
+                'image_url': campaign.image_url,
+                'image_thumbnail_url': campaign.image_thumbnail_url,
+                'business_name': campaign.business_name,
+                'status': campaign.status,
+                'quota': campaign.quota,
+                'application_count': campaign.application_count,
+                'deadline': campaign.deadline.isoformat(),
+            }
+            for campaign in campaigns
+        ],
+    })
+
 
 @campaign_bp.route('/<int:campaign_id>')
 def campaign_detail(campaign_id: int):
@@ -40,27 +132,30 @@ def campaign_detail(campaign_id: int):
         체험단 상세 HTML 페이지
     """
     # 의존성 주입 (간소화를 위해 여기서 생성, 추후 DI 컨테이너 사용 가능)
-    campaign_repository = CampaignRepository(db.session)
-    influencer_repository = InfluencerRepository(db.session)
+    loader = get_request_loader()
+    campaign_repository = loader.campaigns
+    influencer_repository = loader.influencers
     application_repository = ApplicationRepository(db.session)
 
     campaign_service = CampaignService(
         campaign_repository=campaign_repository,
         influencer_repository=influencer_repository,
-        application_repository=application_repository
+        application_repository=application_repository,
+        advertiser_repository=loader.advertisers
     )
 
-    # 현재 로그인한 사용자 ID 및 역할 가져오기
+    # 현재 로그인한 사용자 ID 및 역할 (세션에 저장된 신원 정보 사용)
     user_id = session.get('user_id')
-    user_role = None
-    if user_id:
-        from app.infrastructure.persistence.models.user_model import UserModel
-        user = db.session.get(UserModel, user_id)
-        if user:
-            user_role = user.role
-
-    # 체험단 상세 조회 (user_role 전달)
-    campaign = campaign_service.get_campaign_detail(campaign_id, user_id, user_role)
+    identity = resolve_identity(user_id) if user_id else None
+
+    # 체험단 상세 조회 (역할 및 광고주/인플루언서 ID 전달)
+    campaign = campaign_service.get_campaign_detail(
+        campaign_id,
+        user_id,
+        identity.role if identity else None,
+        advertiser_id=identity.advertiser_id if identity else None,
+        influencer_id=identity.influencer_id if identity else None
+    )
 
     if campaign is None:
         abort(404, description="체험단을 찾을 수 없습니다.")
@@ -88,9 +183,10 @@ def apply_campaign(campaign_id: int):
     # Form 생성
     form = CampaignApplicationForm()
 
-    # 의존성 주입
-    campaign_repository = CampaignRepository(db.session)
-    influencer_repository = InfluencerRepository(db.session)
+    # 의존성 주입 (인플루언서는 influencer_required에서 이미 조회되어 캐시됨)
+    loader = get_request_loader()
+    campaign_repository = loader.campaigns
+    influencer_repository = loader.influencers
     application_repository = ApplicationRepository(db.session)
 
     campaign_service = CampaignService(
@@ -102,26 +198,22 @@ def apply_campaign(campaign_id: int):
     application_service = ApplicationService(
         application_repository=application_repository,
         campaign_repository=campaign_repository,
-        influencer_repository=influencer_repository
+        influencer_repository=influencer_repository,
+        cache=get_feed_cache()
     )
 
-    # 체험단 정보 조회
-    campaign = campaign_service.get_campaign_detail(campaign_id, current_user.id)
-    if campaign is None:
-        abort(404, description="체험단을 찾을 수 없습니다.")
-
-    # 인플루언서 정보 조회
-    influencer = influencer_repository.find_by_user_id(current_user.id)
-    if influencer is None:
+    # 인플루언서 ID (influencer_required에서 세션에 확인됨)
+    influencer_id = current_influencer_id()
+    if influencer_id is None:
         flash('인플루언서 정보를 먼저 등록해주세요.', 'warning')
         return redirect(url_for('influencer.register_influencer', next=request.url))
 
     if form.validate_on_submit():
-        # POST 요청 처리
+        # POST 요청 처리 (체험단 존재/모집 상태는 지원 INSERT에서 함께 확인)
         try:
             application_service.apply_to_campaign(
                 campaign_id=campaign_id,
-                influencer_id=influencer.id,
+                influencer_id=influencer_id,
                 application_reason=form.application_reason.data
             )
 
@@ -148,7 +240,11 @@ def apply_campaign(campaign_id: int):
             flash(f'지원 처리 중 오류가 발생했습니다: {str(e)}', 'danger')
             return redirect(url_for('campaign.campaign_detail', campaign_id=campaign_id))
 
-    # GET 요청: 폼 표시
+    # GET 요청 (또는 폼 검증 실패): 폼 표시
+    campaign = campaign_service.get_campaign_detail(campaign_id, current_user.id)
+    if campaign is None:
+        abort(404, description="체험단을 찾을 수 없습니다.")
+
     return render_template(
         'campaign/apply.html',
         form=form,
@@ -10,13 +10,13 @@ from app.application.services.application_service import ApplicationService
 from app.infrastructure.repositories.influencer_repository import InfluencerRepository
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.infrastructure.repositories.application_repository import ApplicationRepository
-from app.infrastructure.repositories.campaign_repository import CampaignRepository
-from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
+from app.infrastructure.repositories.request_loader import get_request_loader
 from app.domain.exceptions.influencer_exceptions import (
     InfluencerAlreadyRegisteredException,
     InfluencerNotFoundException
 )
 from app.shared.decorators.auth_decorators import influencer_required
+from app.shared.utils.session_identity import current_influencer_id, update_identity
 import json
 
 influencer_bp = Blueprint('influencer', __name__, url_prefix='/influencer')
@@ -59,6 +59,9 @@ def register_influencer():
             # 트랜잭션 커밋
             db.session.commit()
 
+            # 세션 신원 정보 갱신 (이후 요청에서 인플루언서 조회 생략)
+            update_identity(current_user.id, role='influencer', influencer_id=influencer.id)
+
             flash('인플루언서 정보가 성공적으로 등록되었습니다!', 'success')
             return redirect(url_for('main.home'))
 
@@ -81,17 +84,27 @@ def applications():
     """
     인플루언서 지원 내역 조회 페이지
 
+    GET 파라미터:
+    - status: 지원 상태 필터 (APPLIED, SELECTED, REJECTED)
+    - page: 페이지 번호 (기본값: 1)
+
     Returns:
         지원 내역 목록 페이지 (applications.html)
     """
     try:
         from app.extensions import db
 
+        # Query 파라미터 파싱
+        status = request.args.get('status', type=str)
+        if status not in STATUS_TEXT_MAP:
+            status = None
+        page = max(request.args.get('page', 1, type=int), 1)
+
         # Repository 및 Service 생성 (DI)
         application_repo = ApplicationRepository(db.session)
-        campaign_repo = CampaignRepository(db.session)
-        influencer_repo = InfluencerRepository(db.session)
-        advertiser_repo = AdvertiserRepository(db.session)
+        loader = get_request_loader()
+        campaign_repo = loader.campaigns
+        influencer_repo = loader.influencers
 
         application_service = ApplicationService(
             application_repo,
@@ -99,45 +112,45 @@ def applications():
             influencer_repo
         )
 
-        # 현재 인플루언서 ID 조회
-        influencer = influencer_repo.find_by_user_id(current_user.id)
-        if influencer is None:
+        # 현재 인플루언서 ID (influencer_required에서 세션에 확인됨)
+        influencer_id = current_influencer_id()
+        if influencer_id is None:
             flash('인플루언서 정보를 먼저 등록해주세요.', 'warning')
             return redirect(url_for('influencer.register_influencer'))
 
-        # 지원 내역 조회
-        applications_list = application_service.get_applications_by_influencer(influencer.id)
-
-        # 각 지원 내역에 Campaign 및 Advertiser 정보 추가
-        enriched_applications = []
-        for app in applications_list:
-            campaign = campaign_repo.find_by_id(app.campaign_id)
-            if campaign:
-                advertiser = advertiser_repo.find_by_id(campaign.advertiser_id)
-
-                enriched_applications.append({
-                    'id': app.id,
-                    'status': app.status,
-                    'status_text': STATUS_TEXT_MAP.get(app.status, app.status),
-                    'status_badge_color': STATUS_BADGE_COLOR_MAP.get(app.status, 'secondary'),
-                    'applied_at': app.applied_at,
-                    'campaign': {
-                        'id': campaign.id,
-                        'title': campaign.title,
-                        'end_date': campaign.end_date,
-                        'status': campaign.status
-                    },
-                    'advertiser': {
-                        'business_name': advertiser.business_name if advertiser else '알 수 없음'
-                    }
-                })
-
-        # 상태별 개수 계산
+        # 지원 내역 조회 (application + campaign + advertiser JOIN, 상태별 개수는 GROUP BY)
+        history, counts = application_service.get_application_history(
+            influencer_id, status=status, page=page, per_page=APPLICATIONS_PER_PAGE
+        )
+
+        enriched_applications = [
+            {
+                'id': row['application_id'],
+                'status': row['status'],
+                'status_text': STATUS_TEXT_MAP.get(row['status'], row['status']),
+                'status_badge_color': STATUS_BADGE_COLOR_MAP.get(row['status'], 'secondary'),
+                'applied_at': row['applied_at'],
+                'campaign': {
+                    'id': row['campaign_id'],
+                    'title': row['campaign_title'],
+                    'end_date': row['campaign_end_date'],
+                    'status': row['campaign_status']
+                },
+                'advertiser': {
+                    'business_name': row['business_name']
+                }
+            }
+            for row in history
+        ]
+
+        # 상태별 개수
         status_counts = {
-            'applied': sum(1 for app in applications_list if app.is_applied()),
-            'selected': sum(1 for app in applications_list if app.is_selected()),
-            'rejected': sum(1 for app in applications_list if app.is_rejected())
+            'applied': counts.get('APPLIED', 0),
+            'selected': counts.get('SELECTED', 0),
+            'rejected': counts.get('REJECTED', 0)
         }
+        total_count = sum(status_counts.values())
+        filtered_count = counts.get(status, 0) if status else total_count
 
         # JavaScript용 JSON 생성
         applications_json = json.dumps([
@@ -153,7 +166,10 @@ def applications():
             'influencer/applications.html',
             applications=enriched_applications,
             status_counts=status_counts,
-            total_count=len(applications_list),
+            total_count=total_count,
+            status=status,
+            current_page=page,
+            total_pages=(filtered_count + APPLICATIONS_PER_PAGE - 1) // APPLICATIONS_PER_PAGE,
             applications_json=applications_json
         )
 
@@ -166,6 +182,8 @@ def applications():
 
 
 # 상수 정의
+APPLICATIONS_PER_PAGE = 20
+
 STATUS_TEXT_MAP = {
     'APPLIED': '지원완료',
     'SELECTED': '선정됨',
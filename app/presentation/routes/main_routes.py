@@ -1,12 +1,20 @@
 """Main Routes (홈 페이지 등)"""
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, abort, jsonify
 from flask_login import login_required, current_user
 
 from app.application.services.campaign_service import CampaignService
 from app.infrastructure.repositories.campaign_repository import CampaignRepository
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.domain.exceptions import ValidationException
+from app.domain.value_objects.campaign_filter import CampaignFilter
+from app.infrastructure.cache.tagged_cache import get_feed_cache
+from app.infrastructure.cache.user_principal_cache import get_user_principal_cache
+from app.infrastructure.persistence.connection_pool import collect_all_pool_stats
+from app.infrastructure.external.resilience.resilient_auth_provider import get_auth_resilience
 from app.extensions import db
+from app.shared.constants.campaign_constants import DEADLINE_WINDOW_DAYS, NEW_CAMPAIGN_DAYS, QUOTA_RANGES
+from app.shared.utils.session_identity import update_identity
 
 
 # Blueprint 생성
@@ -21,21 +29,75 @@ def home():
     GET 파라미터:
     - page: 페이지 번호 (기본값: 1)
     - sort: 정렬 기준 (latest, deadline, popular)
+    - cursor: 키셋 페이지네이션 커서 (지정 시 page 대신 커서 방식으로 조회,
+      페이지 번호 목록의 '다음' 링크도 커서로 연결)
+    - deadline: N일 이내 마감 (3, 7, 14)
+    - quota: 모집 인원 구간 (1-5, 6-10, 11-30, 31+)
+    - region: 지역 (서울, 경기, ...)
+    - new: 신규 오픈만 (1)
 
     Returns:
-        홈 페이지 HTML
+        홈 페이지 HTML (목록과 함께 필터별 개수 포함)
     """
     # Query 파라미터 파싱
     page = request.args.get('page', 1, type=int)
     sort = request.args.get('sort', 'latest', type=str)
+    cursor = request.args.get('cursor', type=str)
+    try:
+        filters = CampaignFilter.from_params(request.args)
+    except ValidationException:
+        abort(400, description="잘못된 필터 조건입니다.")
 
     # 의존성 주입
     campaign_repository = CampaignRepository(db.session)
-    campaign_service = CampaignService(campaign_repository)
-
-    # 모집 중인 체험단 목록 조회
-    campaigns, total_count = campaign_service.list_recruiting_campaigns(
-        page=page, per_page=12, sort=sort
+    campaign_service = CampaignService(campaign_repository, cache=get_feed_cache())
+
+    # 필터 선택지와 선택지별 개수
+    filter_context = {
+        'filters': filters,
+        'filter_params': filters.to_params(),
+        'facets': campaign_service.get_recruiting_facets(filters),
+        'deadline_windows': DEADLINE_WINDOW_DAYS,
+        'quota_ranges': [name for name, _, _ in QUOTA_RANGES],
+        'new_campaign_days': NEW_CAMPAIGN_DAYS,
+    }
+
+    # 커서 방식: 페이지 깊이와 무관하게 일정한 비용으로 조회
+    if cursor is not None:
+        try:
+            campaigns, next_cursor = campaign_service.list_recruiting_campaigns_by_cursor(
+                cursor=cursor or None, per_page=12, sort=sort, filters=filters
+            )
+        except ValidationException:
+            abort(400, description="잘못된 페이지 커서입니다.")
+
+        return render_template(
+            'home.html',
+            campaigns=campaigns,
+            next_cursor=next_cursor,
+            sort=sort,
+            **filter_context
+        )
+
+    # 총 개수 생략 모드: COUNT 없이 다음 페이지 여부만 조회
+    if not current_app.config.get('HOME_FEED_EXACT_TOTAL', True):
+        campaigns, has_next, next_page_cursor = campaign_service.list_recruiting_campaigns_without_total(
+            page=page, per_page=12, sort=sort, filters=filters
+        )
+
+        return render_template(
+            'home.html',
+            campaigns=campaigns,
+            current_page=page,
+            has_next=has_next,
+            next_page_cursor=next_page_cursor,
+            sort=sort,
+            **filter_context
+        )
+
+    # 모집 중인 체험단 목록 + 총 개수 조회 (단일 쿼리)
+    campaigns, total_count, next_page_cursor = campaign_service.list_recruiting_campaigns(
+        page=page, per_page=12, sort=sort, filters=filters
     )
 
     # 총 페이지 수 계산
@@ -47,7 +109,9 @@ def home():
         current_page=page,
         total_pages=total_pages,
         total_count=total_count,
-        sort=sort
+        next_page_cursor=next_page_cursor,
+        sort=sort,
+        **filter_context
     )
 
 
@@ -82,6 +146,9 @@ def role_selection():
             user.role = role
             user_repository.save(user)
 
+            # 세션 신원 정보의 역할 갱신
+            update_identity(current_user.id, role=role)
+
             flash(f'{"광고주" if role == "advertiser" else "인플루언서"}로 등록되었습니다!', 'success')
 
             # 역할에 따라 리다이렉트
@@ -93,3 +160,53 @@ def role_selection():
             flash('사용자 정보를 찾을 수 없습니다.', 'danger')
 
     return render_template('role_selection.html')
+
+
+@main_bp.route('/metrics/cache')
+def cache_metrics():
+    """
+    캐시 적중률 지표 (METRICS_ENABLED=true 일 때만 노출)
+
+    Returns:
+        JSON: {'feed': {'hits', 'misses', 'hit_ratio', 'invalidations'},
+               'user_loader': {'hits', 'misses', 'hit_ratio'}}
+    """
+    if not current_app.config.get('METRICS_ENABLED'):
+        abort(404)
+
+    cache = get_feed_cache()
+    user_cache = get_user_principal_cache()
+    return jsonify({
+        'feed': cache.stats() if cache is not None else None,
+        'user_loader': user_cache.stats() if user_cache is not None else None,
+    })
+
+
+@main_bp.route('/metrics/pool')
+def pool_metrics():
+    """
+    DB 커넥션 풀 지표 (METRICS_ENABLED=true 일 때만 노출)
+
+    Returns:
+        JSON: {'primary': {'size', 'checked_out', 'overflow', 'wait', ...}, 'replica_0': {...}}
+    """
+    if not current_app.config.get('METRICS_ENABLED'):
+        abort(404)
+
+    return jsonify(collect_all_pool_stats())
+
+
+@main_bp.route('/metrics/auth')
+def auth_metrics():
+    """
+    인증 호출 지표 (METRICS_ENABLED=true 일 때만 노출)
+
+    Returns:
+        JSON: {'circuit': {'state', 'consecutive_failures', 'times_opened', 'rejections'},
+               'calls': {'authenticate': {'calls', 'failures', 'timeouts', 'retries', 'avg_ms', 'p95_ms', ...}}}
+    """
+    if not current_app.config.get('METRICS_ENABLED'):
+        abort(404)
+
+    resilience = get_auth_resilience()
+    return jsonify(resilience.snapshot() if resilience is not None else None)
@@ -9,7 +9,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CampaignListItemDTO:
     """체험단 목록 아이템 DTO"""
     id: int
@@ -21,9 +21,11 @@ class CampaignListItemDTO:
     deadline: date
     business_name: str
     status: str
+    image_thumbnail_url: Optional[str] = None  # 카드용 썸네일 (없으면 image_url 사용)
+    image_srcset: Optional[str] = None  # WebP srcset ("URL 400w, URL 800w")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CampaignDetailDTO:
     """체험단 상세 DTO"""
     id: int
@@ -45,3 +47,5 @@ class CampaignDetailDTO:
     is_owner: bool  # 현재 사용자가 이 체험단의 소유자인지 여부
     user_role: Optional[str]  # 현재 사용자 역할 (advertiser/influencer/None)
     is_authenticated: bool  # 로그인 여부
+    image_thumbnail_url: Optional[str] = None  # 썸네일 (없으면 image_url 사용)
+    image_srcset: Optional[str] = None  # WebP srcset ("URL 400w, URL 800w")
@@ -0,0 +1,4 @@
+"""Cache Constants"""
+
+# 캐시 무효화 태그
+CACHE_TAG_RECRUITING_FEED = "recruiting_feed"  # 모집 중 체험단 목록 (홈 피드)
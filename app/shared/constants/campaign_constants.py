@@ -17,3 +17,24 @@ VALID_APPLICATION_STATUSES = [
     APPLICATION_STATUS_SELECTED,
     APPLICATION_STATUS_REJECTED,
 ]
+
+# 모집 목록 필터
+DEADLINE_WINDOW_DAYS = [3, 7, 14]  # 마감 임박 필터 (N일 이내 마감)
+NEW_CAMPAIGN_DAYS = 3  # 신규 오픈 필터 (N일 이내 등록)
+
+# 모집 인원 구간 (이름, 최소, 최대 - None이면 상한 없음)
+QUOTA_RANGES = [
+    ("1-5", 1, 5),
+    ("6-10", 6, 10),
+    ("11-30", 11, 30),
+    ("31+", 31, None),
+]
+
+# 지역 (광고주 주소의 시/도를 약칭으로 정규화)
+REGIONS = [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+    "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
+]
+
+# 목록 카드 설명 길이 (SQL에서 잘라 조회)
+DESCRIPTION_SHORT_LENGTH = 100
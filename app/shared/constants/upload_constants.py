@@ -0,0 +1,31 @@
+"""Upload Constants"""
+
+# 체험단 대표 이미지 저장 경로 접두사 (내용 해시 기반 키: campaigns/ab/abcdef....jpg)
+CAMPAIGN_IMAGE_PREFIX = "campaigns"
+
+# 허용 이미지 형식: (파일 시그니처, MIME 타입, 확장자)
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (b"GIF87a", "image/gif", "gif"),
+    (b"GIF89a", "image/gif", "gif"),
+]
+
+# 형식 판별에 필요한 최소 바이트 수
+IMAGE_SIGNATURE_LENGTH = max(len(signature) for signature, _, _ in IMAGE_SIGNATURES)
+
+# 반응형 이미지 변형 저장 경로 접두사 (원본 키 기준: variants/ab/abcdef..../w800.webp)
+IMAGE_VARIANT_PREFIX = "variants"
+
+# 카드 썸네일 (WebP를 지원하지 않는 브라우저용 <img> 기본값): (이름, 너비, Pillow 형식, MIME 타입, 확장자)
+IMAGE_THUMBNAIL_VARIANT = ("thumbnail", 400, "JPEG", "image/jpeg", "jpg")
+
+# srcset용 WebP 변형 (원본보다 큰 너비는 만들지 않음)
+IMAGE_WEBP_VARIANTS = [
+    ("w400", 400, "WEBP", "image/webp", "webp"),
+    ("w800", 800, "WEBP", "image/webp", "webp"),
+    ("w1200", 1200, "WEBP", "image/webp", "webp"),
+]
+
+# 변형 인코딩 품질
+IMAGE_VARIANT_QUALITY = 80
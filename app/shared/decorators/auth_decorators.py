@@ -4,10 +4,11 @@
 """
 
 from functools import wraps
-from flask import redirect, url_for, request, flash
+from flask import redirect, url_for, request, flash, g, jsonify
 from flask_login import current_user, login_required
-from app.infrastructure.repositories.advertiser_repository import AdvertiserRepository
-from app.infrastructure.repositories.influencer_repository import InfluencerRepository
+from app.domain.exceptions.auth_exceptions import InvalidTokenException
+from app.shared.utils.session_identity import resolve_identity
+from app.shared.utils.session_tokens import authenticate_request
 
 
 def advertiser_required(f):
@@ -27,16 +28,13 @@ def advertiser_required(f):
     @wraps(f)
     @login_required
     def decorated_function(*args, **kwargs):
-        from app.extensions import db
-
         # 사용자 ID 가져오기
         user_id = current_user.id
 
-        # Advertiser 정보 조회
-        advertiser_repo = AdvertiserRepository(db.session)
-        advertiser = advertiser_repo.find_by_user_id(user_id)
+        # 광고주 ID 확인 (세션에 저장된 값 사용, 없으면 DB 조회 후 저장)
+        advertiser_id = resolve_identity(user_id).advertiser_id
 
-        if not advertiser:
+        if advertiser_id is None:
             # 광고주 정보 미등록
             flash('광고주 정보를 먼저 등록해주세요.', 'warning')
             return redirect(url_for('advertiser.register_advertiser', next=request.url))
@@ -64,16 +62,13 @@ def influencer_required(f):
     @wraps(f)
     @login_required
     def decorated_function(*args, **kwargs):
-        from app.extensions import db
-
         # 사용자 ID 가져오기
         user_id = current_user.id
 
-        # Influencer 정보 조회
-        influencer_repo = InfluencerRepository(db.session)
-        influencer = influencer_repo.find_by_user_id(user_id)
+        # 인플루언서 ID 확인 (세션에 저장된 값 사용, 없으면 DB 조회 후 저장)
+        influencer_id = resolve_identity(user_id).influencer_id
 
-        if not influencer:
+        if influencer_id is None:
             # 인플루언서 정보 미등록
             flash('인플루언서 정보를 먼저 등록해주세요.', 'warning')
             return redirect(url_for('influencer.register_influencer', next=request.url))
@@ -82,3 +77,29 @@ def influencer_required(f):
         return f(*args, **kwargs)
 
     return decorated_function
+
+
+def token_required(f):
+    """
+    Supabase Access Token 검증 데코레이터 (JSON 엔드포인트용)
+
+    - Authorization: Bearer 헤더 또는 로그인 세션의 access_token을 로컬에서 검증
+    - 검증된 클레임은 g.token_claims에 저장 (sub = 사용자 ID)
+    - 실패 시 401 JSON 응답
+
+    Usage:
+        @auth_bp.route('/me')
+        @token_required
+        def me():
+            return jsonify({'user_id': g.token_claims['sub']})
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            g.token_claims = authenticate_request()
+        except InvalidTokenException as e:
+            return jsonify({'success': False, 'error': str(e)}), e.http_status_code
+
+        return f(*args, **kwargs)
+
+    return decorated_function
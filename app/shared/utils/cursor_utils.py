@@ -0,0 +1,45 @@
+"""Cursor Utils (키셋 페이지네이션용 불투명 커서)"""
+
+import base64
+import json
+from typing import Any, List
+
+from app.domain.exceptions import ValidationException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    정렬 키 값 목록을 URL-safe 커서 문자열로 인코딩
+
+    Args:
+        values: JSON 직렬화 가능한 값 리스트 (예: [정렬 키, id])
+
+    Returns:
+        URL-safe base64 커서 문자열 (패딩 제거)
+    """
+    raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩
+
+    Args:
+        cursor: encode_cursor로 생성한 커서 문자열
+
+    Returns:
+        정렬 키 값 리스트
+
+    Raises:
+        ValidationException: 커서 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValidationException(f"Invalid cursor: {cursor}")
+
+    if not isinstance(values, list):
+        raise ValidationException(f"Invalid cursor: {cursor}")
+    return values
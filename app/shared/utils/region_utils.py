@@ -0,0 +1,48 @@
+"""Region Utils (주소 → 시/도 지역)"""
+
+import unicodedata
+from typing import Optional
+
+from app.shared.constants.campaign_constants import REGIONS
+
+# 약칭으로 바로 줄여지지 않는 시/도 정식 명칭
+_REGION_ALIASES = {
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+}
+
+# 시/도 명칭 접미사 (긴 것부터 제거)
+_REGION_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시", "시", "도")
+
+
+def extract_region(address: Optional[str]) -> Optional[str]:
+    """
+    주소의 첫 단어(시/도)를 지역 약칭으로 변환
+
+    Args:
+        address: 광고주 주소 (예: "서울특별시 강남구 ...", "경기도 성남시 ...")
+
+    Returns:
+        REGIONS 중 하나 (예: "서울", "경기"), 알 수 없으면 None
+    """
+    if not address:
+        return None
+
+    words = unicodedata.normalize("NFKC", address).split()
+    if not words:
+        return None
+
+    word = words[0]
+    if word in _REGION_ALIASES:
+        return _REGION_ALIASES[word]
+
+    for suffix in _REGION_SUFFIXES:
+        if word.endswith(suffix) and len(word) > len(suffix):
+            word = word[:-len(suffix)]
+            break
+    return word if word in REGIONS else None
@@ -0,0 +1,75 @@
+"""Search Utils (한국어 2-gram 토큰화)"""
+
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+# 영문/숫자 단어 또는 그 밖의 문자(한글 등) 연속 구간
+_TOKEN_RUN_PATTERN = re.compile(r"[0-9a-z]+|[^\W0-9a-z_]+")
+_ASCII_WORD_PATTERN = re.compile(r"[0-9a-z]+")
+
+# 검색어 최대 토큰 수 (긴 검색어가 과도한 AND 조건을 만들지 않도록 제한)
+MAX_QUERY_TERMS = 16
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    검색용 토큰화
+
+    NFKC 정규화 + 소문자 변환 후, 영문/숫자는 단어 단위로,
+    한글 등은 형태소 분석 없이 문자 2-gram으로 나눕니다. (한 글자 구간은 그대로)
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        토큰 리스트 (예: "파스타 체험단" → ['파스', '스타', '체험', '험단'])
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for match in _TOKEN_RUN_PATTERN.finditer(unicodedata.normalize("NFKC", text).lower()):
+        run = match.group()
+        if _ASCII_WORD_PATTERN.fullmatch(run) or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def build_search_document(*fields: Optional[str]) -> str:
+    """
+    검색 문서 생성 (필드별 토큰을 공백으로 연결)
+
+    Args:
+        fields: 검색 대상 필드 값
+
+    Returns:
+        공백으로 구분된 토큰 문자열 (FTS5 unicode61 / PostgreSQL 'simple' 설정에서 토큰 하나씩으로 인식)
+    """
+    return " ".join(token for field in fields for token in tokenize(field))
+
+
+def parse_search_query(query: Optional[str]) -> List[Tuple[str, bool]]:
+    """
+    검색어 → 검색 조건 토큰
+
+    한 글자 토큰은 문서에 2-gram으로만 저장되므로 접두사 검색으로 처리합니다.
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        [(토큰, 접두사 검색 여부)] (중복 제거, 최대 MAX_QUERY_TERMS개)
+    """
+    terms = []
+    seen = set()
+    for token in tokenize(query):
+        if token in seen:
+            continue
+        seen.add(token)
+        terms.append((token, len(token) == 1))
+        if len(terms) >= MAX_QUERY_TERMS:
+            break
+    return terms
@@ -0,0 +1,129 @@
+"""
+로그인 세션 신원 정보 (role / advertiser_id / influencer_id)
+
+로그인·역할 선택·광고주/인플루언서 등록 시 확인한 역할과 프로필 ID를
+서명된 Flask 세션에 저장하여, 보호된 라우트가 매 요청 find_by_user_id를
+다시 조회하지 않도록 합니다.
+
+- 세션 쿠키는 SECRET_KEY로 서명되므로 변조할 수 없습니다 (내용은 민감 정보 아님)
+- 역할/프로필이 바뀌는 경로(역할 선택, 광고주/인플루언서 등록)는 update_identity로 갱신
+- 다른 기기에서의 변경은 SESSION_IDENTITY_TTL(초)이 지나면 DB에서 다시 확인
+- 역할/프로필 미등록 상태도 같은 TTL로 캐시 (같은 세션의 등록은 update_identity로 바로 반영)
+"""
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Optional
+
+from flask import current_app, session
+from flask_login import current_user
+
+
+SESSION_IDENTITY_KEY = 'identity'
+
+
+@dataclass(frozen=True)
+class SessionIdentity:
+    """세션에 저장되는 사용자 신원 정보"""
+    user_id: str
+    role: Optional[str] = None
+    advertiser_id: Optional[int] = None
+    influencer_id: Optional[int] = None
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(SessionIdentity))
+
+
+def remember_identity(identity: SessionIdentity) -> SessionIdentity:
+    """
+    신원 정보를 세션에 저장
+
+    Args:
+        identity: 저장할 신원 정보
+
+    Returns:
+        저장된 신원 정보
+    """
+    session[SESSION_IDENTITY_KEY] = {**asdict(identity), 'resolved_at': time.time()}
+    return identity
+
+
+def update_identity(user_id: str, **changes) -> SessionIdentity:
+    """
+    세션 신원 정보 일부 갱신 (역할 선택, 프로필 등록 직후 호출)
+
+    Args:
+        user_id: 사용자 ID
+        **changes: 변경할 필드 (role, advertiser_id, influencer_id)
+
+    Returns:
+        갱신된 신원 정보
+    """
+    identity = _cached_identity(user_id, check_ttl=False) or SessionIdentity(user_id=user_id)
+    return remember_identity(replace(identity, **changes))
+
+
+def load_identity(user_id: str) -> SessionIdentity:
+    """
+    DB에서 신원 정보 조회 (요청 단위 로더 사용)
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        SessionIdentity
+    """
+    from app.infrastructure.repositories.request_loader import get_request_loader
+
+    loader = get_request_loader()
+    user = loader.users.find_by_id(user_id)
+    advertiser = loader.advertisers.find_by_user_id(user_id)
+    influencer = loader.influencers.find_by_user_id(user_id)
+
+    return SessionIdentity(
+        user_id=user_id,
+        role=user.role if user else None,
+        advertiser_id=advertiser.id if advertiser else None,
+        influencer_id=influencer.id if influencer else None,
+    )
+
+
+def resolve_identity(user_id: str) -> SessionIdentity:
+    """
+    세션의 신원 정보 반환 (없거나 만료되었으면 DB에서 다시 조회 후 저장)
+
+    역할/프로필 미등록 상태도 TTL 동안 재사용하므로, 미등록 사용자도 요청마다
+    사용자/광고주/인플루언서 조회를 반복하지 않습니다.
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        SessionIdentity
+    """
+    identity = _cached_identity(user_id)
+    if identity is not None:
+        return identity
+    return remember_identity(load_identity(user_id))
+
+
+def current_advertiser_id() -> Optional[int]:
+    """현재 로그인 사용자의 광고주 ID (미등록 시 None)"""
+    return resolve_identity(current_user.id).advertiser_id
+
+
+def current_influencer_id() -> Optional[int]:
+    """현재 로그인 사용자의 인플루언서 ID (미등록 시 None)"""
+    return resolve_identity(current_user.id).influencer_id
+
+
+def _cached_identity(user_id: str, check_ttl: bool = True) -> Optional[SessionIdentity]:
+    """세션에 저장된 신원 정보 (다른 사용자 것이거나 TTL이 지났으면 None)"""
+    data = session.get(SESSION_IDENTITY_KEY)
+    if not data or data.get('user_id') != user_id:
+        return None
+
+    ttl = current_app.config.get('SESSION_IDENTITY_TTL', 0)
+    if check_ttl and ttl and time.time() - data.get('resolved_at', 0) > ttl:
+        return None
+
+    return SessionIdentity(**{name: data.get(name) for name in _FIELD_NAMES})
@@ -0,0 +1,105 @@
+"""
+Supabase Access Token 요청 인증
+
+JSON 엔드포인트가 Authorization: Bearer 헤더 또는 로그인 세션의 access_token을
+Supabase 호출 없이 로컬에서 검증하도록 합니다.
+
+- 세션 토큰이 만료 직전(SUPABASE_TOKEN_REFRESH_MARGIN초 이내)이면 요청 안에서 갱신하여 새 토큰을 세션에 저장
+  (갱신된 refresh_token은 세션에만 남으므로 다른 워커로 가는 다음 요청도 새 토큰을 사용,
+  갱신에 실패해도 기존 토큰이 아직 유효하면 그대로 응답)
+- 세션 토큰이 이미 만료되었으면 한 번만 동기 갱신
+- 같은 refresh_token의 동시 갱신은 SupabaseTokenRefresher가 한 번의 호출로 합침
+- Bearer 토큰은 클라이언트가 관리하므로 검증만 수행
+"""
+from typing import Any, Dict, Optional
+
+from flask import current_app, request, session
+
+from app.domain.exceptions.auth_exceptions import InvalidTokenException
+from app.infrastructure.external.supabase.supabase_token_verifier import (
+    get_token_refresher,
+    get_token_verifier,
+    seconds_until_expiry,
+)
+
+
+SESSION_ACCESS_TOKEN_KEY = 'access_token'
+SESSION_REFRESH_TOKEN_KEY = 'refresh_token'
+
+
+def store_session_tokens(access_token: str, refresh_token: str) -> None:
+    """
+    토큰을 세션에 저장
+
+    Args:
+        access_token: Access Token
+        refresh_token: Refresh Token
+    """
+    session[SESSION_ACCESS_TOKEN_KEY] = access_token
+    session[SESSION_REFRESH_TOKEN_KEY] = refresh_token
+
+
+def authenticate_request() -> Dict[str, Any]:
+    """
+    현재 요청의 Access Token 검증 (Bearer 헤더 우선, 없으면 세션 토큰)
+
+    Returns:
+        Dict: 검증된 토큰 클레임 (sub = 사용자 ID)
+
+    Raises:
+        InvalidTokenException: 토큰 없음, 검증 실패, 갱신 실패
+    """
+    verifier = get_token_verifier()
+
+    bearer = _bearer_token()
+    if bearer is not None:
+        return verifier.verify(bearer)
+
+    access_token = session.get(SESSION_ACCESS_TOKEN_KEY)
+    refresh_token = session.get(SESSION_REFRESH_TOKEN_KEY)
+    if not access_token:
+        raise InvalidTokenException()
+
+    try:
+        claims = verifier.verify(access_token)
+    except InvalidTokenException:
+        if not refresh_token:
+            raise
+        return _refresh_session_tokens(refresh_token)
+
+    margin = current_app.config.get('SUPABASE_TOKEN_REFRESH_MARGIN', 60)
+    if refresh_token and seconds_until_expiry(claims) <= margin:
+        try:
+            claims = _refresh_session_tokens(refresh_token)
+        except InvalidTokenException:
+            # 기존 토큰은 아직 유효하므로 이번 요청은 그대로 처리하고 다음 요청에서 다시 갱신
+            pass
+    return claims
+
+
+def _refresh_session_tokens(refresh_token: str) -> Dict[str, Any]:
+    """
+    토큰을 갱신하여 세션에 저장
+
+    Args:
+        refresh_token: 세션의 Refresh Token
+
+    Returns:
+        Dict: 새 Access Token의 클레임
+
+    Raises:
+        InvalidTokenException: 갱신 실패, 시간 초과, 새 토큰 검증 실패
+    """
+    timeout = current_app.config.get('SUPABASE_HTTP_TIMEOUT', 10.0)
+    tokens = get_token_refresher().refresh_now(refresh_token, timeout=timeout)
+    claims = get_token_verifier().verify(tokens['access_token'])
+    store_session_tokens(tokens['access_token'], tokens['refresh_token'])
+    return claims
+
+
+def _bearer_token() -> Optional[str]:
+    """Authorization: Bearer 헤더의 토큰 (없으면 None)"""
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not token.strip():
+        return None
+    return token.strip()
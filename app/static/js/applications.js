@@ -1,13 +1,12 @@
 /**
  * 인플루언서 지원 내역 조회 페이지 JavaScript
- * 클라이언트 측 필터링 및 정렬 기능
+ * 클라이언트 측 정렬 기능 (상태 필터와 페이지네이션은 서버에서 처리)
  */
 
 // 상태 관리
 const state = {
-  applications: [],           // 전체 지원 내역
-  filteredApplications: [],   // 필터링된 지원 내역
-  statusFilter: 'all',        // 현재 필터 (all, applied, selected, rejected)
+  applications: [],           // 현재 페이지 지원 내역
+  sortedApplications: [],   // 정렬된 지원 내역
   sortOrder: 'desc'           // 정렬 순서 (desc: 최신순, asc: 오래된순)
 };
 
@@ -26,33 +25,25 @@ function init() {
     }
   }
 
-  // 초기 필터링/정렬
-  updateFilteredApplications();
+  // 초기 정렬
+  updateSortedApplications();
 
   // 이벤트 리스너 등록
   registerEventListeners();
 }
 
 /**
- * 필터링 및 정렬 업데이트
+ * 정렬 업데이트
  */
-function updateFilteredApplications() {
-  let filtered = state.applications;
-
-  // 1. 상태 필터링
-  if (state.statusFilter !== 'all') {
-    const targetStatus = state.statusFilter.toUpperCase();
-    filtered = filtered.filter(app => app.status === targetStatus);
-  }
-
-  // 2. 정렬 (applied_at 기준)
-  const sorted = [...filtered].sort((a, b) => {
+function updateSortedApplications() {
+  // 정렬 (applied_at 기준)
+  const sorted = [...state.applications].sort((a, b) => {
     const dateA = new Date(a.applied_at);
     const dateB = new Date(b.applied_at);
     return state.sortOrder === 'desc' ? dateB - dateA : dateA - dateB;
   });
 
-  state.filteredApplications = sorted;
+  state.sortedApplications = sorted;
   render();
 }
 
@@ -61,7 +52,6 @@ function updateFilteredApplications() {
  */
 function render() {
   renderApplicationList();
-  renderFilterButtons();
   renderSortButton();
 }
 
@@ -70,53 +60,15 @@ function render() {
  */
 function renderApplicationList() {
   const allCards = document.querySelectorAll('.application-card');
-  const emptyState = document.getElementById('empty-state');
 
-  // 필터링된 ID 목록 생성
-  const filteredIds = new Set(state.filteredApplications.map(app => app.id));
-
-  // 모든 카드 순회하며 표시/숨김 처리
-  allCards.forEach(card => {
-    const cardId = parseInt(card.dataset.id);
-    if (filteredIds.has(cardId)) {
-      card.style.display = 'block';
-    } else {
-      card.style.display = 'none';
-    }
-  });
-
-  // 빈 상태 메시지 처리
-  if (emptyState) {
-    if (state.filteredApplications.length === 0 && allCards.length > 0) {
-      // 필터링 결과가 없지만 전체 데이터는 있는 경우
-      emptyState.style.display = 'block';
-      emptyState.innerHTML = `
-        <i class="bi bi-inbox"></i>
-        <h4 class="mt-3">해당 상태의 지원 내역이 없습니다</h4>
-        <p class="text-muted">다른 필터를 선택해보세요</p>
-      `;
-    } else if (state.filteredApplications.length === 0 && allCards.length === 0) {
-      // 전체 데이터가 없는 경우 (원래 빈 상태)
-      emptyState.style.display = 'block';
-    } else {
-      emptyState.style.display = 'none';
-    }
-  }
-}
-
-/**
- * 필터 버튼 렌더링
- */
-function renderFilterButtons() {
-  const buttons = document.querySelectorAll('.filter-button');
-  buttons.forEach(button => {
-    const filter = button.dataset.filter;
-    if (filter === state.statusFilter) {
-      button.classList.add('btn-primary');
-      button.classList.remove('btn-outline-primary');
-    } else {
-      button.classList.remove('btn-primary');
-      button.classList.add('btn-outline-primary');
+  // 정렬 순서대로 카드 재배치
+  const container = document.getElementById('application-list');
+  const cardsById = new Map();
+  allCards.forEach(card => cardsById.set(parseInt(card.dataset.id), card));
+  state.sortedApplications.forEach(app => {
+    const card = cardsById.get(app.id);
+    if (card && container) {
+      container.appendChild(card);
     }
   });
 }
@@ -139,21 +91,12 @@ function renderSortButton() {
  * 이벤트 리스너 등록
  */
 function registerEventListeners() {
-  // 필터 버튼
-  document.querySelectorAll('.filter-button').forEach(button => {
-    button.addEventListener('click', (e) => {
-      const clickedButton = e.currentTarget;
-      state.statusFilter = clickedButton.dataset.filter;
-      updateFilteredApplications();
-    });
-  });
-
   // 정렬 버튼
   const sortButton = document.getElementById('sort-button');
   if (sortButton) {
     sortButton.addEventListener('click', () => {
       state.sortOrder = state.sortOrder === 'desc' ? 'asc' : 'desc';
-      updateFilteredApplications();
+      updateSortedApplications();
     });
   }
 }
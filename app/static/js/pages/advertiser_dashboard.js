@@ -9,7 +9,11 @@ document.addEventListener('DOMContentLoaded', function() {
     tabs.forEach(tab => {
         tab.addEventListener('shown.bs.tab', function(event) {
             const targetTab = event.target.getAttribute('data-bs-target');
-            console.log(`Tab changed to: ${targetTab}`);
+
+            // 새로고침해도 같은 탭이 열리도록 URL에 탭 기록
+            const url = new URL(window.location.href);
+            url.searchParams.set('tab', targetTab.substring(1));
+            window.history.replaceState(null, '', url);
 
             // 탭 변경 시 추가 로직 (예: 정렬, 필터 초기화)
             // resetFilters(targetTab);
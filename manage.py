@@ -25,6 +25,21 @@ except Exception as e:
 # Flask-Migrate 초기화
 migration = Migrate(app, db)
 
+
+def print_usage():
+    """사용법 출력"""
+    print("사용법:")
+    print("  python manage.py init                  - 마이그레이션 초기화")
+    print("  python manage.py migrate               - 마이그레이션 파일 생성")
+    print("  python manage.py upgrade               - 데이터베이스에 적용")
+    print("  python manage.py recount-applications  - 체험단 지원자 수 재계산/보정")
+    print("  python manage.py backfill-image-variants [N] - 기존 체험단 이미지 썸네일/WebP 생성 (최대 N개)")
+    print("  python manage.py close-expired-campaigns [--watch] - 모집 기간이 지난 체험단 종료 (--watch: 주기 실행)")
+    print("  python manage.py reindex-search        - 체험단 검색 문서/지역 재생성")
+    print("  python manage.py explain-hot-queries [MIN_ROWS] - 주요 쿼리 실행 계획 점검 (MIN_ROWS행 이상 테이블의 순차 스캔 표시)")
+    print("  python manage.py benchmark-mappers [ROWS] - CampaignMapper/ApplicationMapper 변환 시간/메모리 측정 (기본 10000행)")
+
+
 if __name__ == '__main__':
     with app.app_context():
         if len(sys.argv) > 1:
@@ -46,13 +61,104 @@ if __name__ == '__main__':
                 upgrade()
                 print("완료!")
 
+            elif command == 'recount-applications':
+                from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+                print("체험단 지원자 수 재계산 중...")
+                repaired = CampaignRepository(db.session).recalculate_application_counts()
+                db.session.commit()
+                print(f"완료! ({repaired}개 체험단 보정)")
+
+            elif command == 'backfill-image-variants':
+                from app.infrastructure.external.storage_registry import (
+                    get_image_variant_service,
+                    save_image_variants,
+                )
+                from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+                limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
+                image_urls = CampaignRepository(db.session).find_image_urls_without_variants(limit=limit)
+                variant_service = get_image_variant_service()
+                print(f"이미지 변형 생성 중... ({len(image_urls)}개 이미지)")
+
+                updated, skipped, failed = 0, 0, 0
+                for image_url in image_urls:
+                    try:
+                        # 이미 저장된 변형은 재사용하므로 중단 후 다시 실행해도 안전
+                        variants = variant_service.generate(image_url)
+                    except Exception as e:
+                        failed += 1
+                        print(f"  실패: {image_url} ({e})", file=sys.stderr)
+                        continue
+                    if variants is None:
+                        skipped += 1  # 외부 URL 등 이 스토리지의 이미지가 아님
+                        continue
+                    updated += save_image_variants(image_url, variants)
+                variant_service.shutdown()
+                print(f"완료! ({updated}개 체험단 갱신, {skipped}개 건너뜀, {failed}개 실패)")
+
+            elif command == 'close-expired-campaigns':
+                from app.infrastructure.jobs.campaign_sweeper import (
+                    run_campaign_sweeper,
+                    sweep_expired_campaigns,
+                )
+
+                batch_size = app.config.get('CAMPAIGN_SWEEP_BATCH_SIZE', 500)
+                if '--watch' in sys.argv[2:]:
+                    interval = app.config.get('CAMPAIGN_SWEEP_INTERVAL', 300)
+                    print(f"체험단 자동 종료 워커 시작 ({interval}초 간격)")
+                    run_campaign_sweeper(app, interval=interval, batch_size=batch_size)
+                else:
+                    print("모집 기간이 지난 체험단 종료 중...")
+                    closed = sweep_expired_campaigns(batch_size=batch_size)
+                    print(f"완료! ({closed}개 체험단 종료)")
+
+            elif command == 'reindex-search':
+                from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+                print("체험단 검색 문서/지역 재생성 중...")
+                reindexed = CampaignRepository(db.session).rebuild_search_documents()
+                db.session.commit()
+                print(f"완료! ({reindexed}개 체험단)")
+
+            elif command == 'explain-hot-queries':
+                from app.infrastructure.persistence.query_plan import explain_hot_queries, table_row_counts
+
+                min_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+                print(f"주요 쿼리 실행 계획 점검 중... (순차 스캔 표시 기준: {min_rows}행 이상)")
+                print("  테이블 행 수: " + ", ".join(
+                    f"{table}={count}" for table, count in table_row_counts(db.session).items()
+                ))
+
+                reports = explain_hot_queries(db.session, min_rows=min_rows)
+                for report in reports:
+                    status = f"SEQ SCAN ({', '.join(report.sequential_scans)})" if report.sequential_scans else "OK"
+                    print(f"\n[{status}] {report.name}")
+                    for plan in report.plans:
+                        for line in plan.lines:
+                            print(f"    {line}")
+                db.session.rollback()
+
+                flagged = [report.name for report in reports if report.sequential_scans]
+                if flagged:
+                    print(f"\n큰 테이블 순차 스캔: {len(flagged)}개 쿼리 ({', '.join(flagged)})", file=sys.stderr)
+                    sys.exit(1)
+                print(f"\n완료! ({len(reports)}개 쿼리, 큰 테이블 순차 스캔 없음)")
+
+            elif command == 'benchmark-mappers':
+                from app.infrastructure.persistence.mapper_benchmark import benchmark_mappers
+
+                rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+                print(f"매퍼 변환 벤치마크 중... ({rows}행, slots 엔티티 vs 일반 dataclass)")
+                for result in benchmark_mappers(rows=rows):
+                    print(
+                        f"  {result.name}: "
+                        f"{result.seconds * 1000:.1f}ms / {result.bytes / 1024:.0f}KB "
+                        f"(일반 dataclass {result.baseline_seconds * 1000:.1f}ms / {result.baseline_bytes / 1024:.0f}KB, "
+                        f"메모리 {100 - result.bytes * 100 / result.baseline_bytes:.0f}% 감소)"
+                    )
+
             else:
-                print("사용법:")
-                print("  python manage.py init      - 마이그레이션 초기화")
-                print("  python manage.py migrate   - 마이그레이션 파일 생성")
-                print("  python manage.py upgrade   - 데이터베이스에 적용")
+                print_usage()
         else:
-            print("사용법:")
-            print("  python manage.py init      - 마이그레이션 초기화")
-            print("  python manage.py migrate   - 마이그레이션 파일 생성")
-            print("  python manage.py upgrade   - 데이터베이스에 적용")
+            print_usage()
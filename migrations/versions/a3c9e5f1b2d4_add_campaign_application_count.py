@@ -0,0 +1,39 @@
+"""Add campaign.application_count counter
+
+Revision ID: a3c9e5f1b2d4
+Revises: d1e716e23731
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e5f1b2d4'
+down_revision = 'd1e716e23731'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('application_count', sa.Integer(), nullable=False, server_default='0')
+        )
+
+    # 기존 지원 내역 기준으로 카운터 채우기
+    op.execute(
+        """
+        UPDATE campaign
+        SET application_count = (
+            SELECT COUNT(*) FROM application
+            WHERE application.campaign_id = campaign.id
+        )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.drop_column('application_count')
@@ -0,0 +1,27 @@
+"""Add campaign.image_variants for responsive image variants
+
+Revision ID: b7d2f4a6c8e1
+Revises: a3c9e5f1b2d4
+Create Date: 2025-11-27 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a6c8e1'
+down_revision = 'a3c9e5f1b2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 기존 체험단은 NULL로 두고 python manage.py backfill-image-variants로 채움
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('image_variants', sa.JSON(none_as_null=True), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.drop_column('image_variants')
@@ -0,0 +1,124 @@
+"""Add campaign full-text search (search_document + GIN / FTS5 index)
+
+Revision ID: c4e8a1d3f5b7
+Revises: b7d2f4a6c8e1
+Create Date: 2025-12-04 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.shared.utils.search_utils import build_search_document
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a1d3f5b7'
+down_revision = 'b7d2f4a6c8e1'
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_BATCH_SIZE = 500
+
+campaign_table = sa.table(
+    'campaign',
+    sa.column('id', sa.Integer),
+    sa.column('advertiser_id', sa.Integer),
+    sa.column('title', sa.String),
+    sa.column('description', sa.Text),
+    sa.column('benefits', sa.Text),
+    sa.column('search_document', sa.Text),
+)
+advertiser_table = sa.table(
+    'advertiser',
+    sa.column('id', sa.Integer),
+    sa.column('business_name', sa.String),
+)
+
+
+# app/infrastructure/persistence/models/campaign_model.py 의 SQLITE_SEARCH_DDL과 동일
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS campaign_fts USING fts5("
+    "search_document, content='campaign', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_ai AFTER INSERT ON campaign BEGIN "
+    "INSERT INTO campaign_fts(rowid, search_document) VALUES (new.id, coalesce(new.search_document, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_ad AFTER DELETE ON campaign BEGIN "
+    "INSERT INTO campaign_fts(campaign_fts, rowid, search_document) "
+    "VALUES ('delete', old.id, coalesce(old.search_document, '')); END",
+    "CREATE TRIGGER IF NOT EXISTS campaign_fts_au AFTER UPDATE OF search_document ON campaign BEGIN "
+    "INSERT INTO campaign_fts(campaign_fts, rowid, search_document) "
+    "VALUES ('delete', old.id, coalesce(old.search_document, '')); "
+    "INSERT INTO campaign_fts(rowid, search_document) VALUES (new.id, coalesce(new.search_document, '')); END",
+]
+
+
+def backfill_search_documents():
+    """기존 체험단의 검색 문서 채우기 (CampaignRepository.rebuild_search_documents와 같은 배치 방식)"""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                campaign_table.c.id,
+                campaign_table.c.title,
+                campaign_table.c.description,
+                campaign_table.c.benefits,
+                advertiser_table.c.business_name
+            )
+            .select_from(campaign_table.join(
+                advertiser_table, campaign_table.c.advertiser_id == advertiser_table.c.id
+            ))
+            .where(campaign_table.c.id > last_id)
+            .order_by(campaign_table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+
+        bind.execute(
+            campaign_table.update()
+            .where(campaign_table.c.id == sa.bindparam('campaign_id'))
+            .values(search_document=sa.bindparam('document')),
+            [
+                {
+                    'campaign_id': row.id,
+                    'document': build_search_document(row.title, row.description, row.benefits, row.business_name),
+                }
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_document', sa.Text(), nullable=True))
+
+    # 인덱스 생성 전에 채워서 (FTS5는 아래 rebuild로) 한 번에 색인
+    backfill_search_documents()
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_campaign_search_document',
+            'campaign',
+            [sa.text("to_tsvector('simple', coalesce(search_document, ''))")],
+            postgresql_using='gin'
+        )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO campaign_fts(campaign_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_campaign_search_document', table_name='campaign')
+    elif dialect == 'sqlite':
+        for trigger in ('campaign_fts_ai', 'campaign_fts_ad', 'campaign_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS campaign_fts")
+
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.drop_column('search_document')
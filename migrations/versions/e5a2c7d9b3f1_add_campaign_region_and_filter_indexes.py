@@ -0,0 +1,96 @@
+"""Add campaign.region and partial indexes for recruiting list filters
+
+Revision ID: e5a2c7d9b3f1
+Revises: c4e8a1d3f5b7
+Create Date: 2025-12-08 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.shared.utils.region_utils import extract_region
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2c7d9b3f1'
+down_revision = 'c4e8a1d3f5b7'
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_BATCH_SIZE = 500
+
+campaign_table = sa.table(
+    'campaign',
+    sa.column('id', sa.Integer),
+    sa.column('advertiser_id', sa.Integer),
+    sa.column('region', sa.String),
+)
+advertiser_table = sa.table(
+    'advertiser',
+    sa.column('id', sa.Integer),
+    sa.column('address', sa.Text),
+)
+
+
+# app/infrastructure/persistence/models/campaign_model.py 의 모집 중 부분 인덱스와 동일
+RECRUITING_INDEX_WHERE = sa.text("status = 'RECRUITING'")
+
+RECRUITING_INDEXES = [
+    ('ix_campaign_recruiting_end_date', ['end_date', 'id']),
+    ('ix_campaign_recruiting_created_at', ['created_at', 'id']),
+    ('ix_campaign_recruiting_region_end_date', ['region', 'end_date', 'id']),
+    ('ix_campaign_recruiting_region_created_at', ['region', 'created_at', 'id']),
+    ('ix_campaign_recruiting_quota_end_date', ['quota', 'end_date']),
+]
+
+
+def backfill_regions():
+    """기존 체험단의 지역을 광고주 주소로 채우기 (CampaignRepository.rebuild_search_documents와 같은 배치 방식)"""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(campaign_table.c.id, advertiser_table.c.address)
+            .select_from(campaign_table.join(
+                advertiser_table, campaign_table.c.advertiser_id == advertiser_table.c.id
+            ))
+            .where(campaign_table.c.id > last_id)
+            .order_by(campaign_table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+
+        bind.execute(
+            campaign_table.update()
+            .where(campaign_table.c.id == sa.bindparam('campaign_id'))
+            .values(region=sa.bindparam('campaign_region')),
+            [{'campaign_id': row.id, 'campaign_region': extract_region(row.address)} for row in rows]
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('region', sa.String(length=20), nullable=True))
+
+    # 지역 인덱스 생성 전에 채움
+    backfill_regions()
+
+    for name, columns in RECRUITING_INDEXES:
+        op.create_index(
+            name,
+            'campaign',
+            columns,
+            postgresql_where=RECRUITING_INDEX_WHERE,
+            sqlite_where=RECRUITING_INDEX_WHERE
+        )
+
+
+def downgrade():
+    for name, _ in reversed(RECRUITING_INDEXES):
+        op.drop_index(name, table_name='campaign')
+
+    with op.batch_alter_table('campaign', schema=None) as batch_op:
+        batch_op.drop_column('region')
@@ -0,0 +1,68 @@
+"""Add indexes from supabase/migrations/20251114000002_create_indexes.sql
+
+Revision ID: f6b3d8e0a4c2
+Revises: e5a2c7d9b3f1
+Create Date: 2025-12-10 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b3d8e0a4c2'
+down_revision = 'e5a2c7d9b3f1'
+branch_labels = None
+depends_on = None
+
+
+RECRUITING_INDEX_WHERE = sa.text("status = 'RECRUITING'")
+
+# Supabase SQL과 같은 이름 (Supabase SQL로 이미 만든 DB에서는 IF NOT EXISTS로 건너뜀)
+# 고유 인덱스(idx_user_email, idx_advertiser_user_id, idx_advertiser_business_number,
+# idx_influencer_user_id, idx_application_campaign_influencer)는 초기 마이그레이션의 UNIQUE 제약이 대신함
+INDEXES = [
+    ('idx_user_role', 'users', ['role'],
+     {'postgresql_where': sa.text('role IS NOT NULL'), 'sqlite_where': sa.text('role IS NOT NULL')}),
+    ('idx_advertiser_phone_number', 'advertiser', ['phone_number'], {}),
+    ('idx_influencer_phone_number', 'influencer', ['phone_number'], {}),
+    ('idx_campaign_advertiser_id', 'campaign', ['advertiser_id'], {}),
+    ('idx_campaign_status', 'campaign', ['status'], {}),
+    ('idx_campaign_end_date', 'campaign', ['end_date'], {}),
+    ('idx_campaign_created_at', 'campaign', [sa.text('created_at DESC')], {}),
+    ('idx_campaign_recruiting', 'campaign', ['status'],
+     {'postgresql_where': RECRUITING_INDEX_WHERE, 'sqlite_where': RECRUITING_INDEX_WHERE}),
+    ('idx_campaign_status_created_at', 'campaign', ['status', sa.text('created_at DESC')],
+     {'postgresql_where': RECRUITING_INDEX_WHERE, 'sqlite_where': RECRUITING_INDEX_WHERE}),
+    ('idx_application_influencer_id', 'application', ['influencer_id'], {}),
+    ('idx_application_campaign_id', 'application', ['campaign_id'], {}),
+    ('idx_application_status', 'application', ['status'], {}),
+    ('idx_application_applied_at', 'application', [sa.text('applied_at DESC')], {}),
+    ('idx_application_influencer_applied_at', 'application', ['influencer_id', sa.text('applied_at DESC')], {}),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, table, columns, options in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, **options)
+        return
+
+    # CREATE INDEX CONCURRENTLY: 테이블 쓰기를 막지 않고 생성 (트랜잭션 밖에서만 실행 가능)
+    # 중간에 실패하면 INVALID 인덱스가 남으므로 DROP INDEX 후 다시 upgrade
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True, **options)
+        for table in sorted({table for _, table, _, _ in INDEXES}):
+            op.execute(f'ANALYZE "{table}"')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
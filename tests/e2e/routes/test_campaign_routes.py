@@ -242,3 +242,224 @@ class TestCampaignDetailRoutes:
             # Then: "지원하기" 버튼 표시 (활성화)
             assert '지원하기' in html
             assert url_for('campaign.apply_campaign', campaign_id=1) in html
+
+    def test_campaign_images_use_variants(self, client, app, recruiting_campaign):
+        """
+        반응형 이미지: 변형이 생성된 체험단
+        - Given: 썸네일/WebP 변형이 저장된 체험단
+        - When: 홈, 체험단 상세 페이지 접근
+        - Then: 홈 카드는 썸네일 + WebP srcset, 상세는 원본 + WebP srcset 표시
+        """
+        with app.test_request_context():
+            recruiting_campaign.image_url = '/uploads/campaign-images/campaigns/ab/abcdef.png'
+            recruiting_campaign.image_variants = {
+                'thumbnail': '/uploads/campaign-images/variants/ab/abcdef/thumbnail.jpg',
+                'webp': {
+                    '400': '/uploads/campaign-images/variants/ab/abcdef/w400.webp',
+                    '800': '/uploads/campaign-images/variants/ab/abcdef/w800.webp',
+                },
+            }
+            db.session.commit()
+            srcset = (
+                '/uploads/campaign-images/variants/ab/abcdef/w400.webp 400w, '
+                '/uploads/campaign-images/variants/ab/abcdef/w800.webp 800w'
+            )
+
+            home = client.get(url_for('main.home')).data.decode('utf-8')
+            assert f'srcset="{srcset}"' in home
+            assert 'src="/uploads/campaign-images/variants/ab/abcdef/thumbnail.jpg"' in home
+
+            detail = client.get(url_for('campaign.campaign_detail', campaign_id=1)).data.decode('utf-8')
+            assert f'srcset="{srcset}"' in detail
+            assert 'src="/uploads/campaign-images/campaigns/ab/abcdef.png"' in detail
+
+
+class TestCampaignSearchRoutes:
+    """체험단 검색 라우트 테스트"""
+
+    @pytest.fixture
+    def searchable_campaigns(self, app, registered_advertiser):
+        """검색 문서가 있는 체험단 픽스처 (저장소 save로 생성)"""
+        from datetime import datetime
+        from app.domain.entities.campaign import Campaign, CampaignStatus
+        from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+        repository = CampaignRepository(db.session)
+        for title, status in [('크림 파스타 체험단', 'RECRUITING'), ('브런치 카페 체험단', 'RECRUITING'),
+                              ('로제 파스타 체험단', 'CLOSED')]:
+            repository.save(Campaign(
+                id=None,
+                advertiser_id=1,
+                title=title,
+                description='체험단 설명입니다.',
+                quota=5,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=10),
+                benefits='무료 식사 제공',
+                conditions='리뷰 작성',
+                image_url=None,
+                status=CampaignStatus(status),
+                created_at=datetime.now(),
+                closed_at=None
+            ))
+        db.session.commit()
+
+    def test_search_page(self, client, app, searchable_campaigns):
+        """
+        검색 페이지
+        - Given: '파스타'가 들어간 모집 중 체험단 1개, 종료 체험단 1개
+        - When: '파스타' 검색 (기본 상태 필터)
+        - Then: 모집 중 체험단만 표시
+        """
+        with app.test_request_context():
+            response = client.get(url_for('campaign.search', q='파스타'))
+
+            assert response.status_code == 200
+            html = response.data.decode('utf-8')
+            assert '크림 파스타 체험단' in html
+            assert '로제 파스타 체험단' not in html
+            assert '브런치 카페 체험단' not in html
+
+    def test_search_json_all_statuses(self, client, app, searchable_campaigns):
+        """
+        검색 API
+        - Given: '파스타'가 들어간 체험단 2개 (모집 중/종료)
+        - When: status=ALL 로 JSON 검색
+        - Then: 2개와 총 개수 반환
+        """
+        with app.test_request_context():
+            response = client.get(url_for('campaign.search_json', q='파스타', status='ALL'))
+
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data['total_count'] == 2
+            assert data['status'] is None
+            assert {item['title'] for item in data['items']} == {'크림 파스타 체험단', '로제 파스타 체험단'}
+            assert data['items'][0]['deadline'] == (date.today() + timedelta(days=10)).isoformat()
+
+    def test_search_invalid_status(self, client, app):
+        """
+        잘못된 상태 필터
+        - Given: 지원하지 않는 상태 값
+        - When: 검색
+        - Then: 400 Bad Request
+        """
+        with app.test_request_context():
+            response = client.get(url_for('campaign.search_json', q='파스타', status='DELETED'))
+
+            assert response.status_code == 400
+
+
+class TestHomeFilterRoutes:
+    """홈 피드 필터 라우트 테스트"""
+
+    @pytest.fixture
+    def filterable_campaigns(self, app, registered_advertiser):
+        """마감일/인원이 다른 서울 광고주 체험단 픽스처 (저장소 save로 생성)"""
+        from datetime import datetime
+        from app.domain.entities.campaign import Campaign, CampaignStatus
+        from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+        repository = CampaignRepository(db.session)
+        for title, end_in_days, quota in [('마감임박 체험단', 2, 3), ('여유있는 체험단', 12, 50)]:
+            repository.save(Campaign(
+                id=None,
+                advertiser_id=1,
+                title=title,
+                description='체험단 설명입니다.',
+                quota=quota,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=end_in_days),
+                benefits='무료 식사 제공',
+                conditions='리뷰 작성',
+                image_url=None,
+                status=CampaignStatus.RECRUITING,
+                created_at=datetime.now(),
+                closed_at=None
+            ))
+        db.session.commit()
+
+    def test_home_filtered_with_facet_counts(self, client, app, filterable_campaigns):
+        """
+        필터 적용 홈 피드
+        - Given: 서울 광고주의 2일/12일 뒤 마감 체험단
+        - When: deadline=3, region=서울 로 홈 조회
+        - Then: 마감임박 체험단만 표시, 필터별 개수 표시 (마감 개수는 지역 필터만 적용)
+        """
+        with app.test_request_context():
+            response = client.get(url_for('main.home', deadline=3, region='서울'))
+
+            assert response.status_code == 200
+            html = response.data.decode('utf-8')
+            assert '마감임박 체험단' in html
+            assert '여유있는 체험단' not in html
+            assert '조건에 맞는 체험단 1개' in html
+            assert '14일 이내 마감 (2)' in html
+            assert '서울 (1)' in html
+            assert '31+명 (0)' in html
+
+    def test_home_invalid_filter(self, client, app):
+        """
+        잘못된 필터
+        - Given: 지원하지 않는 마감 기간
+        - When: 홈 조회
+        - Then: 400 Bad Request
+        """
+        with app.test_request_context():
+            response = client.get(url_for('main.home', deadline=5))
+
+            assert response.status_code == 400
+
+
+class TestHomePaginationRoutes:
+    """홈 피드 페이지네이션 라우트 테스트"""
+
+    @pytest.fixture
+    def many_campaigns(self, app, registered_advertiser):
+        """한 페이지(12개)를 넘는 모집 중 체험단 13개 (등록 시각이 1분씩 다름)"""
+        from datetime import datetime
+        from app.domain.entities.campaign import Campaign, CampaignStatus
+        from app.infrastructure.repositories.campaign_repository import CampaignRepository
+
+        repository = CampaignRepository(db.session)
+        now = datetime.now()
+        for i in range(1, 14):
+            repository.save(Campaign(
+                id=None,
+                advertiser_id=1,
+                title=f'피드 체험단 {i:02d}',
+                description='체험단 설명입니다.',
+                quota=5,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=7),
+                benefits='무료 식사 제공',
+                conditions='리뷰 작성',
+                image_url=None,
+                status=CampaignStatus.RECRUITING,
+                created_at=now - timedelta(minutes=i),
+                closed_at=None
+            ))
+        db.session.commit()
+
+    def test_next_link_switches_to_cursor(self, client, app, many_campaigns):
+        """
+        기본 피드의 다음 페이지 링크
+        - Given: 모집 중 체험단 13개
+        - When: 기본 홈 조회 후 rel="next" 링크를 따라감
+        - Then: 다음 링크는 page가 아닌 cursor 방식이고, 다음 페이지에 13번째 체험단 표시
+        """
+        import re
+
+        with app.test_request_context():
+            response = client.get(url_for('main.home'))
+
+            html = response.data.decode('utf-8')
+            assert '피드 체험단 12' in html
+            assert '피드 체험단 13' not in html
+            next_links = re.findall(r'rel="next" href="([^"]+)"', html)
+            assert len(next_links) == 1
+            assert 'cursor=' in next_links[0] and 'page=' not in next_links[0]
+
+            next_page = client.get(next_links[0].replace('&amp;', '&')).data.decode('utf-8')
+            assert '피드 체험단 13' in next_page
+            assert '피드 체험단 12' not in next_page
@@ -3,13 +3,16 @@
 광고주 라우트 트랜잭션 처리 통합 테스트
 """
 
+import io
 import pytest
-from datetime import date
+from concurrent.futures import Future
+from datetime import date, timedelta
 from flask import url_for
 from app.infrastructure.persistence.models.user_model import UserModel
 from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
 from app.infrastructure.persistence.models.campaign_model import CampaignModel
 from app.extensions import db
+from app.infrastructure.external.storage_registry import get_image_upload_service, watch_image_upload
 from tests.conftest import login_user, count_records
 
 
@@ -347,3 +350,309 @@ class TestCampaignCreateTransaction:
             # Assert - Flash 메시지
             html = response.data.decode('utf-8')
             assert '오류가 발생했습니다' in html
+
+
+class TestCampaignCloseTransaction:
+    """체험단 조기종료 트랜잭션 테스트"""
+
+    def test_close_campaign_commits_and_invalidates_home_feed(self, client, app, registered_advertiser):
+        """
+        정상 케이스: 조기종료 커밋 및 홈 피드 캐시 무효화
+        Given: 모집 중인 체험단 1개, 홈 피드가 캐시된 상태
+        When: POST /advertiser/campaign/<id>/close
+        Then: 상태 CLOSED로 커밋, 홈 피드에서 제외
+        """
+        with app.app_context():
+            app.config['WTF_CSRF_ENABLED'] = False
+            campaign = CampaignModel(
+                advertiser_id=1,
+                title='조기종료 체험단',
+                description='설명',
+                quota=5,
+                start_date=date(2025, 11, 15),
+                end_date=date(2099, 12, 1),
+                benefits='혜택',
+                conditions='조건',
+                status='RECRUITING'
+            )
+            db.session.add(campaign)
+            db.session.commit()
+            campaign_id = campaign.id
+
+            login_user(client, 'registered-advertiser-id')
+            assert '조기종료 체험단' in client.get('/').data.decode('utf-8')
+
+            response = client.post(f'/advertiser/campaign/{campaign_id}/close')
+
+            assert response.status_code == 302
+            db.session.expire_all()
+            assert db.session.get(CampaignModel, campaign_id).status == 'CLOSED'
+            assert '조기종료 체험단' not in client.get('/').data.decode('utf-8')
+
+
+class TestAdvertiserDashboardTabs:
+    """광고주 대시보드 탭 유지 테스트"""
+
+    def test_status_page_links_keep_tab(self, client, app, registered_advertiser):
+        """
+        정상 케이스: 상태별 페이지 링크가 같은 탭을 다시 엶
+        Given: 모집 종료 체험단 13개 (2페이지)
+        When: GET /advertiser/dashboard?closed_page=2&tab=closed
+        Then: 모집 종료 탭이 활성화되고, 페이지 링크에 tab=closed 포함
+        """
+        with app.app_context():
+            for i in range(13):
+                db.session.add(CampaignModel(
+                    advertiser_id=1,
+                    title=f'종료 체험단 {i}',
+                    description='설명',
+                    quota=5,
+                    start_date=date(2025, 11, 15),
+                    end_date=date(2025, 11, 30),
+                    benefits='혜택',
+                    conditions='조건',
+                    status='CLOSED'
+                ))
+            db.session.commit()
+            login_user(client, 'registered-advertiser-id')
+
+            html = client.get('/advertiser/dashboard?closed_page=2&tab=closed').data.decode('utf-8')
+
+            assert 'class="nav-link active" id="closed-tab"' in html
+            assert 'class="tab-pane fade show active" id="closed"' in html
+            assert 'class="nav-link" id="recruiting-tab"' in html
+            assert 'closed_page=1' in html and 'tab=closed' in html
+
+    def test_invalid_tab_falls_back_to_recruiting(self, client, app, registered_advertiser):
+        """
+        예외 케이스: 알 수 없는 탭
+        Given: 등록된 광고주
+        When: GET /advertiser/dashboard?tab=unknown
+        Then: 모집 중 탭 활성화
+        """
+        with app.app_context():
+            login_user(client, 'registered-advertiser-id')
+
+            html = client.get('/advertiser/dashboard?tab=unknown').data.decode('utf-8')
+
+            assert 'class="nav-link active" id="recruiting-tab"' in html
+
+
+class TestInfluencerSelectionAcrossPages:
+    """지원자가 한 페이지(50명)를 넘는 체험단의 선정 테스트"""
+
+    @staticmethod
+    def _create_closed_campaign_with_applicants(count):
+        from datetime import datetime
+        from app.infrastructure.persistence.models.application_model import ApplicationModel
+        from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+
+        campaign = CampaignModel(
+            advertiser_id=1,
+            title='선정 대기 체험단',
+            description='설명',
+            quota=5,
+            start_date=date(2025, 11, 15),
+            end_date=date(2025, 11, 30),
+            benefits='혜택',
+            conditions='조건',
+            status='CLOSED'
+        )
+        db.session.add(campaign)
+        db.session.flush()
+        for i in range(count):
+            influencer = InfluencerModel(
+                user_id=f'selection-influencer-{i}',
+                name=f'지원자 {i:02d}',
+                birth_date=date(1995, 1, 1),
+                phone_number='010-0000-0000',
+                channel_name=f'채널 {i}',
+                channel_url=f'https://example.com/{i}',
+                follower_count=i
+            )
+            db.session.add(influencer)
+            db.session.flush()
+            db.session.add(ApplicationModel(
+                campaign_id=campaign.id,
+                influencer_id=influencer.id,
+                status='APPLIED',
+                applied_at=datetime(2025, 11, 20, 10, 0, 0) + timedelta(seconds=i)
+            ))
+        db.session.commit()
+        return campaign.id
+
+    def test_selection_form_lists_every_applied_applicant(self, client, app, registered_advertiser):
+        """
+        정상 케이스: 선정 폼은 페이지/필터 없이 APPLIED 지원자 전원 표시
+        Given: 모집 종료 체험단, APPLIED 지원자 60명
+        When: 2페이지 + 탈락 필터로 상세 조회 후, 표시된 지원자 중 1명만 선정
+        Then: 60명 모두 체크박스로 표시되고, 선정 후 1명 SELECTED / 59명 REJECTED (보지 못한 지원자 없음)
+        """
+        import re
+        from app.infrastructure.persistence.models.application_model import ApplicationModel
+
+        with app.app_context():
+            app.config['WTF_CSRF_ENABLED'] = False
+            campaign_id = self._create_closed_campaign_with_applicants(60)
+            login_user(client, 'registered-advertiser-id')
+
+            html = client.get(
+                f'/advertiser/campaign/{campaign_id}?page=2&status=REJECTED'
+            ).data.decode('utf-8')
+            shown_ids = re.findall(r'name="selected_application_ids\[\]" value="(\d+)"', html)
+
+            assert len(shown_ids) == 60
+            assert 'aria-label="상태 필터"' not in html
+
+            response = client.post(
+                f'/advertiser/campaign/{campaign_id}/select',
+                data={'selected_application_ids[]': [shown_ids[-1]]}
+            )
+
+            assert response.status_code == 302
+            db.session.expire_all()
+            statuses = [status for (status,) in db.session.query(ApplicationModel.status).all()]
+            assert statuses.count('SELECTED') == 1
+            assert statuses.count('REJECTED') == 59
+
+    def test_recruiting_campaign_applicants_are_paginated(self, client, app, registered_advertiser):
+        """
+        정상 케이스: 선정 대기가 아니면 페이지네이션 유지
+        Given: 모집 중 체험단, 지원자 60명
+        When: 상세 조회
+        Then: 체크박스 없이 한 페이지(50명)만 표시
+        """
+        with app.app_context():
+            campaign_id = self._create_closed_campaign_with_applicants(60)
+            db.session.get(CampaignModel, campaign_id).status = 'RECRUITING'
+            db.session.commit()
+            login_user(client, 'registered-advertiser-id')
+
+            html = client.get(f'/advertiser/campaign/{campaign_id}').data.decode('utf-8')
+
+            assert 'selected_application_ids[]' not in html
+            assert html.count('<td>2025-11-20</td>') == 50
+            assert '1 / 2 (총 60명)' in html
+
+
+class TestCampaignImageUpload:
+    """체험단 대표 이미지 업로드 테스트 (로컬 스토리지)"""
+
+    def _form_data(self, image):
+        today = date.today()
+        return {
+            'title': '이미지 포함 체험단 모집',
+            'description': '대표 이미지를 포함한 체험단 생성 테스트입니다.',
+            'quota': 5,
+            'start_date': (today + timedelta(days=1)).isoformat(),
+            'end_date': (today + timedelta(days=20)).isoformat(),
+            'benefits': '무료 식사 제공',
+            'conditions': '인스타그램 피드 1개 업로드',
+            'image': image,
+        }
+
+    def test_create_campaign_with_image(self, client, app, registered_advertiser, tmp_path):
+        """
+        정상 케이스: 이미지 업로드
+        Given: 로컬 스토리지 설정, PNG 이미지
+        When: 이미지와 함께 체험단 생성
+        Then: 내용 해시 URL이 저장되고 백그라운드 업로드 후 파일 생성
+        """
+        app.config.update(STORAGE_BACKEND='local', LOCAL_STORAGE_ROOT=str(tmp_path))
+        login_user(client, registered_advertiser.id)
+        png = b'\x89PNG\r\n\x1a\n' + b'\x00' * 1024
+
+        response = client.post(
+            '/advertiser/campaign/create',
+            data=self._form_data((io.BytesIO(png), 'photo.png')),
+            content_type='multipart/form-data'
+        )
+
+        assert response.status_code == 302
+        campaign = db.session.query(CampaignModel).filter_by(title='이미지 포함 체험단 모집').one()
+        assert campaign.image_url.startswith('/uploads/campaign-images/campaigns/')
+        get_image_upload_service().shutdown()
+        stored = tmp_path / campaign.image_url[len('/uploads/'):]
+        assert stored.read_bytes() == png
+
+    @staticmethod
+    def _campaign_with_image(title, image_url):
+        campaign = CampaignModel(
+            advertiser_id=1,
+            title=title,
+            description='설명',
+            quota=5,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=7),
+            benefits='혜택',
+            conditions='조건',
+            image_url=image_url,
+            image_variants={'thumbnail': '/t.jpg', 'webp': {}},
+            status='RECRUITING'
+        )
+        db.session.add(campaign)
+        db.session.commit()
+        return campaign.id
+
+    def test_failed_upload_clears_only_new_campaign_image(self, client, app, registered_advertiser, tmp_path):
+        """
+        예외 케이스: 같은 이미지 URL을 쓰는 체험단 중 새 체험단의 업로드만 실패
+        Given: 같은 내용 해시 URL의 기존 체험단과 새 체험단, 스토리지에 파일 없음
+        When: 새 체험단의 업로드가 재시도까지 실패
+        Then: 새 체험단의 이미지 URL/변형 URL만 비우고 기존 체험단은 유지
+        """
+        app.config.update(STORAGE_BACKEND='local', LOCAL_STORAGE_ROOT=str(tmp_path))
+        image_url = '/uploads/campaign-images/campaigns/ab/abcdef.png'
+        older_id = self._campaign_with_image('기존 체험단', image_url)
+        newer_id = self._campaign_with_image('업로드 실패 체험단', image_url)
+        upload = Future()
+
+        watch_image_upload(newer_id, image_url, upload)
+        upload.set_exception(OSError('storage unavailable'))
+
+        db.session.expire_all()
+        older = db.session.get(CampaignModel, older_id)
+        newer = db.session.get(CampaignModel, newer_id)
+        assert (newer.image_url, newer.image_variants) == (None, None)
+        assert older.image_url == image_url
+        assert older.image_variants == {'thumbnail': '/t.jpg', 'webp': {}}
+
+    def test_failed_upload_keeps_image_when_file_exists(self, client, app, registered_advertiser, tmp_path):
+        """
+        경계 케이스: 업로드는 실패했지만 같은 파일이 이미 스토리지에 있음
+        Given: 스토리지에 저장된 이미지와 그 URL의 체험단
+        When: 업로드가 예외로 끝남
+        Then: 파일이 있으므로 이미지 URL 유지
+        """
+        app.config.update(STORAGE_BACKEND='local', LOCAL_STORAGE_ROOT=str(tmp_path))
+        image_url = get_image_upload_service().storage.upload_file(
+            'campaign-images', 'campaigns/ab/abcdef.png', b'\x89PNG\r\n\x1a\n'
+        )
+        campaign_id = self._campaign_with_image('업로드 실패 체험단', image_url)
+        upload = Future()
+
+        watch_image_upload(campaign_id, image_url, upload)
+        upload.set_exception(OSError('storage unavailable'))
+
+        db.session.expire_all()
+        assert db.session.get(CampaignModel, campaign_id).image_url == image_url
+
+    def test_create_campaign_rejects_non_image(self, client, app, registered_advertiser, tmp_path):
+        """
+        예외 케이스: 이미지가 아닌 파일 (확장자만 이미지)
+        Given: 내용이 PDF인 .jpg 파일
+        When: 체험단 생성
+        Then: 생성되지 않고 안내 메시지 표시
+        """
+        app.config.update(STORAGE_BACKEND='local', LOCAL_STORAGE_ROOT=str(tmp_path))
+        login_user(client, registered_advertiser.id)
+
+        response = client.post(
+            '/advertiser/campaign/create',
+            data=self._form_data((io.BytesIO(b'%PDF-1.7' + b'\x00' * 64), 'fake.jpg')),
+            content_type='multipart/form-data'
+        )
+
+        assert response.status_code == 200
+        assert '대표 이미지' in response.data.decode('utf-8')
+        assert count_records(CampaignModel) == 0
@@ -0,0 +1,75 @@
+# tests/integration/routes/test_auth_routes.py
+"""
+Auth Routes 통합 테스트 (인증 서버 장애 시 응답)
+"""
+
+import pytest
+from app.domain.exceptions.auth_exceptions import AuthProviderUnavailableException
+from app.infrastructure.external.resilience.circuit_breaker import CircuitBreaker
+from app.infrastructure.external.resilience.resilient_auth_provider import ResilientAuthProvider
+from app.presentation.routes import auth_routes
+
+
+class UnavailableAuthProvider:
+    """항상 응답하지 않는 인증 제공자"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def authenticate(self, email, password):
+        self.calls += 1
+        raise AuthProviderUnavailableException()
+
+    def create_user(self, email, password):
+        self.calls += 1
+        raise AuthProviderUnavailableException()
+
+
+@pytest.fixture
+def unavailable_provider(app, monkeypatch):
+    """장애 대응 래퍼로 감싼 장애 제공자 (재시도 대기 없음)"""
+    fake = UnavailableAuthProvider()
+    resilience = app.extensions['auth_resilience']
+    resilience.sleep = lambda seconds: None
+    monkeypatch.setattr(auth_routes, 'get_auth_provider', lambda: ResilientAuthProvider(fake, resilience))
+    return fake
+
+
+class TestAuthProviderUnavailable:
+    """인증 서버 장애 테스트"""
+
+    def test_login_renders_friendly_error(self, client, unavailable_provider):
+        """
+        예외 케이스: 인증 서버 응답 없음
+        Given: 응답하지 않는 인증 서버
+        When: 로그인 요청
+        Then: 503과 안내 메시지
+        """
+        response = client.post('/auth/login', data={
+            'email': 'user@example.com',
+            'password': 'password123'
+        })
+
+        assert response.status_code == 503
+        assert auth_routes.AUTH_UNAVAILABLE_MESSAGE in response.get_data(as_text=True)
+
+    def test_login_fails_fast_when_circuit_open(self, app, client, unavailable_provider):
+        """
+        예외 케이스: 연속 장애 후 회로 open
+        Given: 실패 기준만큼 실패한 인증 서버
+        When: 다시 로그인 요청
+        Then: 인증 서버를 호출하지 않고 503
+        """
+        breaker = app.extensions['auth_resilience'].breaker
+        for _ in range(breaker.failure_threshold):
+            client.post('/auth/login', data={'email': 'user@example.com', 'password': 'password123'})
+        calls = unavailable_provider.calls
+
+        response = client.post('/auth/login', data={
+            'email': 'user@example.com',
+            'password': 'password123'
+        })
+
+        assert response.status_code == 503
+        assert breaker.state == CircuitBreaker.OPEN
+        assert unavailable_provider.calls == calls
@@ -65,7 +65,7 @@ class TestApplicationServiceApply:
         mock_campaign_repo.find_by_id.return_value = campaign
         mock_influencer_repo.find_by_id.return_value = influencer
         mock_application_repo.exists_by_campaign_and_influencer.return_value = False
-        mock_application_repo.save.return_value = Application(
+        mock_application_repo.insert_if_recruiting.return_value = Application(
             id=1,
             campaign_id=campaign_id,
             influencer_id=influencer_id,
@@ -92,7 +92,9 @@ class TestApplicationServiceApply:
         assert result.campaign_id == campaign_id
         assert result.influencer_id == influencer_id
         assert result.status == APPLICATION_STATUS_APPLIED
-        mock_application_repo.save.assert_called_once()
+        mock_application_repo.insert_if_recruiting.assert_called_once()
+        mock_application_repo.exists_by_campaign_and_influencer.assert_not_called()
+        mock_campaign_repo.increment_application_count.assert_called_once_with(campaign_id)
 
     def test_apply_to_campaign_raises_when_influencer_not_found(self):
         """인플루언서 정보가 없을 때 예외 발생"""
@@ -160,6 +162,7 @@ class TestApplicationServiceApply:
 
         mock_campaign_repo.find_by_id.return_value = campaign
         mock_influencer_repo.find_by_id.return_value = influencer
+        mock_application_repo.insert_if_recruiting.return_value = None
 
         service = ApplicationService(
             mock_application_repo,
@@ -216,6 +219,7 @@ class TestApplicationServiceApply:
         mock_campaign_repo.find_by_id.return_value = campaign
         mock_influencer_repo.find_by_id.return_value = influencer
         mock_application_repo.exists_by_campaign_and_influencer.return_value = True  # 이미 지원함
+        mock_application_repo.insert_if_recruiting.return_value = None
 
         service = ApplicationService(
             mock_application_repo,
@@ -230,3 +234,41 @@ class TestApplicationServiceApply:
                 influencer_id=influencer_id,
                 application_reason=None
             )
+
+
+class TestApplicationServiceSelect:
+    """ApplicationService.select_influencers() 통합 테스트"""
+
+    def test_select_influencers_applies_selection_in_single_update(self):
+        """선정 시 지원 목록을 불러오지 않고 단일 UPDATE로 반영"""
+        # Arrange
+        campaign = Campaign(
+            id=1,
+            advertiser_id=1,
+            title="테스트 체험단",
+            description="테스트",
+            quota=5,
+            start_date=date.today(),
+            end_date=date.today(),
+            benefits="혜택",
+            conditions="조건",
+            image_url=None,
+            status=CampaignStatus.CLOSED,
+            created_at=datetime.now(),
+            closed_at=datetime.now()
+        )
+
+        mock_application_repo = Mock()
+        mock_campaign_repo = Mock()
+        mock_campaign_repo.find_by_id.return_value = campaign
+
+        service = ApplicationService(mock_application_repo, mock_campaign_repo, Mock())
+
+        # Act
+        service.select_influencers(campaign_id=1, advertiser_id=1, selected_application_ids=[3, 7])
+
+        # Assert
+        mock_application_repo.apply_selection.assert_called_once_with(1, [3, 7])
+        mock_application_repo.find_by_campaign_id.assert_not_called()
+        assert campaign.status == CampaignStatus.SELECTED
+        mock_campaign_repo.save.assert_called_once_with(campaign)
@@ -0,0 +1,232 @@
+# tests/integration/services/test_image_upload_service.py
+"""
+ImageUploadService 통합 테스트 (LocalStorageProvider 사용)
+"""
+
+import hashlib
+import io
+import os
+
+import pytest
+from app.application.services.image_upload_service import ImageUploadService
+from app.domain.exceptions.validation_exceptions import InvalidImageException
+from app.infrastructure.external.local.local_storage import LocalStorageProvider
+
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 2048
+
+
+class CountingStream(io.BytesIO):
+    """읽은 바이트 수를 기록하는 스트림"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+        self.largest_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        self.largest_read = max(self.largest_read, len(chunk))
+        return chunk
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """로컬 파일 시스템 스토리지"""
+    return LocalStorageProvider(root=str(tmp_path / 'storage'))
+
+
+@pytest.fixture
+def service(storage, tmp_path):
+    """작은 청크/최대 크기로 설정한 업로드 서비스"""
+    tmp_dir = tmp_path / 'tmp'
+    tmp_dir.mkdir()
+    service = ImageUploadService(
+        storage=storage,
+        bucket='campaign-images',
+        max_bytes=4096,
+        chunk_size=512,
+        tmp_dir=str(tmp_dir)
+    )
+    yield service
+    service.shutdown()
+
+
+class TestImageUploadService:
+    """ImageUploadService 테스트"""
+
+    def test_stage_streams_in_chunks_with_content_hash_key(self, service):
+        """
+        정상 케이스: 청크 단위 기록
+        Given: PNG 업로드 스트림
+        When: stage 호출
+        Then: 청크 크기 이하로만 읽고, 내용 해시 기반 키와 MIME 타입 결정
+        """
+        stream = CountingStream(PNG_BYTES)
+
+        staged = service.stage(stream)
+
+        sha256 = hashlib.sha256(PNG_BYTES).hexdigest()
+        assert stream.largest_read <= 512
+        assert staged.key == f'campaigns/{sha256[:2]}/{sha256}.png'
+        assert staged.content_type == 'image/png'
+        assert staged.size == len(PNG_BYTES)
+        with open(staged.temp_path, 'rb') as f:
+            assert f.read() == PNG_BYTES
+        os.remove(staged.temp_path)
+
+    def test_oversized_upload_rejected_while_streaming(self, service, tmp_path):
+        """
+        예외 케이스: 최대 크기 초과
+        Given: 최대 크기(4KB)보다 훨씬 큰 PNG 스트림
+        When: stage 호출
+        Then: 최대 크기를 넘은 청크에서 중단, 임시 파일 삭제
+        """
+        stream = CountingStream(b'\x89PNG\r\n\x1a\n' + b'\x00' * (1024 * 1024))
+
+        with pytest.raises(InvalidImageException):
+            service.stage(stream)
+
+        assert stream.bytes_read <= 4096 + 512
+        assert os.listdir(tmp_path / 'tmp') == []
+
+    @pytest.mark.parametrize('data', [b'', b'%PDF-1.7 not an image' + b'\x00' * 100, b'GIF'])
+    def test_invalid_type_rejected(self, service, data):
+        """
+        예외 케이스: 빈 파일 / 이미지가 아닌 파일 / 시그니처보다 짧은 파일
+        Given: 잘못된 업로드 스트림
+        When: stage 호출
+        Then: InvalidImageException 발생
+        """
+        with pytest.raises(InvalidImageException):
+            service.stage(io.BytesIO(data))
+
+    def test_submit_uploads_in_background_and_deduplicates(self, service, storage):
+        """
+        정상 케이스: 백그라운드 업로드 및 중복 제거
+        Given: 같은 이미지 두 번 업로드
+        When: submit 호출 후 완료 대기
+        Then: 같은 URL, 스토리지에 파일 1개, 임시 파일 삭제
+        """
+        url1, future1 = service.submit(io.BytesIO(PNG_BYTES))
+        assert future1.result(timeout=5) == url1
+
+        url2, future2 = service.submit(io.BytesIO(PNG_BYTES))
+        future2.result(timeout=5)
+
+        sha256 = hashlib.sha256(PNG_BYTES).hexdigest()
+        key = f'campaigns/{sha256[:2]}/{sha256}.png'
+        assert url1 == url2 == f'/uploads/campaign-images/{key}'
+        assert storage.exists('campaign-images', key)
+        assert os.listdir(os.path.dirname(storage._full_path('campaign-images', key))) == [f'{sha256}.png']
+        assert os.listdir(service.tmp_dir) == []
+
+
+    def test_upload_retries_transient_failure(self, storage, tmp_path, monkeypatch):
+        """
+        정상 케이스: 일시적 전송 실패
+        Given: 첫 전송만 실패하는 스토리지
+        When: submit 후 완료 대기
+        Then: 재시도하여 업로드 성공, 임시 파일 삭제
+        """
+        original = storage.upload_stream
+        attempts = []
+
+        def flaky_upload(*args):
+            attempts.append(args[1])
+            if len(attempts) == 1:
+                raise OSError('connection reset')
+            return original(*args)
+
+        monkeypatch.setattr(storage, 'upload_stream', flaky_upload)
+        service = ImageUploadService(storage=storage, bucket='campaign-images', tmp_dir=str(tmp_path), retry_delay=0)
+
+        url, future = service.submit(io.BytesIO(PNG_BYTES))
+
+        assert future.result(timeout=5) == url
+        assert len(attempts) == 2
+        assert storage.exists('campaign-images', attempts[0])
+        assert [name for name in os.listdir(tmp_path) if name.startswith('image-upload-')] == []
+        service.shutdown()
+
+    def test_existence_check_failure_is_retried(self, storage, tmp_path, monkeypatch):
+        """
+        정상 케이스: 스토리지 조회 실패
+        Given: 첫 존재 확인만 예외를 내는 스토리지
+        When: submit 후 완료 대기
+        Then: 파일 없음으로 취급하지 않고 재시도하여 업로드 성공, is_stored True
+        """
+        original = storage.exists
+        checks = []
+
+        def flaky_exists(bucket, path):
+            checks.append(path)
+            if len(checks) == 1:
+                raise Exception('파일 존재 확인 실패: timeout')
+            return original(bucket, path)
+
+        monkeypatch.setattr(storage, 'exists', flaky_exists)
+        service = ImageUploadService(storage=storage, bucket='campaign-images', tmp_dir=str(tmp_path), retry_delay=0)
+
+        url, future = service.submit(io.BytesIO(PNG_BYTES))
+
+        assert future.result(timeout=5) == url
+        assert len(checks) == 2
+        assert service.is_stored(url)
+        assert not service.is_stored('https://example.com/other.png')
+        service.shutdown()
+
+    def test_upload_fails_after_retries(self, storage, tmp_path, monkeypatch):
+        """
+        예외 케이스: 재시도까지 모두 실패
+        Given: 항상 실패하는 스토리지, 재시도 2회
+        When: submit 후 완료 대기
+        Then: 3번 시도 후 Future에 예외, 임시 파일 삭제
+        """
+        attempts = []
+
+        def failing_upload(*args):
+            attempts.append(args[1])
+            raise OSError('storage unavailable')
+
+        monkeypatch.setattr(storage, 'upload_stream', failing_upload)
+        service = ImageUploadService(
+            storage=storage, bucket='campaign-images', tmp_dir=str(tmp_path), retries=2, retry_delay=0
+        )
+
+        _, future = service.submit(io.BytesIO(PNG_BYTES))
+
+        with pytest.raises(OSError):
+            future.result(timeout=5)
+        assert len(attempts) == 3
+        assert [name for name in os.listdir(tmp_path) if name.startswith('image-upload-')] == []
+        service.shutdown()
+
+
+class TestLocalStorageProvider:
+    """LocalStorageProvider 테스트"""
+
+    def test_upload_stream_and_delete(self, storage):
+        """
+        정상 케이스: 스트림 업로드 후 삭제
+        Given: 로컬 스토리지
+        When: upload_stream, delete_file 호출
+        Then: 파일 생성 후 삭제
+        """
+        url = storage.upload_stream('bucket', 'a/b.png', io.BytesIO(PNG_BYTES), 'image/png')
+
+        assert url == '/uploads/bucket/a/b.png'
+        assert storage.exists('bucket', 'a/b.png')
+        assert storage.delete_file('bucket', 'a/b.png')
+        assert not storage.exists('bucket', 'a/b.png')
+
+    def test_path_outside_root_rejected(self, storage):
+        """
+        예외 케이스: 루트 밖 경로
+        Given: ../ 를 포함한 경로
+        When: upload_file 호출
+        Then: ValueError 발생
+        """
+        with pytest.raises(ValueError):
+            storage.upload_file('bucket', '../../escape.png', PNG_BYTES)
@@ -0,0 +1,213 @@
+# tests/integration/services/test_image_variant_service.py
+"""
+ImageVariantService 통합 테스트 (LocalStorageProvider, 가짜 인코더 사용)
+
+TestPillowRenderer는 실제 Pillow 인코더로 변형을 만듭니다. (Pillow가 없으면 건너뜀)
+"""
+
+import io
+from concurrent.futures import Future
+
+import pytest
+from app.application.services.image_variant_service import (
+    ImageVariantService,
+    image_srcset,
+    image_thumbnail_url,
+    render_variants_with_pillow,
+)
+from app.infrastructure.external.local.local_storage import LocalStorageProvider
+
+
+SOURCE_KEY = 'campaigns/ab/abcdef.png'
+SOURCE_URL = f'/uploads/campaign-images/{SOURCE_KEY}'
+
+
+class FakeRenderer:
+    """요청받은 변형마다 이름을 내용으로 돌려주는 인코더 (skip에 있는 이름은 생략)"""
+
+    def __init__(self, skip=()):
+        self.calls = []
+        self.skip = set(skip)
+
+    def __call__(self, source, specs):
+        self.calls.append((source, [name for name, _, _ in specs]))
+        return {name: name.encode() for name, _, _ in specs if name not in self.skip}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """원본 이미지가 저장된 로컬 스토리지"""
+    storage = LocalStorageProvider(root=str(tmp_path))
+    storage.upload_file('campaign-images', SOURCE_KEY, b'source-image')
+    return storage
+
+
+def make_service(storage, renderer):
+    return ImageVariantService(storage=storage, bucket='campaign-images', renderer=renderer)
+
+
+class TestImageVariantService:
+    """ImageVariantService 테스트"""
+
+    def test_generate_stores_variants_under_source_key(self, storage):
+        """
+        정상 케이스: 변형 생성
+        Given: 스토리지의 원본 이미지
+        When: generate 호출
+        Then: 원본 키 기준 경로에 썸네일/WebP 저장, URL 딕셔너리 반환
+        """
+        renderer = FakeRenderer()
+        service = make_service(storage, renderer)
+
+        variants = service.generate(SOURCE_URL)
+
+        base = '/uploads/campaign-images/variants/ab/abcdef'
+        assert variants == {
+            'thumbnail': f'{base}/thumbnail.jpg',
+            'webp': {'400': f'{base}/w400.webp', '800': f'{base}/w800.webp', '1200': f'{base}/w1200.webp'},
+        }
+        assert renderer.calls[0][0] == b'source-image'
+        assert storage.download_file('campaign-images', 'variants/ab/abcdef/w800.webp') == b'w800'
+        assert image_thumbnail_url(variants) == f'{base}/thumbnail.jpg'
+        assert image_srcset(variants) == f'{base}/w400.webp 400w, {base}/w800.webp 800w, {base}/w1200.webp 1200w'
+        service.shutdown()
+
+    def test_generate_is_idempotent(self, storage):
+        """
+        정상 케이스: 재실행
+        Given: 변형이 이미 저장된 이미지
+        When: generate 다시 호출
+        Then: 원본을 다시 인코딩하지 않고 같은 결과 반환
+        """
+        renderer = FakeRenderer()
+        service = make_service(storage, renderer)
+        first = service.generate(SOURCE_URL)
+
+        second = service.generate(SOURCE_URL)
+
+        assert second == first
+        assert len(renderer.calls) == 1
+        service.shutdown()
+
+    def test_skipped_widths_left_out_of_srcset(self, storage):
+        """
+        경계 케이스: 원본보다 큰 너비
+        Given: 1200 너비를 만들지 않는 인코더 (작은 원본)
+        When: generate 호출
+        Then: srcset에 1200w 없음
+        """
+        service = make_service(storage, FakeRenderer(skip={'w1200'}))
+
+        variants = service.generate(SOURCE_URL)
+
+        assert set(variants['webp']) == {'400', '800'}
+        assert '1200w' not in image_srcset(variants)
+        service.shutdown()
+
+    @pytest.mark.parametrize('image_url', [
+        'https://example.com/photo.jpg',
+        '/uploads/other-bucket/campaigns/ab/abcdef.png',
+    ])
+    def test_external_image_skipped(self, storage, image_url):
+        """
+        예외 케이스: 이 버킷의 체험단 이미지가 아님
+        Given: 외부 URL / 다른 버킷 URL
+        When: generate 호출
+        Then: None 반환, 인코딩하지 않음
+        """
+        renderer = FakeRenderer()
+        service = make_service(storage, renderer)
+
+        assert service.generate(image_url) is None
+        assert renderer.calls == []
+        service.shutdown()
+
+    def test_submit_waits_for_upload_then_calls_back(self, storage):
+        """
+        정상 케이스: 백그라운드 생성
+        Given: 아직 끝나지 않은 업로드 Future
+        When: submit 후 업로드 완료
+        Then: 업로드 완료 후 생성되고 콜백에 변형 전달
+        """
+        service = make_service(storage, FakeRenderer())
+        upload = Future()
+        saved = {}
+
+        future = service.submit(SOURCE_URL, wait_for=upload, on_success=saved.__setitem__)
+        assert service.submit(SOURCE_URL) is future
+        upload.set_result(SOURCE_URL)
+
+        variants = future.result(timeout=5)
+        assert saved == {SOURCE_URL: variants}
+        service.shutdown()
+
+
+class TestPillowRenderer:
+    """render_variants_with_pillow 테스트 (실제 이미지)"""
+
+    @pytest.fixture
+    def pil_image(self):
+        return pytest.importorskip('PIL.Image')
+
+    def make_png(self, pil_image, width, height):
+        buffer = io.BytesIO()
+        pil_image.new('RGBA', (width, height), (200, 80, 40, 128)).save(buffer, format='PNG')
+        return buffer.getvalue()
+
+    def test_renders_resized_variants(self, pil_image):
+        """
+        정상 케이스: 실제 PNG 인코딩
+        Given: 1000x600 반투명 PNG
+        When: 썸네일(JPEG 400) / WebP 400, 800, 1200, 1600 변형 요청
+        Then: 비율 유지 축소, JPEG는 RGB, 원본보다 큰 WebP는 확대 없이 하나만 생성
+        """
+        source = self.make_png(pil_image, 1000, 600)
+        specs = [
+            ('thumbnail', 400, 'JPEG'),
+            ('w400', 400, 'WEBP'),
+            ('w800', 800, 'WEBP'),
+            ('w1200', 1200, 'WEBP'),
+            ('w1600', 1600, 'WEBP'),
+        ]
+
+        rendered = render_variants_with_pillow(source, specs)
+
+        assert set(rendered) == {'thumbnail', 'w400', 'w800', 'w1200'}
+        opened = {name: pil_image.open(io.BytesIO(data)) for name, data in rendered.items()}
+        assert (opened['thumbnail'].format, opened['thumbnail'].mode) == ('JPEG', 'RGB')
+        assert opened['thumbnail'].size == (400, 240)
+        assert opened['w800'].format == 'WEBP'
+        assert opened['w800'].size == (800, 480)
+        assert opened['w1200'].size == (1000, 600)
+
+    def test_service_generates_variants_with_pillow(self, pil_image, tmp_path):
+        """
+        정상 케이스: 기본 인코더(Pillow)로 변형 생성
+        Given: 스토리지에 저장된 600x300 PNG 원본
+        When: 인코더를 지정하지 않은 서비스로 generate 호출
+        Then: 썸네일과 WebP 변형이 실제 이미지로 저장됨
+        """
+        storage = LocalStorageProvider(root=str(tmp_path))
+        storage.upload_file('campaign-images', SOURCE_KEY, self.make_png(pil_image, 600, 300))
+        service = ImageVariantService(storage=storage, bucket='campaign-images')
+
+        variants = service.generate(SOURCE_URL)
+
+        assert sorted(variants['webp'], key=int) == ['400', '800']
+        thumbnail = storage.download_file('campaign-images', 'variants/ab/abcdef/thumbnail.jpg')
+        assert pil_image.open(io.BytesIO(thumbnail)).size == (400, 200)
+        w800 = storage.download_file('campaign-images', 'variants/ab/abcdef/w800.webp')
+        assert pil_image.open(io.BytesIO(w800)).size == (600, 300)
+        service.shutdown()
+
+
+def test_image_helpers_without_variants():
+    """
+    경계 케이스: 변형이 아직 없는 체험단
+    Given: image_variants가 None
+    When: 썸네일/srcset 조회
+    Then: 둘 다 None (템플릿이 원본 이미지 사용)
+    """
+    assert image_thumbnail_url(None) is None
+    assert image_srcset(None) is None
+    assert image_srcset({'thumbnail': '/t.jpg', 'webp': {}}) is None
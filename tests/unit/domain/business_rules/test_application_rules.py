@@ -3,7 +3,7 @@ ApplicationRules 단위 테스트
 """
 
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from app.domain.business_rules.application_rules import ApplicationRules
 from app.domain.entities.campaign import Campaign, CampaignStatus
 from app.domain.entities.influencer import Influencer
@@ -161,3 +161,40 @@ class TestApplicationRules:
         # Assert
         assert can_apply is False
         assert error_message == "인플루언서 정보가 등록되지 않았습니다"
+
+    def test_can_apply_returns_false_when_end_date_passed(self):
+        """모집 기간이 지났지만 아직 자동 종료되지 않은 체험단은 지원 불가"""
+        # Arrange
+        campaign = Campaign(
+            id=1,
+            advertiser_id=1,
+            title="테스트 체험단",
+            description="테스트 설명",
+            quota=5,
+            start_date=date.today() - timedelta(days=10),
+            end_date=date.today() - timedelta(days=1),
+            benefits="테스트 혜택",
+            conditions="테스트 조건",
+            image_url=None,
+            status=CampaignStatus.RECRUITING,
+            created_at=datetime.now(),
+            closed_at=None
+        )
+        influencer = Influencer(
+            id=1,
+            user_id="test-user-id",
+            name="테스트 인플루언서",
+            birth_date=date(1990, 1, 1),
+            phone_number="010-1234-5678",
+            channel_name="테스트 채널",
+            channel_url="https://example.com",
+            follower_count=1000,
+            created_at=datetime.now()
+        )
+
+        # Act
+        can_apply, error_message = ApplicationRules.can_apply(campaign, influencer, False)
+
+        # Assert
+        assert can_apply is False
+        assert error_message == "모집이 종료된 체험단입니다"
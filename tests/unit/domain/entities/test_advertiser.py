@@ -1,6 +1,7 @@
 """Advertiser Entity 단위 테스트"""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, date
 from app.domain.entities.advertiser import Advertiser
 
@@ -107,3 +108,26 @@ class TestAdvertiserEntity:
 
         # Act & Assert
         assert advertiser1 != advertiser2  # ID가 다르면 다름
+
+    def test_advertiser_is_immutable_and_slotted(self):
+        """Advertiser는 불변(frozen)이며 인스턴스 __dict__가 없음 (해시 기준 필드 변경 불가)"""
+        # Arrange
+        advertiser = Advertiser(
+            id=1,
+            user_id="test-uuid-1234",
+            name="김광고",
+            birth_date=date(1985, 5, 15),
+            phone_number="010-1234-5678",
+            business_name="테스트 카페",
+            address="서울시 강남구 테헤란로 123",
+            business_phone="02-1234-5678",
+            business_number="1234567890",
+            representative_name="김대표",
+            created_at=datetime(2025, 11, 14, 10, 0, 0)
+        )
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            advertiser.id = 2
+        assert not hasattr(advertiser, "__dict__")
+        assert {advertiser} == {advertiser}
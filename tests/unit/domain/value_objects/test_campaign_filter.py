@@ -0,0 +1,48 @@
+"""CampaignFilter Value Object 테스트"""
+
+import pytest
+
+from app.domain.exceptions import ValidationException
+from app.domain.value_objects.campaign_filter import CampaignFilter
+
+
+class TestCampaignFilter:
+    """CampaignFilter 테스트"""
+
+    def test_from_params_round_trip(self):
+        """정상 케이스: 쿼리 파라미터 → 필터 → 쿼리 파라미터"""
+        params = {'deadline': '7', 'quota': '1-5', 'region': '서울', 'new': '1'}
+
+        filters = CampaignFilter.from_params(params)
+
+        assert filters == CampaignFilter(deadline_days=7, quota_range='1-5', region='서울', new_only=True)
+        assert filters.quota_bounds == (1, 5)
+        assert filters.to_params() == params
+
+    def test_empty_params(self):
+        """경계 케이스: 빈 값은 필터 없음"""
+        filters = CampaignFilter.from_params({'deadline': '', 'quota': '', 'region': ''})
+
+        assert filters.is_empty()
+        assert filters.to_params() == {}
+        assert filters.quota_bounds is None
+
+    def test_open_ended_quota_range(self):
+        """경계 케이스: 상한 없는 인원 구간"""
+        assert CampaignFilter(quota_range='31+').quota_bounds == (31, None)
+
+    def test_cache_key_distinguishes_filters(self):
+        """동등성 테스트: 같은 필터는 같은 캐시 키"""
+        assert CampaignFilter(region='서울').cache_key() == CampaignFilter(region='서울').cache_key()
+        assert CampaignFilter(region='서울').cache_key() != CampaignFilter(region='부산').cache_key()
+
+    @pytest.mark.parametrize('params', [
+        {'deadline': '5'},
+        {'deadline': 'soon'},
+        {'quota': '100-200'},
+        {'region': '서울시'},
+    ])
+    def test_invalid_params(self, params):
+        """에러 케이스: 지원하지 않는 필터 값"""
+        with pytest.raises(ValidationException):
+            CampaignFilter.from_params(params)
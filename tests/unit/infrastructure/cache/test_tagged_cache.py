@@ -0,0 +1,174 @@
+# tests/unit/infrastructure/cache/test_tagged_cache.py
+"""
+TaggedCache 및 캐시 백엔드 단위 테스트
+"""
+
+import pytest
+from sqlalchemy import text
+from app.infrastructure.cache.memory_cache import LRUCacheBackend
+from app.infrastructure.cache.redis_cache import RedisCacheBackend
+from app.infrastructure.cache.tagged_cache import TaggedCache
+from app.extensions import db
+
+
+class _RedisStandIn:
+    """테스트용 Redis 호환 클라이언트 (get/set/delete/incr)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+
+class TestLRUCacheBackend:
+    """LRUCacheBackend 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """
+        정상 케이스: 최대 항목 수 초과 시 LRU 제거
+        Given: max_entries=2, a/b 저장 후 a 조회
+        When: c 저장
+        Then: b 제거, a/c 유지
+        """
+        backend = LRUCacheBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+
+        backend.set('c', 3)
+
+        assert backend.get('a') == 1
+        assert backend.get('b') is None
+        assert backend.get('c') == 3
+
+    def test_expired_entry_is_not_returned(self, monkeypatch):
+        """
+        경계 케이스: TTL 만료
+        Given: ttl=10으로 저장
+        When: 11초 경과 후 조회
+        Then: None
+        """
+        import app.infrastructure.cache.memory_cache as memory_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(memory_cache.time, 'monotonic', lambda: now[0])
+        backend = LRUCacheBackend()
+        backend.set('key', 'value', ttl=10)
+
+        now[0] += 11
+
+        assert backend.get('key') is None
+
+    def test_counters_survive_eviction(self):
+        """
+        경계 케이스: 카운터는 LRU 제거 대상 아님
+        Given: max_entries=1, 카운터 증가
+        When: 항목 여러 개 저장
+        Then: 카운터 값 유지
+        """
+        backend = LRUCacheBackend(max_entries=1)
+        backend.incr('tag')
+        backend.set('a', 1)
+        backend.set('b', 2)
+
+        assert backend.get_counter('tag') == 1
+
+
+class TestTaggedCache:
+    """TaggedCache 테스트"""
+
+    @pytest.mark.parametrize('backend_factory', [
+        lambda: LRUCacheBackend(),
+        lambda: RedisCacheBackend(_RedisStandIn()),
+    ])
+    def test_get_or_set_and_invalidate(self, backend_factory):
+        """
+        정상 케이스: 캐시 적중 및 태그 무효화
+        Given: 태그가 지정된 항목 캐시
+        When: 재조회, 태그 무효화 후 재조회
+        Then: 두 번째는 적중, 무효화 후에는 loader 재실행
+        """
+        cache = TaggedCache(backend_factory(), namespace='test')
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return ['dto', len(calls)]
+
+        first = cache.get_or_set('feed:1', loader, tags=('feed',))
+        second = cache.get_or_set('feed:1', loader, tags=('feed',))
+        cache.invalidate('feed')
+        third = cache.get_or_set('feed:1', loader, tags=('feed',))
+
+        assert first == second == ['dto', 1]
+        assert third == ['dto', 2]
+        assert cache.stats() == {'hits': 1, 'misses': 2, 'hit_ratio': 0.3333, 'invalidations': 1}
+
+    def test_invalidation_waits_for_commit(self, app):
+        """
+        정상 케이스: 커밋 시점 무효화
+        Given: session_provider가 설정된 캐시
+        When: invalidate_on_commit 후 롤백, 다시 invalidate_on_commit 후 커밋
+        Then: 롤백 시에는 유지, 커밋 후에만 무효화
+        """
+        with app.app_context():
+            cache = TaggedCache(LRUCacheBackend(), session_provider=lambda: db.session())
+            cache.get_or_set('key', lambda: 'old', tags=('feed',))
+
+            db.session.execute(text('SELECT 1'))
+            cache.invalidate_on_commit('feed')
+            assert cache.get_or_set('key', lambda: 'new', tags=('feed',)) == 'old'
+            db.session.rollback()
+            db.session.commit()
+            assert cache.get_or_set('key', lambda: 'new', tags=('feed',)) == 'old'
+
+            db.session.execute(text('SELECT 1'))
+            cache.invalidate_on_commit('feed')
+            db.session.commit()
+            assert cache.get_or_set('key', lambda: 'new', tags=('feed',)) == 'new'
+
+    def test_refill_within_fresh_window_uses_fresh_reads(self, monkeypatch):
+        """
+        정상 케이스: 무효화 직후 재적재만 fresh_reads 안에서 실행
+        Given: fresh_window=5초 캐시
+        When: 최초 적재, 무효화 후 재적재, 5초 경과 후 무효화 없이 다른 키 적재
+        Then: 무효화 직후 재적재만 fresh_reads 블록 안에서 loader 실행
+        """
+        from contextlib import contextmanager
+        import app.infrastructure.cache.memory_cache as memory_cache
+
+        fresh = []
+
+        @contextmanager
+        def fresh_reads():
+            fresh.append(True)
+            yield
+            fresh.pop()
+
+        now = [1000.0]
+        monkeypatch.setattr(memory_cache.time, 'monotonic', lambda: now[0])
+        cache = TaggedCache(LRUCacheBackend(), fresh_window=5, fresh_reads=fresh_reads)
+        loaded_fresh = []
+
+        def loader():
+            loaded_fresh.append(bool(fresh))
+            return 'value'
+
+        cache.get_or_set('a', loader, tags=('feed',))
+        cache.invalidate('feed')
+        cache.get_or_set('a', loader, tags=('feed',))
+        now[0] += 6
+        cache.get_or_set('b', loader, tags=('feed',))
+
+        assert loaded_fresh == [False, True, False]
@@ -0,0 +1,117 @@
+# tests/unit/infrastructure/cache/test_user_principal_cache.py
+"""
+user_loader 캐시 (UserPrincipal / UserPrincipalCache) 단위 테스트
+"""
+
+import pytest
+from sqlalchemy import event
+from app.infrastructure.cache.user_principal_cache import UserPrincipal, UserPrincipalCache
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.extensions import db
+
+
+class TestUserPrincipal:
+    """UserPrincipal 테스트"""
+
+    def test_slotted_flask_login_user(self):
+        """
+        정상 케이스: Flask-Login 사용자 인터페이스
+        Given: UserPrincipal
+        When: 속성 확인
+        Then: 인증 상태 및 get_id 제공, 인스턴스 __dict__ 없음
+        """
+        principal = UserPrincipal(id='user-1', email='a@example.com', role='advertiser')
+
+        assert principal.is_authenticated and principal.is_active and not principal.is_anonymous
+        assert principal.get_id() == 'user-1'
+        assert not hasattr(principal, '__dict__')
+        assert principal == UserPrincipal(id='user-1', email='changed@example.com', role=None)
+
+
+class TestUserPrincipalCache:
+    """UserPrincipalCache 테스트"""
+
+    def test_caches_until_invalidated(self):
+        """
+        정상 케이스: 캐시 적중 및 무효화
+        Given: TTL 캐시
+        When: 두 번 조회, 무효화 후 재조회
+        Then: loader는 무효화 전후 1회씩 실행
+        """
+        cache = UserPrincipalCache(ttl=30)
+        calls = []
+
+        def loader(user_id):
+            calls.append(user_id)
+            return UserPrincipal(id=user_id, email='a@example.com', role=None)
+
+        cache.get('user-1', loader)
+        cache.get('user-1', loader)
+        cache.invalidate('user-1')
+        cache.get('user-1', loader)
+
+        assert calls == ['user-1', 'user-1']
+        assert cache.stats() == {'hits': 1, 'misses': 2, 'hit_ratio': 0.3333}
+
+    @pytest.mark.parametrize('ttl, result, expected_calls', [
+        (0, UserPrincipal(id='user-1', email='a@example.com', role=None), 2),
+        (30, None, 2),
+    ])
+    def test_disabled_or_missing_user_is_not_cached(self, ttl, result, expected_calls):
+        """
+        경계 케이스: TTL 0 또는 존재하지 않는 사용자
+        Given: ttl=0 캐시 / loader가 None 반환
+        When: 두 번 조회
+        Then: 매번 loader 실행
+        """
+        cache = UserPrincipalCache(ttl=ttl)
+        calls = []
+
+        def loader(user_id):
+            calls.append(user_id)
+            return result
+
+        cache.get('user-1', loader)
+        cache.get('user-1', loader)
+
+        assert len(calls) == expected_calls
+
+
+class TestUserLoader:
+    """Flask-Login user_loader 통합 테스트"""
+
+    def test_loads_user_once_and_invalidates_on_save(self, app, influencer_user):
+        """
+        정상 케이스: 캐시 및 UserRepository.save 무효화
+        Given: 저장된 사용자
+        When: load_user 2회, 역할 변경 저장 후 1회
+        Then: users 조회는 첫 호출과 저장 후 호출에서만 발생, 변경된 역할 반영
+        """
+        from app.extensions import load_user
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT') and 'FROM users' in statement:
+                statements.append(statement)
+
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', _record)
+            try:
+                first = load_user('influencer-id')
+                second = load_user('influencer-id')
+                assert len(statements) == 1
+                assert isinstance(first, UserPrincipal) and first is second
+
+                repository = UserRepository(db.session)
+                user = repository.find_by_id('influencer-id')
+                user.role = 'advertiser'
+                repository.save(user)
+                statements.clear()
+
+                reloaded = load_user('influencer-id')
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', _record)
+
+        assert len(statements) == 1
+        assert reloaded.role == 'advertiser'
@@ -0,0 +1,214 @@
+# tests/unit/infrastructure/external/test_resilient_auth_provider.py
+"""
+장애 대응 인증 제공자 (ResilientAuthProvider / CircuitBreaker) 단위 테스트
+
+지연과 장애를 주입하는 가짜 인증 제공자를 사용합니다.
+"""
+
+import threading
+import time
+
+import pytest
+from app.domain.exceptions.auth_exceptions import (
+    AuthProviderUnavailableException,
+    InvalidCredentialsException,
+)
+from app.infrastructure.external.interfaces.i_auth_provider import (
+    AuthUserCreationResult,
+    IAuthProvider,
+)
+from app.infrastructure.external.resilience.circuit_breaker import CircuitBreaker
+from app.infrastructure.external.resilience.resilient_auth_provider import (
+    AuthResilience,
+    ResilientAuthProvider,
+)
+
+
+class FakeAuthProvider(IAuthProvider):
+    """응답 지연/장애를 순서대로 주입하는 인증 제공자"""
+
+    def __init__(self, script=None, delay=0.0):
+        """
+        Args:
+            script: 호출마다 꺼내 쓸 동작 목록 ('ok', 'unavailable', 'invalid', 'slow')
+            delay: 'slow' 동작의 지연 시간(초)
+        """
+        self.script = list(script or [])
+        self.delay = delay
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _next(self):
+        self.calls += 1
+        action = self.script.pop(0) if self.script else 'ok'
+        if action == 'slow':
+            self.release.wait(self.delay)
+        elif action == 'unavailable':
+            raise AuthProviderUnavailableException()
+        elif action == 'invalid':
+            raise InvalidCredentialsException()
+
+    def create_user(self, email, password):
+        self._next()
+        return AuthUserCreationResult(user_id='user-1', email=email)
+
+    def authenticate(self, email, password):
+        self._next()
+        return {'access_token': 'access', 'refresh_token': 'refresh', 'user_id': 'user-1'}
+
+    def refresh_session(self, refresh_token):
+        self._next()
+        return {'access_token': 'access', 'refresh_token': 'refresh-next', 'user_id': 'user-1'}
+
+
+@pytest.fixture
+def resilience():
+    """빠른 테스트용 설정 (대기 없음)"""
+    resilience = AuthResilience(
+        deadline=0.5,
+        max_retries=2,
+        backoff=0.01,
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        sleep=lambda seconds: None
+    )
+    yield resilience
+    resilience.shutdown()
+
+
+class TestResilientAuthProvider:
+    """ResilientAuthProvider 테스트"""
+
+    def test_authenticate_retries_transient_failures(self, resilience):
+        """
+        정상 케이스: 일시적 장애 후 성공
+        Given: 두 번 실패 후 성공하는 제공자
+        When: authenticate 호출
+        Then: 재시도하여 성공, 재시도 2회 기록, 회로 closed 유지
+        """
+        fake = FakeAuthProvider(script=['unavailable', 'unavailable', 'ok'])
+        provider = ResilientAuthProvider(fake, resilience)
+
+        result = provider.authenticate('user@example.com', 'password123')
+
+        assert result['user_id'] == 'user-1'
+        assert fake.calls == 3
+        stats = resilience.snapshot()
+        assert stats['calls']['authenticate']['retries'] == 2
+        assert stats['circuit']['state'] == CircuitBreaker.CLOSED
+
+    def test_create_user_not_retried(self, resilience):
+        """
+        예외 케이스: 멱등하지 않은 호출
+        Given: 실패하는 제공자
+        When: create_user 호출
+        Then: 재시도 없이 AuthProviderUnavailableException
+        """
+        fake = FakeAuthProvider(script=['unavailable', 'ok'])
+        provider = ResilientAuthProvider(fake, resilience)
+
+        with pytest.raises(AuthProviderUnavailableException):
+            provider.create_user('user@example.com', 'password123')
+
+        assert fake.calls == 1
+
+    def test_deadline_bounds_slow_call(self, resilience):
+        """
+        예외 케이스: 응답 지연
+        Given: 5초 지연되는 제공자, 제한 시간 0.5초
+        When: authenticate 호출
+        Then: 제한 시간 안에 AuthProviderUnavailableException, 시간 초과 기록
+        """
+        fake = FakeAuthProvider(script=['slow'] * 5, delay=5)
+        provider = ResilientAuthProvider(fake, resilience)
+
+        started = time.monotonic()
+        with pytest.raises(AuthProviderUnavailableException):
+            provider.authenticate('user@example.com', 'password123')
+        elapsed = time.monotonic() - started
+        fake.release.set()
+
+        assert elapsed < 1.5
+        assert resilience.snapshot()['calls']['authenticate']['timeouts'] >= 1
+
+    def test_domain_errors_pass_through_without_opening_circuit(self, resilience):
+        """
+        정상 케이스: 잘못된 비밀번호
+        Given: InvalidCredentialsException을 내는 제공자
+        When: 기준 이상 authenticate 호출
+        Then: 재시도 없이 그대로 전달, 회로 closed 유지
+        """
+        fake = FakeAuthProvider(script=['invalid'] * 3)
+        provider = ResilientAuthProvider(fake, resilience)
+
+        for _ in range(3):
+            with pytest.raises(InvalidCredentialsException):
+                provider.authenticate('user@example.com', 'wrong-password')
+
+        assert fake.calls == 3
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+    def test_open_circuit_fails_fast(self, resilience):
+        """
+        예외 케이스: 연속 장애로 회로 open
+        Given: 계속 실패하는 제공자, 실패 기준 2회
+        When: create_user 2회 실패 후 authenticate 호출
+        Then: 제공자를 호출하지 않고 즉시 실패, 거부 수 기록
+        """
+        fake = FakeAuthProvider(script=['unavailable'] * 2)
+        provider = ResilientAuthProvider(fake, resilience)
+
+        for _ in range(2):
+            with pytest.raises(AuthProviderUnavailableException):
+                provider.create_user('user@example.com', 'password123')
+
+        with pytest.raises(AuthProviderUnavailableException):
+            provider.authenticate('user@example.com', 'password123')
+
+        assert fake.calls == 2
+        stats = resilience.snapshot()
+        assert stats['circuit']['state'] == CircuitBreaker.OPEN
+        assert stats['calls']['authenticate']['rejected'] == 1
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_half_open_allows_single_trial(self):
+        """
+        정상 케이스: 복구 시험
+        Given: open 상태에서 reset_timeout 경과
+        When: allow 두 번 호출 후 성공 기록
+        Then: 시험 호출 1건만 허용, 성공 시 closed
+        """
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: now[0])
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] = 31.0
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """
+        예외 케이스: 복구 시험 실패
+        Given: half_open 상태의 시험 호출
+        When: 실패 기록
+        Then: 다시 open, reset_timeout 동안 거부
+        """
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=lambda: now[0])
+        for _ in range(3):
+            breaker.record_failure()
+
+        now[0] = 31.0
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert breaker.snapshot()['times_opened'] == 2
@@ -0,0 +1,170 @@
+# tests/unit/infrastructure/external/test_supabase_client.py
+"""
+Supabase 클라이언트 레지스트리 단위 테스트
+
+실제 Supabase 대신 로컬 HTTP 서버(GoTrue 응답 흉내)로 연결 재사용을 확인합니다.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from app.infrastructure.external.supabase import supabase_client as supabase_client_module
+from app.infrastructure.external.supabase.supabase_client import SupabaseClientRegistry
+from app.infrastructure.external.supabase.supabase_auth import SupabaseAuthProvider
+
+
+SESSION_RESPONSE = {
+    'access_token': 'access-token',
+    'token_type': 'bearer',
+    'expires_in': 3600,
+    'refresh_token': 'refresh-token',
+    'user': {
+        'id': 'auth-user-id',
+        'aud': 'authenticated',
+        'role': 'authenticated',
+        'email': 'user@example.com',
+        'app_metadata': {},
+        'user_metadata': {},
+        'created_at': '2025-01-01T00:00:00Z',
+    },
+}
+
+
+class _GoTrueStub(BaseHTTPRequestHandler):
+    """POST /auth/v1/token 에 세션 JSON을 응답하는 keep-alive 서버"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.paths.append(self.path)
+        body = json.dumps(SESSION_RESPONSE).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gotrue_server():
+    """로컬 GoTrue 대체 서버"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _GoTrueStub)
+    server.connections = 0
+    server.paths = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry(gotrue_server):
+    """로컬 서버를 가리키는 레지스트리"""
+    host, port = gotrue_server.server_address
+    registry = SupabaseClientRegistry(url=f'http://{host}:{port}/', anon_key='a.b.c', service_key='d.e.f')
+    yield registry
+    registry.close()
+
+
+class TestSupabaseClientRegistry:
+    """SupabaseClientRegistry 테스트"""
+
+    def test_auth_client_created_per_call(self, registry):
+        """
+        정상 케이스: 인증 클라이언트는 호출마다 생성, HTTP 클라이언트만 공유
+        Given: 레지스트리
+        When: auth()를 두 번 호출
+        Then: 서로 다른 GoTrue 클라이언트, 같은 공용 HTTP 클라이언트 사용
+        """
+        first = registry.auth()
+        second = registry.auth()
+
+        assert first is not second
+        assert first._http_client is second._http_client is registry.http_client()
+
+    def test_provider_does_not_keep_previous_session(self, app, registry, gotrue_server):
+        """
+        정상 케이스: 로그인 결과 세션이 다음 호출에 남지 않음
+        Given: 앱에 등록된 레지스트리를 사용하는 SupabaseAuthProvider
+        When: authenticate 후 다음 호출에 쓸 클라이언트 조회
+        Then: 새 클라이언트에는 이전 사용자의 세션이 없음
+        """
+        app.extensions['supabase'] = registry
+        provider = SupabaseAuthProvider()
+
+        provider.authenticate('user@example.com', 'password123')
+
+        assert provider.auth._in_memory_session is None
+
+    def test_authenticate_reuses_connection(self, registry, gotrue_server):
+        """
+        정상 케이스: 로그인 요청 간 keep-alive 연결 재사용
+        Given: 공유 클라이언트를 사용하는 SupabaseAuthProvider 두 개
+        When: authenticate를 두 번 호출
+        Then: 두 요청 모두 성공하고 TCP 연결은 1개만 생성
+        """
+        first = SupabaseAuthProvider(auth_client=registry.auth())
+        second = SupabaseAuthProvider(auth_client=registry.auth())
+
+        result1 = first.authenticate('user@example.com', 'password123')
+        result2 = second.authenticate('user@example.com', 'password123')
+
+        assert result1['user_id'] == result2['user_id'] == 'auth-user-id'
+        assert result1['access_token'] == 'access-token'
+        assert gotrue_server.paths == ['/auth/v1/token?grant_type=password'] * 2
+        assert gotrue_server.connections == 1
+
+    def test_clients_recreated_after_fork(self, registry, monkeypatch):
+        """
+        정상 케이스: fork 후 새 클라이언트 생성
+        Given: 부모 프로세스에서 생성된 클라이언트
+        When: PID가 바뀐 뒤 auth() 호출
+        Then: 부모의 클라이언트를 재사용하지 않음
+        """
+        parent_auth = registry.auth()
+        parent_http = registry.http_client()
+        child_pid = supabase_client_module.os.getpid() + 1
+        monkeypatch.setattr(supabase_client_module.os, 'getpid', lambda: child_pid)
+
+        child_auth = registry.auth()
+
+        assert child_auth is not parent_auth
+        assert child_auth._http_client is not parent_http
+        assert registry.http_client() is child_auth._http_client
+        parent_http.close()
+
+    def test_missing_configuration_raises(self):
+        """
+        예외 케이스: Supabase 설정 누락
+        Given: URL이 없는 레지스트리
+        When: auth() 호출
+        Then: ValueError 발생
+        """
+        registry = SupabaseClientRegistry(url=None, anon_key='a.b.c')
+
+        with pytest.raises(ValueError):
+            registry.auth()
+
+    def test_init_supabase_registers_registry(self, app):
+        """
+        정상 케이스: 앱에 레지스트리 등록
+        Given: create_app으로 만든 앱
+        When: 레지스트리 조회
+        Then: 설정한 타임아웃/연결 풀 크기 적용
+        """
+        registry = supabase_client_module.get_supabase_registry()
+
+        assert app.extensions['supabase'] is registry
+        assert registry.timeout.read == app.config['SUPABASE_HTTP_TIMEOUT']
+        assert registry.limits.max_connections == app.config['SUPABASE_HTTP_MAX_CONNECTIONS']
@@ -0,0 +1,45 @@
+# tests/unit/infrastructure/external/test_supabase_storage.py
+"""SupabaseStorageProvider 단위 테스트 (Storage 클라이언트는 Mock)"""
+
+from unittest.mock import Mock
+
+import pytest
+from app.infrastructure.external.supabase.supabase_storage import SupabaseStorageProvider
+
+
+def make_provider(list_result=None, list_error=None):
+    bucket = Mock()
+    bucket.list.return_value = list_result
+    bucket.list.side_effect = list_error
+    client = Mock()
+    client.storage.from_.return_value = bucket
+    return SupabaseStorageProvider(client), bucket
+
+
+class TestSupabaseStorageExists:
+    """SupabaseStorageProvider.exists 테스트"""
+
+    def test_exists_searches_parent_folder(self):
+        """
+        정상 케이스: 파일 존재 확인
+        Given: 상위 폴더 목록에 같은 이름의 파일
+        When: exists 호출
+        Then: 파일 이름으로 검색하여 True, 다른 이름이면 False
+        """
+        provider, bucket = make_provider(list_result=[{'name': 'abcdef.png'}])
+
+        assert provider.exists('campaign-images', 'campaigns/ab/abcdef.png') is True
+        bucket.list.assert_called_with('campaigns/ab', {'search': 'abcdef.png'})
+        assert provider.exists('campaign-images', 'campaigns/ab/other.png') is False
+
+    def test_list_failure_is_not_reported_as_missing(self):
+        """
+        예외 케이스: 목록 조회 실패 (네트워크 오류)
+        Given: list가 예외를 내는 Storage 클라이언트
+        When: exists 호출
+        Then: False 대신 예외 전파
+        """
+        provider, _ = make_provider(list_error=ConnectionError('timeout'))
+
+        with pytest.raises(Exception, match='파일 존재 확인 실패'):
+            provider.exists('campaign-images', 'campaigns/ab/abcdef.png')
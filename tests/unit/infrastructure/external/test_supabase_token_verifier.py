@@ -0,0 +1,213 @@
+# tests/unit/infrastructure/external/test_supabase_token_verifier.py
+"""
+Supabase Access Token 로컬 검증 / 토큰 갱신기 단위 테스트
+
+서명 키는 테스트에서 직접 생성합니다.
+"""
+
+import base64
+import threading
+import time
+
+import jwt
+import pytest
+from app.domain.exceptions.auth_exceptions import InvalidTokenException
+from app.infrastructure.external.supabase.supabase_token_verifier import (
+    SupabaseTokenRefresher,
+    SupabaseTokenVerifier,
+)
+
+
+SECRET = 'local-test-jwt-secret-with-at-least-32-bytes'
+ISSUER = 'https://project.supabase.co/auth/v1'
+
+
+def make_token(key=SECRET, expires_in=3600, headers=None, **claims):
+    """테스트용 Supabase 형식 Access Token"""
+    payload = {
+        'sub': 'user-1',
+        'aud': 'authenticated',
+        'iss': ISSUER,
+        'exp': int(time.time()) + expires_in,
+        'email': 'user@example.com',
+        **claims,
+    }
+    return jwt.encode(payload, key, algorithm='HS256', headers=headers)
+
+
+def oct_jwk(kid, secret):
+    """대칭 키 JWK"""
+    encoded = base64.urlsafe_b64encode(secret.encode()).rstrip(b'=').decode()
+    return {'kty': 'oct', 'kid': kid, 'alg': 'HS256', 'k': encoded}
+
+
+class TestSupabaseTokenVerifier:
+    """SupabaseTokenVerifier 테스트"""
+
+    def test_verify_with_jwt_secret(self):
+        """
+        정상 케이스: JWT secret으로 로컬 검증
+        Given: HS256 토큰
+        When: verify 호출
+        Then: 클레임 반환
+        """
+        verifier = SupabaseTokenVerifier(jwt_secret=SECRET, issuer=ISSUER)
+
+        claims = verifier.verify(make_token())
+
+        assert claims['sub'] == 'user-1'
+        assert claims['email'] == 'user@example.com'
+
+    @pytest.mark.parametrize('token', [
+        make_token(key='another-secret-with-at-least-32-bytes!!'),
+        make_token(expires_in=-120),
+        make_token(aud='anon'),
+        make_token(iss='https://other.supabase.co/auth/v1'),
+        'not-a-jwt',
+    ])
+    def test_verify_rejects_invalid_tokens(self, token):
+        """
+        예외 케이스: 서명 불일치, 만료, aud/iss 불일치, 형식 오류
+        Given: 유효하지 않은 토큰
+        When: verify 호출
+        Then: InvalidTokenException 발생
+        """
+        verifier = SupabaseTokenVerifier(jwt_secret=SECRET, issuer=ISSUER)
+
+        with pytest.raises(InvalidTokenException):
+            verifier.verify(token)
+
+    def test_verify_rejects_unsigned_token(self):
+        """
+        예외 케이스: alg=none 토큰
+        Given: 서명 없는 토큰
+        When: verify 호출
+        Then: InvalidTokenException 발생
+        """
+        verifier = SupabaseTokenVerifier(jwt_secret=SECRET)
+        token = jwt.encode({'sub': 'user-1', 'exp': int(time.time()) + 60}, None, algorithm='none')
+
+        with pytest.raises(InvalidTokenException):
+            verifier.verify(token)
+
+    def test_jwks_cached_between_verifications(self):
+        """
+        정상 케이스: JWKS 캐시
+        Given: kid가 있는 토큰과 JWKS 조회 함수
+        When: verify를 여러 번 호출
+        Then: JWKS는 한 번만 조회
+        """
+        calls = []
+
+        def fetch_jwks():
+            calls.append(1)
+            return {'keys': [oct_jwk('key-1', SECRET)]}
+
+        verifier = SupabaseTokenVerifier(fetch_jwks=fetch_jwks)
+        token = make_token(headers={'kid': 'key-1'})
+
+        for _ in range(3):
+            assert verifier.verify(token)['sub'] == 'user-1'
+
+        assert len(calls) == 1
+
+    def test_jwks_refetched_for_rotated_key(self):
+        """
+        정상 케이스: 서명 키 교체
+        Given: 캐시에 없는 kid로 서명된 토큰
+        When: verify 호출
+        Then: JWKS를 다시 조회하여 새 키로 검증
+        """
+        jwks = {'keys': [oct_jwk('key-1', SECRET)]}
+        calls = []
+
+        def fetch_jwks():
+            calls.append(1)
+            return jwks
+
+        verifier = SupabaseTokenVerifier(fetch_jwks=fetch_jwks, jwks_min_refetch_interval=0)
+        verifier.verify(make_token(headers={'kid': 'key-1'}))
+
+        new_secret = 'rotated-test-jwt-secret-with-32-bytes!!'
+        jwks = {'keys': [oct_jwk('key-1', SECRET), oct_jwk('key-2', new_secret)]}
+        claims = verifier.verify(make_token(key=new_secret, headers={'kid': 'key-2'}))
+
+        assert claims['sub'] == 'user-1'
+        assert len(calls) == 2
+
+    def test_unknown_kid_refetch_rate_limited(self):
+        """
+        예외 케이스: 알 수 없는 kid 반복
+        Given: JWKS에 없는 kid로 서명된 토큰
+        When: 최소 재조회 간격 안에 여러 번 verify 호출
+        Then: 모두 거부되고 JWKS는 한 번만 조회
+        """
+        calls = []
+
+        def fetch_jwks():
+            calls.append(1)
+            return {'keys': [oct_jwk('key-1', SECRET)]}
+
+        verifier = SupabaseTokenVerifier(fetch_jwks=fetch_jwks, jwks_min_refetch_interval=30)
+        token = make_token(headers={'kid': 'unknown'})
+
+        for _ in range(3):
+            with pytest.raises(InvalidTokenException):
+                verifier.verify(token)
+
+        assert len(calls) == 1
+
+
+class TestSupabaseTokenRefresher:
+    """SupabaseTokenRefresher 테스트"""
+
+    def test_concurrent_refreshes_share_one_call(self):
+        """
+        정상 케이스: 단일 갱신 호출
+        Given: 느린 갱신 함수
+        When: 같은 refresh_token으로 여러 번 갱신 요청
+        Then: 갱신 함수는 한 번만 호출되고 모두 같은 결과
+        """
+        calls = []
+        release = threading.Event()
+
+        def refresh(refresh_token):
+            calls.append(refresh_token)
+            release.wait(5)
+            return {'access_token': 'new-access', 'refresh_token': 'new-refresh'}
+
+        refresher = SupabaseTokenRefresher(refresh=refresh)
+        futures = [refresher.schedule('refresh-1') for _ in range(5)]
+
+        assert not any(future.done() for future in futures)
+        release.set()
+
+        assert refresher.refresh_now('refresh-1', timeout=5)['access_token'] == 'new-access'
+        assert all(future.result(timeout=5)['refresh_token'] == 'new-refresh' for future in futures)
+        assert refresher.schedule('refresh-1') is futures[0]
+        assert calls == ['refresh-1']
+        refresher.shutdown()
+
+    def test_failed_refresh_raises_and_retries(self):
+        """
+        예외 케이스: 갱신 실패
+        Given: 처음 한 번 실패하는 갱신 함수
+        When: refresh_now 후 다시 refresh_now
+        Then: 첫 호출은 InvalidTokenException, 다음 호출은 재시도하여 성공
+        """
+        calls = []
+
+        def refresh(refresh_token):
+            calls.append(refresh_token)
+            if len(calls) == 1:
+                raise InvalidTokenException()
+            return {'access_token': 'new-access', 'refresh_token': 'new-refresh'}
+
+        refresher = SupabaseTokenRefresher(refresh=refresh)
+
+        with pytest.raises(InvalidTokenException):
+            refresher.refresh_now('refresh-1', timeout=5)
+
+        assert refresher.refresh_now('refresh-1', timeout=5)['access_token'] == 'new-access'
+        assert len(calls) == 2
+        refresher.shutdown()
@@ -0,0 +1,87 @@
+# tests/unit/infrastructure/jobs/test_campaign_sweeper.py
+"""
+체험단 자동 종료 작업 단위 테스트
+"""
+
+import threading
+from datetime import date, timedelta
+
+from app.extensions import db
+from app.infrastructure.jobs import campaign_sweeper
+from app.infrastructure.jobs.campaign_sweeper import run_campaign_sweeper, sweep_expired_campaigns
+from app.infrastructure.persistence.models.campaign_model import CampaignModel
+
+
+def _create_campaigns(advertiser_id, end_date_offsets):
+    for i, offset in enumerate(end_date_offsets):
+        db.session.add(CampaignModel(
+            advertiser_id=advertiser_id,
+            title=f'체험단 {i}',
+            description='설명',
+            quota=5,
+            start_date=date.today() - timedelta(days=30),
+            end_date=date.today() + timedelta(days=offset),
+            benefits='혜택',
+            conditions='조건',
+            status='RECRUITING'
+        ))
+    db.session.commit()
+
+
+class TestSweepExpiredCampaigns:
+    """sweep_expired_campaigns 테스트"""
+
+    def test_sweeps_all_batches_and_invalidates_feed(self, app, registered_advertiser):
+        """
+        정상 케이스: 여러 배치 처리
+        Given: 기간 지난 체험단 5개, 진행 중 1개
+        When: 배치 크기 2로 실행
+        Then: 5개 모두 종료(커밋), 홈 피드 캐시 무효화
+        """
+        _create_campaigns(1, [-5, -4, -3, -2, -1, 3])
+        invalidations = app.extensions['feed_cache'].invalidations
+
+        closed = sweep_expired_campaigns(batch_size=2)
+
+        assert closed == 5
+        db.session.expire_all()
+        statuses = [row.status for row in db.session.query(CampaignModel).order_by(CampaignModel.id)]
+        assert statuses == ['CLOSED'] * 5 + ['RECRUITING']
+        assert app.extensions['feed_cache'].invalidations > invalidations
+
+    def test_nothing_to_close(self, app, registered_advertiser):
+        """
+        경계 케이스: 종료할 체험단 없음
+        Given: 진행 중 체험단만 존재
+        When: 실행
+        Then: 0 반환, 캐시 무효화 없음
+        """
+        _create_campaigns(1, [0, 10])
+        invalidations = app.extensions['feed_cache'].invalidations
+
+        assert sweep_expired_campaigns() == 0
+        assert app.extensions['feed_cache'].invalidations == invalidations
+
+
+def test_run_campaign_sweeper_survives_failures(app, monkeypatch):
+    """
+    예외 케이스: 주기 실행 중 실패
+    Given: 첫 실행은 실패, 두 번째 실행에서 종료 신호
+    When: run_campaign_sweeper 실행
+    Then: 워커가 죽지 않고 다음 주기에 다시 실행
+    """
+    stop_event = threading.Event()
+    calls = []
+
+    def fake_sweep(batch_size):
+        calls.append(batch_size)
+        if len(calls) == 1:
+            raise RuntimeError('db down')
+        stop_event.set()
+        return 0
+
+    monkeypatch.setattr(campaign_sweeper, 'sweep_expired_campaigns', fake_sweep)
+
+    run_campaign_sweeper(app, interval=0, batch_size=10, stop_event=stop_event)
+
+    assert calls == [10, 10]
@@ -0,0 +1,116 @@
+# tests/unit/infrastructure/persistence/test_connection_pool.py
+"""
+커넥션 풀 설정 및 지표 단위 테스트
+"""
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import NullPool
+from app.infrastructure.persistence.connection_pool import (
+    InstrumentedQueuePool,
+    build_engine_options,
+    collect_pool_stats,
+)
+
+
+class TestBuildEngineOptions:
+    """build_engine_options 테스트"""
+
+    def test_postgres_uses_instrumented_queue_pool(self):
+        """
+        정상 케이스: PostgreSQL 풀 설정
+        Given: DB_POOL_* 설정
+        When: build_engine_options 호출
+        Then: 설정값이 엔진 옵션에 반영
+        """
+        options = build_engine_options({
+            'SQLALCHEMY_DATABASE_URI': 'postgresql://user:pw@localhost/db',
+            'DB_POOL_SIZE': 3,
+            'DB_MAX_OVERFLOW': 2,
+            'DB_POOL_TIMEOUT': 7,
+            'DB_POOL_RECYCLE': 120,
+            'DB_POOL_PRE_PING': True,
+        })
+
+        assert options == {
+            'pool_pre_ping': True,
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': 3,
+            'max_overflow': 2,
+            'pool_timeout': 7,
+            'pool_recycle': 120,
+        }
+
+    def test_pgbouncer_transaction_mode_disables_app_pool(self):
+        """
+        정상 케이스: PgBouncer transaction 모드
+        Given: DB_PGBOUNCER_TRANSACTION_MODE=True, psycopg3 드라이버
+        When: build_engine_options 호출
+        Then: NullPool + prepared statement 비활성화
+        """
+        options = build_engine_options({
+            'SQLALCHEMY_DATABASE_URI': 'postgresql+psycopg://user:pw@localhost:6543/db',
+            'DB_PGBOUNCER_TRANSACTION_MODE': True,
+        })
+
+        assert options['poolclass'] is NullPool
+        assert options['connect_args'] == {'prepare_threshold': None}
+        assert 'pool_size' not in options
+
+    def test_sqlite_only_sets_pre_ping(self):
+        """경계 케이스: SQLite는 pre-ping만 적용"""
+        options = build_engine_options({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:'})
+
+        assert options == {'pool_pre_ping': True}
+
+
+class TestInstrumentedQueuePool:
+    """InstrumentedQueuePool 지표 테스트"""
+
+    def test_records_checkouts_and_timeouts(self, tmp_path):
+        """
+        정상 케이스: 풀 포화 시 타임아웃 집계
+        Given: pool_size=1, max_overflow=0 엔진
+        When: 커넥션 1개 사용 중 추가 획득 시도
+        Then: checked_out=1, 타임아웃 1회 기록
+        """
+        engine = create_engine(
+            f'sqlite:///{tmp_path / "pool.db"}',
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+
+        connection = engine.connect()
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+        stats = collect_pool_stats(engine)
+        assert stats['checked_out'] == 1
+        assert stats['max_overflow'] == 0
+        assert stats['wait']['checkouts'] == 1
+        assert stats['wait']['timeouts'] == 1
+
+        connection.close()
+        engine.dispose()
+        assert collect_pool_stats(engine)['wait']['timeouts'] == 1
+
+
+class TestPoolMetricsEndpoint:
+    """/metrics/pool 엔드포인트 테스트"""
+
+    def test_hidden_unless_enabled(self, app, client):
+        """
+        정상 케이스: METRICS_ENABLED에 따라 노출
+        Given: METRICS_ENABLED False → True
+        When: GET /metrics/pool
+        Then: 404 → 200 + primary 풀 정보
+        """
+        assert client.get('/metrics/pool').status_code == 404
+
+        app.config['METRICS_ENABLED'] = True
+        response = client.get('/metrics/pool')
+
+        assert response.status_code == 200
+        assert 'primary' in response.get_json()
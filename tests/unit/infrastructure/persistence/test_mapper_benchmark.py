@@ -0,0 +1,41 @@
+# tests/unit/infrastructure/persistence/test_mapper_benchmark.py
+"""
+매퍼 변환 벤치마크 단위 테스트
+"""
+
+from app.domain.entities.application import Application
+from app.domain.entities.campaign import Campaign
+from app.infrastructure.persistence.mapper_benchmark import benchmark_mappers
+from app.infrastructure.persistence.mappers import application_mapper, campaign_mapper
+
+
+class TestBenchmarkMappers:
+    """benchmark_mappers 테스트"""
+
+    def test_slotted_entities_use_less_memory(self, app):
+        """
+        정상 케이스: slots 엔티티 메모리 비교
+        Given: 모델 500개
+        When: benchmark_mappers 호출
+        Then: 두 매퍼 모두 slots 엔티티가 일반 dataclass보다 메모리를 적게 사용
+        """
+        with app.app_context():
+            results = benchmark_mappers(rows=500, repeat=1)
+
+        assert [result.name for result in results] == ['CampaignMapper', 'ApplicationMapper']
+        for result in results:
+            assert result.rows == 500
+            assert 0 < result.bytes < result.baseline_bytes
+
+    def test_restores_entity_classes(self, app):
+        """
+        정상 케이스: 비교 후 원래 엔티티 클래스 복원
+        Given: 벤치마크 실행
+        When: 매퍼 모듈의 엔티티 클래스 확인
+        Then: 원래 slots 엔티티 클래스
+        """
+        with app.app_context():
+            benchmark_mappers(rows=10, repeat=1)
+
+        assert campaign_mapper.Campaign is Campaign
+        assert application_mapper.Application is Application
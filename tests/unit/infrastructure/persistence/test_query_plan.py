@@ -0,0 +1,85 @@
+# tests/unit/infrastructure/persistence/test_query_plan.py
+"""
+쿼리 실행 계획 점검 단위 테스트 (SQLite EXPLAIN QUERY PLAN)
+"""
+
+from app.extensions import db
+from app.infrastructure.persistence.models.campaign_model import CampaignModel
+from app.infrastructure.persistence.query_plan import (
+    QueryPlan,
+    capture_query_plans,
+    explain_hot_queries,
+    find_sequential_scans,
+)
+
+
+class TestFindSequentialScans:
+    """find_sequential_scans 테스트"""
+
+    def test_postgresql_seq_scan(self):
+        """
+        정상 케이스: PostgreSQL 실행 계획
+        Given: Seq Scan과 Index Scan이 섞인 계획
+        When: find_sequential_scans 호출
+        Then: Seq Scan 테이블만 반환
+        """
+        plan = QueryPlan(
+            statement='SELECT ...',
+            lines=[
+                'Hash Join  (cost=1.09..2.21 rows=5 width=64)',
+                '  ->  Seq Scan on campaign campaign_1  (cost=0.00..1.05 rows=5 width=32)',
+                '  ->  Index Scan using advertiser_pkey on advertiser  (cost=0.15..8.17 rows=1 width=32)',
+            ],
+            dialect='postgresql'
+        )
+
+        assert find_sequential_scans(plan) == ['campaign']
+
+    def test_sqlite_scan_with_alias(self):
+        """
+        정상 케이스: SQLite 실행 계획
+        Given: 별칭으로 스캔한 테이블, 인덱스 전체 스캔, FTS5 가상 테이블 스캔
+        When: find_sequential_scans 호출
+        Then: 별칭을 원래 테이블 이름으로 바꾼 순차 스캔만 반환
+        """
+        plan = QueryPlan(
+            statement='SELECT * FROM application AS application_1 JOIN campaign ON ...',
+            lines=[
+                'SCAN application_1',
+                'SCAN campaign USING INDEX idx_campaign_status',
+                'SCAN campaign_fts VIRTUAL TABLE INDEX 0:=M1',
+            ],
+            dialect='sqlite'
+        )
+
+        assert find_sequential_scans(plan) == ['application']
+
+
+class TestExplainHotQueries:
+    """capture_query_plans / explain_hot_queries 테스트"""
+
+    def test_capture_flags_unindexed_filter(self, app):
+        """
+        정상 케이스: 인덱스가 없는 조건
+        Given: 인덱스가 없는 title 조건 쿼리
+        When: capture_query_plans 안에서 실행
+        Then: 실행 계획이 수집되고 campaign 순차 스캔으로 표시
+        """
+        with capture_query_plans() as plans:
+            db.session.query(CampaignModel).filter(CampaignModel.title == '없는 체험단').all()
+
+        assert len(plans) == 1
+        assert find_sequential_scans(plans[0]) == ['campaign']
+
+    def test_hot_queries_are_index_driven(self, app):
+        """
+        정상 케이스: 주요 쿼리 점검
+        Given: 모델에 선언된 인덱스로 만든 스키마
+        When: 모든 테이블을 큰 테이블로 보고(min_rows=0) explain_hot_queries 호출
+        Then: 모든 주요 쿼리의 실행 계획이 수집되고 순차 스캔 없음
+        """
+        reports = explain_hot_queries(db.session, min_rows=0)
+
+        assert len(reports) >= 10
+        assert all(report.plans for report in reports)
+        assert {report.name: report.sequential_scans for report in reports if report.sequential_scans} == {}
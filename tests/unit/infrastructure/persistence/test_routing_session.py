@@ -0,0 +1,174 @@
+# tests/unit/infrastructure/persistence/test_routing_session.py
+"""
+RoutingSession (읽기 복제본 라우팅) 단위 테스트
+
+primary / replica 두 개의 SQLite 파일로 라우팅을 검증합니다.
+"""
+
+import time
+import pytest
+from datetime import date
+from flask import g, session as flask_session
+from app import create_app
+from app.extensions import db
+from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
+from app.infrastructure.persistence.models.campaign_model import CampaignModel
+from app.infrastructure.repositories.campaign_repository import CampaignRepository
+from tests.conftest import TestConfig
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """primary + replica 1개 구성 앱"""
+
+    class ReplicaConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "primary.db"}'
+        SQLALCHEMY_REPLICA_URIS = [f'sqlite:///{tmp_path / "replica.db"}']
+        REPLICA_STICKY_SECONDS = 5
+
+    app = create_app(ReplicaConfig)
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines['replica_0'])
+        yield app
+        db.session.remove()
+        # bind별 MetaData는 전역 db에 등록되므로 다른 테스트 앱에 영향이 없도록 제거
+        db.metadatas.pop('replica_0', None)
+
+
+def _add_recruiting_campaign(title='체험단'):
+    """primary에 광고주 + 모집 중 체험단 추가 (커밋 전)"""
+    advertiser = AdvertiserModel(
+        user_id=f'user-{title}',
+        name='김광고',
+        birth_date=date(1985, 5, 15),
+        phone_number='010-1234-5678',
+        business_name='테스트 카페',
+        address='서울시 강남구',
+        business_phone='02-1234-5678',
+        business_number=str(abs(hash(title)) % 10**10).zfill(10),
+        representative_name='김대표'
+    )
+    db.session.add(advertiser)
+    db.session.flush()
+    db.session.add(CampaignModel(
+        advertiser_id=advertiser.id,
+        title=title,
+        description='설명',
+        quota=5,
+        start_date=date(2025, 11, 15),
+        end_date=date(2099, 12, 1),
+        benefits='혜택',
+        conditions='조건',
+        status='RECRUITING'
+    ))
+
+
+class TestRoutingSession:
+    """라우팅 규칙 테스트"""
+
+    def test_read_only_methods_use_replica(self, replica_app):
+        """
+        정상 케이스: 조회 전용 메서드는 복제본 사용
+        Given: primary에만 체험단 존재 (복제 지연 상황)
+        When: @read_only 메서드와 일반 메서드 호출
+        Then: @read_only는 복제본(0건), 일반 조회는 primary
+        """
+        _add_recruiting_campaign()
+        db.session.commit()
+        repository = CampaignRepository(db.session)
+
+        assert repository.count_recruiting_campaigns() == 0
+        campaign_id = db.session.query(CampaignModel.id).scalar()
+        assert repository.find_by_id(campaign_id) is not None
+
+    def test_reads_after_write_in_same_transaction_use_primary(self, replica_app):
+        """
+        정상 케이스: 같은 트랜잭션에서 쓰기 이후 조회는 primary
+        Given: 체험단 추가 후 flush (미커밋)
+        When: @read_only 메서드 호출
+        Then: primary에서 조회 (1건)
+        """
+        _add_recruiting_campaign()
+        db.session.flush()
+
+        assert CampaignRepository(db.session).count_recruiting_campaigns() == 1
+        db.session.rollback()
+
+
+class TestReadYourWrites:
+    """쓰기 후 primary 고정 테스트"""
+
+    def test_commit_pins_user_to_primary(self, replica_app):
+        """
+        정상 케이스: 쓰기 커밋 후 같은 요청의 조회는 primary
+        Given: 요청 컨텍스트
+        When: 쓰기 커밋
+        Then: 세션에 고정 만료 시각 기록, 이후 조회는 primary
+        """
+        with replica_app.test_request_context('/'):
+            replica_app.preprocess_request()
+            _add_recruiting_campaign()
+            db.session.commit()
+
+            assert g.read_primary is True
+            assert flask_session['_primary_until'] > time.time()
+            assert CampaignRepository(db.session).count_recruiting_campaigns() == 1
+
+    def test_sticky_window_is_honoured_on_next_request(self, replica_app):
+        """
+        정상 케이스: 고정 시간 내 다음 요청은 primary, 만료 후에는 복제본
+        Given: primary에만 체험단 존재
+        When: 고정 만료 전/후로 홈 요청
+        Then: 만료 전에는 체험단 노출, 만료 후에는 미노출
+        """
+        _add_recruiting_campaign('방금 만든 체험단')
+        db.session.commit()
+        client = replica_app.test_client()
+
+        with client.session_transaction() as sess:
+            sess['_primary_until'] = time.time() + 5
+        assert '방금 만든 체험단' in client.get('/?page=1&sort=deadline').data.decode('utf-8')
+
+        with client.session_transaction() as sess:
+            sess['_primary_until'] = time.time() - 1
+        assert '방금 만든 체험단' not in client.get('/?page=1&sort=latest').data.decode('utf-8')
+
+
+class TestFeedCacheRefill:
+    """무효화 직후 캐시 재적재 테스트"""
+
+    def test_refill_after_invalidation_reads_primary(self, replica_app):
+        """
+        정상 케이스: 무효화 직후 재적재는 primary에서 조회
+        Given: 복제본 기준 홈 피드가 캐시된 상태
+        When: primary에 체험단 커밋 후 피드 태그 무효화, primary 고정되지 않은 다른 방문자가 홈 요청
+        Then: 복제 지연과 무관하게 새 체험단 노출 (지연된 복제본 결과를 TTL 동안 캐시하지 않음)
+        """
+        from app.infrastructure.cache.tagged_cache import get_feed_cache
+        from app.shared.constants.cache_constants import CACHE_TAG_RECRUITING_FEED
+
+        assert '복제 전 체험단' not in replica_app.test_client().get('/').data.decode('utf-8')
+
+        _add_recruiting_campaign('복제 전 체험단')
+        db.session.commit()
+        get_feed_cache().invalidate(CACHE_TAG_RECRUITING_FEED)
+
+        assert '복제 전 체험단' in replica_app.test_client().get('/').data.decode('utf-8')
+
+    def test_primary_reads_overrides_read_only(self, replica_app):
+        """
+        정상 케이스: primary_reads 블록
+        Given: primary에만 체험단 존재
+        When: primary_reads 블록 안팎에서 @read_only 메서드 호출
+        Then: 블록 안에서만 primary 결과(1건)
+        """
+        from app.infrastructure.persistence.routing_session import primary_reads
+
+        _add_recruiting_campaign()
+        db.session.commit()
+        repository = CampaignRepository(db.session)
+
+        with primary_reads(db.session):
+            assert repository.count_recruiting_campaigns() == 1
+        assert repository.count_recruiting_campaigns() == 0
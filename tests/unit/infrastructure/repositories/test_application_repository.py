@@ -0,0 +1,317 @@
+# tests/unit/infrastructure/repositories/test_application_repository.py
+"""
+ApplicationRepository 단위 테스트
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from app.infrastructure.repositories.application_repository import ApplicationRepository
+from app.infrastructure.persistence.models.campaign_model import CampaignModel
+from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
+from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+from app.infrastructure.persistence.models.application_model import ApplicationModel
+from app.extensions import db
+
+
+def _create_campaign_with_applicants(follower_counts, statuses=None):
+    """체험단 1개와 지원자 N명 생성"""
+    advertiser = AdvertiserModel(
+        user_id='test-advertiser-id',
+        name='김광고',
+        birth_date=date(1985, 5, 15),
+        phone_number='010-1234-5678',
+        business_name='테스트 카페',
+        address='서울시 강남구',
+        business_phone='02-1234-5678',
+        business_number='1234567890',
+        representative_name='김대표'
+    )
+    db.session.add(advertiser)
+    db.session.flush()
+
+    campaign = CampaignModel(
+        advertiser_id=advertiser.id,
+        title='체험단',
+        description='설명',
+        quota=5,
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=15),
+        benefits='혜택',
+        conditions='조건',
+        status='CLOSED'
+    )
+    db.session.add(campaign)
+    db.session.flush()
+
+    statuses = statuses or ['APPLIED'] * len(follower_counts)
+    for i, (follower_count, status) in enumerate(zip(follower_counts, statuses)):
+        influencer = InfluencerModel(
+            user_id=f'influencer-{i}',
+            name=f'인플루언서 {i}',
+            birth_date=date(1995, 1, 1),
+            phone_number='010-0000-0000',
+            channel_name=f'채널 {i}',
+            channel_url=f'https://example.com/{i}',
+            follower_count=follower_count
+        )
+        db.session.add(influencer)
+        db.session.flush()
+        db.session.add(ApplicationModel(
+            campaign_id=campaign.id,
+            influencer_id=influencer.id,
+            status=status,
+            applied_at=datetime(2025, 11, 20, 10, 0, 0) + timedelta(seconds=i)
+        ))
+    db.session.commit()
+    return campaign.id
+
+
+class TestApplicationRepositoryFindApplicantsByCampaign:
+    """find_applicants_by_campaign 테스트"""
+
+    def test_returns_applicants_with_influencer_info(self, app):
+        """
+        정상 케이스: 인플루언서 정보 포함, 최신 지원순
+        Given: 지원자 3명
+        When: find_applicants_by_campaign 호출
+        Then: 최신 지원순 리스트와 전체 개수 3 반환
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants([100, 300, 200])
+            repository = ApplicationRepository(db.session)
+
+            applicants, total_count = repository.find_applicants_by_campaign(campaign_id)
+
+            assert total_count == 3
+            assert [a['influencer_name'] for a in applicants] == ['인플루언서 2', '인플루언서 1', '인플루언서 0']
+            assert applicants[0]['channel_url'] == 'https://example.com/2'
+            assert applicants[0]['status'] == 'APPLIED'
+
+    def test_sort_by_follower_count_with_pagination(self, app):
+        """
+        정상 케이스: 팔로워순 정렬 + 페이지네이션
+        Given: 지원자 4명
+        When: sort='follower_count', skip=1, limit=2 로 조회
+        Then: 팔로워 2~3위, 전체 개수 4
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants([100, 400, 300, 200])
+            repository = ApplicationRepository(db.session)
+
+            applicants, total_count = repository.find_applicants_by_campaign(
+                campaign_id, sort='follower_count', skip=1, limit=2
+            )
+
+            assert [a['follower_count'] for a in applicants] == [300, 200]
+            assert total_count == 4
+
+    def test_status_filter(self, app):
+        """
+        정상 케이스: 상태 필터
+        Given: 선정 1명, 탈락 2명
+        When: status='REJECTED' 로 조회
+        Then: 탈락자 2명만 반환
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants(
+                [100, 200, 300], statuses=['SELECTED', 'REJECTED', 'REJECTED']
+            )
+            repository = ApplicationRepository(db.session)
+
+            applicants, total_count = repository.find_applicants_by_campaign(campaign_id, status='REJECTED')
+
+            assert total_count == 2
+            assert all(a['status'] == 'REJECTED' for a in applicants)
+
+    def test_page_out_of_range_keeps_total(self, app):
+        """경계 케이스: 범위를 벗어난 페이지는 빈 리스트, 전체 개수 유지"""
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants([100, 200])
+            repository = ApplicationRepository(db.session)
+
+            applicants, total_count = repository.find_applicants_by_campaign(campaign_id, skip=10, limit=5)
+
+            assert applicants == []
+            assert total_count == 2
+
+
+class TestApplicationRepositoryInfluencerHistory:
+    """find_history_by_influencer / count_by_status_for_influencer 테스트"""
+
+    def test_history_includes_campaign_and_advertiser(self, app):
+        """
+        정상 케이스: 체험단/광고주 정보 포함 지원 내역
+        Given: 인플루언서가 체험단 1개에 지원
+        When: find_history_by_influencer 호출
+        Then: 체험단 제목과 업체명이 포함된 1건 반환
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants([100, 200])
+            influencer_id = db.session.query(InfluencerModel.id).filter_by(user_id='influencer-0').scalar()
+            repository = ApplicationRepository(db.session)
+
+            history = repository.find_history_by_influencer(influencer_id)
+
+            assert len(history) == 1
+            assert history[0]['campaign_id'] == campaign_id
+            assert history[0]['campaign_title'] == '체험단'
+            assert history[0]['business_name'] == '테스트 카페'
+
+    def test_status_filter_and_counts(self, app):
+        """
+        정상 케이스: 상태 필터 및 상태별 개수
+        Given: 선정된 지원 1건
+        When: status='REJECTED'로 조회, 상태별 개수 조회
+        Then: 빈 리스트, {'APPLIED': 0, 'SELECTED': 1, 'REJECTED': 0}
+        """
+        with app.app_context():
+            _create_campaign_with_applicants([100], statuses=['SELECTED'])
+            influencer_id = db.session.query(InfluencerModel.id).filter_by(user_id='influencer-0').scalar()
+            repository = ApplicationRepository(db.session)
+
+            assert repository.find_history_by_influencer(influencer_id, status='REJECTED') == []
+            assert repository.count_by_status_for_influencer(influencer_id) == {
+                'APPLIED': 0, 'SELECTED': 1, 'REJECTED': 0
+            }
+
+
+class TestApplicationRepositoryApplySelection:
+    """apply_selection 테스트"""
+
+    def test_selects_and_rejects_in_one_update(self, app):
+        """
+        정상 케이스: 선정/미선정 동시 반영
+        Given: APPLIED 3명, SELECTED 1명
+        When: 첫 번째 지원만 선정
+        Then: 첫 번째 SELECTED, 나머지 APPLIED는 REJECTED, 기존 SELECTED 유지
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants(
+                [100, 200, 300, 400], statuses=['APPLIED', 'APPLIED', 'APPLIED', 'SELECTED']
+            )
+            ids = [
+                row.id for row in
+                db.session.query(ApplicationModel.id).order_by(ApplicationModel.id).all()
+            ]
+            repository = ApplicationRepository(db.session)
+
+            updated = repository.apply_selection(campaign_id, [ids[0]])
+            db.session.commit()
+
+            statuses = dict(db.session.query(ApplicationModel.id, ApplicationModel.status).all())
+            assert updated == 3
+            assert [statuses[i] for i in ids] == ['SELECTED', 'REJECTED', 'REJECTED', 'SELECTED']
+
+    def test_ignores_ids_from_other_campaigns(self, app):
+        """
+        경계 케이스: 다른 체험단의 지원 ID
+        Given: 체험단 지원자 2명
+        When: 존재하지 않는 ID만 선정
+        Then: 전원 REJECTED
+        """
+        with app.app_context():
+            campaign_id = _create_campaign_with_applicants([100, 200])
+            repository = ApplicationRepository(db.session)
+
+            repository.apply_selection(campaign_id, [9999])
+            db.session.commit()
+
+            assert {status for (status,) in db.session.query(ApplicationModel.status).all()} == {'REJECTED'}
+
+    def test_postgresql_passes_ids_as_single_array_parameter(self, app):
+        """
+        정상 케이스: PostgreSQL 배열 파라미터
+        Given: postgresql dialect
+        When: 선정 ID 조건 컴파일
+        Then: IN 목록 대신 = ANY(배열 파라미터 1개)
+        """
+        from unittest.mock import Mock
+        from sqlalchemy.dialects import postgresql
+
+        session = Mock()
+        session.get_bind.return_value.dialect.name = 'postgresql'
+        repository = ApplicationRepository(session)
+
+        sql = str(repository._id_in(list(range(10000))).compile(dialect=postgresql.dialect()))
+
+        assert sql == 'application.id = ANY (%(selected_application_ids)s::INTEGER[])'
+
+
+class TestApplicationRepositoryInsertIfRecruiting:
+    """insert_if_recruiting 테스트"""
+
+    @staticmethod
+    def _application(campaign_id, influencer_id):
+        from app.domain.entities.application import Application
+        return Application(
+            id=None,
+            campaign_id=campaign_id,
+            influencer_id=influencer_id,
+            application_reason='지원합니다',
+            status='APPLIED',
+            applied_at=datetime(2025, 11, 21, 9, 0, 0)
+        )
+
+    def _setup(self, campaign_status):
+        campaign_id = _create_campaign_with_applicants([100])
+        db.session.query(CampaignModel).filter_by(id=campaign_id).update({'status': campaign_status})
+        influencer = InfluencerModel(
+            user_id='new-influencer',
+            name='신규',
+            birth_date=date(1995, 1, 1),
+            phone_number='010-0000-0000',
+            channel_name='신규 채널',
+            channel_url='https://example.com/new',
+            follower_count=10
+        )
+        db.session.add(influencer)
+        db.session.commit()
+        return campaign_id, influencer.id
+
+    def test_inserts_when_recruiting(self, app):
+        """
+        정상 케이스: 모집 중인 체험단 지원
+        Given: RECRUITING 체험단
+        When: insert_if_recruiting 호출
+        Then: ID가 부여된 Application 반환, DB에 저장
+        """
+        with app.app_context():
+            campaign_id, influencer_id = self._setup('RECRUITING')
+            repository = ApplicationRepository(db.session)
+
+            saved = repository.insert_if_recruiting(self._application(campaign_id, influencer_id))
+            db.session.commit()
+
+            assert saved.id is not None
+            stored = db.session.get(ApplicationModel, saved.id)
+            assert (stored.campaign_id, stored.influencer_id, stored.status) == (campaign_id, influencer_id, 'APPLIED')
+
+    def test_duplicate_returns_none_without_integrity_error(self, app):
+        """
+        경계 케이스: 중복 지원
+        Given: 이미 지원한 인플루언서
+        When: 같은 체험단에 다시 insert_if_recruiting 호출
+        Then: None 반환, 트랜잭션은 계속 사용 가능
+        """
+        with app.app_context():
+            campaign_id, influencer_id = self._setup('RECRUITING')
+            repository = ApplicationRepository(db.session)
+            repository.insert_if_recruiting(self._application(campaign_id, influencer_id))
+
+            assert repository.insert_if_recruiting(self._application(campaign_id, influencer_id)) is None
+            db.session.commit()
+            assert db.session.query(ApplicationModel).filter_by(influencer_id=influencer_id).count() == 1
+
+    def test_not_recruiting_returns_none(self, app):
+        """
+        경계 케이스: 모집 종료 체험단
+        Given: CLOSED 체험단
+        When: insert_if_recruiting 호출
+        Then: None 반환, 저장되지 않음
+        """
+        with app.app_context():
+            campaign_id, influencer_id = self._setup('CLOSED')
+            repository = ApplicationRepository(db.session)
+
+            assert repository.insert_if_recruiting(self._application(campaign_id, influencer_id)) is None
+            assert db.session.query(ApplicationModel).filter_by(influencer_id=influencer_id).count() == 0
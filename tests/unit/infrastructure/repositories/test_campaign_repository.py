@@ -6,13 +6,14 @@ TDD RED Phase: 실패하는 테스트 작성
 """
 
 import pytest
-from datetime import date, datetime, UTC
+from datetime import date, datetime, timedelta, UTC
 from app.domain.entities.campaign import Campaign, CampaignStatus
 from app.infrastructure.repositories.campaign_repository import CampaignRepository
 from app.infrastructure.persistence.models.campaign_model import CampaignModel
 from app.infrastructure.persistence.models.advertiser_model import AdvertiserModel
 from app.infrastructure.persistence.models.application_model import ApplicationModel
 from app.extensions import db
+from app.shared.constants.campaign_constants import DESCRIPTION_SHORT_LENGTH
 
 
 class TestCampaignRepositoryFindByIdWithAdvertiser:
@@ -189,6 +190,191 @@ class TestCampaignRepositoryGetApplicationCount:
             assert count == 0
 
 
+class TestCampaignRepositoryApplicationCounter:
+    """application_count 카운터 테스트"""
+
+    @staticmethod
+    def _create_campaign_with_applications(application_count):
+        from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-counter',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='테스트 카페',
+            address='서울시 강남구',
+            business_phone='02-1234-5678',
+            business_number='2222222222',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.flush()
+
+        campaign_model = CampaignModel(
+            advertiser_id=advertiser.id,
+            title='체험단',
+            description='설명',
+            quota=5,
+            start_date=date(2025, 11, 15),
+            end_date=date(2025, 11, 30),
+            benefits='혜택',
+            conditions='조건',
+            status='RECRUITING'
+        )
+        db.session.add(campaign_model)
+        db.session.flush()
+
+        for i in range(application_count):
+            influencer = InfluencerModel(
+                user_id=f'influencer-{i}',
+                name=f'인플루언서 {i}',
+                birth_date=date(1995, 1, 1),
+                phone_number='010-0000-0000',
+                channel_name=f'채널 {i}',
+                channel_url=f'https://example.com/{i}',
+                follower_count=100
+            )
+            db.session.add(influencer)
+            db.session.flush()
+            db.session.add(ApplicationModel(
+                campaign_id=campaign_model.id,
+                influencer_id=influencer.id,
+                status='APPLIED'
+            ))
+        db.session.commit()
+        return campaign_model.id
+
+    def test_increment_application_count(self, app):
+        """
+        정상 케이스: 카운터 증가
+        Given: 지원자 수 0인 체험단
+        When: increment_application_count 2회 호출
+        Then: get_application_count가 2 반환
+        """
+        with app.app_context():
+            campaign_id = self._create_campaign_with_applications(0)
+            repository = CampaignRepository(db.session)
+
+            repository.increment_application_count(campaign_id)
+            repository.increment_application_count(campaign_id)
+            db.session.commit()
+
+            assert repository.get_application_count(campaign_id) == 2
+
+    def test_recalculate_application_counts_repairs_drift(self, app):
+        """
+        정상 케이스: 어긋난 카운터 보정
+        Given: 실제 지원 3건, 카운터 0인 체험단
+        When: recalculate_application_counts 호출
+        Then: 1개 체험단 보정, 카운터 3
+        """
+        with app.app_context():
+            campaign_id = self._create_campaign_with_applications(3)
+            repository = CampaignRepository(db.session)
+
+            repaired = repository.recalculate_application_counts()
+            db.session.commit()
+
+            assert repaired == 1
+            assert repository.get_application_count(campaign_id) == 3
+            assert repository.recalculate_application_counts() == 0
+
+
+class TestCampaignRepositoryFindAdvertiserCampaignsByStatus:
+    """find_advertiser_campaigns_by_status 테스트"""
+
+    @staticmethod
+    def _create_campaigns(statuses):
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-dashboard',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='테스트 카페',
+            address='서울시 강남구',
+            business_phone='02-1234-5678',
+            business_number='3333333333',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.commit()
+
+        for i, status in enumerate(statuses):
+            db.session.add(CampaignModel(
+                advertiser_id=advertiser.id,
+                title=f'체험단 {i+1}',
+                description='설명',
+                quota=5,
+                start_date=date(2025, 11, 15),
+                end_date=date(2025, 11, 30),
+                benefits='혜택',
+                conditions='조건',
+                status=status,
+                created_at=datetime(2025, 11, 1, 12, 0, i)
+            ))
+        db.session.commit()
+        return advertiser.id
+
+    def test_groups_by_status_with_totals(self, app):
+        """
+        정상 케이스: 상태별 분류 및 총 개수
+        Given: 모집 중 3개, 모집 종료 2개
+        When: find_advertiser_campaigns_by_status 호출
+        Then: 상태별 리스트와 총 개수 반환 (선정 완료는 0)
+        """
+        with app.app_context():
+            advertiser_id = self._create_campaigns(['RECRUITING'] * 3 + ['CLOSED'] * 2)
+            repository = CampaignRepository(db.session)
+
+            campaigns, counts = repository.find_advertiser_campaigns_by_status(advertiser_id)
+
+            assert len(campaigns['RECRUITING']) == 3
+            assert len(campaigns['CLOSED']) == 2
+            assert campaigns['SELECTED'] == []
+            assert counts == {'RECRUITING': 3, 'CLOSED': 2, 'SELECTED': 0}
+
+    def test_per_status_pagination(self, app):
+        """
+        정상 케이스: 상태별 페이지네이션
+        Given: 모집 중 5개, 모집 종료 3개
+        When: limit_per_status=2, 모집 중 offset=2 로 조회
+        Then: 모집 중은 3~4번째(최신순), 모집 종료는 첫 2개, 총 개수는 전체 기준
+        """
+        with app.app_context():
+            advertiser_id = self._create_campaigns(['RECRUITING'] * 5 + ['CLOSED'] * 3)
+            repository = CampaignRepository(db.session)
+
+            campaigns, counts = repository.find_advertiser_campaigns_by_status(
+                advertiser_id, limit_per_status=2, offsets={'RECRUITING': 2}
+            )
+
+            assert [c.title for c in campaigns['RECRUITING']] == ['체험단 3', '체험단 2']
+            assert [c.title for c in campaigns['CLOSED']] == ['체험단 8', '체험단 7']
+            assert counts == {'RECRUITING': 5, 'CLOSED': 3, 'SELECTED': 0}
+
+    def test_card_rows_project_short_description(self, app):
+        """
+        정상 케이스: 카드 읽기 모델
+        Given: 설명이 DESCRIPTION_SHORT_LENGTH자보다 긴 모집 중 체험단
+        When: 대시보드/홈 피드 목록 조회
+        Then: 설명은 SQL에서 잘린 description_short로만 조회되고 전체 설명/혜택/조건은 조회하지 않음
+        """
+        with app.app_context():
+            advertiser_id = self._create_campaigns(['RECRUITING'])
+            db.session.query(CampaignModel).update({'description': '가' * 150, 'end_date': date.today()})
+            db.session.commit()
+            repository = CampaignRepository(db.session)
+
+            campaigns, _ = repository.find_advertiser_campaigns_by_status(advertiser_id, limit_per_status=2)
+            feed = repository.find_recruiting_campaigns()
+
+            for row in (campaigns['RECRUITING'][0], feed[0]):
+                assert row.description_short == '가' * DESCRIPTION_SHORT_LENGTH
+                assert not {'description', 'benefits', 'conditions'} & set(row._fields)
+            assert feed[0].business_name == '테스트 카페'
+
+
 class TestCampaignRepositoryFindRecruitingCampaigns:
     """find_recruiting_campaigns 테스트"""
 
@@ -223,8 +409,8 @@ class TestCampaignRepositoryFindRecruitingCampaigns:
                     title=f'체험단 {i+1}',
                     description='설명',
                     quota=5,
-                    start_date=date(2025, 11, 15),
-                    end_date=date(2025, 11, 30),
+                    start_date=date.today(),
+                    end_date=date.today() + timedelta(days=15),
                     benefits='혜택',
                     conditions='조건',
                     status='RECRUITING'
@@ -240,9 +426,7 @@ class TestCampaignRepositoryFindRecruitingCampaigns:
             assert len(results) >= 3
             # 최신순 정렬 확인 (created_at DESC)
             if len(results) >= 2:
-                campaign1, _, _ = results[0]
-                campaign2, _, _ = results[1]
-                assert campaign1.created_at >= campaign2.created_at
+                assert results[0].created_at >= results[1].created_at
 
     def test_find_recruiting_campaigns_pagination(self, app):
         """
@@ -255,6 +439,185 @@ class TestCampaignRepositoryFindRecruitingCampaigns:
         pass
 
 
+class TestCampaignRepositoryFindRecruitingCampaignsByCursor:
+    """find_recruiting_campaigns_by_cursor 테스트"""
+
+    @staticmethod
+    def _create_campaigns(count):
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-cursor',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='테스트 카페',
+            address='서울시 강남구',
+            business_phone='02-1234-5678',
+            business_number='1111111111',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.commit()
+
+        for i in range(count):
+            db.session.add(CampaignModel(
+                advertiser_id=advertiser.id,
+                title=f'체험단 {i+1}',
+                description='설명',
+                quota=5,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=16 + i % 3),
+                benefits='혜택',
+                conditions='조건',
+                status='RECRUITING',
+                created_at=datetime(2025, 11, 1, 12, 0, i % 4)
+            ))
+        db.session.commit()
+
+    @pytest.mark.parametrize('sort', ['latest', 'deadline', 'popular'])
+    def test_cursor_pages_match_offset_pages(self, app, sort):
+        """
+        정상 케이스: 커서 페이지를 끝까지 따라가면 OFFSET 방식과 동일한 순서
+        Given: 정렬 키가 중복되는 체험단 10개
+        When: limit=3으로 커서를 따라가며 조회
+        Then: 누락/중복 없이 OFFSET 방식 결과와 동일
+        """
+        with app.app_context():
+            self._create_campaigns(10)
+            repository = CampaignRepository(db.session)
+
+            expected = [
+                row.id
+                for row in repository.find_recruiting_campaigns(skip=0, limit=100, sort=sort)
+            ]
+
+            collected = []
+            cursor = None
+            while True:
+                rows, cursor = repository.find_recruiting_campaigns_by_cursor(
+                    cursor=cursor, limit=3, sort=sort
+                )
+                collected.extend(row.id for row in rows)
+                if cursor is None:
+                    break
+
+            assert collected == expected
+            assert len(collected) == 10
+
+    def test_last_page_has_no_next_cursor(self, app):
+        """경계 케이스: 결과가 limit 이하이면 다음 커서 없음"""
+        with app.app_context():
+            self._create_campaigns(3)
+            repository = CampaignRepository(db.session)
+
+            rows, next_cursor = repository.find_recruiting_campaigns_by_cursor(limit=3)
+
+            assert len(rows) == 3
+            assert next_cursor is None
+
+    def test_cursor_for_other_sort_raises(self, app):
+        """에러 케이스: 다른 정렬 기준의 커서는 거부"""
+        from app.domain.exceptions import ValidationException
+
+        with app.app_context():
+            self._create_campaigns(5)
+            repository = CampaignRepository(db.session)
+            _, cursor = repository.find_recruiting_campaigns_by_cursor(limit=2, sort='latest')
+
+            with pytest.raises(ValidationException):
+                repository.find_recruiting_campaigns_by_cursor(cursor=cursor, limit=2, sort='deadline')
+
+
+class TestCampaignRepositoryFindRecruitingCampaignsPage:
+    """find_recruiting_campaigns_page 테스트"""
+
+    _create_campaigns = staticmethod(TestCampaignRepositoryFindRecruitingCampaignsByCursor._create_campaigns)
+
+    def test_returns_page_and_total_in_one_query(self, app):
+        """
+        정상 케이스: 목록 + 총 개수 단일 쿼리
+        Given: 모집 중인 체험단 7개
+        When: find_recruiting_campaigns_page(skip=3, limit=3) 호출
+        Then: OFFSET 방식과 같은 행, 총 개수 7, 다음 페이지 있음, SELECT 1회
+        """
+        from sqlalchemy import event
+
+        with app.app_context():
+            self._create_campaigns(7)
+            repository = CampaignRepository(db.session)
+            expected = [row.id for row in repository.find_recruiting_campaigns(skip=3, limit=3)]
+
+            statements = []
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                rows, total_count, has_next = repository.find_recruiting_campaigns_page(skip=3, limit=3)
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+
+            assert [row.id for row in rows] == expected
+            assert total_count == 7
+            assert has_next is True
+            assert len(statements) == 1
+
+    def test_out_of_range_page_still_returns_total(self, app):
+        """
+        경계 케이스: 범위를 벗어난 페이지
+        Given: 모집 중인 체험단 2개
+        When: skip=10으로 조회
+        Then: 빈 목록, 총 개수 2, 다음 페이지 없음
+        """
+        with app.app_context():
+            self._create_campaigns(2)
+            repository = CampaignRepository(db.session)
+
+            rows, total_count, has_next = repository.find_recruiting_campaigns_page(skip=10, limit=3)
+
+            assert rows == []
+            assert total_count == 2
+            assert has_next is False
+
+    def test_without_total_returns_has_next_only(self, app):
+        """
+        정상 케이스: 총 개수 생략 모드
+        Given: 모집 중인 체험단 6개
+        When: with_total=False로 두 페이지 조회 (limit=3)
+        Then: 총 개수 None, 첫 페이지만 다음 페이지 있음
+        """
+        with app.app_context():
+            self._create_campaigns(6)
+            repository = CampaignRepository(db.session)
+
+            first, first_total, first_has_next = repository.find_recruiting_campaigns_page(
+                skip=0, limit=3, with_total=False
+            )
+            second, _, second_has_next = repository.find_recruiting_campaigns_page(
+                skip=3, limit=3, with_total=False
+            )
+
+            assert first_total is None
+            assert len(first) == 3 and len(second) == 3
+            assert first_has_next is True
+            assert second_has_next is False
+
+    def test_falls_back_to_count_query_without_window_functions(self, app, monkeypatch):
+        """
+        정상 케이스: 윈도우 함수 미지원 DB 대체 경로
+        Given: 윈도우 함수 미지원으로 설정
+        When: find_recruiting_campaigns_page 호출
+        Then: 동일한 결과 반환
+        """
+        with app.app_context():
+            self._create_campaigns(4)
+            repository = CampaignRepository(db.session)
+            monkeypatch.setattr(repository, '_supports_window_functions', lambda: False)
+
+            rows, total_count, has_next = repository.find_recruiting_campaigns_page(skip=0, limit=3)
+
+            assert len(rows) == 3
+            assert total_count == 4
+            assert has_next is True
+
+
 # Pytest Fixture
 @pytest.fixture
 def app():
@@ -269,3 +632,378 @@ def app():
         yield app
         db.session.remove()
         db.drop_all()
+
+
+class TestCampaignRepositoryImageVariants:
+    """반응형 이미지 변형 저장/조회 테스트"""
+
+    @staticmethod
+    def _create_campaigns(image_urls):
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-variants',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='테스트 카페',
+            address='서울시 강남구',
+            business_phone='02-1234-5678',
+            business_number='3333333333',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.flush()
+
+        for i, image_url in enumerate(image_urls):
+            db.session.add(CampaignModel(
+                advertiser_id=advertiser.id,
+                title=f'체험단 {i}',
+                description='설명',
+                quota=5,
+                start_date=date(2025, 11, 15),
+                end_date=date(2025, 11, 30),
+                benefits='혜택',
+                conditions='조건',
+                image_url=image_url,
+                status='RECRUITING'
+            ))
+        db.session.commit()
+
+    def test_update_and_find_without_variants(self, app):
+        """
+        정상 케이스: 같은 이미지 체험단에 변형 저장
+        Given: 같은 이미지 2개, 다른 이미지 1개, 이미지 없음 1개
+        When: 한 이미지의 변형 저장
+        Then: 2개 체험단 수정, 변형 없는 이미지 URL에서 제외되고 엔티티에 반영
+        """
+        with app.app_context():
+            self._create_campaigns(['/uploads/a.png', '/uploads/a.png', '/uploads/b.png', None])
+            repository = CampaignRepository(db.session)
+            assert repository.find_image_urls_without_variants() == ['/uploads/a.png', '/uploads/b.png']
+
+            variants = {'thumbnail': '/uploads/thumb.jpg', 'webp': {'400': '/uploads/w400.webp'}}
+            updated = repository.update_image_variants('/uploads/a.png', variants)
+            db.session.commit()
+
+            assert updated == 2
+            assert repository.find_image_urls_without_variants() == ['/uploads/b.png']
+            assert repository.find_image_urls_without_variants(limit=0) == []
+            campaign = db.session.query(CampaignModel).filter_by(image_url='/uploads/a.png').first()
+            assert repository.find_by_id(campaign.id).image_variants == variants
+
+
+class TestCampaignRepositoryCloseExpiredCampaigns:
+    """모집 기간이 지난 체험단 자동 종료 테스트"""
+
+    @staticmethod
+    def _create_campaigns(end_date_offsets, status='RECRUITING'):
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-expired',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='테스트 카페',
+            address='서울시 강남구',
+            business_phone='02-1234-5678',
+            business_number='4444444444',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.flush()
+
+        for i, offset in enumerate(end_date_offsets):
+            db.session.add(CampaignModel(
+                advertiser_id=advertiser.id,
+                title=f'체험단 {i}',
+                description='설명',
+                quota=5,
+                start_date=date.today() - timedelta(days=30),
+                end_date=date.today() + timedelta(days=offset),
+                benefits='혜택',
+                conditions='조건',
+                status=status
+            ))
+        db.session.commit()
+
+    def test_expired_campaigns_hidden_before_sweep(self, app):
+        """
+        정상 케이스: 조회 시점 필터
+        Given: 어제 끝난 체험단 1개, 오늘 끝나는 체험단 1개 (둘 다 RECRUITING)
+        When: 모집 중 목록/개수 조회
+        Then: 오늘 끝나는 체험단만 포함
+        """
+        with app.app_context():
+            self._create_campaigns([-1, 0])
+            repository = CampaignRepository(db.session)
+
+            campaigns = repository.find_recruiting_campaigns(skip=0, limit=10)
+
+            assert [row.title for row in campaigns] == ['체험단 1']
+            assert repository.count_recruiting_campaigns() == 1
+
+    def test_close_expired_campaigns_in_batches(self, app):
+        """
+        정상 케이스: 배치 단위 종료
+        Given: 기간 지난 체험단 3개, 진행 중 체험단 1개
+        When: 배치 크기 2로 반복 호출
+        Then: 2개, 1개, 0개 순으로 종료되고 closed_at 설정, 진행 중 체험단은 유지
+        """
+        with app.app_context():
+            self._create_campaigns([-3, -2, -1, 5])
+            repository = CampaignRepository(db.session)
+            closed_at = datetime(2025, 12, 1, 0, 0)
+
+            results = [
+                repository.close_expired_campaigns(date.today(), closed_at=closed_at, limit=2)
+                for _ in range(3)
+            ]
+            db.session.commit()
+
+            assert results == [2, 1, 0]
+            rows = db.session.query(CampaignModel).order_by(CampaignModel.id).all()
+            assert [row.status for row in rows] == ['CLOSED', 'CLOSED', 'CLOSED', 'RECRUITING']
+            assert [row.closed_at for row in rows[:3]] == [closed_at] * 3
+            assert rows[3].closed_at is None
+
+    def test_already_closed_campaigns_untouched(self, app):
+        """
+        경계 케이스: 이미 종료/선정된 체험단
+        Given: 기간 지난 SELECTED 체험단
+        When: close_expired_campaigns 호출
+        Then: 상태 변경 없음
+        """
+        with app.app_context():
+            self._create_campaigns([-1], status='SELECTED')
+            repository = CampaignRepository(db.session)
+
+            assert repository.close_expired_campaigns(date.today(), closed_at=datetime(2025, 12, 1)) == 0
+            assert db.session.query(CampaignModel).one().status == 'SELECTED'
+
+
+class TestCampaignRepositorySearchCampaigns:
+    """search_campaigns 테스트"""
+
+    @staticmethod
+    def _save_campaigns(campaigns):
+        advertiser = AdvertiserModel(
+            user_id='test-user-id-search',
+            name='김광고',
+            birth_date=date(1985, 5, 15),
+            phone_number='010-1234-5678',
+            business_name='을지로 식당',
+            address='서울시 중구',
+            business_phone='02-1234-5678',
+            business_number='5555555555',
+            representative_name='김대표'
+        )
+        db.session.add(advertiser)
+        db.session.flush()
+
+        repository = CampaignRepository(db.session)
+        for title, description, status in campaigns:
+            repository.save(Campaign(
+                id=None,
+                advertiser_id=advertiser.id,
+                title=title,
+                description=description,
+                quota=5,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=10),
+                benefits='무료 식사 제공',
+                conditions='조건',
+                image_url=None,
+                status=CampaignStatus(status),
+                created_at=datetime.now(UTC),
+                closed_at=None
+            ))
+        db.session.commit()
+        return repository
+
+    _campaigns = [
+        ('크림 파스타 체험단', '신메뉴 크림 파스타를 소개해주세요.', 'RECRUITING'),
+        ('브런치 카페 체험단', '주말 브런치 메뉴 리뷰', 'RECRUITING'),
+        ('파스타 파스타 파스타', '파스타 집중 리뷰', 'CLOSED'),
+    ]
+
+    def test_korean_search_ranked_and_filtered_by_status(self, app):
+        """
+        정상 케이스: 한국어 검색 (FTS5)
+        Given: '파스타'가 들어간 모집 중 체험단 1개, 종료 체험단 1개
+        When: '파스타'로 모집 중/전체 검색
+        Then: 모집 중 필터는 1개, 전체는 관련도순 2개
+        """
+        from app.shared.utils.search_utils import parse_search_query
+
+        with app.app_context():
+            repository = self._save_campaigns(self._campaigns)
+
+            recruiting, recruiting_total = repository.search_campaigns(parse_search_query('파스타'))
+            everything, total = repository.search_campaigns(parse_search_query('파스타'), status=None)
+
+            assert [row.title for row in recruiting] == ['크림 파스타 체험단']
+            assert recruiting_total == 1
+            assert [row.title for row in everything] == ['파스타 파스타 파스타', '크림 파스타 체험단']
+            assert total == 2
+
+    def test_matches_business_name_and_single_character(self, app):
+        """
+        정상 케이스: 상호명 / 한 글자 검색
+        Given: 상호명이 '을지로 식당'인 체험단
+        When: '을지로', '브' 로 검색
+        Then: 상호명 일치는 모집 중 2개, 한 글자는 접두사로 일치
+        """
+        from app.shared.utils.search_utils import parse_search_query
+
+        with app.app_context():
+            repository = self._save_campaigns(self._campaigns)
+
+            _, by_business_name = repository.search_campaigns(parse_search_query('을지로'))
+            single, _ = repository.search_campaigns(parse_search_query('브'))
+
+            assert by_business_name == 2
+            assert [row.title for row in single] == ['브런치 카페 체험단']
+
+    def test_like_fallback_without_fts_table(self, app, monkeypatch):
+        """
+        대체 경로: FTS5 테이블이 없는 SQLite
+        Given: 검색 테이블 없음
+        When: 검색
+        Then: search_document LIKE 검색으로 같은 체험단 조회, 페이지네이션 적용
+        """
+        from app.shared.utils.search_utils import parse_search_query
+
+        with app.app_context():
+            repository = self._save_campaigns(self._campaigns)
+            monkeypatch.setattr(CampaignRepository, '_has_sqlite_search_table', lambda self: False)
+
+            results, total = repository.search_campaigns(parse_search_query('체험단'), skip=1, limit=1)
+
+            assert total == 2
+            assert len(results) == 1
+
+    def test_rebuild_search_documents(self, app):
+        """
+        정상 케이스: 검색 문서 재생성
+        Given: 검색 문서가 비어 있는 기존 체험단
+        When: rebuild_search_documents 호출
+        Then: 검색 가능
+        """
+        from app.shared.utils.search_utils import parse_search_query
+
+        with app.app_context():
+            repository = self._save_campaigns(self._campaigns[:1])
+            db.session.query(CampaignModel).update({CampaignModel.search_document: None})
+            db.session.commit()
+            assert repository.search_campaigns(parse_search_query('크림'))[1] == 0
+
+            assert repository.rebuild_search_documents(batch_size=1) == 1
+            db.session.commit()
+
+            assert repository.search_campaigns(parse_search_query('크림'))[1] == 1
+
+
+class TestCampaignRepositoryRecruitingFilters:
+    """모집 목록 필터 / 필터별 개수 테스트"""
+
+    @staticmethod
+    def _save_campaigns():
+        """
+        서울 광고주: 3일 뒤 마감(5명), 10일 뒤 마감(20명, 10일 전 등록)
+        부산 광고주: 5일 뒤 마감(40명)
+        """
+        repository = CampaignRepository(db.session)
+        campaigns = [
+            ('서울특별시 강남구', '1111111111', [('서울 마감임박', 3, 5, 0), ('서울 여유', 10, 20, 10)]),
+            ('부산광역시 해운대구', '2222222222', [('부산 대규모', 5, 40, 0)]),
+        ]
+        for index, (address, business_number, rows) in enumerate(campaigns):
+            advertiser = AdvertiserModel(
+                user_id=f'test-user-id-filter-{index}',
+                name='김광고',
+                birth_date=date(1985, 5, 15),
+                phone_number='010-1234-5678',
+                business_name=f'테스트 업체 {index}',
+                address=address,
+                business_phone='02-1234-5678',
+                business_number=business_number,
+                representative_name='김대표'
+            )
+            db.session.add(advertiser)
+            db.session.flush()
+
+            for title, end_in_days, quota, created_days_ago in rows:
+                repository.save(Campaign(
+                    id=None,
+                    advertiser_id=advertiser.id,
+                    title=title,
+                    description='설명',
+                    quota=quota,
+                    start_date=date.today(),
+                    end_date=date.today() + timedelta(days=end_in_days),
+                    benefits='무료 식사 제공',
+                    conditions='조건',
+                    image_url=None,
+                    status=CampaignStatus.RECRUITING,
+                    created_at=datetime.now(UTC) - timedelta(days=created_days_ago),
+                    closed_at=None
+                ))
+        db.session.commit()
+        return repository
+
+    def test_region_derived_from_advertiser_address(self, app):
+        """
+        정상 케이스: 저장 시 광고주 주소에서 지역 파생
+        Given: '서울특별시', '부산광역시' 주소의 광고주
+        When: 체험단 저장
+        Then: region이 '서울', '부산'
+        """
+        with app.app_context():
+            self._save_campaigns()
+
+            regions = dict(db.session.query(CampaignModel.title, CampaignModel.region).all())
+
+            assert regions == {'서울 마감임박': '서울', '서울 여유': '서울', '부산 대규모': '부산'}
+
+    def test_filters_combined(self, app):
+        """
+        정상 케이스: 필터 조합
+        Given: 서울 2개, 부산 1개 모집 중 체험단
+        When: 지역/마감/인원/신규 필터로 조회
+        Then: 모든 조건을 만족하는 체험단만 반환, 총 개수 일치
+        """
+        from app.domain.value_objects.campaign_filter import CampaignFilter
+
+        with app.app_context():
+            repository = self._save_campaigns()
+
+            def titles(filters):
+                rows, total, _ = repository.find_recruiting_campaigns_page(sort='deadline', filters=filters)
+                assert total == len(rows)
+                return [row.title for row in rows]
+
+            assert titles(CampaignFilter(region='서울')) == ['서울 마감임박', '서울 여유']
+            assert titles(CampaignFilter(deadline_days=7)) == ['서울 마감임박', '부산 대규모']
+            assert titles(CampaignFilter(region='서울', deadline_days=7)) == ['서울 마감임박']
+            assert titles(CampaignFilter(quota_range='31+')) == ['부산 대규모']
+            assert titles(CampaignFilter(new_only=True)) == ['서울 마감임박', '부산 대규모']
+            assert repository.count_recruiting_campaigns(CampaignFilter(quota_range='11-30')) == 1
+
+    def test_facet_counts_exclude_own_filter(self, app):
+        """
+        정상 케이스: 필터별 개수
+        Given: 서울 2개, 부산 1개 모집 중 체험단
+        When: 지역=서울 필터로 필터별 개수 조회
+        Then: 지역 개수는 지역 필터 없이, 나머지는 서울 안에서 계산
+        """
+        from app.domain.value_objects.campaign_filter import CampaignFilter
+
+        with app.app_context():
+            repository = self._save_campaigns()
+
+            facets = repository.count_recruiting_facets(CampaignFilter(region='서울'))
+
+            assert facets['region']['서울'] == 2
+            assert facets['region']['부산'] == 1
+            assert facets['region']['제주'] == 0
+            assert facets['deadline'] == {3: 1, 7: 1, 14: 2}
+            assert facets['quota'] == {'1-5': 1, '6-10': 0, '11-30': 1, '31+': 0}
+            assert facets['new'] == 1
@@ -0,0 +1,157 @@
+# tests/unit/infrastructure/repositories/test_request_loader.py
+"""
+RequestLoader (요청 단위 Identity Map) 단위 테스트
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import event
+from app.infrastructure.repositories.request_loader import RequestLoader, get_request_loader
+from app.infrastructure.persistence.models.influencer_model import InfluencerModel
+from app.extensions import db
+from tests.conftest import login_user
+
+
+def _create_influencers(count):
+    """인플루언서 N명 생성 후 id 리스트 반환"""
+    ids = []
+    for i in range(count):
+        influencer = InfluencerModel(
+            user_id=f'influencer-{i}',
+            name=f'인플루언서 {i}',
+            birth_date=date(1995, 1, 1),
+            phone_number='010-0000-0000',
+            channel_name=f'채널 {i}',
+            channel_url=f'https://example.com/{i}',
+            follower_count=100 * (i + 1)
+        )
+        db.session.add(influencer)
+        db.session.flush()
+        ids.append(influencer.id)
+    db.session.commit()
+    return ids
+
+
+class _QueryCounter:
+    """SELECT 쿼리 수 측정 (table 지정 시 해당 테이블 조회만)"""
+
+    def __init__(self, table=None):
+        self.table = table
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith('SELECT'):
+            return
+        if self.table is None or f'FROM {self.table}' in statement:
+            self.count += 1
+
+    def __enter__(self):
+        event.listen(db.engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, 'before_cursor_execute', self)
+
+
+class TestRequestLoaderIdentityMap:
+    """id / user_id 캐시 테스트"""
+
+    def test_repeated_lookups_hit_database_once(self, app):
+        """
+        정상 케이스: 같은 엔티티 반복 조회
+        Given: 인플루언서 1명
+        When: find_by_user_id / find_by_id 를 여러 번 호출
+        Then: 쿼리 1회, 같은 객체 반환
+        """
+        with app.app_context():
+            influencer_id = _create_influencers(1)[0]
+            loader = RequestLoader(db.session)
+
+            with _QueryCounter() as counter:
+                first = loader.influencers.find_by_user_id('influencer-0')
+                second = loader.influencers.find_by_user_id('influencer-0')
+                by_id = loader.influencers.find_by_id(influencer_id)
+
+            assert counter.count == 1
+            assert first is second is by_id
+            assert loader.stats()['influencer'] == {'hits': 2, 'misses': 1, 'queries': 1}
+
+    def test_missing_entity_is_cached(self, app):
+        """
+        경계 케이스: 존재하지 않는 엔티티
+        Given: 빈 DB
+        When: 같은 user_id로 두 번 조회
+        Then: None 반환, 쿼리 1회
+        """
+        with app.app_context():
+            loader = RequestLoader(db.session)
+
+            with _QueryCounter() as counter:
+                assert loader.advertisers.find_by_user_id('nobody') is None
+                assert loader.advertisers.find_by_user_id('nobody') is None
+
+            assert counter.count == 1
+
+
+class TestRequestLoaderBatching:
+    """find_by_ids 일괄 조회 테스트"""
+
+    def test_find_by_ids_loads_only_missing_ids_in_one_query(self, app):
+        """
+        정상 케이스: 일부 캐시된 상태에서 일괄 조회
+        Given: 인플루언서 3명 중 1명은 이미 조회됨
+        When: 중복 및 존재하지 않는 id 포함하여 find_by_ids 호출
+        Then: 쿼리 1회, 요청 순서대로 존재하는 엔티티만 반환
+        """
+        with app.app_context():
+            ids = _create_influencers(3)
+            loader = RequestLoader(db.session)
+            loader.influencers.find_by_id(ids[0])
+
+            with _QueryCounter() as counter:
+                influencers = loader.influencers.find_by_ids([ids[2], ids[0], ids[2], 9999, ids[1]])
+                loader.influencers.find_by_ids([ids[1], 9999])
+
+            assert counter.count == 1
+            assert [i.id for i in influencers] == [ids[2], ids[0], ids[1]]
+
+    def test_find_by_ids_with_empty_list(self, app):
+        """
+        경계 케이스: 빈 id 목록
+        Given: RequestLoader
+        When: find_by_ids([]) 호출
+        Then: 쿼리 없이 빈 리스트 반환
+        """
+        with app.app_context():
+            loader = RequestLoader(db.session)
+
+            with _QueryCounter() as counter:
+                assert loader.campaigns.find_by_ids([]) == []
+
+            assert counter.count == 0
+
+
+class TestRequestLoaderScope:
+    """요청 범위 테스트"""
+
+    def test_loader_is_shared_within_request_and_reset_between_requests(self, app, client, registered_advertiser):
+        """
+        정상 케이스: 요청 단위 범위
+        Given: 광고주 로그인
+        When: 같은 요청에서 get_request_loader를 여러 번 호출, 이후 새 요청
+        Then: 요청 안에서는 같은 로더, 광고주 조회는 첫 요청에서 1회 (이후 세션 신원 정보 사용)
+        """
+        with app.test_request_context('/'):
+            assert get_request_loader() is get_request_loader()
+
+        login_user(client, 'registered-advertiser-id')
+        counts = []
+        for _ in range(2):
+            with _QueryCounter('advertiser') as counter:
+                response = client.get('/advertiser/dashboard')
+
+            assert response.status_code == 200
+            counts.append(counter.count)
+
+        # advertiser_required와 라우트가 같은 캐시를 공유, 두 번째 요청은 세션의 광고주 ID 사용
+        assert counts == [1, 0]
@@ -0,0 +1,30 @@
+"""CursorUtils 테스트"""
+
+import pytest
+
+
+class TestCursorRoundTrip:
+    """encode_cursor / decode_cursor 테스트"""
+
+    def test_round_trip(self):
+        """정상 케이스: 인코딩 후 디코딩하면 원래 값"""
+        from app.shared.utils.cursor_utils import encode_cursor, decode_cursor
+
+        cursor = encode_cursor(['latest', '2025-11-01T12:00:00', 42])
+        assert decode_cursor(cursor) == ['latest', '2025-11-01T12:00:00', 42]
+
+    def test_cursor_is_url_safe(self):
+        """정상 케이스: URL에 그대로 사용할 수 있는 문자만 포함"""
+        from app.shared.utils.cursor_utils import encode_cursor
+
+        cursor = encode_cursor(['popular', 12345, 67890])
+        assert all(ch.isalnum() or ch in '-_' for ch in cursor)
+
+    @pytest.mark.parametrize('cursor', ['not-a-cursor!', 'e30', ''])
+    def test_invalid_cursor_raises(self, cursor):
+        """에러 케이스: 잘못된 커서"""
+        from app.domain.exceptions import ValidationException
+        from app.shared.utils.cursor_utils import decode_cursor
+
+        with pytest.raises(ValidationException):
+            decode_cursor(cursor)
@@ -0,0 +1,30 @@
+"""RegionUtils 테스트"""
+
+import pytest
+
+from app.shared.utils.region_utils import extract_region
+
+
+class TestExtractRegion:
+    """extract_region 함수 테스트"""
+
+    @pytest.mark.parametrize('address, region', [
+        ('서울특별시 강남구 테헤란로 123', '서울'),
+        ('서울시 강남구', '서울'),
+        ('서울 마포구', '서울'),
+        ('부산광역시 해운대구', '부산'),
+        ('세종특별자치시 한누리대로', '세종'),
+        ('경기도 성남시 분당구', '경기'),
+        ('강원특별자치도 춘천시', '강원'),
+        ('충청북도 청주시', '충북'),
+        ('전북특별자치도 전주시', '전북'),
+        ('제주특별자치도 제주시', '제주'),
+    ])
+    def test_region_from_address(self, address, region):
+        """정상 케이스: 시/도 정식 명칭/약칭 → 약칭"""
+        assert extract_region(address) == region
+
+    @pytest.mark.parametrize('address', [None, '', '   ', '강남구 테헤란로', 'Seoul'])
+    def test_unknown_region(self, address):
+        """경계 케이스: 시/도를 알 수 없는 주소"""
+        assert extract_region(address) is None
@@ -0,0 +1,53 @@
+"""SearchUtils 테스트"""
+
+from app.shared.utils.search_utils import (
+    MAX_QUERY_TERMS,
+    build_search_document,
+    parse_search_query,
+    tokenize,
+)
+
+
+class TestTokenize:
+    """tokenize 함수 테스트"""
+
+    def test_korean_bigrams(self):
+        """정상 케이스: 한글은 문자 2-gram"""
+        assert tokenize("파스타 체험단") == ["파스", "스타", "체험", "험단"]
+
+    def test_mixed_text(self):
+        """정상 케이스: 영문/숫자는 단어 단위, 소문자 및 전각 정규화"""
+        assert tokenize("ＳＮＳ 리뷰3건!") == ["sns", "리뷰", "3", "건"]
+
+    def test_single_character_run_kept(self):
+        """경계 케이스: 한 글자 구간은 그대로"""
+        assert tokenize("빵 맛집") == ["빵", "맛집"]
+
+    def test_empty(self):
+        """경계 케이스: 빈 문자열 / None"""
+        assert tokenize("") == []
+        assert tokenize(None) == []
+
+
+class TestBuildSearchDocument:
+    """build_search_document 함수 테스트"""
+
+    def test_joins_fields(self):
+        """정상 케이스: 필드별 토큰을 공백으로 연결 (None 필드 무시)"""
+        assert build_search_document("신메뉴", None, "카페") == "신메 메뉴 카페"
+
+
+class TestParseSearchQuery:
+    """parse_search_query 함수 테스트"""
+
+    def test_dedupes_and_marks_prefix(self):
+        """정상 케이스: 중복 제거, 한 글자 토큰은 접두사 검색"""
+        assert parse_search_query("파스타 파스타 빵") == [("파스", False), ("스타", False), ("빵", True)]
+
+    def test_caps_term_count(self):
+        """경계 케이스: 긴 검색어는 최대 토큰 수로 제한"""
+        assert len(parse_search_query("가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허")) == MAX_QUERY_TERMS
+
+    def test_punctuation_only(self):
+        """경계 케이스: 토큰이 없는 검색어"""
+        assert parse_search_query("!!! ---") == []
@@ -0,0 +1,99 @@
+"""세션 신원 정보 (session_identity) 테스트"""
+
+import pytest
+import app.shared.utils.session_identity as session_identity
+from app.shared.utils.session_identity import (
+    SessionIdentity,
+    resolve_identity,
+    update_identity,
+)
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    """load_identity 호출 기록"""
+    calls = []
+    original = session_identity.load_identity
+
+    def _counting_load(user_id):
+        calls.append(user_id)
+        return original(user_id)
+
+    monkeypatch.setattr(session_identity, 'load_identity', _counting_load)
+    return calls
+
+
+class TestResolveIdentity:
+    """resolve_identity 테스트"""
+
+    def test_resolves_once_then_uses_session(self, app, registered_advertiser, load_calls):
+        """
+        정상 케이스: 세션 재사용
+        Given: 광고주 정보가 등록된 사용자
+        When: resolve_identity 두 번 호출
+        Then: DB 조회는 1회, 광고주 ID와 역할 반환
+        """
+        with app.test_request_context('/'):
+            first = resolve_identity('registered-advertiser-id')
+            second = resolve_identity('registered-advertiser-id')
+
+        assert first == second == SessionIdentity(
+            user_id='registered-advertiser-id', role='advertiser', advertiser_id=1, influencer_id=None
+        )
+        assert load_calls == ['registered-advertiser-id']
+
+    def test_reloads_after_ttl_or_for_other_user(self, app, registered_advertiser, load_calls, monkeypatch):
+        """
+        경계 케이스: TTL 만료 및 다른 사용자
+        Given: 세션에 저장된 신원 정보
+        When: TTL 경과 후 조회, 다른 사용자 ID로 조회
+        Then: 매번 DB에서 다시 조회
+        """
+        now = [1000.0]
+        monkeypatch.setattr(session_identity.time, 'time', lambda: now[0])
+        app.config['SESSION_IDENTITY_TTL'] = 60
+
+        with app.test_request_context('/'):
+            resolve_identity('registered-advertiser-id')
+            now[0] += 61
+            resolve_identity('registered-advertiser-id')
+            resolve_identity('other-user-id')
+
+        assert load_calls == ['registered-advertiser-id', 'registered-advertiser-id', 'other-user-id']
+
+    def test_incomplete_identity_is_cached(self, app, influencer_user, load_calls):
+        """
+        경계 케이스: 프로필 미등록
+        Given: 인플루언서 정보 미등록 사용자
+        When: resolve_identity 두 번 호출 후 인플루언서 등록(update_identity)
+        Then: 미등록 상태도 TTL 동안 한 번만 DB 확인, 등록 결과는 조회 없이 반영
+        """
+        with app.test_request_context('/'):
+            identity = resolve_identity('influencer-id')
+            resolve_identity('influencer-id')
+            update_identity('influencer-id', influencer_id=7)
+            registered = resolve_identity('influencer-id')
+
+        assert identity.influencer_id is None
+        assert registered.influencer_id == 7
+        assert len(load_calls) == 1
+
+
+class TestUpdateIdentity:
+    """update_identity 테스트"""
+
+    def test_updates_fields_without_query(self, app, load_calls):
+        """
+        정상 케이스: 역할 선택/등록 후 갱신
+        Given: 역할 없는 신원 정보
+        When: 역할 및 인플루언서 ID 갱신 후 resolve_identity
+        Then: DB 조회 없이 갱신된 값 반환
+        """
+        with app.test_request_context('/'):
+            update_identity('new-user-id', role='influencer')
+            update_identity('new-user-id', influencer_id=7)
+
+            identity = resolve_identity('new-user-id')
+
+            assert identity == SessionIdentity(user_id='new-user-id', role='influencer', influencer_id=7)
+            assert load_calls == []
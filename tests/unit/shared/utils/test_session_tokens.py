@@ -0,0 +1,141 @@
+"""Access Token 요청 인증 (session_tokens / token_required) 테스트"""
+
+import time
+
+import jwt
+import pytest
+from app.domain.exceptions.auth_exceptions import InvalidTokenException
+from app.infrastructure.external.supabase.supabase_token_verifier import (
+    SupabaseTokenRefresher,
+    SupabaseTokenVerifier,
+)
+
+
+SECRET = 'local-test-jwt-secret-with-at-least-32-bytes'
+
+
+def make_token(expires_in=3600, sub='user-1'):
+    """테스트용 Access Token"""
+    payload = {'sub': sub, 'aud': 'authenticated', 'exp': int(time.time()) + expires_in}
+    return jwt.encode(payload, SECRET, algorithm='HS256')
+
+
+@pytest.fixture
+def refresh_calls(app):
+    """로컬 검증기/갱신기 설정 및 갱신 호출 기록"""
+    calls = []
+
+    def refresh(refresh_token):
+        # Supabase처럼 한 번 사용한 refresh_token은 거부 (토큰 순환)
+        if refresh_token in calls:
+            raise InvalidTokenException()
+        calls.append(refresh_token)
+        return {'access_token': make_token(), 'refresh_token': f'{refresh_token}-next'}
+
+    refresher = SupabaseTokenRefresher(refresh=refresh)
+    app.extensions['supabase_token_verifier'] = SupabaseTokenVerifier(jwt_secret=SECRET)
+    app.extensions['supabase_token_refresher'] = refresher
+    yield calls
+    refresher.shutdown()
+
+
+def set_session_tokens(client, access_token, refresh_token='refresh-1'):
+    with client.session_transaction() as sess:
+        sess['access_token'] = access_token
+        sess['refresh_token'] = refresh_token
+
+
+class TestTokenRequired:
+    """token_required (/auth/me) 테스트"""
+
+    def test_bearer_token_verified_locally(self, client, refresh_calls):
+        """
+        정상 케이스: Bearer 토큰
+        Given: 유효한 Access Token
+        When: Authorization 헤더로 /auth/me 요청
+        Then: 200, 토큰 사용자 반환, 갱신 호출 없음
+        """
+        response = client.get('/auth/me', headers={'Authorization': f'Bearer {make_token()}'})
+
+        assert response.status_code == 200
+        assert response.get_json()['user_id'] == 'user-1'
+        assert refresh_calls == []
+
+    def test_missing_or_invalid_token_returns_401(self, client, refresh_calls):
+        """
+        예외 케이스: 토큰 없음 / 위조 토큰
+        Given: 토큰 없는 요청, 잘못된 Bearer 토큰
+        When: /auth/me 요청
+        Then: 401 JSON 응답
+        """
+        assert client.get('/auth/me').status_code == 401
+
+        response = client.get('/auth/me', headers={'Authorization': 'Bearer forged.token.value'})
+
+        assert response.status_code == 401
+        assert response.get_json()['success'] is False
+
+    def test_expiring_session_token_refreshed_in_request(self, client, refresh_calls):
+        """
+        정상 케이스: 만료 직전 세션 토큰
+        Given: 30초 후 만료되는 세션 토큰 (갱신 기준 60초)
+        When: /auth/me 요청
+        Then: 요청 안에서 갱신 1회, 새 토큰을 세션에 저장
+        """
+        set_session_tokens(client, make_token(expires_in=30))
+
+        assert client.get('/auth/me').status_code == 200
+
+        with client.session_transaction() as sess:
+            assert sess['refresh_token'] == 'refresh-1-next'
+        assert refresh_calls == ['refresh-1']
+
+    def test_rotated_token_kept_after_refresher_forgets_result(self, app, client, refresh_calls):
+        """
+        정상 케이스: 갱신 결과 보관 기간이 지난 뒤 토큰 만료
+        Given: 만료 직전 토큰으로 갱신이 끝났고, 갱신기는 결과를 바로 버림 (result_ttl=0, 다른 워커와 동일)
+        When: 이후 Access Token이 만료된 상태로 /auth/me 요청
+        Then: 세션에 저장된 새 refresh_token으로 갱신하여 200 (이미 사용한 토큰을 재사용하지 않음)
+        """
+        app.extensions['supabase_token_refresher'].result_ttl = 0
+        set_session_tokens(client, make_token(expires_in=30))
+        assert client.get('/auth/me').status_code == 200
+
+        with client.session_transaction() as sess:
+            sess['access_token'] = make_token(expires_in=-120)
+
+        assert client.get('/auth/me').status_code == 200
+        assert refresh_calls == ['refresh-1', 'refresh-1-next']
+
+    def test_failed_refresh_keeps_valid_token(self, app, client, refresh_calls):
+        """
+        예외 케이스: 만료 직전 토큰 갱신 실패
+        Given: 이미 사용한 refresh_token과 30초 후 만료되는 세션 토큰
+        When: /auth/me 요청
+        Then: 기존 토큰이 아직 유효하므로 200, 세션 토큰 유지
+        """
+        refresh_calls.append('refresh-1')
+        access_token = make_token(expires_in=30)
+        set_session_tokens(client, access_token)
+
+        assert client.get('/auth/me').status_code == 200
+
+        with client.session_transaction() as sess:
+            assert sess['access_token'] == access_token
+            assert sess['refresh_token'] == 'refresh-1'
+
+    def test_expired_session_token_refreshed_once(self, client, refresh_calls):
+        """
+        정상 케이스: 만료된 세션 토큰
+        Given: 이미 만료된 세션 토큰
+        When: /auth/me 요청
+        Then: 동기 갱신 1회 후 200
+        """
+        set_session_tokens(client, make_token(expires_in=-120))
+
+        response = client.get('/auth/me')
+
+        assert response.status_code == 200
+        assert refresh_calls == ['refresh-1']
+        with client.session_transaction() as sess:
+            assert sess['refresh_token'] == 'refresh-1-next'